@@ -3,6 +3,8 @@
 
 환경 변수에 따라 적절한 클라이언트 구현체를 반환
 USE_A6000_MODELS=true 시 A6000 클라이언트로 자동 전환
+
+API 서버는 ClientRegistry(clients/registry.py)가 앱 시작 시 한 번만 호출
 """
 
 import os
@@ -10,6 +12,7 @@ from clients.base import STTClient, LLMClient, TTSClient
 from clients.whisper_client import WhisperLocalClient, WhisperA6000Client
 from clients.gemini_client import GeminiClient, LLaMAA6000Client
 from clients.melo_tts_client import MeloTTSLocalClient, MeloTTSA6000Client
+from clients.cached_tts_client import CachedTTSClient
 
 
 def get_stt_client() -> STTClient:
@@ -54,6 +57,7 @@ def get_tts_client() -> TTSClient:
 
     환경 변수:
         USE_A6000_MODELS: "true"이면 A6000 클라이언트 사용
+        TTS_CACHE_ENABLED: "false"이면 TTS 캐시 사용 안 함 (기본: true)
 
     Returns:
         TTSClient 구현체
@@ -61,15 +65,23 @@ def get_tts_client() -> TTSClient:
     use_a6000 = os.getenv("USE_A6000_MODELS", "false").lower() == "true"
 
     if use_a6000:
-        return MeloTTSA6000Client()
+        client = MeloTTSA6000Client()
     else:
-        return MeloTTSLocalClient()
+        client = MeloTTSLocalClient()
+
+    if os.getenv("TTS_CACHE_ENABLED", "true").lower() == "true":
+        return CachedTTSClient(client)
+    return client
+
+
+from clients.registry import ClientRegistry  # noqa: E402  (팩토리 정의 후 import)
 
 
 __all__ = [
     "get_stt_client",
     "get_llm_client",
     "get_tts_client",
+    "ClientRegistry",
     "STTClient",
     "LLMClient",
     "TTSClient"
@@ -6,10 +6,54 @@ STT, LLM, TTS 클라이언트의 기본 인터페이스 정의
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Dict, Any, AsyncIterator
 
 
-class STTClient(ABC):
+async def check_http_health(base_url: str, timeout_sec: float = 3.0) -> Dict[str, Any]:
+    """
+    HTTP 모델 서버의 /health 확인 (A6000 서버, Melo TTS 서버 공통)
+
+    Args:
+        base_url: 서버 URL
+        timeout_sec: 요청 타임아웃 (초)
+
+    Returns:
+        {"status": "ok" | "error", "url": ..., "detail": ...}
+    """
+    from clients.http_pool import get_http_pool
+
+    try:
+        await get_http_pool().request_json(
+            "GET", f"{base_url}/health", timeout_sec=timeout_sec, retries=0
+        )
+        return {"status": "ok", "url": base_url}
+    except Exception as e:
+        return {"status": "error", "url": base_url, "detail": str(e)}
+
+
+class BaseClient(ABC):
+    """
+    클라이언트 공통 수명주기 인터페이스
+
+    ClientRegistry가 앱 시작 시 한 번 생성하고,
+    /health에서 health_check(), 앱 종료 시 close()를 호출
+    """
+
+    async def health_check(self) -> Dict[str, Any]:
+        """
+        클라이언트 상태 확인
+
+        Returns:
+            {"status": "ok" | "error", ...}
+        """
+        return {"status": "ok"}
+
+    async def close(self) -> None:
+        """보유 중인 리소스(HTTP 세션, 모델 등) 정리"""
+        return None
+
+
+class STTClient(BaseClient):
     """
     음성 → 텍스트 변환 클라이언트 인터페이스
 
@@ -18,6 +62,9 @@ class STTClient(ABC):
     - WhisperA6000Client: A6000 로컬 Whisper (향후 HTTP 연동)
     """
 
+    # STT 모델 티어 (InterviewTranscript.stt_model, 전사 재사용 매칭 키)
+    model_tier: str = "unknown"
+
     @abstractmethod
     async def transcribe(
         self,
@@ -36,8 +83,28 @@ class STTClient(ABC):
         """
         pass
 
+    async def transcribe_with_segments(
+        self,
+        audio_path: str,
+        language: str = "ko"
+    ) -> Dict[str, Any]:
+        """
+        음성 파일을 텍스트 + 구간(segments) 정보로 변환
+
+        구간 정보를 제공하지 않는 구현체는 빈 segments를 반환
+
+        Args:
+            audio_path: .wav 파일 경로
+            language: 언어 코드 (ko, en 등)
+
+        Returns:
+            {"text": "...", "segments": [{"start": 0.0, "end": 2.1, "text": "..."}]}
+        """
+        text = await self.transcribe(audio_path, language=language)
+        return {"text": text, "segments": []}
+
 
-class LLMClient(ABC):
+class LLMClient(BaseClient):
     """
     대형 언어 모델 클라이언트 인터페이스
 
@@ -66,8 +133,24 @@ class LLMClient(ABC):
         """
         pass
 
+    async def generate_stream(
+        self,
+        prompt: str,
+        max_tokens: int = 200,
+        temperature: float = 0.7
+    ) -> AsyncIterator[str]:
+        """
+        프롬프트를 받아 텍스트를 조각(델타) 단위로 생성
+
+        스트리밍을 지원하지 않는 구현체는 전체 결과를 한 번에 반환
+
+        Yields:
+            생성된 텍스트 델타
+        """
+        yield await self.generate(prompt, max_tokens=max_tokens, temperature=temperature)
 
-class TTSClient(ABC):
+
+class TTSClient(BaseClient):
     """
     텍스트 → 음성 변환 클라이언트 인터페이스
 
@@ -76,6 +159,9 @@ class TTSClient(ABC):
     - MeloTTSA6000Client: A6000 GPU Melo TTS (향후)
     """
 
+    # TTS 모델 버전 (TTS 캐시 키, 모델이 바뀌면 캐시 무효화)
+    model_version: str = "unknown"
+
     @abstractmethod
     async def synthesize(
         self,
@@ -97,3 +183,45 @@ class TTSClient(ABC):
             생성된 음성 파일 URL
         """
         pass
+
+    async def synthesize_stream(
+        self,
+        text: str,
+        speaker: str = "KR",
+        speed: float = 1.0
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        문장/절 단위 스트리밍 합성
+
+        먼저 끝난 조각부터 반환하므로 전체 합성을 기다리지 않고 재생 시작 가능
+        기본 구현은 조각마다 synthesize() 호출 (캐시 래퍼도 조각 단위로 재사용)
+
+        Yields:
+            {"index": 0, "text": "...", "audio_url": "..."}
+        """
+        from utils.sentences import split_sentences
+
+        for index, chunk in enumerate(split_sentences(text)):
+            audio_url = await self.synthesize(chunk, speaker=speaker, speed=speed)
+            yield {"index": index, "text": chunk, "audio_url": audio_url}
+
+    @abstractmethod
+    async def synthesize_audio(
+        self,
+        text: str,
+        speaker: str = "KR",
+        speed: float = 1.0,
+        codec: Optional[str] = None,
+        bitrate_kbps: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        압축 오디오(Opus / MP3 등)를 바이트로 직접 받기 (파일 URL 없이)
+
+        Args:
+            codec: "opus" | "webm" | "mp3" | "wav" (None이면 서버 기본값)
+            bitrate_kbps: 목표 비트레이트
+
+        Returns:
+            {"audio": bytes, "content_type": "audio/ogg; codecs=opus", "codec": "opus", "bitrate_kbps": 24}
+        """
+        pass
@@ -0,0 +1,157 @@
+"""
+캐시 TTS 클라이언트
+
+다른 TTSClient를 감싸서 같은 (텍스트, 화자, 속도, 모델 버전) 요청은
+TTS 서버를 다시 부르지 않고 디스크 캐시(utils/tts_cache.py)의 audio_url을 반환
+(압축 오디오는 코덱 / 비트레이트별로 바이트 자체를 캐시)
+
+audio_url이 가리키는 wav는 TTS 서버가 자체 LRU로 지우므로,
+TTL이 지난 항목은 서버에 파일이 남아 있는지(HEAD) 확인하고 없으면 다시 합성
+
+환경 변수:
+    TTS_URL_CACHE_TTL_SEC: audio_url 항목을 확인 없이 쓰는 시간 (기본: 600)
+"""
+
+import asyncio
+import os
+import time
+from typing import Optional, Dict, Any
+
+import aiohttp
+
+from clients.base import TTSClient
+from clients.http_pool import get_http_pool
+from utils.audio_utils import AUDIO_CODECS, clamp_bitrate, negotiate_audio_codec
+from utils.tts_cache import TTSCache, get_tts_cache, tts_cache_key
+
+
+TTS_URL_CACHE_TTL_SEC = float(os.getenv("TTS_URL_CACHE_TTL_SEC", "600"))
+
+
+class _EmptyAudio(Exception):
+    """TTS 서버가 audio_url 없이 응답한 경우"""
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+class CachedTTSClient(TTSClient):
+    """
+    TTSClient 캐시 래퍼
+
+    키에 TTS 서버 URL을 포함하므로 서버를 바꾸면 다른 캐시 항목을 사용
+    """
+
+    def __init__(
+        self,
+        inner: TTSClient,
+        cache: Optional[TTSCache] = None,
+        url_ttl_sec: Optional[float] = None
+    ):
+        self.inner = inner
+        self.cache = cache or get_tts_cache()
+        self.model_version = inner.model_version
+        self.base_url = getattr(inner, "base_url", "") or ""
+        self.url_ttl_sec = TTS_URL_CACHE_TTL_SEC if url_ttl_sec is None else url_ttl_sec
+        self.resynthesized = 0
+
+    async def _audio_url_available(self, audio_url: str) -> bool:
+        """TTS 서버에 audio_url 파일이 남아 있는지 (404 / 410이면 False, 그 외 오류는 있다고 간주)"""
+        url = audio_url if audio_url.startswith("http") else f"{self.base_url}{audio_url}"
+        try:
+            await get_http_pool().request_bytes("HEAD", url, retries=0)
+        except aiohttp.ClientResponseError as e:
+            return e.status not in (404, 410)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return True
+        return True
+
+    async def _drop_if_gone(self, key: str) -> None:
+        """TTL이 지난 audio_url 항목 확인 (남아 있으면 TTL 갱신, 없으면 삭제)"""
+        entry = self.cache.get_json(key)
+        if entry is None:
+            return
+        if time.time() - entry.get("checked_at", 0) < self.url_ttl_sec:
+            return
+        if await self._audio_url_available(entry["audio_url"]):
+            self.cache.put_json(key, {**entry, "checked_at": time.time()})
+        else:
+            print(f"♻️ TTS audio evicted on server, re-synthesizing: {entry['audio_url']}")
+            self.cache.delete(key, ".json")
+            self.resynthesized += 1
+
+    async def synthesize(
+        self,
+        text: str,
+        speaker: str = "KR",
+        speed: float = 1.0,
+        output_path: Optional[str] = None
+    ) -> str:
+        # 저장 경로를 지정한 호출은 파일이 실제로 필요하므로 캐시하지 않음
+        if output_path:
+            return await self.inner.synthesize(text, speaker=speaker, speed=speed, output_path=output_path)
+
+        key = tts_cache_key(
+            text,
+            speaker,
+            speed,
+            self.model_version,
+            namespace=self.base_url
+        )
+        await self._drop_if_gone(key)
+
+        async def produce() -> Dict[str, Any]:
+            audio_url = await self.inner.synthesize(text, speaker=speaker, speed=speed)
+            if not audio_url:
+                # 빈 결과는 캐시에 남기지 않음
+                raise _EmptyAudio()
+            return {"audio_url": audio_url, "checked_at": time.time()}
+
+        try:
+            entry = await self.cache.get_or_create_json(key, produce)
+        except _EmptyAudio:
+            return ""
+        return entry["audio_url"]
+
+    async def synthesize_audio(
+        self,
+        text: str,
+        speaker: str = "KR",
+        speed: float = 1.0,
+        codec: Optional[str] = None,
+        bitrate_kbps: Optional[int] = None
+    ) -> Dict[str, Any]:
+        # 캐시 키에 코덱 / 비트레이트가 들어가므로 서버 기본값 대신 여기서 확정
+        codec = negotiate_audio_codec(codec)
+        bitrate = clamp_bitrate(codec, bitrate_kbps)
+        spec = AUDIO_CODECS[codec]
+        key = tts_cache_key(
+            text,
+            speaker,
+            speed,
+            self.model_version,
+            namespace=f"{self.base_url}|{codec}@{bitrate}"
+        )
+
+        async def produce(tmp_path: str) -> None:
+            result = await self.inner.synthesize_audio(
+                text, speaker=speaker, speed=speed, codec=codec, bitrate_kbps=bitrate
+            )
+            await asyncio.to_thread(_write_bytes, tmp_path, result["audio"])
+
+        path = await self.cache.get_or_create(key, produce, suffix=spec["suffix"])
+        return {
+            "audio": await asyncio.to_thread(path.read_bytes),
+            "content_type": spec["mime"],
+            "codec": codec,
+            "bitrate_kbps": bitrate
+        }
+
+    async def health_check(self) -> Dict[str, Any]:
+        result = await self.inner.health_check()
+        return {**result, "cache": {**self.cache.stats(), "resynthesized": self.resynthesized}}
+
+    async def close(self) -> None:
+        await self.inner.close()
@@ -8,9 +8,13 @@ Gemini LLM 클라이언트
 
 import os
 import json
-from typing import Optional
+import asyncio
+from typing import Optional, Dict, Any, AsyncIterator
 import google.generativeai as genai
-from clients.base import LLMClient
+from clients.base import LLMClient, check_http_health
+from clients.http_pool import get_http_pool
+from clients.llm_gateway import LLMGateway, get_llm_gateway
+from utils.bounded_executor import llm_executor
 
 
 class GeminiClient(LLMClient):
@@ -19,24 +23,32 @@ class GeminiClient(LLMClient):
 
     ⚠️ A6000 서버로 마이그레이션 시 LLaMAA6000Client로 교체
 
+    호출은 LLM 게이트웨이(키 라우팅 / 속도 제한 / 429 쿨다운)를 거침
+    (프로세스 전역 genai.configure()를 호출하지 않음, api_key를 주면 그 키 전용 게이트웨이)
+
     환경 변수:
-        GEMINI_API_KEY: Google Gemini API 키
+        GEMINI_API_KEY (GEMINI_API_KEY1 ~ 3): Google Gemini API 키
         GEMINI_MODEL: 모델 이름 (기본: gemini-2.0-flash-exp)
+        LLM_MAX_CONCURRENCY / LLM_TIMEOUT_SEC: 동시 호출 수 / 호출별 타임아웃
     """
 
     def __init__(
         self,
         api_key: Optional[str] = None,
-        model_name: Optional[str] = None
+        model_name: Optional[str] = None,
+        timeout_sec: Optional[float] = None
     ):
-        self.api_key = api_key or os.getenv("GEMINI_API_KEY")
-        if not self.api_key:
+        # GEMINI_API_ENDPOINT(목 서버 등)가 있으면 게이트웨이의 키별 클라이언트가 그 주소로 REST 호출
+        self.gateway = LLMGateway(api_keys=[api_key]) if api_key else get_llm_gateway()
+        if not self.gateway.has_keys:
             raise ValueError("GEMINI_API_KEY is required")
 
-        genai.configure(api_key=self.api_key)
-
         self.model_name = model_name or os.getenv("GEMINI_MODEL", "gemini-2.0-flash-exp")
-        self.model = genai.GenerativeModel(self.model_name)
+        self.timeout_sec = timeout_sec or llm_executor.timeout_sec
+
+    async def health_check(self) -> Dict[str, Any]:
+        # API 호출 없이 설정만 확인 (무료 티어 쿼터 보호)
+        return {"status": "ok", "model": self.model_name}
 
     async def generate(
         self,
@@ -60,13 +72,59 @@ class GeminiClient(LLMClient):
             temperature=temperature
         )
 
-        response = self.model.generate_content(
+        # 동기 게이트웨이 호출은 전용 스레드 풀에서 실행 (이벤트 루프 블로킹 방지)
+        # 마감은 실행기 타임아웃으로 걸어 SDK 호출이 끝날 때까지 슬롯을 점유
+        response = await llm_executor.run(
+            self.gateway.generate_content,
             prompt,
-            generation_config=generation_config
+            model_name=self.model_name,
+            generation_config=generation_config,
+            timeout_sec=self.timeout_sec
         )
 
         return response.text.strip()
 
+    async def generate_stream(
+        self,
+        prompt: str,
+        max_tokens: int = 200,
+        temperature: float = 0.7
+    ) -> AsyncIterator[str]:
+        """
+        스트리밍 생성 (게이트웨이가 고른 키로 generate_content_async(stream=True))
+
+        Yields:
+            생성된 텍스트 델타
+        """
+        generation_config = genai.types.GenerationConfig(
+            max_output_tokens=max_tokens,
+            temperature=temperature
+        )
+
+        async with llm_executor.slot(), self.gateway.stream_model(self.model_name) as model:
+            response = await asyncio.wait_for(
+                model.generate_content_async(
+                    prompt,
+                    generation_config=generation_config,
+                    stream=True
+                ),
+                timeout=self.timeout_sec
+            )
+            chunks = response.__aiter__()
+            while True:
+                try:
+                    # 청크 사이 대기에도 타임아웃 적용
+                    chunk = await asyncio.wait_for(chunks.__anext__(), timeout=self.timeout_sec)
+                except StopAsyncIteration:
+                    break
+                try:
+                    delta = chunk.text
+                except ValueError:
+                    # 안전 필터 등으로 텍스트 파트가 없는 청크
+                    continue
+                if delta:
+                    yield delta
+
     def build_followup_prompt(
         self,
         portfolio_text: str,
@@ -78,7 +136,7 @@ class GeminiClient(LLMClient):
         꼬리질문 생성을 위한 프롬프트 구성
         
         Args:
-            portfolio_text: 포트폴리오 파싱 텍스트
+            portfolio_text: 포트폴리오 다이제스트 텍스트 (services/portfolio_digest.py)
             current_question: 현재 질문
             user_answer: 사용자 답변 (STT 결과)
             question_type: 질문 유형 (technical, behavioral, project)
@@ -90,7 +148,7 @@ class GeminiClient(LLMClient):
 지원자의 포트폴리오와 답변을 기반으로 깊이 있는 꼬리질문 1개를 생성해주세요.
 
 # 포트폴리오 정보
-{portfolio_text[:1000]}  # 너무 길면 잘라냄
+{portfolio_text}
 
 # 현재 질문
 {current_question}
@@ -187,6 +245,9 @@ class LLaMAA6000Client(LLMClient):
         if not self.base_url:
             raise ValueError("A6000_LLM_URL is required")
 
+    async def health_check(self) -> Dict[str, Any]:
+        return await check_http_health(self.base_url)
+
     async def generate(
         self,
         prompt: str,
@@ -204,20 +265,48 @@ class LLaMAA6000Client(LLMClient):
         Returns:
             생성된 텍스트
         """
-        import aiohttp
-
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
+        async with llm_executor.slot():
+            result = await get_http_pool().request_json(
+                "POST",
                 f"{self.base_url}/generate",
                 json={
                     "prompt": prompt,
                     "max_tokens": max_tokens,
                     "temperature": temperature
-                }
-            ) as resp:
-                resp.raise_for_status()
-                result = await resp.json()
-                return result.get("text", "")
+                },
+                timeout_sec=llm_executor.timeout_sec
+            )
+        return result.get("text", "")
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        max_tokens: int = 200,
+        temperature: float = 0.7
+    ) -> AsyncIterator[str]:
+        """
+        A6000 서버 스트리밍 생성 (NDJSON: {"delta": "..."} 줄 단위)
+
+        스트리밍을 모르는 서버가 {"text": "..."} 한 줄로 응답해도 동작
+        """
+        async with llm_executor.slot():
+            async for line in get_http_pool().stream_lines(
+                "POST",
+                f"{self.base_url}/generate",
+                json={
+                    "prompt": prompt,
+                    "max_tokens": max_tokens,
+                    "temperature": temperature,
+                    "stream": True
+                },
+                timeout_sec=llm_executor.timeout_sec
+            ):
+                event = json.loads(line)
+                if event.get("error"):
+                    raise RuntimeError(f"LLM stream failed: {event['error']}")
+                delta = event.get("delta", event.get("text", ""))
+                if delta:
+                    yield delta
 
     def build_followup_prompt(
         self,
@@ -232,7 +321,7 @@ class LLaMAA6000Client(LLMClient):
 지원자의 포트폴리오와 답변을 기반으로 깊이 있는 꼬리질문 1개를 생성해주세요.
 
 # 포트폴리오 정보
-{portfolio_text[:1000]}
+{portfolio_text}
 
 # 현재 질문
 {current_question}
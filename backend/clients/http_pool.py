@@ -0,0 +1,317 @@
+"""
+모델 서버 HTTP 커넥션 풀
+
+Melo TTS / A6000 STT·LLM·TTS 서버 호출이 공유하는 aiohttp 세션
+- 호스트별 커넥션 제한 + keep-alive 재사용 (호출마다 TCP 연결을 새로 맺지 않음)
+- 타임아웃 / 지터 포함 지수 백오프 재시도
+  (POST 등 멱등이 아닌 요청은 서버가 처리하지 않은 게 확실한 경우만 재시도:
+   연결 실패, 429/502/503 / 타임아웃까지 재시도하려면 idempotent=True)
+- 호스트별 요청·재시도·실패·지연 통계
+
+환경 변수:
+    HTTP_POOL_LIMIT: 전체 동시 커넥션 수 (기본: 100)
+    HTTP_POOL_LIMIT_PER_HOST: 호스트별 동시 커넥션 수 (기본: 16)
+    HTTP_POOL_KEEPALIVE_SEC: 유휴 커넥션 유지 시간 (기본: 60)
+    HTTP_CONNECT_TIMEOUT_SEC: 연결 타임아웃 (기본: 5)
+    HTTP_TOTAL_TIMEOUT_SEC: 요청 전체 타임아웃 (기본: 60)
+    HTTP_RETRIES: 재시도 횟수 (기본: 2)
+    HTTP_RETRY_BACKOFF_SEC: 백오프 기본 간격 (기본: 0.2)
+"""
+
+import asyncio
+import os
+import random
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+
+
+# 재시도 대상 상태 코드 (과부하 / 게이트웨이 오류)
+RETRY_STATUSES = {429, 502, 503, 504}
+# 멱등이 아닌 요청도 재시도하는 상태 코드 (504는 서버가 이미 처리 중일 수 있어 제외)
+UNPROCESSED_STATUSES = {429, 502, 503}
+# 기본으로 멱등 취급하는 메서드 (나머지는 idempotent=True로 명시해야 타임아웃 재시도)
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+class HostStats:
+    """호스트별 요청 통계"""
+
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.in_flight = 0
+        self.total_latency_sec = 0.0
+        self.max_latency_sec = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        completed = self.requests - self.in_flight
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "failures": self.failures,
+            "in_flight": self.in_flight,
+            "avg_latency_ms": round(self.total_latency_sec / completed * 1000, 1) if completed > 0 else 0.0,
+            "max_latency_ms": round(self.max_latency_sec * 1000, 1)
+        }
+
+
+class HTTPPool:
+    """
+    공유 aiohttp 세션 + 재시도 정책
+
+    세션은 첫 요청 시 현재 이벤트 루프에서 생성하고, close()로 정리
+    """
+
+    def __init__(
+        self,
+        limit: Optional[int] = None,
+        limit_per_host: Optional[int] = None,
+        keepalive_sec: Optional[float] = None,
+        connect_timeout_sec: Optional[float] = None,
+        total_timeout_sec: Optional[float] = None,
+        retries: Optional[int] = None,
+        backoff_sec: Optional[float] = None
+    ):
+        self.limit = limit or int(os.getenv("HTTP_POOL_LIMIT", "100"))
+        self.limit_per_host = limit_per_host or int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "16"))
+        self.keepalive_sec = keepalive_sec or float(os.getenv("HTTP_POOL_KEEPALIVE_SEC", "60"))
+        self.connect_timeout_sec = connect_timeout_sec or float(os.getenv("HTTP_CONNECT_TIMEOUT_SEC", "5"))
+        self.total_timeout_sec = total_timeout_sec or float(os.getenv("HTTP_TOTAL_TIMEOUT_SEC", "60"))
+        self.retries = retries if retries is not None else int(os.getenv("HTTP_RETRIES", "2"))
+        self.backoff_sec = backoff_sec or float(os.getenv("HTTP_RETRY_BACKOFF_SEC", "0.2"))
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._hosts: Dict[str, HostStats] = {}
+        self.sessions_created = 0
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_sec,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(
+                    total=self.total_timeout_sec,
+                    connect=self.connect_timeout_sec
+                )
+            )
+            self.sessions_created += 1
+        return self._session
+
+    def _backoff(self, attempt: int) -> float:
+        """지수 백오프 + full jitter"""
+        return random.uniform(0, self.backoff_sec * (2 ** attempt))
+
+    async def request_json(
+        self,
+        method: str,
+        url: str,
+        json: Optional[Dict[str, Any]] = None,
+        data_factory: Optional[Callable[[], Any]] = None,
+        timeout_sec: Optional[float] = None,
+        retries: Optional[int] = None,
+        idempotent: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """
+        요청 후 JSON 응답 반환 (연결 오류 / 타임아웃 / RETRY_STATUSES는 재시도)
+
+        멱등이 아닌 요청(POST /generate, /stt 등)은 타임아웃 / 끊긴 연결 / 504를 재시도하지 않음
+        (서버가 이미 처리 중일 수 있어 재시도하면 GPU 작업이 중복됨)
+        → 연결 실패(ClientConnectorError)와 UNPROCESSED_STATUSES만 재시도
+
+        Args:
+            method: HTTP 메서드
+            url: 요청 URL
+            json: JSON 본문
+            data_factory: 시도마다 새 본문을 만드는 함수 (FormData는 재사용 불가)
+            timeout_sec: 요청 전체 타임아웃 (None이면 풀 기본값)
+            retries: 재시도 횟수 (None이면 풀 기본값)
+            idempotent: 전체 재시도 정책 적용 여부 (None이면 IDEMPOTENT_METHODS 기준)
+
+        Returns:
+            응답 JSON
+
+        Raises:
+            aiohttp.ClientError / asyncio.TimeoutError: 재시도 후에도 실패한 경우
+        """
+        async def read(resp: aiohttp.ClientResponse) -> Dict[str, Any]:
+            return await resp.json()
+
+        return await self._request(
+            method, url, read, json, data_factory, timeout_sec, retries, idempotent=idempotent
+        )
+
+    async def request_bytes(
+        self,
+        method: str,
+        url: str,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout_sec: Optional[float] = None,
+        retries: Optional[int] = None,
+        idempotent: Optional[bool] = None
+    ) -> Tuple[bytes, Dict[str, str]]:
+        """
+        요청 후 바이너리 응답 본문 + 응답 헤더 반환 (재시도 정책은 request_json과 같음)
+
+        압축 오디오처럼 본문 자체가 결과인 응답용
+        """
+        async def read(resp: aiohttp.ClientResponse) -> Tuple[bytes, Dict[str, str]]:
+            return await resp.read(), dict(resp.headers)
+
+        return await self._request(method, url, read, json, None, timeout_sec, retries, headers, idempotent)
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        read: Callable[[aiohttp.ClientResponse], Awaitable[Any]],
+        json: Optional[Dict[str, Any]] = None,
+        data_factory: Optional[Callable[[], Any]] = None,
+        timeout_sec: Optional[float] = None,
+        retries: Optional[int] = None,
+        headers: Optional[Dict[str, str]] = None,
+        idempotent: Optional[bool] = None
+    ) -> Any:
+        host = urlsplit(url).netloc
+        stats = self._hosts.setdefault(host, HostStats())
+        retries = self.retries if retries is None else retries
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        if idempotent:
+            retry_statuses = RETRY_STATUSES
+            retry_errors: Tuple[type, ...] = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+        else:
+            # 요청이 서버에 닿지 않았거나 서버가 거절한 경우만
+            retry_statuses = UNPROCESSED_STATUSES
+            retry_errors = (aiohttp.ClientConnectorError,)
+        timeout = aiohttp.ClientTimeout(total=timeout_sec) if timeout_sec else None
+
+        stats.requests += 1
+        stats.in_flight += 1
+        started = time.perf_counter()
+        try:
+            for attempt in range(retries + 1):
+                try:
+                    kwargs: Dict[str, Any] = {}
+                    if json is not None:
+                        kwargs["json"] = json
+                    if data_factory is not None:
+                        kwargs["data"] = data_factory()
+                    if timeout is not None:
+                        kwargs["timeout"] = timeout
+                    if headers:
+                        kwargs["headers"] = headers
+
+                    async with self._get_session().request(method, url, **kwargs) as resp:
+                        if resp.status in retry_statuses and attempt < retries:
+                            stats.retries += 1
+                            await asyncio.sleep(self._backoff(attempt))
+                            continue
+                        resp.raise_for_status()
+                        return await read(resp)
+
+                except retry_errors:
+                    if attempt >= retries:
+                        raise
+                    stats.retries += 1
+                    await asyncio.sleep(self._backoff(attempt))
+
+            raise RuntimeError("unreachable")  # pragma: no cover
+
+        except Exception:
+            stats.failures += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            stats.in_flight -= 1
+            stats.total_latency_sec += elapsed
+            stats.max_latency_sec = max(stats.max_latency_sec, elapsed)
+
+    async def stream_lines(
+        self,
+        method: str,
+        url: str,
+        json: Optional[Dict[str, Any]] = None,
+        timeout_sec: Optional[float] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        줄 단위 스트리밍 응답 (NDJSON 등)
+
+        첫 바이트 이후 실패는 재시도할 수 없으므로 재시도하지 않음
+        """
+        host = urlsplit(url).netloc
+        stats = self._hosts.setdefault(host, HostStats())
+        timeout = aiohttp.ClientTimeout(total=timeout_sec) if timeout_sec else None
+
+        stats.requests += 1
+        stats.in_flight += 1
+        started = time.perf_counter()
+        try:
+            kwargs: Dict[str, Any] = {}
+            if json is not None:
+                kwargs["json"] = json
+            if timeout is not None:
+                kwargs["timeout"] = timeout
+
+            async with self._get_session().request(method, url, **kwargs) as resp:
+                resp.raise_for_status()
+                async for line in resp.content:
+                    line = line.strip()
+                    if line:
+                        yield line
+        except Exception:
+            stats.failures += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            stats.in_flight -= 1
+            stats.total_latency_sec += elapsed
+            stats.max_latency_sec = max(stats.max_latency_sec, elapsed)
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 설정 + 호스트별 통계"""
+        idle = 0
+        connector = self._session.connector if self._session and not self._session.closed else None
+        if connector is not None:
+            idle = sum(len(conns) for conns in getattr(connector, "_conns", {}).values())
+
+        return {
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "keepalive_sec": self.keepalive_sec,
+            "sessions_created": self.sessions_created,
+            "idle_connections": idle,
+            "hosts": {host: s.to_dict() for host, s in self._hosts.items()}
+        }
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+# 프로세스 전역 풀 (모든 모델 서버 클라이언트가 공유)
+_pool: Optional[HTTPPool] = None
+
+
+def get_http_pool() -> HTTPPool:
+    global _pool
+    if _pool is None:
+        _pool = HTTPPool()
+    return _pool
+
+
+async def close_http_pool() -> None:
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
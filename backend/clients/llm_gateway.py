@@ -0,0 +1,557 @@
+"""
+Gemini LLM 게이트웨이
+
+API 키별 클라이언트 풀을 하나로 관리
+- 키마다 전용 GenerativeServiceClient를 붙인 모델 객체를 재사용
+  (프로세스 전역 genai.configure()를 호출하지 않으므로 동시 요청에도 안전)
+- 스트리밍 생성은 stream_model()로 같은 라우팅 / 속도 제한 / 쿨다운을 거친 키의 async 모델 사용
+- 키별 토큰 버킷으로 요청 속도 제한
+- 429 / 쿼터 초과 오류가 난 키는 일정 시간 쿨다운
+- 쿨다운이 아닌 키 중 처리 중인 요청이 가장 적은 키로 라우팅
+- 키별 요청 수 / 오류 / 지연 통계
+- cache=True인 호출은 응답 텍스트를 LLM 응답 캐시(utils/llm_cache.py)에서 재사용
+- deadline_sec를 준 호출은 마감 시간 안에서만 기다리고, 모델의 최근 p95 지연이 지나도
+  응답이 없으면 다른 키(또는 헤지 모델)로 같은 요청을 한 번 더 보내 먼저 온 응답을 사용 (헤지)
+  → 마감을 넘기면 LLMDeadlineExceeded, 호출자는 규칙 기반 결과로 대체
+
+환경 변수:
+    GEMINI_API_KEY1 ~ 3, GEMINI_API_KEY: 사용할 API 키
+    LLM_KEY_RPM: 키별 분당 요청 수 상한 (기본: 30)
+    LLM_KEY_COOLDOWN_SEC: 429 / 쿼터 오류 후 키 쿨다운 (기본: 60)
+    LLM_KEY_MAX_WAIT_SEC: 사용할 키가 없을 때 기다릴 최대 시간 (기본: 10)
+    LLM_HEDGE_ENABLED: false면 헤지 요청을 보내지 않음 (기본: true)
+    LLM_HEDGE_MODEL: 키가 1개일 때 헤지에 쓸 모델 (기본: 없음 → 키가 1개면 헤지 안 함)
+    LLM_HEDGE_DEFAULT_DELAY_MS: 지연 샘플이 적을 때 헤지까지 기다릴 시간 (기본: 3000)
+    LLM_HEDGE_MIN_DELAY_MS: 헤지 대기 시간 하한 (기본: 500)
+    GEMINI_API_ENDPOINT: Gemini API 대신 호출할 REST 엔드포인트
+        (예: http://localhost:8090, scripts/mock_model_server.py로 부하 테스트할 때)
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
+
+from utils.latency import LatencyRecorder
+from utils.llm_cache import LLMResponseCache, get_llm_cache, llm_cache_key
+
+
+def gemini_client_options(api_key: str) -> Tuple[Dict[str, Any], Optional[str]]:
+    """
+    GenerativeServiceClient 생성 인자 (client_options, transport)
+
+    GEMINI_API_ENDPOINT가 있으면 그 주소로 REST 호출 (목 서버 / 프록시)
+    """
+    options: Dict[str, Any] = {"api_key": api_key}
+    endpoint = os.getenv("GEMINI_API_ENDPOINT")
+    if not endpoint:
+        return options, None
+    options["api_endpoint"] = endpoint
+    return options, "rest"
+
+
+def get_gemini_api_keys() -> List[str]:
+    """환경변수에서 사용 가능한 모든 Gemini API 키 (GEMINI_API_KEY1 ~ 3, 레거시 GEMINI_API_KEY)"""
+    keys = []
+    for i in range(1, 4):
+        key = os.getenv(f"GEMINI_API_KEY{i}")
+        if key:
+            keys.append(key)
+    legacy_key = os.getenv("GEMINI_API_KEY")
+    if legacy_key and legacy_key not in keys:
+        keys.append(legacy_key)
+    return keys
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """429 / 쿼터 초과 오류 여부 (google.api_core.exceptions.ResourceExhausted 등)"""
+    if getattr(error, "code", None) == 429 or type(error).__name__ == "ResourceExhausted":
+        return True
+    message = str(error).lower()
+    return "429" in message or "quota" in message or "resource exhausted" in message
+
+
+class CachedResponse:
+    """캐시에서 꺼낸 응답 (GenerateContentResponse처럼 .text로 사용)"""
+
+    cached = True
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class NoAvailableKeyError(RuntimeError):
+    """모든 키가 쿨다운 중이거나 속도 제한에 걸려 max_wait 안에 요청할 수 없음"""
+
+
+class LLMDeadlineExceeded(TimeoutError):
+    """deadline_sec 안에 응답(헤지 요청 포함)을 받지 못함"""
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷 (rate_per_sec로 충전, capacity까지 버스트 허용)"""
+
+    def __init__(self, rate_per_sec: float, capacity: float):
+        self.rate_per_sec = rate_per_sec
+        self.capacity = capacity
+        self.tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate_per_sec)
+        self._updated = now
+
+    def available(self) -> float:
+        with self._lock:
+            self._refill()
+            return self.tokens
+
+    def try_acquire(self) -> float:
+        """토큰 1개 사용 시도 → 성공하면 0, 실패하면 다음 토큰까지 남은 초"""
+        with self._lock:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate_per_sec
+
+
+class KeySlot:
+    """API 키 1개의 상태 (모델 객체, 속도 제한, 쿨다운, 통계)"""
+
+    def __init__(self, index: int, api_key: str, rpm: float):
+        self.index = index
+        self.api_key = api_key
+        self.bucket = TokenBucket(rate_per_sec=rpm / 60.0, capacity=max(1.0, rpm / 6.0))
+        self.cooldown_until = 0.0
+        self.in_flight = 0
+        self.requests = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self._models: Dict[str, Any] = {}
+        self._async_models: Dict[str, Any] = {}
+        self._client = None
+        self._async_client = None
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return f"key{self.index}"
+
+    def cooling_down(self, now: Optional[float] = None) -> bool:
+        return (now or time.monotonic()) < self.cooldown_until
+
+    def model(self, model_name: str) -> Any:
+        """이 키 전용 클라이언트를 붙인 GenerativeModel (모델 이름별 1개, 재사용)"""
+        with self._lock:
+            model = self._models.get(model_name)
+            if model is None:
+                import google.generativeai as genai
+                from google.ai import generativelanguage as glm
+
+                if self._client is None:
+                    options, transport = gemini_client_options(self.api_key)
+                    self._client = glm.GenerativeServiceClient(client_options=options, transport=transport)
+                model = genai.GenerativeModel(model_name)
+                # generate_content는 _client가 비어 있을 때만 전역 기본 클라이언트를 사용
+                model._client = self._client
+                self._models[model_name] = model
+            return model
+
+    def async_model(self, model_name: str) -> Any:
+        """이 키 전용 async 클라이언트를 붙인 GenerativeModel (generate_content_async용)"""
+        with self._lock:
+            model = self._async_models.get(model_name)
+            if model is None:
+                import google.generativeai as genai
+                from google.ai import generativelanguage as glm
+
+                if self._async_client is None:
+                    options, transport = gemini_client_options(self.api_key)
+                    self._async_client = glm.GenerativeServiceAsyncClient(
+                        client_options=options, transport=transport
+                    )
+                model = genai.GenerativeModel(model_name)
+                # generate_content_async도 _async_client가 비어 있을 때만 전역 기본 클라이언트를 사용
+                model._async_client = self._async_client
+                self._async_models[model_name] = model
+            return model
+
+
+class LLMGateway:
+    """
+    키별 클라이언트 풀 + 라우팅 + 속도 제한
+
+    generate_content()는 블로킹 호출이므로 async 코드에서는
+    llm_executor.run(gateway.generate_content, ...)처럼 스레드에서 실행
+    """
+
+    def __init__(
+        self,
+        api_keys: Optional[Sequence[str]] = None,
+        rpm: Optional[float] = None,
+        cooldown_sec: Optional[float] = None,
+        max_wait_sec: Optional[float] = None,
+        cache: Optional[LLMResponseCache] = None
+    ):
+        self.cache = cache or get_llm_cache()
+        keys = list(api_keys) if api_keys is not None else get_gemini_api_keys()
+        rpm = rpm or float(os.getenv("LLM_KEY_RPM", "30"))
+        self.cooldown_sec = cooldown_sec or float(os.getenv("LLM_KEY_COOLDOWN_SEC", "60"))
+        self.max_wait_sec = max_wait_sec if max_wait_sec is not None else float(
+            os.getenv("LLM_KEY_MAX_WAIT_SEC", "10")
+        )
+        self.slots = [KeySlot(i + 1, key, rpm) for i, key in enumerate(keys)]
+        self.latency = LatencyRecorder(window=200)
+        self._lock = threading.Lock()
+        self._next = 0
+
+        self.hedge_enabled = os.getenv("LLM_HEDGE_ENABLED", "true").lower() == "true"
+        self.hedge_model_name = os.getenv("LLM_HEDGE_MODEL") or None
+        self.hedge_default_delay_sec = float(os.getenv("LLM_HEDGE_DEFAULT_DELAY_MS", "3000")) / 1000
+        self.hedge_min_delay_sec = float(os.getenv("LLM_HEDGE_MIN_DELAY_MS", "500")) / 1000
+        self.hedge_min_samples = 20
+        # 마감 시간이 있는 호출 전용 스레드 (마감을 넘긴 호출은 스레드에서 끝까지 실행되고 결과는 버림)
+        self._pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="llm-hedge")
+        self._policy: Dict[str, Dict[str, int]] = {}
+
+    @property
+    def has_keys(self) -> bool:
+        return bool(self.slots)
+
+    def _pick(self, exclude: set) -> Optional[KeySlot]:
+        """
+        쿨다운이 아니고 토큰이 있는 키 중 처리 중인 요청이 가장 적은 키 (동률이면 순환)
+
+        Returns:
+            선택한 키 (in_flight 증가됨), 지금 쓸 수 있는 키가 없으면 None
+        """
+        with self._lock:
+            now = time.monotonic()
+            candidates = [s for s in self.slots if s.index not in exclude and not s.cooling_down(now)]
+            # 순환 시작점을 옮겨 동률일 때 항상 키 #1부터 쓰지 않도록
+            start = self._next % max(1, len(self.slots))
+            candidates.sort(key=lambda s: (s.in_flight, (s.index - 1 - start) % len(self.slots)))
+            for slot in candidates:
+                if slot.bucket.try_acquire() == 0.0:
+                    slot.in_flight += 1
+                    slot.requests += 1
+                    self._next = slot.index
+                    return slot
+            return None
+
+    def _wait_hint(self, exclude: set) -> Optional[float]:
+        """제외되지 않은 키 중 가장 빨리 쓸 수 있게 되는 시간 (초)"""
+        now = time.monotonic()
+        waits = []
+        for slot in self.slots:
+            if slot.index in exclude:
+                continue
+            cooldown = max(0.0, slot.cooldown_until - now)
+            refill = max(0.0, (1 - slot.bucket.available()) / slot.bucket.rate_per_sec)
+            waits.append(max(cooldown, refill))
+        return min(waits) if waits else None
+
+    def _acquire(self, exclude: set, deadline: float) -> KeySlot:
+        while True:
+            slot = self._pick(exclude)
+            if slot is not None:
+                return slot
+            wait = self._wait_hint(exclude)
+            if wait is None or time.monotonic() + wait > deadline:
+                raise NoAvailableKeyError("All Gemini API keys are rate limited or cooling down.")
+            time.sleep(min(max(wait, 0.01), 1.0))
+
+    def generate_content(
+        self,
+        contents: Any,
+        model_name: Optional[str] = None,
+        cache: bool = False,
+        cache_ttl_sec: Optional[float] = None,
+        deadline_sec: Optional[float] = None,
+        operation: Optional[str] = None,
+        **kwargs: Any
+    ) -> Any:
+        """
+        GenerativeModel.generate_content와 같은 인자로 호출
+
+        실패하면 아직 시도하지 않은 다른 키로 재시도 (키마다 최대 1회),
+        429 / 쿼터 오류가 난 키는 cooldown_sec 동안 라우팅에서 제외
+
+        Args:
+            cache: True면 hash(model, prompt, config)로 응답 텍스트 캐시
+                (문자열 프롬프트만, LLM_CACHE_ENABLED=false면 우회)
+            cache_ttl_sec: 캐시 TTL (None이면 LLM_CACHE_TTL_SEC)
+            deadline_sec: 응답을 기다릴 최대 시간 (헤지 요청 포함, None이면 제한 없음)
+            operation: 헤지 / 대체 통계용 호출 종류 (예: "feedback")
+
+        Returns:
+            GenerateContentResponse, 캐시 히트면 CachedResponse (.text만 제공)
+
+        Raises:
+            NoAvailableKeyError: 키가 없거나 max_wait_sec 안에 쓸 수 있는 키가 없음
+            LLMDeadlineExceeded: deadline_sec 안에 응답이 없음
+            Exception: 모든 키가 실패한 경우 마지막 오류
+        """
+        if not self.slots:
+            raise NoAvailableKeyError("No Gemini API keys found in environment variables.")
+
+        model_name = model_name or os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
+
+        cache_key = None
+        if cache and isinstance(contents, str):
+            cache_key = llm_cache_key(model_name, contents, kwargs.get("generation_config"))
+            cached_text = self.cache.get(cache_key)
+            if cached_text is not None:
+                return CachedResponse(cached_text)
+
+        if deadline_sec is not None:
+            response = self._generate_with_deadline(
+                contents, model_name, deadline_sec, operation or model_name, **kwargs
+            )
+        else:
+            response = self._generate_uncached(contents, model_name, **kwargs)
+        if cache_key is not None:
+            try:
+                self.cache.put(cache_key, model_name, response.text, ttl_sec=cache_ttl_sec)
+            except ValueError:
+                # 안전 필터 등으로 텍스트가 없는 응답은 캐시하지 않음
+                pass
+        return response
+
+    @asynccontextmanager
+    async def stream_model(self, model_name: Optional[str] = None) -> AsyncIterator[Any]:
+        """
+        스트리밍 생성용 키 1개 점유 (키 선택 / 속도 제한 / 429 쿨다운은 generate_content와 같음)
+
+        첫 청크 이후에는 다른 키로 재시도할 수 없으므로 실패는 그대로 전달
+
+        Yields:
+            이 키 전용 async 클라이언트를 붙인 GenerativeModel (generate_content_async(stream=True)용)
+
+        Raises:
+            NoAvailableKeyError: 키가 없거나 max_wait_sec 안에 쓸 수 있는 키가 없음
+        """
+        if not self.slots:
+            raise NoAvailableKeyError("No Gemini API keys found in environment variables.")
+
+        model_name = model_name or os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
+        deadline = time.monotonic() + self.max_wait_sec
+        while True:
+            slot = self._pick(set())
+            if slot is not None:
+                break
+            wait = self._wait_hint(set())
+            if wait is None or time.monotonic() + wait > deadline:
+                raise NoAvailableKeyError("All Gemini API keys are rate limited or cooling down.")
+            # 이벤트 루프를 막지 않고 대기
+            await asyncio.sleep(min(max(wait, 0.01), 1.0))
+
+        try:
+            yield slot.async_model(model_name)
+        except Exception as e:
+            slot.errors += 1
+            if is_rate_limit_error(e):
+                slot.rate_limited += 1
+                slot.cooldown_until = time.monotonic() + self.cooldown_sec
+                print(f"⚠️ Gemini {slot.name} rate limited, cooling down {self.cooldown_sec:.0f}s")
+            raise
+        finally:
+            with self._lock:
+                slot.in_flight -= 1
+
+    def forget(self, contents: Any, model_name: Optional[str] = None, **kwargs: Any) -> None:
+        """generate_content(cache=True)로 캐시된 응답 삭제 (같은 인자로 호출)"""
+        if isinstance(contents, str):
+            model_name = model_name or os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
+            self.cache.delete(llm_cache_key(model_name, contents, kwargs.get("generation_config")))
+
+    def _policy_stats(self, operation: str) -> Dict[str, int]:
+        """호출 종류별 헤지 / 마감 / 대체 카운터 (락 보유 상태에서 호출)"""
+        return self._policy.setdefault(
+            operation, {"calls": 0, "hedged": 0, "hedge_won": 0, "deadline_exceeded": 0, "fallbacks": 0}
+        )
+
+    def record_fallback(self, operation: str) -> None:
+        """호출자가 LLM 응답 대신 규칙 기반 / 기본 결과를 사용함"""
+        with self._lock:
+            self._policy_stats(operation)["fallbacks"] += 1
+
+    def hedge_delay_sec(self, model_name: str) -> float:
+        """헤지 요청까지 기다릴 시간 (모델의 최근 p95, 샘플이 적으면 기본값)"""
+        if self.latency.count(model_name) < self.hedge_min_samples:
+            return self.hedge_default_delay_sec
+        return max(self.hedge_min_delay_sec, self.latency.percentile(model_name, 0.95) / 1000)
+
+    def _hedge_target(self, model_name: str, primary_index: Optional[int]) -> Optional[Tuple[str, set]]:
+        """헤지 요청의 (모델, 제외할 키) — 다른 키가 있으면 다른 키, 없으면 헤지 모델"""
+        if len(self.slots) > 1 and primary_index is not None:
+            return self.hedge_model_name or model_name, {primary_index}
+        if self.hedge_model_name and self.hedge_model_name != model_name:
+            return self.hedge_model_name, set()
+        return None
+
+    def _generate_with_deadline(
+        self,
+        contents: Any,
+        model_name: str,
+        deadline_sec: float,
+        operation: str,
+        **kwargs: Any
+    ) -> Any:
+        """
+        마감 시간 안에서 생성 (p95가 지나도 응답이 없으면 헤지 요청 1회, 먼저 온 응답 사용)
+
+        블로킹 SDK 호출은 취소할 수 없으므로 늦은 요청은 스레드에서 끝나고 결과만 버림
+        """
+        with self._lock:
+            stats = self._policy_stats(operation)
+            stats["calls"] += 1
+
+        deadline = time.monotonic() + deadline_sec
+        primary: Dict[str, int] = {}
+        futures: Dict[Future, str] = {
+            self._pool.submit(
+                self._generate_uncached, contents, model_name,
+                on_slot=lambda slot: primary.setdefault("index", slot.index), **kwargs
+            ): "primary"
+        }
+        hedge_at = time.monotonic() + self.hedge_delay_sec(model_name) if self.hedge_enabled else None
+        last_error: Optional[Exception] = None
+
+        while futures:
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            wait_until = deadline if hedge_at is None else min(deadline, hedge_at)
+            done, _ = wait(list(futures), timeout=max(0.0, wait_until - now), return_when=FIRST_COMPLETED)
+            for future in done:
+                kind = futures.pop(future)
+                try:
+                    response = future.result()
+                except Exception as e:
+                    last_error = e
+                    continue
+                if kind == "hedge":
+                    with self._lock:
+                        stats["hedge_won"] += 1
+                return response
+
+            if hedge_at is not None and time.monotonic() >= hedge_at and futures:
+                hedge_at = None
+                target = self._hedge_target(model_name, primary.get("index"))
+                if target is not None:
+                    hedge_model, exclude = target
+                    with self._lock:
+                        stats["hedged"] += 1
+                    futures[self._pool.submit(
+                        self._generate_uncached, contents, hedge_model, exclude=exclude, **kwargs
+                    )] = "hedge"
+
+        if not futures and last_error is not None:
+            # 마감 전에 모든 요청이 실패
+            raise last_error
+        with self._lock:
+            stats["deadline_exceeded"] += 1
+        print(f"⚠️ Gemini {operation} deadline exceeded ({deadline_sec:.1f}s)")
+        raise LLMDeadlineExceeded(f"{operation}: no response within {deadline_sec:.1f}s")
+
+    def _generate_uncached(
+        self,
+        contents: Any,
+        model_name: str,
+        exclude: Optional[set] = None,
+        on_slot: Optional[Callable[[KeySlot], Any]] = None,
+        **kwargs: Any
+    ) -> Any:
+        deadline = time.monotonic() + self.max_wait_sec
+        tried: set = set(exclude or ())
+        last_error: Optional[Exception] = None
+
+        while len(tried) < len(self.slots):
+            try:
+                slot = self._acquire(tried, deadline)
+            except NoAvailableKeyError:
+                if last_error is not None:
+                    raise last_error
+                raise
+            tried.add(slot.index)
+            if on_slot is not None:
+                on_slot(slot)
+
+            started = time.perf_counter()
+            try:
+                response = slot.model(model_name).generate_content(contents, **kwargs)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                self.latency.record(slot.name, elapsed_ms)
+                self.latency.record(model_name, elapsed_ms)
+                return response
+            except Exception as e:
+                last_error = e
+                slot.errors += 1
+                if is_rate_limit_error(e):
+                    slot.rate_limited += 1
+                    slot.cooldown_until = time.monotonic() + self.cooldown_sec
+                    print(f"⚠️ Gemini {slot.name} rate limited, cooling down {self.cooldown_sec:.0f}s")
+                else:
+                    print(f"⚠️ Gemini {slot.name} failed: {str(e)[:200]}")
+            finally:
+                with self._lock:
+                    slot.in_flight -= 1
+
+        raise last_error or RuntimeError("All Gemini API keys failed.")
+
+    def policy_stats(self) -> Dict[str, Any]:
+        """호출 종류별 헤지 / 마감 초과 / 대체 비율"""
+        with self._lock:
+            snapshot = {name: dict(values) for name, values in self._policy.items()}
+        for values in snapshot.values():
+            calls = values["calls"]
+            values["hedge_rate"] = round(values["hedged"] / calls, 3) if calls else 0.0
+            values["fallback_rate"] = round(values["fallbacks"] / calls, 3) if calls else 0.0
+        return snapshot
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        latency = self.latency.summary()
+        return {
+            "keys": {
+                slot.name: {
+                    "in_flight": slot.in_flight,
+                    "requests": slot.requests,
+                    "errors": slot.errors,
+                    "rate_limited": slot.rate_limited,
+                    "cooldown_remaining_sec": round(max(0.0, slot.cooldown_until - now), 1),
+                    "tokens": round(slot.bucket.available(), 2),
+                    "models": sorted(slot._models),
+                    "latency": latency.get(slot.name)
+                }
+                for slot in self.slots
+            },
+            "models": {name: value for name, value in latency.items() if not name.startswith("key")},
+            "hedge_delay_ms": {
+                name: round(self.hedge_delay_sec(name) * 1000)
+                for name in latency if not name.startswith("key")
+            },
+            "policy": self.policy_stats(),
+            "cache": self.cache.stats()
+        }
+
+
+# 프로세스 전역 게이트웨이 (모든 Gemini 호출 지점이 공유)
+_gateway: Optional[LLMGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway() -> LLMGateway:
+    global _gateway
+    if _gateway is None:
+        with _gateway_lock:
+            if _gateway is None:
+                _gateway = LLMGateway()
+    return _gateway
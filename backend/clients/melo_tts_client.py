@@ -7,10 +7,72 @@ Melo TTS 클라이언트
 """
 
 import os
+import json
 import uuid
 import aiohttp
-from typing import Optional
-from clients.base import TTSClient
+from typing import Optional, Dict, Any, AsyncIterator
+from clients.base import TTSClient, check_http_health
+from clients.http_pool import get_http_pool
+
+
+async def stream_from_tts_server(
+    client: TTSClient,
+    text: str,
+    speaker: str,
+    speed: float
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    TTS 서버의 /tts/stream (NDJSON) 호출
+
+    스트리밍을 지원하지 않는 서버(404)면 문장 단위 synthesize()로 대체
+    """
+    try:
+        async for line in get_http_pool().stream_lines(
+            "POST",
+            f"{client.base_url}/tts/stream",
+            json={"text": text, "speaker": speaker, "speed": speed}
+        ):
+            event = json.loads(line)
+            if event.get("error"):
+                raise RuntimeError(f"TTS stream failed: {event['error']}")
+            if "audio_url" in event:
+                yield event
+        return
+    except aiohttp.ClientResponseError as e:
+        if e.status != 404:
+            raise
+
+    async for event in TTSClient.synthesize_stream(client, text, speaker=speaker, speed=speed):
+        yield event
+
+
+async def fetch_audio_from_tts_server(
+    client: TTSClient,
+    text: str,
+    speaker: str,
+    speed: float,
+    codec: Optional[str] = None,
+    bitrate_kbps: Optional[int] = None
+) -> Dict[str, Any]:
+    """TTS 서버의 /tts/audio 호출 (압축 오디오를 응답 본문으로 받음)"""
+    payload: Dict[str, Any] = {"text": text, "speaker": speaker, "speed": speed}
+    if codec:
+        payload["format"] = codec
+    if bitrate_kbps:
+        payload["bitrate_kbps"] = bitrate_kbps
+
+    audio, headers = await get_http_pool().request_bytes(
+        "POST",
+        f"{client.base_url}/tts/audio",
+        json=payload
+    )
+    bitrate = headers.get("X-Audio-Bitrate-Kbps")
+    return {
+        "audio": audio,
+        "content_type": headers.get("Content-Type", "application/octet-stream"),
+        "codec": headers.get("X-Audio-Codec", codec or ""),
+        "bitrate_kbps": int(bitrate) if bitrate else None
+    }
 
 
 class MeloTTSLocalClient(TTSClient):
@@ -21,6 +83,7 @@ class MeloTTSLocalClient(TTSClient):
 
     환경 변수:
         MELO_TTS_BASE_URL: Melo TTS 서버 URL (기본: http://localhost:8001)
+        MELO_TTS_MODEL_VERSION: 모델 버전 (TTS 캐시 키, 기본: melotts-kr)
     """
 
     def __init__(self, base_url: Optional[str] = None):
@@ -28,6 +91,10 @@ class MeloTTSLocalClient(TTSClient):
             "MELO_TTS_BASE_URL",
             "http://localhost:8001"
         )
+        self.model_version = os.getenv("MELO_TTS_MODEL_VERSION", "melotts-kr")
+
+    async def health_check(self) -> Dict[str, Any]:
+        return await check_http_health(self.base_url)
 
     async def synthesize(
         self,
@@ -48,18 +115,35 @@ class MeloTTSLocalClient(TTSClient):
         Returns:
             생성된 음성 파일 URL
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.base_url}/tts",
-                json={
-                    "text": text,
-                    "speaker": speaker,
-                    "speed": speed
-                }
-            ) as resp:
-                resp.raise_for_status()
-                result = await resp.json()
-                return result.get("audio_url", "")
+        result = await get_http_pool().request_json(
+            "POST",
+            f"{self.base_url}/tts",
+            json={
+                "text": text,
+                "speaker": speaker,
+                "speed": speed
+            }
+        )
+        return result.get("audio_url", "")
+
+    async def synthesize_stream(
+        self,
+        text: str,
+        speaker: str = "KR",
+        speed: float = 1.0
+    ) -> AsyncIterator[Dict[str, Any]]:
+        async for event in stream_from_tts_server(self, text, speaker, speed):
+            yield event
+
+    async def synthesize_audio(
+        self,
+        text: str,
+        speaker: str = "KR",
+        speed: float = 1.0,
+        codec: Optional[str] = None,
+        bitrate_kbps: Optional[int] = None
+    ) -> Dict[str, Any]:
+        return await fetch_audio_from_tts_server(self, text, speaker, speed, codec, bitrate_kbps)
 
 
 class MeloTTSA6000Client(TTSClient):
@@ -70,12 +154,17 @@ class MeloTTSA6000Client(TTSClient):
 
     환경 변수:
         A6000_TTS_URL: A6000 TTS 서버 URL (예: http://a6000-server:8004)
+        A6000_TTS_MODEL_VERSION: 모델 버전 (TTS 캐시 키, 기본: melotts-kr-a6000)
     """
 
     def __init__(self, base_url: Optional[str] = None):
         self.base_url = base_url or os.getenv("A6000_TTS_URL")
         if not self.base_url:
             raise ValueError("A6000_TTS_URL is required")
+        self.model_version = os.getenv("A6000_TTS_MODEL_VERSION", "melotts-kr-a6000")
+
+    async def health_check(self) -> Dict[str, Any]:
+        return await check_http_health(self.base_url)
 
     async def synthesize(
         self,
@@ -96,15 +185,32 @@ class MeloTTSA6000Client(TTSClient):
         Returns:
             생성된 음성 파일 URL
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.base_url}/tts",
-                json={
-                    "text": text,
-                    "speaker": speaker,
-                    "speed": speed
-                }
-            ) as resp:
-                resp.raise_for_status()
-                result = await resp.json()
-                return result.get("audio_url", "")
+        result = await get_http_pool().request_json(
+            "POST",
+            f"{self.base_url}/tts",
+            json={
+                "text": text,
+                "speaker": speaker,
+                "speed": speed
+            }
+        )
+        return result.get("audio_url", "")
+
+    async def synthesize_stream(
+        self,
+        text: str,
+        speaker: str = "KR",
+        speed: float = 1.0
+    ) -> AsyncIterator[Dict[str, Any]]:
+        async for event in stream_from_tts_server(self, text, speaker, speed):
+            yield event
+
+    async def synthesize_audio(
+        self,
+        text: str,
+        speaker: str = "KR",
+        speed: float = 1.0,
+        codec: Optional[str] = None,
+        bitrate_kbps: Optional[int] = None
+    ) -> Dict[str, Any]:
+        return await fetch_audio_from_tts_server(self, text, speaker, speed, codec, bitrate_kbps)
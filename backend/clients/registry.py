@@ -0,0 +1,159 @@
+"""
+클라이언트 레지스트리
+
+STT / LLM / TTS 클라이언트를 앱 수명 동안 한 번만 생성해 재사용
+- main.py lifespan에서 start() / close() 호출
+- 라우터는 Depends(get_stt) 등으로 주입받음
+- USE_A6000_MODELS 값에 따라 clients 팩토리가 구현체를 고르므로
+  환경 변수만 바꾸고 재시작하면 로컬 ↔ A6000 전환
+"""
+
+import asyncio
+import os
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import HTTPException, Request, status
+
+from clients.base import BaseClient, STTClient, LLMClient, TTSClient
+from clients.http_pool import get_http_pool
+from clients.llm_gateway import get_llm_gateway
+from utils.bounded_executor import llm_executor
+
+
+class ClientRegistry:
+    """
+    앱 수명 동안 공유되는 모델 클라이언트 모음
+
+    생성에 실패한 클라이언트는 errors에 기록하고 나머지는 정상 동작
+    (예: GEMINI_API_KEY가 없어도 영상 분석 API는 살아있어야 함)
+    """
+
+    CLIENT_NAMES = ("stt", "llm", "tts")
+
+    def __init__(self, factories: Optional[Dict[str, Callable[[], BaseClient]]] = None):
+        if factories is None:
+            from clients import get_stt_client, get_llm_client, get_tts_client
+            factories = {
+                "stt": get_stt_client,
+                "llm": get_llm_client,
+                "tts": get_tts_client
+            }
+        self._factories = factories
+        self._clients: Dict[str, BaseClient] = {}
+        self.errors: Dict[str, str] = {}
+        self.backend = "a6000" if os.getenv("USE_A6000_MODELS", "false").lower() == "true" else "local"
+
+    async def start(self) -> None:
+        """
+        모든 클라이언트 생성
+
+        WhisperLocalClient 모델 로드처럼 블로킹 초기화가 있으므로 스레드에서 생성
+        """
+        for name in self.CLIENT_NAMES:
+            factory = self._factories.get(name)
+            if factory is None:
+                continue
+            try:
+                self._clients[name] = await asyncio.to_thread(factory)
+                print(f"✅ {name.upper()} 클라이언트 준비 완료: {type(self._clients[name]).__name__}")
+            except Exception as e:
+                self.errors[name] = str(e)
+                print(f"⚠️ {name.upper()} 클라이언트 생성 실패: {e}")
+
+    async def close(self) -> None:
+        """모든 클라이언트 리소스 정리 (앱 종료 시)"""
+        for name, client in list(self._clients.items()):
+            try:
+                await client.close()
+            except Exception as e:
+                print(f"⚠️ {name.upper()} 클라이언트 종료 실패: {e}")
+        self._clients.clear()
+
+    def get(self, name: str) -> BaseClient:
+        """
+        이름으로 클라이언트 조회
+
+        Raises:
+            RuntimeError: 생성되지 않았거나 생성에 실패한 경우
+        """
+        client = self._clients.get(name)
+        if client is None:
+            reason = self.errors.get(name, "not initialized")
+            raise RuntimeError(f"{name.upper()} client unavailable: {reason}")
+        return client
+
+    @property
+    def stt(self) -> STTClient:
+        return self.get("stt")
+
+    @property
+    def llm(self) -> LLMClient:
+        return self.get("llm")
+
+    @property
+    def tts(self) -> TTSClient:
+        return self.get("tts")
+
+    async def health(self) -> Dict[str, Any]:
+        """
+        클라이언트별 상태
+
+        Returns:
+            {"backend": "local" | "a6000", "clients": {"stt": {...}, ...}, "http_pool": {...}}
+        """
+        names = [name for name in self.CLIENT_NAMES if name in self._clients]
+        results = await asyncio.gather(
+            *(self._clients[name].health_check() for name in names),
+            return_exceptions=True
+        )
+
+        clients: Dict[str, Any] = {}
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                result = {"status": "error", "detail": str(result)}
+            clients[name] = {"client": type(self._clients[name]).__name__, **result}
+        for name, error in self.errors.items():
+            clients[name] = {"status": "error", "detail": error}
+
+        return {
+            "backend": self.backend,
+            "clients": clients,
+            "http_pool": get_http_pool().stats(),
+            "llm_executor": llm_executor.stats(),
+            "llm_gateway": get_llm_gateway().stats()
+        }
+
+
+# ==================== FastAPI 의존성 ====================
+
+def get_client_registry(request: Request) -> ClientRegistry:
+    """lifespan에서 app.state에 등록한 레지스트리"""
+    registry = getattr(request.app.state, "clients", None)
+    if registry is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Client registry not initialized"
+        )
+    return registry
+
+
+def _require(request: Request, name: str) -> BaseClient:
+    try:
+        return get_client_registry(request).get(name)
+    except RuntimeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
+
+
+def get_stt(request: Request) -> STTClient:
+    return _require(request, "stt")
+
+
+def get_llm(request: Request) -> LLMClient:
+    return _require(request, "llm")
+
+
+def get_tts(request: Request) -> TTSClient:
+    return _require(request, "tts")
@@ -8,11 +8,12 @@ Whisper STT 클라이언트
 
 import asyncio
 import os
-from typing import Optional
+from typing import Optional, Dict, Any
 
 import aiohttp
 
-from clients.base import STTClient
+from clients.base import STTClient, check_http_health
+from clients.http_pool import get_http_pool
 
 
 class WhisperLocalClient(STTClient):
@@ -31,6 +32,7 @@ class WhisperLocalClient(STTClient):
     ):
         self.model_size = model_size or os.getenv("WHISPER_LOCAL_MODEL", "base")
         self.device = device or os.getenv("WHISPER_LOCAL_DEVICE", "cpu")
+        self.model_tier = f"openai-whisper-{self.model_size}"
 
         try:
             import whisper  # type: ignore
@@ -56,13 +58,43 @@ class WhisperLocalClient(STTClient):
             language
         )
 
+    async def transcribe_with_segments(
+        self,
+        audio_path: str,
+        language: str = "ko"
+    ) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            None,
+            self._transcribe_raw,
+            audio_path,
+            language
+        )
+        return {
+            "text": result.get("text", "").strip(),
+            "segments": result.get("segments", [])
+        }
+
+    async def health_check(self) -> Dict[str, Any]:
+        return {
+            "status": "ok" if self._whisper is not None else "error",
+            "model": self.model_tier,
+            "device": self.device
+        }
+
+    async def close(self) -> None:
+        self._whisper = None
+
     def _transcribe_sync(self, audio_path: str, language: str) -> str:
-        result = self._whisper.transcribe(
+        result = self._transcribe_raw(audio_path, language)
+        return result.get("text", "").strip()
+
+    def _transcribe_raw(self, audio_path: str, language: str) -> Dict[str, Any]:
+        return self._whisper.transcribe(
             audio_path,
             language=language,
             fp16=self._use_fp16
         )
-        return result.get("text", "").strip()
 
 
 class WhisperA6000Client(STTClient):
@@ -73,12 +105,17 @@ class WhisperA6000Client(STTClient):
 
     환경 변수:
         A6000_STT_URL: A6000 STT 서버 URL (예: http://a6000-server:8002)
+        A6000_STT_MODEL: 서버 모델 이름 (기본: whisper-large-v3)
     """
 
     def __init__(self, base_url: Optional[str] = None):
         self.base_url = base_url or os.getenv("A6000_STT_URL")
         if not self.base_url:
             raise ValueError("A6000_STT_URL is required")
+        self.model_tier = f"a6000-{os.getenv('A6000_STT_MODEL', 'whisper-large-v3')}"
+
+    async def health_check(self) -> Dict[str, Any]:
+        return await check_http_health(self.base_url)
 
     async def transcribe(
         self,
@@ -95,21 +132,40 @@ class WhisperA6000Client(STTClient):
         Returns:
             변환된 텍스트
         """
-        async with aiohttp.ClientSession() as session:
-            with open(audio_path, "rb") as audio_file:
-                form = aiohttp.FormData()
-                form.add_field(
-                    "file",
-                    audio_file,
-                    filename=os.path.basename(audio_path),
-                    content_type="audio/wav"
-                )
-                form.add_field("language", language)
-
-                async with session.post(
-                    f"{self.base_url}/stt",
-                    data=form
-                ) as resp:
-                    resp.raise_for_status()
-                    result = await resp.json()
-                    return result.get("text", "")
+        result = await self.transcribe_with_segments(audio_path, language=language)
+        return result["text"]
+
+    async def transcribe_with_segments(
+        self,
+        audio_path: str,
+        language: str = "ko"
+    ) -> Dict[str, Any]:
+        """
+        A6000 서버의 Whisper로 텍스트 + segments 변환
+
+        서버가 segments를 주지 않으면 빈 리스트 반환
+        """
+        with open(audio_path, "rb") as audio_file:
+            audio_bytes = audio_file.read()
+
+        def build_form() -> aiohttp.FormData:
+            # FormData는 한 번 전송하면 재사용 불가 → 재시도마다 새로 생성
+            form = aiohttp.FormData()
+            form.add_field(
+                "file",
+                audio_bytes,
+                filename=os.path.basename(audio_path),
+                content_type="audio/wav"
+            )
+            form.add_field("language", language)
+            return form
+
+        result = await get_http_pool().request_json(
+            "POST",
+            f"{self.base_url}/stt",
+            data_factory=build_form
+        )
+        return {
+            "text": result.get("text", ""),
+            "segments": result.get("segments", [])
+        }
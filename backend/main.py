@@ -1,20 +1,56 @@
-from fastapi import FastAPI, Depends
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from database import get_db, engine
 from models import Base
+from clients.registry import ClientRegistry
+from clients.http_pool import close_http_pool
+from services.question_generator import pre_synthesize_main_questions
+from utils.latency import latency_metrics
+from utils.single_flight import single_flight
+from utils.structured_output import structured_output_metrics
+from utils.prompt_budget import prompt_size_metrics
+from utils.deadline import blocking_pool_stats
+import asyncio
 import uvicorn
 import os
 
 # Create tables on startup
 Base.metadata.create_all(bind=engine)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """STT/LLM/TTS 클라이언트를 앱 수명 동안 한 번만 생성하고 종료 시 정리"""
+    registry = ClientRegistry()
+    await registry.start()
+    app.state.clients = registry
+
+    # 고정 메인 질문 음성 미리 합성 (TTS 캐시 워밍업, 서버 시작은 막지 않음)
+    warmup_task = None
+    if os.getenv("TTS_WARMUP", "true").lower() == "true":
+        try:
+            warmup_task = asyncio.create_task(pre_synthesize_main_questions(registry.tts))
+        except RuntimeError as e:
+            print(f"⚠️ TTS 워밍업 생략: {e}")
+
+    try:
+        yield
+    finally:
+        if warmup_task and not warmup_task.done():
+            warmup_task.cancel()
+        await registry.close()
+        await close_http_pool()
+
+
 app = FastAPI(
     title="Interview Practice API",
     description="API for AI-powered interview practice application",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware - allow origins from environment variable
@@ -52,14 +88,54 @@ def health_check(db: Session = Depends(get_db)):
         return {"status": "unhealthy", "error": str(e)}
 
 
+@app.get("/health/clients")
+async def clients_health_check(request: Request):
+    """STT/LLM/TTS 클라이언트 상태 (모델 서버 연결 포함)"""
+    registry: ClientRegistry = request.app.state.clients
+    result = await registry.health()
+    healthy = all(c.get("status") == "ok" for c in result["clients"].values())
+    return {"status": "healthy" if healthy else "degraded", **result}
+
+
+@app.get("/health/latency")
+def latency_check():
+    """단계별 지연 시간 (p50 / p95, 최근 샘플 기준)"""
+    return latency_metrics.summary()
+
+
+@app.get("/health/single-flight")
+def single_flight_check():
+    """중복 요청 합치기 통계 (작업별 실행 / 합쳐진 요청 수)"""
+    return single_flight.stats()
+
+
+@app.get("/health/structured-output")
+def structured_output_check():
+    """프롬프트 종류별 LLM JSON 응답 파싱 통계 (ok / repaired / failed)"""
+    return structured_output_metrics.stats()
+
+
+@app.get("/health/prompt-sizes")
+def prompt_sizes_check():
+    """프롬프트 종류별 추정 토큰 수 / 압축으로 줄인 토큰 수"""
+    return prompt_size_metrics.stats()
+
+
+@app.get("/health/blocking-pool")
+def blocking_pool_check():
+    """마감 시간 블로킹 단계(Whisper 등) 전용 풀 상태 (버려진 작업 / 포화로 건너뛴 단계 수)"""
+    return blocking_pool_stats()
+
+
 # Include routers
-from routers import users, portfolios, job_postings, interviews, video_analysis
+from routers import users, portfolios, job_postings, interviews, video_analysis, voice_sessions
 
 app.include_router(users.router, prefix="/api/users", tags=["users"])
 app.include_router(portfolios.router, prefix="/api/portfolios", tags=["portfolios"])
 app.include_router(job_postings.router, prefix="/api/job-postings", tags=["job-postings"])
 app.include_router(interviews.router, prefix="/api/interviews", tags=["interviews"])
 app.include_router(video_analysis.router, prefix="/api/video", tags=["video-analysis"])
+app.include_router(voice_sessions.router, prefix="/api/voice", tags=["voice"])
 
 # Mount static files for uploaded portfolios
 uploads_dir = "uploads"
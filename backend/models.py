@@ -38,6 +38,8 @@ class Portfolio(Base):
     filename = Column(String, nullable=False)
     parsed_text = Column(Text)
     summary = Column(Text)
+    digest_json = Column(Text)  # 포트폴리오 다이제스트 JSON (기술 스택 / 프로젝트 / 요약, 프롬프트용)
+    digest_hash = Column(String)  # 다이제스트를 만든 parsed_text의 SHA-256
     created_at = Column(String, nullable=False, default=lambda: datetime.utcnow().isoformat())
 
     # Relationships
@@ -139,6 +141,9 @@ class InterviewTranscript(Base):
     video_id = Column(String, ForeignKey("interview_video.id", ondelete="CASCADE"), nullable=False)
     text = Column(Text, nullable=False)
     language = Column(String)
+    media_hash = Column(String, index=True)  # 원본 미디어 SHA-256 (STT 결과 재사용 키)
+    stt_model = Column(String)  # STT 모델 티어 (예: 'openai-whisper-base')
+    segments_json = Column(Text)  # Whisper segments JSON (start/end/text)
     created_at = Column(String, nullable=False, default=lambda: datetime.utcnow().isoformat())
 
     # Relationships
@@ -2,20 +2,16 @@ from pathlib import Path
 import re
 import whisper
 
-# Korean + English fillers
-FILLERS = [
-    "음", "어", "그", "저", "아", "뭐", "막",
-    "uh", "um", "erm", "like", "you know"
-]
+from pipeline.fillers import get_filler_matcher, detect_fillers
 
-def transcribe_whisper(wav_path: Path, model_size: str = "base"):
+def transcribe_whisper(wav_path: Path, model_size: str = "base", word_timestamps: bool = False):
     """
     Returns Whisper transcription dict with:
       - text
-      - segments (each has start/end/text)
+      - segments (each has start/end/text, plus words if word_timestamps=True)
     """
     model = whisper.load_model(model_size)
-    result = model.transcribe(str(wav_path))
+    result = model.transcribe(str(wav_path), word_timestamps=word_timestamps)
     return result
 
 def compute_wpm(transcript_text: str, duration_sec: float):
@@ -28,14 +24,7 @@ def compute_wpm(transcript_text: str, duration_sec: float):
 
 def compute_filler_count(transcript_text: str):
     """
-    Count filler occurrences using regex word boundaries where possible.
+    Count filler occurrences with the token-based multi-pattern matcher.
+    Korean fillers only match whole tokens ("어" but not "어떻게").
     """
-    text = transcript_text.lower()
-    count = 0
-    for f in FILLERS:
-        # Korean doesn't have strict word boundaries so simple count is ok
-        if re.search(r"[가-힣]", f):
-            count += text.count(f)
-        else:
-            count += len(re.findall(rf"\b{re.escape(f)}\b", text))
-    return count
+    return get_filler_matcher().count(transcript_text)
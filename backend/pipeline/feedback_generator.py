@@ -3,95 +3,79 @@ Gemini-based feedback generation
 AI를 활용한 면접 피드백 생성
 """
 import os
+import time
 from typing import Dict, List, Optional, Tuple
 from dotenv import load_dotenv
-import google.generativeai as genai
+
+from clients.llm_gateway import get_gemini_api_keys, get_llm_gateway  # get_gemini_api_keys: 하위 호환
 
 # .env 파일 로드
 load_dotenv()
 
+# Gemini 2.0 Flash 모델 사용 (가장 빠르고 효율적)
+FEEDBACK_MODEL = os.getenv("FEEDBACK_GEMINI_MODEL", "gemini-2.0-flash")
 
-def get_gemini_api_keys() -> List[str]:
-    """Get available Gemini API keys from environment variables"""
-    keys = []
-    for i in range(1, 4):  # GEMINI_API_KEY1, GEMINI_API_KEY2, GEMINI_API_KEY3
-        key = os.getenv(f"GEMINI_API_KEY{i}")
-        if key:
-            keys.append(key)
-    # 기존 GEMINI_API_KEY도 지원 (하위 호환성)
-    legacy_key = os.getenv("GEMINI_API_KEY")
-    if legacy_key and legacy_key not in keys:
-        keys.append(legacy_key)
-    return keys
+# 마감 시간 (초과하면 규칙 기반 피드백으로 대체, p95 이후 헤지 요청은 LLM 게이트웨이가 처리)
+FEEDBACK_DEADLINE_SEC = float(os.getenv("FEEDBACK_DEADLINE_SEC", "20"))
+ALERT_FEEDBACK_DEADLINE_SEC = float(os.getenv("ALERT_FEEDBACK_DEADLINE_SEC", "8"))
 
 
-def generate_feedback_with_gemini(metrics: Dict, transcript: str = "") -> List[str]:
+def generate_feedback_with_gemini(
+    metrics: Dict,
+    transcript: str = "",
+    use_cache: bool = True,
+    deadline_sec: Optional[float] = None
+) -> List[str]:
     """
     Generate interview feedback using Gemini API.
-    여러 API 키를 순차적으로 시도: GEMINI_API_KEY1 -> GEMINI_API_KEY2 -> GEMINI_API_KEY3
+    API 키 선택 / 속도 제한 / 429 쿨다운 / 응답 캐시는 LLM 게이트웨이가 처리 (clients/llm_gateway.py)
     
     Args:
         metrics: 분석 메트릭 딕셔너리
         transcript: 면접 답변 전사 텍스트 (선택)
+        use_cache: False면 LLM 응답 캐시를 우회
+        deadline_sec: 마감 시간 (요청의 남은 예산, None이면 FEEDBACK_DEADLINE_SEC)
     
     Returns:
         List of feedback strings in Korean
     """
-    api_keys = get_gemini_api_keys()
+    gateway = get_llm_gateway()
     
-    if not api_keys:
+    if not gateway.has_keys:
         print("⚠️ Gemini API 키가 없습니다. 규칙 기반 피드백을 사용합니다.")
         return generate_feedback_fallback(metrics)
     
-    # 프롬프트 구성 (한 번만)
     prompt = build_feedback_prompt(metrics, transcript)
     
-    # 각 API 키로 시도
-    for idx, api_key in enumerate(api_keys, 1):
-        try:
-            print(f"🤖 Gemini API 키 #{idx} 시도 중...")
-            genai.configure(api_key=api_key)
-            
-            # Gemini 2.0 Flash 모델 사용 (가장 빠르고 효율적)
-            # 사용 가능한 모델: gemini-2.0-flash, gemini-1.5-flash, gemini-1.5-pro
-            try:
-                model = genai.GenerativeModel('gemini-2.0-flash')
-            except Exception:
-                # Fallback to stable version
-                model = genai.GenerativeModel('gemini-1.5-flash')
-            
-            # API 호출
-            response = model.generate_content(prompt)
-            
-            # 응답 파싱
-            feedback_text = response.text.strip()
-            print(f"✅ API 키 #{idx} 성공!")
-            print(f"📝 Gemini 원본 응답 (처음 500자): {feedback_text[:500]}")
-            
-            feedback_list = parse_feedback_response(feedback_text)
-            print(f"✅ 파싱된 피드백 개수: {len(feedback_list)}")
-            
-            if len(feedback_list) == 0:
-                print("⚠️ 파싱된 피드백이 없습니다. 원본 응답을 그대로 사용합니다.")
-                return [feedback_text]
-            
-            return feedback_list
-            
-        except Exception as e:
-            print(f"⚠️ API 키 #{idx} 실패: {str(e)[:200]}")
-            # 마지막 키가 아니면 다음 키로 시도
-            if idx < len(api_keys):
-                print(f"   다음 API 키로 시도합니다...")
-                continue
-            else:
-                # 모든 키 실패
-                print(f"❌ 모든 API 키 시도 실패. 규칙 기반 피드백을 사용합니다.")
-                import traceback
-                print(f"마지막 에러 상세: {traceback.format_exc()}")
-                return generate_feedback_fallback(metrics)
-    
-    # 여기 도달하면 안 되지만 안전장치
-    return generate_feedback_fallback(metrics)
+    try:
+        response = gateway.generate_content(
+            prompt,
+            model_name=FEEDBACK_MODEL,
+            cache=use_cache,
+            deadline_sec=deadline_sec if deadline_sec is not None else FEEDBACK_DEADLINE_SEC,
+            operation="feedback"
+        )
+        
+        # 응답 파싱
+        feedback_text = response.text.strip()
+        print(f"📝 Gemini 원본 응답 (처음 500자): {feedback_text[:500]}")
+        
+        feedback_list = parse_feedback_response(feedback_text)
+        print(f"✅ 파싱된 피드백 개수: {len(feedback_list)}")
+        
+        if len(feedback_list) == 0:
+            print("⚠️ 파싱된 피드백이 없습니다. 원본 응답을 그대로 사용합니다.")
+            return [feedback_text]
+        
+        return feedback_list
+        
+    except Exception:
+        # 모든 키 실패 또는 마감 시간 초과
+        print(f"❌ Gemini 피드백 생성 실패(모든 키 실패 / 마감 초과). 규칙 기반 피드백을 사용합니다.")
+        import traceback
+        print(f"마지막 에러 상세: {traceback.format_exc()}")
+        gateway.record_fallback("feedback")
+        return generate_feedback_fallback(metrics)
 
 
 def build_feedback_prompt(metrics: Dict, transcript: str = "") -> str:
@@ -437,21 +421,27 @@ def detect_timeline_segments(timeline: List[Dict]) -> List[Dict]:
     return segments
 
 
-def generate_alert_feedback_with_gemini(segment: Dict) -> Optional[str]:
+def generate_alert_feedback_with_gemini(
+    segment: Dict,
+    use_cache: bool = True,
+    deadline_sec: Optional[float] = None
+) -> Optional[str]:
     """
     Generate natural language feedback for a timeline segment using Gemini.
     
     Args:
         segment: Segment dict with start_t, end_t, and severity (average smile value)
+        use_cache: False면 LLM 응답 캐시를 우회
+        deadline_sec: 마감 시간 (None이면 ALERT_FEEDBACK_DEADLINE_SEC)
     
     Returns:
         Natural language feedback string in Korean, or None if Gemini fails
     """
-    api_keys = get_gemini_api_keys()
+    gateway = get_llm_gateway()
     
     severity = segment.get("severity", 0.8)
     
-    if not api_keys:
+    if not gateway.has_keys:
         # Fallback to simple rule-based feedback
         return f"{segment['start_t']:.1f}초~{segment['end_t']:.1f}초 구간에서 웃음이 과도했습니다 (평균 미소 점수: {severity:.2f}). 자연스러운 표정을 유지하는 것이 좋습니다."
     
@@ -463,40 +453,43 @@ def generate_alert_feedback_with_gemini(segment: Dict) -> Optional[str]:
 
 피드백:"""
     
-    # Try each API key
-    for idx, api_key in enumerate(api_keys, 1):
-        try:
-            genai.configure(api_key=api_key)
-            
-            try:
-                model = genai.GenerativeModel('gemini-2.0-flash')
-            except Exception:
-                model = genai.GenerativeModel('gemini-1.5-flash')
-            
-            response = model.generate_content(prompt)
-            feedback_text = response.text.strip()
-            
-            # Clean up feedback (remove quotes, bullets, etc.)
-            feedback_text = feedback_text.lstrip('"\'•-*123456789.) ')
-            feedback_text = feedback_text.rstrip('"\'')
-            
-            if len(feedback_text) >= 5:  # Minimum length check
-                return feedback_text
-            
-        except Exception as e:
-            if idx < len(api_keys):
-                continue
-            # All keys failed, use fallback
-            break
+    try:
+        response = gateway.generate_content(
+            prompt,
+            model_name=FEEDBACK_MODEL,
+            cache=use_cache,
+            deadline_sec=deadline_sec if deadline_sec is not None else ALERT_FEEDBACK_DEADLINE_SEC,
+            operation="alert_feedback"
+        )
+        feedback_text = response.text.strip()
+        
+        # Clean up feedback (remove quotes, bullets, etc.)
+        feedback_text = feedback_text.lstrip('"\'•-*123456789.) ')
+        feedback_text = feedback_text.rstrip('"\'')
+        
+        if len(feedback_text) >= 5:  # Minimum length check
+            return feedback_text
+        
+    except Exception:
+        # All keys failed or deadline exceeded, use fallback
+        pass
     
     # Fallback
+    gateway.record_fallback("alert_feedback")
+    return _rule_based_alert_message(segment)
+
+
+def _rule_based_alert_message(segment: Dict) -> str:
     return f"{segment['start_t']:.1f}초~{segment['end_t']:.1f}초 구간에서 웃음이 과하다."
 
 
-def generate_alerts_from_timeline(timeline: List[Dict]) -> List[Dict]:
+def generate_alerts_from_timeline(timeline: List[Dict], time_budget_sec: Optional[float] = None) -> List[Dict]:
     """
     Generate alerts from timeline by detecting problematic segments and generating feedback.
     
+    time_budget_sec: Gemini 호출에 쓸 수 있는 전체 시간 (요청의 남은 예산),
+    다 쓰면 남은 구간은 규칙 기반 문구 사용
+    
     Returns list of alerts with:
     - start_t: start time in seconds
     - end_t: end time in seconds
@@ -505,9 +498,17 @@ def generate_alerts_from_timeline(timeline: List[Dict]) -> List[Dict]:
     """
     segments = detect_timeline_segments(timeline)
     alerts = []
+    stop_at = time.monotonic() + time_budget_sec if time_budget_sec is not None else None
     
     for segment in segments:
-        message = generate_alert_feedback_with_gemini(segment)
+        remaining = stop_at - time.monotonic() if stop_at is not None else None
+        if remaining is not None and remaining < 1.0:
+            message = _rule_based_alert_message(segment)
+        else:
+            message = generate_alert_feedback_with_gemini(
+                segment,
+                deadline_sec=min(ALERT_FEEDBACK_DEADLINE_SEC, remaining) if remaining is not None else None
+            )
         
         if message:
             alerts.append({
@@ -0,0 +1,184 @@
+"""
+Filler (채움말) detection engine.
+
+All filler phrases are compiled once into a single Aho-Corasick automaton over
+tokens, so the transcript is scanned in one pass regardless of lexicon size.
+Matching is token-based, which gives Korean fillers proper boundaries:
+"어" matches the token "어" (or an elongated "어어") but not "어떻게".
+"""
+import json
+import os
+import re
+from collections import deque
+from functools import lru_cache
+from math import ceil
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Korean + English fillers (default lexicon)
+FILLERS = [
+    "음", "어", "그", "저", "아", "뭐", "막",
+    "uh", "um", "erm", "like", "you know"
+]
+
+TOKEN_RE = re.compile(r"[\w가-힣']+")
+REPEATED_SYLLABLE_RE = re.compile(r"([가-힣])\1+")
+
+
+def _normalize_token(token: str) -> str:
+    """Collapse elongated single-syllable Korean tokens ("어어어" -> "어")."""
+    if REPEATED_SYLLABLE_RE.fullmatch(token):
+        return token[0]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens (Korean eojeol / English words), punctuation dropped."""
+    return [_normalize_token(t) for t in TOKEN_RE.findall(text.lower())]
+
+
+class FillerMatcher:
+    """
+    Aho-Corasick automaton whose alphabet is tokens instead of characters.
+
+    Multi-word fillers ("you know") are matched as token sequences; every
+    pattern is matched in a single left-to-right pass over the tokens.
+    """
+
+    def __init__(self, lexicon: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, str]]] = [[]]
+        self.lexicon: List[str] = []
+
+        for phrase in lexicon:
+            tokens = tokenize(phrase)
+            if not tokens:
+                continue
+            node = 0
+            for tok in tokens:
+                nxt = self._goto[node].get(tok)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                    self._goto[node][tok] = nxt
+                node = nxt
+            label = " ".join(tokens)
+            if (len(tokens), label) not in self._out[node]:
+                self._out[node].append((len(tokens), label))
+                self.lexicon.append(label)
+
+        self._build_fail_links()
+
+    def _build_fail_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for tok, child in self._goto[node].items():
+                f = self._fail[node]
+                while f and tok not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(tok, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+                queue.append(child)
+
+    def find(self, tokens: List[str]) -> List[Tuple[int, int, str]]:
+        """
+        Returns all filler matches as (start_token_idx, end_token_idx, filler).
+        """
+        matches = []
+        node = 0
+        for i, tok in enumerate(tokens):
+            while node and tok not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(tok, 0)
+            for length, label in self._out[node]:
+                matches.append((i - length + 1, i, label))
+        return matches
+
+    def count(self, text: str) -> int:
+        return len(self.find(tokenize(text)))
+
+
+def load_lexicon(path: Optional[str] = None) -> List[str]:
+    """
+    Load filler lexicon.
+    FILLER_LEXICON_PATH may point to a JSON list or a text file (one filler per line);
+    falls back to the built-in FILLERS.
+    """
+    path = path or os.getenv("FILLER_LEXICON_PATH")
+    if not path or not os.path.exists(path):
+        return list(FILLERS)
+
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+    if path.endswith(".json"):
+        return [str(x) for x in json.loads(content)]
+    return [line.strip() for line in content.splitlines() if line.strip() and not line.startswith("#")]
+
+
+@lru_cache(maxsize=4)
+def get_filler_matcher(path: Optional[str] = None) -> FillerMatcher:
+    """Compiled matcher for the configured lexicon (built once per process)."""
+    return FillerMatcher(load_lexicon(path))
+
+
+def timed_tokens(segments: List[Dict[str, Any]]) -> Tuple[List[str], List[float]]:
+    """
+    Flatten Whisper segments into tokens with start times.
+    Uses word timestamps when present, otherwise spreads the segment's
+    tokens evenly over [start, end].
+    """
+    tokens: List[str] = []
+    times: List[float] = []
+    for seg in segments:
+        words = seg.get("words")
+        if words:
+            for w in words:
+                for tok in tokenize(w.get("word", "")):
+                    tokens.append(tok)
+                    times.append(float(w.get("start", seg.get("start", 0.0))))
+            continue
+
+        seg_tokens = tokenize(seg.get("text", ""))
+        if not seg_tokens:
+            continue
+        start = float(seg.get("start", 0.0))
+        span = max(float(seg.get("end", start)) - start, 0.0)
+        step = span / len(seg_tokens)
+        for k, tok in enumerate(seg_tokens):
+            tokens.append(tok)
+            times.append(start + step * k)
+    return tokens, times
+
+
+def detect_fillers(
+    segments: List[Dict[str, Any]],
+    duration_sec: Optional[float] = None,
+    matcher: Optional[FillerMatcher] = None
+) -> Dict[str, Any]:
+    """
+    Detect fillers over Whisper segments.
+
+    Returns:
+      - count: total filler occurrences
+      - events: [{"t": sec, "filler": "음"}, ...]
+      - timeline: per-second filler counts (index = second)
+    """
+    matcher = matcher or get_filler_matcher()
+    tokens, times = timed_tokens(segments)
+
+    events = [
+        {"t": round(times[start], 2), "filler": label}
+        for start, _, label in matcher.find(tokens)
+    ]
+
+    last_t = times[-1] if times else 0.0
+    n_sec = int(ceil(max(duration_sec or 0.0, last_t + 1e-6)))
+    timeline = [0] * n_sec
+    for ev in events:
+        timeline[min(int(ev["t"]), n_sec - 1)] += 1
+
+    return {"count": len(events), "events": events, "timeline": timeline}
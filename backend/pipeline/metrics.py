@@ -70,6 +70,43 @@ def nod_count(timeline: List[Dict[str, Any]], pitch_thresh_deg: float = 8.0) ->
 
     return nods
 
+def metrics_by_speech_span(
+    timeline: List[Dict[str, Any]],
+    labels: List[str],
+    pitch_thresh_deg: float = 8.0
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Gaze / smile / nod metrics computed separately per speech span
+    (pre_answer / speaking / pause), given one label per frame.
+
+    - smile uses the whole-clip adaptive threshold so spans are comparable
+    - nods are counted per contiguous run so span boundaries don't create fake nods
+    """
+    _, smile_thresh = smile_ratio(timeline, threshold=None)
+
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    runs: Dict[str, List[List[Dict[str, Any]]]] = {}
+    prev_label = None
+    for frame, label in zip(timeline, labels):
+        groups.setdefault(label, []).append(frame)
+        if label != prev_label:
+            runs.setdefault(label, []).append([])
+            prev_label = label
+        runs[label][-1].append(frame)
+
+    total = len(timeline)
+    result = {}
+    for label, frames in groups.items():
+        result[label] = {
+            "frame_count": len(frames),
+            "frame_ratio": len(frames) / total if total else 0.0,
+            "start_t": frames[0].get("t"),
+            "center_gaze_ratio": center_gaze_ratio(frames),
+            "smile_ratio": smile_ratio(frames, threshold=smile_thresh)[0] if smile_thresh is not None else 0.0,
+            "nod_count": sum(nod_count(run, pitch_thresh_deg) for run in runs[label]),
+        }
+    return result
+
 def emotion_distribution(timeline: List[Dict[str, Any]]) -> Dict[str, float]:
     """
     Calculate emotion distribution from timeline.
@@ -0,0 +1,160 @@
+"""
+Segment-level speech analytics aligned to the vision timeline.
+
+Computes rolling WPM, current pause length and filler density for every
+vision frame timestamp, using sorted arrays + np.searchsorted so the whole
+timeline is evaluated in one vectorized pass.
+"""
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from pipeline.fillers import timed_tokens
+
+SPEECH_COLUMNS = ("wpm", "pause_sec", "filler_density")
+SPEECH_SPANS = ("pre_answer", "speaking", "pause")
+
+
+def build_speech_timeline(
+    segments: List[Dict[str, Any]],
+    frame_times: List[float],
+    filler_events: Optional[List[Dict[str, Any]]] = None,
+    window_sec: float = 5.0,
+    duration_sec: Optional[float] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Evaluate speech metrics at each frame time.
+
+    Args:
+        segments: Whisper segments (start/end/text, optional words)
+        frame_times: vision timeline timestamps (sec)
+        filler_events: detect_fillers()["events"]
+        window_sec: centered rolling window length
+        duration_sec: clip length (for the trailing pause)
+
+    Returns:
+        {"wpm": arr, "pause_sec": arr, "filler_density": arr}
+          - wpm: words per minute inside the window
+          - pause_sec: length of the silent gap the frame falls in (0 while speaking)
+          - filler_density: fillers per minute inside the window
+    """
+    t = np.asarray(frame_times, dtype=np.float64)
+    half = window_sec / 2.0
+    per_min = 60.0 / window_sec
+
+    _, word_times = timed_tokens(segments)
+    words = np.sort(np.asarray(word_times, dtype=np.float64))
+    fillers = np.sort(np.asarray([e["t"] for e in (filler_events or [])], dtype=np.float64))
+
+    def window_count(points: np.ndarray) -> np.ndarray:
+        return np.searchsorted(points, t + half, side="right") - np.searchsorted(points, t - half, side="left")
+
+    wpm = window_count(words) * per_min
+    filler_density = window_count(fillers) * per_min
+
+    # Pauses: gaps between consecutive speech segments
+    spans = sorted((float(s.get("start", 0.0)), float(s.get("end", 0.0))) for s in segments)
+    if spans:
+        starts = np.array([s for s, _ in spans])
+        ends = np.maximum.accumulate(np.array([e for _, e in spans]))
+        end_of_clip = max(float(duration_sec or 0.0), float(ends[-1]), float(t.max()) if t.size else 0.0)
+
+        idx = np.searchsorted(starts, t, side="right") - 1
+        prev_end = np.where(idx >= 0, ends[np.clip(idx, 0, None)], 0.0)
+        next_start = np.where(idx + 1 < len(starts), starts[np.clip(idx + 1, 0, len(starts) - 1)], end_of_clip)
+        speaking = (idx >= 0) & (t < prev_end)
+        pause_sec = np.where(speaking, 0.0, np.maximum(next_start - prev_end, 0.0))
+    else:
+        pause_sec = np.full(t.shape, float(duration_sec or 0.0))
+
+    return {
+        "wpm": wpm.astype(np.float64),
+        "pause_sec": pause_sec.astype(np.float64),
+        "filler_density": filler_density.astype(np.float64)
+    }
+
+
+def attach_speech_columns(
+    timeline: List[Dict[str, Any]],
+    speech: Dict[str, np.ndarray]
+) -> List[Dict[str, Any]]:
+    """
+    Add speech columns to each vision frame (in place) so the stored
+    timeline carries vision + speech side by side.
+    """
+    columns = {name: np.round(speech[name], 2).tolist() for name in SPEECH_COLUMNS}
+    for i, frame in enumerate(timeline):
+        for name in SPEECH_COLUMNS:
+            frame[name] = columns[name][i]
+    return timeline
+
+
+def summarize_speech_timeline(speech: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    """Peak/variance summary used for metadata (where speech sped up or stalled)."""
+    wpm = speech["wpm"]
+    pause = speech["pause_sec"]
+    if wpm.size == 0:
+        return {"wpm_max": 0.0, "wpm_std": 0.0, "longest_pause_sec": 0.0}
+    return {
+        "wpm_max": float(wpm.max()),
+        "wpm_std": float(wpm.std()),
+        "longest_pause_sec": float(pause.max())
+    }
+
+
+def merge_speech_intervals(
+    segments: List[Dict[str, Any]],
+    min_gap_sec: float = 0.3
+) -> List[Tuple[float, float]]:
+    """
+    Disjoint, sorted speech intervals.
+    Uses word timestamps when present (Whisper segments often abut each other
+    across silences), falling back to segment bounds; gaps shorter than
+    min_gap_sec are treated as continuous speech.
+    """
+    raw = []
+    for seg in segments:
+        words = seg.get("words")
+        if words:
+            raw.extend((float(w.get("start", 0.0)), float(w.get("end", 0.0))) for w in words)
+        else:
+            raw.append((float(seg.get("start", 0.0)), float(seg.get("end", 0.0))))
+
+    merged: List[Tuple[float, float]] = []
+    for start, end in sorted(raw):
+        if merged and start - merged[-1][1] <= min_gap_sec:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def label_speech_spans(
+    frame_times: List[float],
+    segments: List[Dict[str, Any]]
+) -> List[str]:
+    """
+    Interval join of frame timestamps against speech segments.
+
+    Each frame gets one of SPEECH_SPANS:
+      - pre_answer: before the first speech segment (thinking before answering)
+      - speaking: inside a speech segment
+      - pause: silent gap after the answer has started
+
+    O(m log m) to sort/merge segments + O(n log m) bisect lookups.
+    """
+    intervals = merge_speech_intervals(segments)
+    starts = [s for s, _ in intervals]
+    first_start = starts[0] if starts else float("inf")
+
+    labels = []
+    for t in frame_times:
+        i = bisect_right(starts, t) - 1
+        if i >= 0 and t < intervals[i][1]:
+            labels.append("speaking")
+        elif t < first_start:
+            labels.append("pre_answer")
+        else:
+            labels.append("pause")
+    return labels
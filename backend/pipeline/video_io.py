@@ -1,12 +1,16 @@
 import subprocess
+import time
 from pathlib import Path
+from typing import Optional
 import cv2
 
-def extract_frames_opencv(video_path: Path, fps: float, out_dir: Path):
+def extract_frames_opencv(video_path: Path, fps: float, out_dir: Path, time_budget_sec: Optional[float] = None):
     """
     Extract frames at target fps using OpenCV.
     Saves frames as JPG into out_dir.
     Returns list of (timestamp_sec, frame_path).
+    If time_budget_sec is given, stops decoding once it is spent and returns
+    the frames extracted so far (a prefix of the video).
     """
     out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -20,10 +24,15 @@ def extract_frames_opencv(video_path: Path, fps: float, out_dir: Path):
 
     step = max(int(round(src_fps / fps)), 1)
 
+    stop_at = time.monotonic() + time_budget_sec if time_budget_sec is not None else None
+
     frames = []
     idx = 0
     saved = 0
     while True:
+        if stop_at is not None and time.monotonic() >= stop_at:
+            print(f"⏱️ Frame extraction stopped at {idx / src_fps:.1f}s (time budget spent)")
+            break
         ok, frame = cap.read()
         if not ok:
             break
@@ -40,9 +49,10 @@ def extract_frames_opencv(video_path: Path, fps: float, out_dir: Path):
     cap.release()
     return frames
 
-def extract_audio_ffmpeg(video_path: Path, out_wav: Path):
+def extract_audio_ffmpeg(video_path: Path, out_wav: Path, timeout_sec: Optional[float] = None):
     """
     Extract mono 16k wav for Whisper.
+    Raises TimeoutError (after killing ffmpeg) if it runs longer than timeout_sec.
     """
     out_wav.parent.mkdir(parents=True, exist_ok=True)
     cmd = [
@@ -50,5 +60,8 @@ def extract_audio_ffmpeg(video_path: Path, out_wav: Path):
         "-vn", "-ac", "1", "-ar", "16000",
         str(out_wav)
     ]
-    subprocess.run(cmd, check=True)
+    try:
+        subprocess.run(cmd, check=True, timeout=timeout_sec)
+    except subprocess.TimeoutExpired:
+        raise TimeoutError(f"ffmpeg audio extraction timed out after {timeout_sec:.1f}s")
     return out_wav
@@ -1,14 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Header
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
-import aiohttp
 import whisper
 import os
 import tempfile
 from pathlib import Path
 from database import get_db
 from auth import get_current_user
+from clients.base import TTSClient
+from clients.registry import get_tts
+from utils.audio_utils import negotiate_audio_codec
 from models import (
     InterviewSession,
     InterviewQuestion,
@@ -41,6 +44,7 @@ from schemas import (
     InterviewAnswerResponse
 )
 from services.llm_analyzer import LLMAnalyzer
+from services.portfolio_digest import portfolio_prompt_text
 
 router = APIRouter()
 llm_analyzer = LLMAnalyzer()
@@ -83,7 +87,8 @@ def create_interview_session(
             ).order_by(Portfolio.created_at.desc()).first()
 
         if portfolio:
-            portfolio_text = portfolio.parsed_text or portfolio.summary or "내용 없음"
+            # 원문 대신 업로드 시 만든 포트폴리오 다이제스트 사용
+            portfolio_text = portfolio_prompt_text(portfolio, db)
             # 세션에 포트폴리오 ID 자동 설정
             if not session.portfolio_id:
                 db_session.portfolio_id = portfolio.id
@@ -182,8 +187,8 @@ def generate_initial_questions(session_id: str, db: Session = Depends(get_db)):
     if session.portfolio_id:
         portfolio = db.query(Portfolio).filter(Portfolio.id == session.portfolio_id).first()
         if portfolio:
-            # 파싱된 텍스트나 요약 사용
-            portfolio_text = portfolio.parsed_text or portfolio.summary or "내용 없음"
+            # 원문 대신 업로드 시 만든 포트폴리오 다이제스트 사용
+            portfolio_text = portfolio_prompt_text(portfolio, db)
 
     # 직무 공고 조회
     job_posting_text = "직무 공고 없음"
@@ -533,9 +538,13 @@ def generate_followup_question(
 
 # TTS endpoint
 @router.get("/questions/{question_id}/tts")
-async def get_question_tts(question_id: str, db: Session = Depends(get_db)):
+async def get_question_tts(
+    question_id: str,
+    db: Session = Depends(get_db),
+    tts_client: TTSClient = Depends(get_tts)
+):
     """
-    질문을 음성으로 변환
+    질문을 음성으로 변환 (앱 레지스트리의 TTS 클라이언트 - 캐시 / 공유 커넥션 풀 경유)
 
     Args:
         question_id: 질문 ID
@@ -554,40 +563,78 @@ async def get_question_tts(question_id: str, db: Session = Depends(get_db)):
             detail="Question not found"
         )
 
-    # MeloTTS 서버 호출 (Docker 컨테이너, port 8010)
-    tts_url = os.getenv("MELO_TTS_BASE_URL", "http://localhost:8010")
+    tts_url = getattr(tts_client, "base_url", "")
+
+    try:
+        audio_path = await tts_client.synthesize(
+            text=question.text,
+            speaker="KR",
+            speed=1.0
+        )
+
+        # MeloTTS 서버의 전체 URL로 변환
+        if audio_path and not audio_path.startswith("http"):
+            audio_url = f"{tts_url}{audio_path}"
+        else:
+            audio_url = audio_path
+
+        return {
+            "question_id": question_id,
+            "audio_url": audio_url,
+            "text": question.text
+        }
+
+    except Exception as e:
+        print(f"TTS Error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"TTS service error: {str(e)}"
+        )
+
+
+@router.get("/questions/{question_id}/tts/audio")
+async def get_question_tts_audio(
+    question_id: str,
+    format: Optional[str] = None,
+    bitrate_kbps: Optional[int] = None,
+    accept: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+    tts_client: TTSClient = Depends(get_tts)
+):
+    """
+    질문 음성을 압축 오디오로 직접 반환 (URL 조회 → 파일 다운로드 2단계 대신 1회 응답)
+
+    Args:
+        question_id: 질문 ID
+        format: "opus" | "webm" | "mp3" | "wav" (없으면 Accept 헤더로 결정)
+        bitrate_kbps: 목표 비트레이트 (코덱별 범위로 보정)
+
+    Returns:
+        오디오 바이트 (Content-Type: audio/ogg; codecs=opus 등)
+    """
+    question = db.query(InterviewQuestion).filter(
+        InterviewQuestion.id == question_id
+    ).first()
+
+    if not question:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Question not found"
+        )
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{tts_url}/tts",
-                json={
-                    "text": question.text,
-                    "speaker": "KR",
-                    "speed": 1.0
-                }
-            ) as resp:
-                if resp.status != 200:
-                    raise HTTPException(
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        detail="TTS generation failed"
-                    )
-
-                result = await resp.json()
-                audio_path = result.get("audio_url", "")
-
-                # MeloTTS 서버의 전체 URL로 변환
-                if audio_path and not audio_path.startswith("http"):
-                    audio_url = f"{tts_url}{audio_path}"
-                else:
-                    audio_url = audio_path
-
-                return {
-                    "question_id": question_id,
-                    "audio_url": audio_url,
-                    "text": question.text
-                }
+        codec = negotiate_audio_codec(format, accept)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_406_NOT_ACCEPTABLE, detail=str(e))
 
+    try:
+        result = await tts_client.synthesize_audio(
+            text=question.text,
+            speaker="KR",
+            speed=1.0,
+            codec=codec,
+            bitrate_kbps=bitrate_kbps
+        )
     except Exception as e:
         print(f"TTS Error: {e}")
         raise HTTPException(
@@ -595,6 +642,15 @@ async def get_question_tts(question_id: str, db: Session = Depends(get_db)):
             detail=f"TTS service error: {str(e)}"
         )
 
+    headers = {
+        "X-Audio-Codec": result["codec"],
+        "Cache-Control": "private, max-age=86400",
+        "Vary": "Accept"
+    }
+    if result["bitrate_kbps"]:
+        headers["X-Audio-Bitrate-Kbps"] = str(result["bitrate_kbps"])
+    return Response(content=result["audio"], media_type=result["content_type"], headers=headers)
+
 
 # STT endpoint
 @router.post("/stt")
@@ -9,6 +9,8 @@ from schemas import (
 )
 from services.cv_analyzer import analyze_cv_pipeline
 from services.capability_evaluator import evaluate_portfolio_capabilities
+from services.portfolio_digest import build_portfolio_digest, store_portfolio_digest
+from utils.bounded_executor import llm_executor
 from auth import get_current_user
 import os
 import uuid
@@ -79,6 +81,15 @@ async def upload_portfolio(
     db.commit()
     db.refresh(db_portfolio)
 
+    # 포트폴리오 다이제스트 생성 (이후 질문 생성 / 꼬리 질문 / CV 분석 프롬프트가 원문 대신 사용)
+    # 실패해도 업로드는 성공시키고, 처음 사용할 때 다시 생성
+    try:
+        digest = await llm_executor.run(build_portfolio_digest, parsed_text)
+        store_portfolio_digest(db_portfolio, digest, db)
+        db.refresh(db_portfolio)
+    except Exception as e:
+        print(f"⚠️ 포트폴리오 다이제스트 생성 실패: {e}")
+
     return db_portfolio
 
 
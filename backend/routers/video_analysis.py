@@ -18,10 +18,19 @@ from pipeline.video_io import extract_frames_opencv, extract_audio_ffmpeg
 from pipeline.vision_mediapipe import build_timeline_from_frames, save_timeline
 from pipeline.metrics import (
     center_gaze_ratio, smile_ratio, nod_count, emotion_distribution, get_primary_emotion,
-    compute_metadata
+    compute_metadata, metrics_by_speech_span
 )
-from pipeline.audio_analysis import transcribe_whisper, compute_wpm, compute_filler_count
-from pipeline.feedback_generator import generate_feedback_with_gemini, generate_feedback_fallback, generate_alerts_from_timeline
+from pipeline.audio_analysis import transcribe_whisper, compute_wpm, detect_fillers
+from pipeline.speech_metrics import (
+    build_speech_timeline, attach_speech_columns, summarize_speech_timeline, label_speech_spans
+)
+from pipeline.feedback_generator import (
+    generate_feedback_with_gemini, generate_feedback_fallback, generate_alerts_from_timeline, FEEDBACK_DEADLINE_SEC
+)
+from services.transcript_store import stt_model_tier, compact_segments, find_reusable_transcript, load_segments
+from utils.audio_utils import compute_media_hash
+from utils.single_flight import single_flight
+from utils.deadline import Deadline, DeadlineExceeded, VIDEO_ANALYSIS_DEADLINE_SEC
 from dotenv import load_dotenv
 
 # .env 파일 로드
@@ -35,11 +44,15 @@ VIDEO_UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
 # Gemini API 사용 여부 확인 (.env 로드 후)
 # GEMINI_API_KEY1, GEMINI_API_KEY2, GEMINI_API_KEY3 또는 GEMINI_API_KEY 중 하나라도 있으면 사용
-# 실제 피드백 생성 시에는 generate_feedback_with_gemini()에서 키 1, 2, 3을 순차적으로 시도
+# 실제 피드백 생성 시에는 LLM 게이트웨이(clients/llm_gateway.py)가 가장 한가한 키로 라우팅
 USE_GEMINI = any(
     os.getenv(f"GEMINI_API_KEY{i}") for i in range(1, 4)
 ) or bool(os.getenv("GEMINI_API_KEY"))
 
+# 분석 마감 시간 (utils/deadline.py): 메트릭 계산 / DB 저장용으로 남겨 두는 시간, 프레임 추출 상한 비율
+ANALYSIS_SAVE_RESERVE_SEC = float(os.getenv("ANALYSIS_SAVE_RESERVE_SEC", "5"))
+FRAME_EXTRACTION_BUDGET_RATIO = 0.3
+
 
 @router.get("/status")
 def video_status():
@@ -165,6 +178,18 @@ def analyze_interview(video_id: str, db: Session = Depends(get_db)):
     Returns:
         - 분석 결과 + DB에 저장된 레코드 IDs
     """
+    # 같은 비디오 분석이 이미 진행 중이면(더블 클릭 / 재시도 / 다른 워커) 그 결과를 기다림
+    return single_flight.do(
+        "analyze_interview",
+        video_id,
+        lambda: _analyze_interview(video_id, db)
+    )
+
+
+def _analyze_interview(video_id: str, db: Session) -> dict:
+    # 요청 전체 예산: 단계마다 남은 시간만큼만 실행, 넘은 단계는 건너뛰고 부분 결과 반환
+    deadline = Deadline(VIDEO_ANALYSIS_DEADLINE_SEC, name="analyze_interview")
+
     # 1. DB에서 비디오 정보 조회
     video_record = db.query(InterviewVideo).filter(InterviewVideo.id == video_id).first()
     if not video_record:
@@ -185,30 +210,89 @@ def analyze_interview(video_id: str, db: Session = Depends(get_db)):
         frames_dir = artifacts_dir / "frames"
         
         FPS_ANALYZED = 5.0  # Store for metadata
+        frame_budget = deadline.budget(
+            "frames",
+            cap=deadline.budget_sec * FRAME_EXTRACTION_BUDGET_RATIO,
+            reserve=ANALYSIS_SAVE_RESERVE_SEC
+        )
+        frames_started = deadline.remaining()
         frames = extract_frames_opencv(
-            video_path, fps=FPS_ANALYZED, out_dir=frames_dir
+            video_path, fps=FPS_ANALYZED, out_dir=frames_dir, time_budget_sec=frame_budget
         )
+        if frames_started - deadline.remaining() >= frame_budget:
+            # 예산을 다 써서 앞부분 프레임만 추출됨
+            deadline.timeout("frames")
 
         # 3. Vision timeline 생성
         print("👁️ Analyzing facial features...")
         timeline = build_timeline_from_frames(frames)
         timeline_path = artifacts_dir / "timeline.json"
-        save_timeline(timeline, timeline_path)
 
         # 4. 오디오 분석
         print("🎤 Analyzing audio...")
         wav_path = artifacts_dir / "audio.wav"
-        wav = extract_audio_ffmpeg(video_path, wav_path)
-        audio, sr = sf.read(str(wav))
-        duration_sec = len(audio) / sr
+        # 예산 안에 오디오를 못 얻으면 비언어 지표만 계산 (길이는 마지막 프레임 시각)
+        wav = None
+        duration_sec = timeline[-1]["t"] if timeline else 0.0
+        try:
+            wav = extract_audio_ffmpeg(
+                video_path, wav_path,
+                timeout_sec=deadline.budget("audio_extract", reserve=ANALYSIS_SAVE_RESERVE_SEC)
+            )
+            audio, sr = sf.read(str(wav))
+            duration_sec = len(audio) / sr
+        except DeadlineExceeded:
+            pass  # 시작 전에 예산 소진 (건너뜀으로 기록됨)
+        except TimeoutError:
+            deadline.timeout("audio_extract")
         
-        print("📝 Transcribing speech...")
         WHISPER_MODEL_SIZE = "base"  # Store for metadata
-        stt = transcribe_whisper(wav, model_size=WHISPER_MODEL_SIZE)
-        text = stt["text"]
+        stt_model = stt_model_tier(WHISPER_MODEL_SIZE)
+        media_hash = compute_media_hash(str(video_path))
+
+        # 음성 면접 등에서 같은 미디어를 이미 전사했으면 Whisper 생략
+        existing_transcript = find_reusable_transcript(
+            db, media_hash, stt_model, require_segments=True
+        )
+        if existing_transcript:
+            print("♻️ Reusing existing transcript (same media hash + STT model)")
+            text = existing_transcript.text
+            segments = load_segments(existing_transcript)
+            transcript_source = "reused"
+        elif wav is None:
+            deadline.skip("stt")
+            text, segments, transcript_source = "", [], "skipped"
+        else:
+            print("📝 Transcribing speech...")
+            try:
+                stt = deadline.call(
+                    "stt", transcribe_whisper, wav,
+                    model_size=WHISPER_MODEL_SIZE, word_timestamps=True,
+                    reserve=ANALYSIS_SAVE_RESERVE_SEC
+                )
+                text = stt["text"].strip()
+                segments = compact_segments(stt.get("segments", []))
+                transcript_source = "whisper"
+            except DeadlineExceeded:
+                text, segments, transcript_source = "", [], "skipped"
 
         # 5. 메트릭 계산
         print("📊 Computing metrics...")
+        speech_segments = segments or ([{"start": 0.0, "end": duration_sec, "text": text}] if text else [])
+        fillers = detect_fillers(speech_segments, duration_sec=duration_sec)
+
+        # 음성 타임라인 (구간별 WPM / 휴지 / 필러 밀도) → vision 타임라인에 컬럼 추가
+        SPEECH_WINDOW_SEC = 5.0
+        speech = build_speech_timeline(
+            speech_segments,
+            frame_times=[f["t"] for f in timeline],
+            filler_events=fillers["events"],
+            window_sec=SPEECH_WINDOW_SEC,
+            duration_sec=duration_sec
+        )
+        attach_speech_columns(timeline, speech)
+        save_timeline(timeline, timeline_path)
+
         emotion_dist = emotion_distribution(timeline)
         primary_emo = get_primary_emotion(timeline)
         
@@ -218,6 +302,12 @@ def analyze_interview(video_id: str, db: Session = Depends(get_db)):
         # Nod pitch threshold
         NOD_PITCH_THRESHOLD = 8.0
         nod_count_val = nod_count(timeline, pitch_thresh_deg=NOD_PITCH_THRESHOLD)
+
+        # 말하는 구간 / 휴지 / 답변 전 구간별 비언어 지표 (전사 segments × 타임라인 interval join)
+        span_labels = label_speech_spans([f["t"] for f in timeline], speech_segments)
+        speech_span_metrics = metrics_by_speech_span(
+            timeline, span_labels, pitch_thresh_deg=NOD_PITCH_THRESHOLD
+        )
         
         # NEW: Calculate nod_rate_per_min (normalized)
         duration_min = duration_sec / 60.0
@@ -231,7 +321,7 @@ def analyze_interview(video_id: str, db: Session = Depends(get_db)):
             "emotion_distribution": emotion_dist,
             "primary_emotion": primary_emo,
             "wpm": compute_wpm(text, duration_sec),
-            "filler_count": compute_filler_count(text),
+            "filler_count": fillers["count"],
         }
         
         # 5.5. 메타데이터 계산 (재현 가능성을 위한 구조화)
@@ -244,12 +334,27 @@ def analyze_interview(video_id: str, db: Session = Depends(get_db)):
             whisper_model_size=WHISPER_MODEL_SIZE,
             duration_sec=duration_sec
         )
+        metadata["transcript_source"] = transcript_source
+        metadata["filler_timeline"] = {
+            "bin_sec": 1.0,
+            "counts": fillers["timeline"],
+            "events": fillers["events"]
+        }
+        metadata["speech_timeline"] = {
+            "window_sec": SPEECH_WINDOW_SEC,
+            "columns": ["wpm", "pause_sec", "filler_density"],
+            **summarize_speech_timeline(speech)
+        }
 
-        # 6. 피드백 생성
+        # 6. 피드백 생성 (남은 예산이 Gemini 마감 시간, 없으면 규칙 기반)
         if USE_GEMINI:
             print("🤖 Generating feedback with Gemini 2.5 Flash Lite...")
             try:
-                feedback_list = generate_feedback_with_gemini(metrics, transcript=text)
+                feedback_list = generate_feedback_with_gemini(
+                    metrics,
+                    transcript=text,
+                    deadline_sec=deadline.budget("feedback", cap=FEEDBACK_DEADLINE_SEC, reserve=ANALYSIS_SAVE_RESERVE_SEC)
+                )
                 feedback_mode = "gemini"
             except Exception as e:
                 print(f"⚠️ Gemini failed, using fallback: {e}")
@@ -264,12 +369,17 @@ def analyze_interview(video_id: str, db: Session = Depends(get_db)):
         print("🔔 Generating timeline alerts...")
         alerts = []
         try:
-            alerts = generate_alerts_from_timeline(timeline)
+            alerts = generate_alerts_from_timeline(
+                timeline,
+                time_budget_sec=max(0.0, deadline.remaining() - ANALYSIS_SAVE_RESERVE_SEC)
+            )
             print(f"✅ 생성된 알림 개수: {len(alerts)}")
         except Exception as e:
             print(f"⚠️ Alerts 생성 실패: {e}")
             alerts = []
 
+        metadata["deadline"] = deadline.to_dict()
+
         # 7. DB에 저장 (기존 데이터 삭제 후 새로 저장)
         print("💾 Saving to database...")
         
@@ -285,7 +395,10 @@ def analyze_interview(video_id: str, db: Session = Depends(get_db)):
         transcript_record = InterviewTranscript(
             video_id=video_id,
             text=text,
-            language="ko"  # Whisper가 자동 감지하지만 기본값
+            language="ko",  # Whisper가 자동 감지하지만 기본값
+            media_hash=media_hash,
+            stt_model=stt_model,
+            segments_json=json.dumps(segments, ensure_ascii=False)
         )
         db.add(transcript_record)
         
@@ -337,7 +450,10 @@ def analyze_interview(video_id: str, db: Session = Depends(get_db)):
         # 커밋
         db.commit()
         
-        print("✅ Analysis complete!")
+        if deadline.partial:
+            print(f"⏱️ Analysis complete with partial results: {deadline.to_dict()}")
+        else:
+            print("✅ Analysis complete!")
         
         return {
             "video_id": video_id,
@@ -348,7 +464,10 @@ def analyze_interview(video_id: str, db: Session = Depends(get_db)):
             "feedback": feedback_list,
             "feedback_mode": feedback_mode,
             "alerts": alerts,  # NEW: Timeline-based alerts
+            "speech_span_metrics": speech_span_metrics,
             "transcript": text,
+            "partial": deadline.partial,
+            "deadline": deadline.to_dict(),
             "database_records": {
                 "transcript_id": transcript_record.id,
                 "metrics_id": metrics_record.id,
@@ -357,6 +476,12 @@ def analyze_interview(video_id: str, db: Session = Depends(get_db)):
             }
         }
     
+    except DeadlineExceeded as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=504,
+            detail=f"Video analysis deadline exceeded: {str(e)}"
+        )
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -429,6 +554,16 @@ def get_analysis_results(video_id: str, db: Session = Depends(get_db)):
         except Exception as e:
             print(f"⚠️ Alerts 생성 실패: {e}")
             alerts = []
+
+    # 말하는 구간 / 휴지 / 답변 전 구간별 지표 (전사 segments × 타임라인 interval join)
+    speech_span_metrics = None
+    segments = load_segments(transcript)
+    if timeline_data and segments:
+        try:
+            span_labels = label_speech_spans([f.get("t", 0.0) for f in timeline_data], segments)
+            speech_span_metrics = metrics_by_speech_span(timeline_data, span_labels)
+        except Exception as e:
+            print(f"⚠️ 구간별 지표 계산 실패: {e}")
     
     return {
         "video": {
@@ -451,6 +586,7 @@ def get_analysis_results(video_id: str, db: Session = Depends(get_db)):
         } if metrics else None,
         "metadata": metadata_dict,  # NEW: metadata moved to top level for clarity
         "alerts": alerts,  # NEW: Timeline-based alerts
+        "speech_span_metrics": speech_span_metrics,
         "feedbacks": [
             {
                 "id": f.id,
@@ -3,17 +3,34 @@
 
 /api/voice/session/start - 세션 시작
 /api/voice/answer/complete - 답변 처리
+/api/voice/session/{id}/history - 질문/답변 기록
+/api/voice/questions/{id}/audio/stream - 질문 음성 문장 단위 스트리밍
+/api/voice/session/{id}/stream - 실시간 음성 세션 (WebSocket)
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+import asyncio
+import json
+import time
+import uuid
+from pathlib import Path
+from fastapi import (
+    APIRouter, Depends, HTTPException, status, UploadFile, File, Form,
+    WebSocket, WebSocketDisconnect
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import Optional
 
 from database import get_db
-from models import InterviewSession, User, Portfolio
-from clients import get_stt_client, get_llm_client, get_tts_client
+from models import InterviewSession, InterviewQuestion, User, Portfolio
+from clients.base import STTClient, LLMClient, TTSClient
+from clients.registry import get_stt, get_llm, get_tts
 from services.voice_orchestrator import VoiceInterviewOrchestrator
 from services.question_generator import QuestionGenerator
+from services.transcript_store import get_session_history
+from services.streaming_stt import EnergyVAD, IncrementalTranscriber, write_wav
+from utils.latency import latency_metrics
+from utils.deadline import DeadlineExceeded
 
 
 router = APIRouter()
@@ -24,7 +41,8 @@ async def start_voice_session(
     user_id: str = Form(...),
     portfolio_id: Optional[str] = Form(None),
     job_posting_id: Optional[str] = Form(None),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    tts_client: TTSClient = Depends(get_tts)
 ):
     """
     음성 면접 세션 시작
@@ -69,7 +87,6 @@ async def start_voice_session(
     first_question = question_gen.get_main_question(0)
 
     # TTS로 음성 생성
-    tts_client = get_tts_client()
     audio_url = await tts_client.synthesize(
         text=first_question["text"],
         speaker="KR",
@@ -105,7 +122,11 @@ async def complete_answer(
     question_id: str = Form(...),
     turn_type: str = Form(...),  # "main" or "followup"
     audio_file: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    stream_tts: bool = Form(False),
+    db: Session = Depends(get_db),
+    stt_client: STTClient = Depends(get_stt),
+    llm_client: LLMClient = Depends(get_llm),
+    tts_client: TTSClient = Depends(get_tts)
 ):
     """
     답변 완료 처리
@@ -115,6 +136,12 @@ async def complete_answer(
         question_id: 현재 질문 ID
         turn_type: "main" (메인 질문 답변) or "followup" (꼬리질문 답변)
         audio_file: 녹음된 음성 파일
+        stream_tts: True면 꼬리질문 음성 대신 audio_stream_url 반환
+
+    next_question 음성:
+        - audio_url: 질문 전체 음성 (비어 있을 수 있음)
+        - audio_url이 비어 있으면 audio_chunks를 순서대로 재생하거나 audio_stream_url로 받음
+          (여러 문장인 꼬리질문, stream_tts=True, TTS가 마감 시간을 넘은 경우)
 
     Returns:
         {
@@ -122,12 +149,15 @@ async def complete_answer(
             "metrics": {
                 "duration_sec": 18.2,
                 "word_count": 45,
-                "avg_wpm": 150
+                "avg_wpm": 150,
+                "stage_ms": {"save": 3.1, "convert": 120.4, "stt": 950.2, ...}
             },
             "next_question": {
                 "id": "...",
                 "text": "...",
-                "audio_url": "...",
+                "audio_url": "...",         # 질문 전체 음성 ("" 가능)
+                "audio_stream_url": "...",  # audio_url이 비어 있을 때
+                "audio_chunks": [{"text": "...", "audio_url": "..."}],  # 여러 문장인 꼬리질문
                 "type": "followup" | "main" | "end"
             }
         }
@@ -142,30 +172,29 @@ async def complete_answer(
 
     # Orchestrator 초기화
     orchestrator = VoiceInterviewOrchestrator(
-        stt_client=get_stt_client(),
-        llm_client=get_llm_client(),
-        tts_client=get_tts_client(),
+        stt_client=stt_client,
+        llm_client=llm_client,
+        tts_client=tts_client,
         db=db
     )
 
     # 전체 파이프라인 실행
     try:
-        result = await orchestrator.process_answer(
+        # 세션 종료(다음 질문이 "end")도 orchestrator가 같은 트랜잭션에서 처리
+        return await orchestrator.process_answer(
             session_id=session_id,
             question_id=question_id,
             audio_file=audio_file,
-            turn_type=turn_type
+            turn_type=turn_type,
+            stream_tts=stream_tts
         )
 
-        # 세션 종료 처리
-        if result["next_question"]["type"] == "end":
-            session.status = "completed"
-            from datetime import datetime
-            session.completed_at = datetime.utcnow().isoformat()
-            db.commit()
-
-        return result
-
+    except DeadlineExceeded as e:
+        # 변환 / STT가 턴 예산 안에 끝나지 않음 (LLM / TTS 초과는 부분 결과로 응답)
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=f"Processing deadline exceeded: {str(e)}"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -212,3 +241,265 @@ async def get_session_status(
         "total_questions": total_questions,
         "answered_questions": answered_questions
     }
+
+
+@router.get("/session/{session_id}/history")
+async def get_voice_session_history(
+    session_id: str,
+    db: Session = Depends(get_db)
+):
+    """
+    세션 질문/답변 기록 조회
+
+    음성 답변 전사와 영상 분석(/api/video/analyze) 전사를 모두 포함
+
+    Returns:
+        {
+            "session_id": "...",
+            "history": [
+                {"question_id": "...", "question": "...", "answer": "...", ...}
+            ]
+        }
+    """
+    session = db.query(InterviewSession).filter_by(id=session_id).first()
+    if not session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Session not found"
+        )
+
+    return {
+        "session_id": session.id,
+        "history": get_session_history(db, session_id)
+    }
+
+
+@router.get("/questions/{question_id}/audio/stream")
+async def stream_question_audio(
+    question_id: str,
+    db: Session = Depends(get_db),
+    tts_client: TTSClient = Depends(get_tts)
+):
+    """
+    질문 음성을 문장/절 단위로 스트리밍 (NDJSON, chunked)
+
+    조각이 합성될 때마다 한 줄씩 전송하므로 첫 문장부터 재생 가능
+
+    Returns:
+        {"index": 0, "text": "...", "audio_url": "..."}
+        ...
+        {"done": true, "chunks": 2, "ttfb_ms": 640.2, "total_ms": 1510.8}
+    """
+    question = db.query(InterviewQuestion).filter_by(id=question_id).first()
+    if not question:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Question not found"
+        )
+    text = question.text
+
+    async def events():
+        started = time.perf_counter()
+        ttfb_ms = None
+        chunks = 0
+        try:
+            async for event in tts_client.synthesize_stream(text, speaker="KR", speed=1.0):
+                if ttfb_ms is None:
+                    ttfb_ms = round((time.perf_counter() - started) * 1000, 1)
+                    latency_metrics.record("tts_stream_ttfb", ttfb_ms)
+                chunks += 1
+                yield json.dumps(event, ensure_ascii=False) + "\n"
+
+            total_ms = round((time.perf_counter() - started) * 1000, 1)
+            latency_metrics.record("tts_stream_total", total_ms)
+            yield json.dumps({
+                "done": True,
+                "chunks": chunks,
+                "ttfb_ms": ttfb_ms,
+                "total_ms": total_ms
+            }) + "\n"
+        except Exception as e:
+            print(f"⚠️ 질문 음성 스트리밍 실패: {e}")
+            yield json.dumps({"error": str(e)}, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
+class _StreamingTurn:
+    """WebSocket 음성 세션의 답변 턴 1개 (부분 전사 + VAD)"""
+
+    def __init__(self, question_id: str, turn_type: str, stt_client: STTClient):
+        self.question_id = question_id
+        self.turn_type = turn_type
+        self.transcriber = IncrementalTranscriber(stt_client)
+        self.vad = EnergyVAD()
+        self.step_task: Optional[asyncio.Task] = None
+        self.prepared_next: Optional[asyncio.Task] = None
+
+    def cancel(self) -> None:
+        for task in (self.step_task, self.prepared_next):
+            if task is not None and not task.done():
+                task.cancel()
+
+
+@router.websocket("/session/{session_id}/stream")
+async def voice_session_stream(
+    websocket: WebSocket,
+    session_id: str,
+    db: Session = Depends(get_db)
+):
+    """
+    실시간 음성 세션 (WebSocket, 전이중)
+
+    답변을 받는 동안 슬라이딩 윈도우로 부분 전사하고, 침묵(VAD)으로 턴 종료를
+    감지하면 바로 최종 전사 → 꼬리질문 생성 → 문장별 음성을 전송
+
+    Client → Server:
+        {"type": "start", "question_id": "...", "turn_type": "main" | "followup"}
+        <binary> 16kHz mono PCM16 오디오 프레임
+        {"type": "stop"}  # VAD를 기다리지 않고 턴 종료
+
+    Server → Client:
+        {"type": "ready", "question_id": "..."}
+        {"type": "partial", "text": "..."}
+        {"type": "end_of_turn", "reason": "vad" | "stop", "audio_sec": 12.4}
+        {"type": "final", "text": "..."}
+        {"type": "audio_chunk", "index": 0, "text": "...", "audio_url": "..."}
+        {"type": "result", ...}  # /answer/complete 응답과 같은 형식
+        {"type": "error", "detail": "..."}
+    """
+    await websocket.accept()
+
+    # WebSocket 라우트는 Request 기반 의존성(get_stt 등)을 쓸 수 없으므로 직접 조회
+    try:
+        registry = websocket.app.state.clients
+        stt_client, llm_client, tts_client = registry.stt, registry.llm, registry.tts
+    except (AttributeError, RuntimeError) as e:
+        await websocket.send_json({"type": "error", "detail": f"Model clients unavailable: {e}"})
+        await websocket.close(code=1011)
+        return
+
+    if not db.query(InterviewSession).filter_by(id=session_id).first():
+        await websocket.send_json({"type": "error", "detail": "Session not found"})
+        await websocket.close(code=1008)
+        return
+
+    orchestrator = VoiceInterviewOrchestrator(
+        stt_client=stt_client,
+        llm_client=llm_client,
+        tts_client=tts_client,
+        db=db
+    )
+    send_lock = asyncio.Lock()
+
+    async def send(event: dict) -> None:
+        # 부분 전사 태스크와 메인 루프가 동시에 보낼 수 있으므로 직렬화
+        async with send_lock:
+            await websocket.send_text(json.dumps(event, ensure_ascii=False))
+
+    async def run_step(turn: _StreamingTurn) -> None:
+        try:
+            text = await turn.transcriber.step()
+            await send({"type": "partial", "text": text})
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"⚠️ 부분 전사 실패: {e}")
+
+    async def finish_turn(turn: _StreamingTurn, reason: str) -> None:
+        eot_started = time.perf_counter()
+        transcriber = turn.transcriber
+        await send({
+            "type": "end_of_turn",
+            "reason": reason,
+            "audio_sec": round(transcriber.duration_sec, 2)
+        })
+        if not transcriber.pcm:
+            turn.cancel()
+            await send({"type": "error", "detail": "No audio received"})
+            return
+
+        # 진행 중인 부분 전사가 윈도우를 옮길 수 있으므로 끝난 뒤 최종 전사
+        if turn.step_task is not None:
+            await turn.step_task
+        final = await transcriber.finalize()
+        stage_ms = {"stt_final": round((time.perf_counter() - eot_started) * 1000, 1)}
+        await send({"type": "final", "text": final["text"]})
+
+        wav_path = str(Path("uploads/audio") / f"{uuid.uuid4()}.wav")
+        await asyncio.to_thread(write_wav, wav_path, bytes(transcriber.pcm), transcriber.sample_rate)
+
+        async def on_audio_chunk(chunk: dict) -> None:
+            await send({"type": "audio_chunk", **chunk})
+
+        result = await orchestrator.finish_streamed_answer(
+            session_id=session_id,
+            question_id=turn.question_id,
+            turn_type=turn.turn_type,
+            wav_path=wav_path,
+            transcript_text=final["text"],
+            segments=final["segments"],
+            duration=transcriber.duration_sec,
+            stage_ms=stage_ms,
+            prepared_next=turn.prepared_next,
+            on_audio_chunk=on_audio_chunk
+        )
+        result["metrics"]["stt_calls"] = transcriber.stt_calls
+        latency_metrics.record("voice_eot_to_result", (time.perf_counter() - eot_started) * 1000)
+        await send({"type": "result", **result})
+
+    turn: Optional[_StreamingTurn] = None
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+
+            if message.get("bytes") is not None:
+                if turn is None:
+                    continue
+                samples = turn.transcriber.append(message["bytes"])
+                end_of_turn = turn.vad.update(samples)
+                if turn.transcriber.should_step() and (turn.step_task is None or turn.step_task.done()):
+                    turn.step_task = asyncio.create_task(run_step(turn))
+                if not end_of_turn:
+                    continue
+                reason = "vad"
+            else:
+                try:
+                    data = json.loads(message.get("text") or "{}")
+                except json.JSONDecodeError:
+                    await send({"type": "error", "detail": "Invalid JSON message"})
+                    continue
+
+                if data.get("type") == "start":
+                    question_id = data.get("question_id")
+                    if not question_id:
+                        await send({"type": "error", "detail": "start message requires question_id"})
+                        continue
+                    if turn is not None:
+                        turn.cancel()
+                    turn = _StreamingTurn(question_id, data.get("turn_type", "main"), stt_client)
+                    if turn.turn_type != "main":
+                        # 꼬리질문 답변 턴: 다음 메인 질문은 답변을 듣는 동안 준비
+                        turn.prepared_next = orchestrator.prepare_next_main_question(session_id)
+                    await send({"type": "ready", "question_id": turn.question_id})
+                    continue
+                if data.get("type") != "stop" or turn is None:
+                    continue
+                reason = "stop"
+
+            current, turn = turn, None
+            try:
+                await finish_turn(current, reason)
+            except Exception as e:
+                current.cancel()
+                db.rollback()
+                print(f"⚠️ 음성 턴 처리 실패: {e}")
+                await send({"type": "error", "detail": f"Processing failed: {str(e)}"})
+
+    except WebSocketDisconnect:
+        pass
+    finally:
+        if turn is not None:
+            turn.cancel()
@@ -178,6 +178,8 @@ class InterviewTranscriptCreate(InterviewTranscriptBase):
 class InterviewTranscriptResponse(InterviewTranscriptBase):
     id: str
     video_id: str
+    media_hash: Optional[str] = None
+    stt_model: Optional[str] = None
     created_at: str
 
     model_config = ConfigDict(from_attributes=True)
@@ -384,3 +386,61 @@ class InterviewAnswerResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# LLM Structured Output Schemas (Gemini response_schema로 사용)
+class CompetencyAnalysisResult(BaseModel):
+    """CV / GitHub 역량 분석 결과"""
+    role: str
+    possessed_skills: List[str]
+    missing_skills: List[str]
+    strengths: List[SkillItem]
+    weaknesses: List[SkillItem]
+    overall_score: int
+    summary: str
+
+
+class JobPostingParseResult(BaseModel):
+    """채용 공고 구조화 결과"""
+    company: str
+    position: str
+    url: str
+    experience_years: str
+    employment_type: str
+    required_skills: List[str]
+    preferred_skills: List[str]
+    responsibilities: List[str]
+    qualifications: List[str]
+    preferred_qualifications: List[str]
+
+
+class InitialQuestionItem(BaseModel):
+    """초기 면접 질문 (type: weakness / portfolio / job)"""
+    type: str
+    text: str
+
+
+class PortfolioDigestProject(BaseModel):
+    name: str
+    stack: List[str]
+    summary: str
+
+
+class PortfolioDigestResult(BaseModel):
+    """포트폴리오 다이제스트 (업로드 시 한 번 생성, 모든 프롬프트에서 원문 대신 사용)"""
+    skills: List[str]
+    tech_stacks: List[str]
+    projects: List[PortfolioDigestProject]
+    summary: str
+
+
+class CapabilityScoreItem(BaseModel):
+    capability_index: int
+    score: float
+    reason: str
+    feedback: str
+
+
+class CapabilityScoresResult(BaseModel):
+    """6개 역량 평가 결과"""
+    evaluations: List[CapabilityScoreItem]
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""모델 서버 호출 벤치마크: 요청마다 새 세션 vs 공유 커넥션 풀
+
+먼저 mock 서버(또는 실제 A6000 서버)를 띄운 뒤 실행:
+    python scripts/mock_model_server.py --port 8090 --latency-ms 20
+    python scripts/bench_http_pool.py --base-url http://localhost:8090 --requests 500 --concurrency 32
+
+A6000 클라이언트(MeloTTSA6000Client 등)를 통해 호출하므로 실제 코드 경로를 측정
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import aiohttp
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from clients.http_pool import get_http_pool, close_http_pool
+from clients.melo_tts_client import MeloTTSA6000Client
+from clients.gemini_client import LLaMAA6000Client
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark pooled vs per-call HTTP sessions")
+    parser.add_argument("--base-url", default="http://localhost:8090", help="Model server URL")
+    parser.add_argument("--requests", type=int, default=200, help="Total requests per mode")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent requests")
+    parser.add_argument("--endpoint", choices=["tts", "generate"], default="tts")
+    return parser.parse_args()
+
+
+async def _per_call_session(base_url: str, endpoint: str) -> None:
+    """기존 방식: 호출마다 ClientSession 생성"""
+    payload = {"text": "안녕하세요"} if endpoint == "tts" else {"prompt": "안녕하세요"}
+    async with aiohttp.ClientSession() as session:
+        async with session.post(f"{base_url}/{endpoint}", json=payload) as resp:
+            resp.raise_for_status()
+            await resp.json()
+
+
+async def _run(name: str, call, total: int, concurrency: int) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            await call()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"[{name}] {total} req in {elapsed:.2f}s "
+        f"({total / elapsed:.1f} req/s) | p50 {statistics.median(latencies):.1f}ms | p95 {p95:.1f}ms"
+    )
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    if args.endpoint == "tts":
+        client = MeloTTSA6000Client(base_url=args.base_url)
+        pooled = lambda: client.synthesize("안녕하세요")  # noqa: E731
+    else:
+        client = LLaMAA6000Client(base_url=args.base_url)
+        pooled = lambda: client.generate("안녕하세요")  # noqa: E731
+
+    # 워밍업 (서버 JIT / 첫 연결 비용 제외)
+    await pooled()
+
+    await _run("per-call session", lambda: _per_call_session(args.base_url, args.endpoint),
+               args.requests, args.concurrency)
+    await _run("pooled session", pooled, args.requests, args.concurrency)
+
+    print("[pool stats]", get_http_pool().stats())
+    await close_http_pool()
+
+
+def main():
+    asyncio.run(main_async(parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+"""전체 면접 흐름 부하 테스트 - 회원가입 → 포트폴리오 업로드 → 음성 세션 → 답변 턴 → 영상 분석
+
+실제 사용자 세션 흐름을 동시에 여러 개 재생하고 단계별 처리량 / 지연 백분위를 출력.
+Gemini / STT / TTS 쿼터를 쓰지 않도록 목 서버(scripts/mock_model_server.py)를 붙여서 실행:
+
+    python scripts/mock_model_server.py --port 8090 \\
+        --latency gemini=800:lognormal:0.6 --latency stt=400:uniform \\
+        --latency generate=300:lognormal --latency tts=150:uniform --error-rate all=0.01
+    GEMINI_API_ENDPOINT=http://localhost:8090 GEMINI_API_KEY=mock \\
+    A6000_STT_URL=http://localhost:8090 A6000_LLM_URL=http://localhost:8090 \\
+    A6000_TTS_URL=http://localhost:8090 USE_A6000_MODELS=true uvicorn main:app --port 8000
+    python scripts/load_test_flows.py --flows 50 --concurrency 10 --turns 4 \\
+        --video sample.mp4 --mock-url http://localhost:8090
+
+--video가 없으면 영상 분석 단계는 건너뜀 (영상 분석은 ffmpeg / MediaPipe / Whisper를 로컬에서 실행)
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import math
+import os
+import statistics
+import struct
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+PORTFOLIO_TEXT = [
+    "Backend developer portfolio",
+    "Skills: Python, FastAPI, SQLAlchemy, Docker, AWS, Redis",
+    "Project: AI interview coach - FastAPI backend, Gemini API, WebSocket voice sessions",
+    "Project: Order service - Spring Boot, MySQL, Kafka, 2000 TPS load tested",
+]
+
+
+def build_pdf(lines: List[str]) -> bytes:
+    """텍스트 줄을 담은 1페이지 PDF (PdfReader로 추출 가능한 최소 구조)"""
+    stream = "BT /F1 12 Tf 72 720 Td 16 TL " + " ".join(
+        "(" + line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ") '" for line in lines
+    ) + " ET"
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        "/Contents 4 0 R /Resources << /Font << /F1 5 0 R >> >> >>",
+        f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1"))
+    xref = out.tell()
+    out.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1"))
+    for offset in offsets:
+        out.write(f"{offset:010d} 00000 n \n".encode("latin-1"))
+    out.write(f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1"))
+    return out.getvalue()
+
+
+def build_wav(duration_sec: float = 2.0, sample_rate: int = 16000) -> bytes:
+    """답변 음성 대신 보낼 16-bit 모노 WAV (220Hz 톤)"""
+    frames = int(duration_sec * sample_rate)
+    samples = b"".join(
+        struct.pack("<h", int(3000 * math.sin(2 * math.pi * 220 * i / sample_rate))) for i in range(frames)
+    )
+    header = b"RIFF" + struct.pack("<I", 36 + len(samples)) + b"WAVE"
+    header += b"fmt " + struct.pack("<IHHIIHH", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16)
+    return header + b"data" + struct.pack("<I", len(samples)) + samples
+
+
+class StepStats:
+    """단계별 지연 (성공만) / 실패 수"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.partial = 0
+
+    def record(self, step: str, latency_ms: float) -> None:
+        self.latencies.setdefault(step, []).append(latency_ms)
+
+    def fail(self, step: str) -> None:
+        self.errors[step] = self.errors.get(step, 0) + 1
+
+    def report(self, elapsed: float) -> None:
+        steps = list(dict.fromkeys([*self.latencies, *self.errors]))
+        print(f"{'step':<16}{'ok':>6}{'fail':>6}{'req/s':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}")
+        for step in steps:
+            values = sorted(self.latencies.get(step, []))
+            if values:
+                pct = lambda q: values[min(len(values) - 1, int(math.ceil(len(values) * q)) - 1)]
+                cols = f"{statistics.median(values):>8.0f}ms{pct(0.95):>7.0f}ms{pct(0.99):>7.0f}ms{values[-1]:>7.0f}ms"
+            else:
+                cols = ""
+            print(f"{step:<16}{len(values):>6}{self.errors.get(step, 0):>6}{len(values) / elapsed:>8.2f}{cols}")
+
+
+class FlowRunner:
+    """사용자 1명의 면접 흐름 재생"""
+
+    def __init__(self, session: aiohttp.ClientSession, args: argparse.Namespace, stats: StepStats):
+        self.http = session
+        self.args = args
+        self.stats = stats
+        self.pdf = build_pdf(PORTFOLIO_TEXT)
+        self.wav = build_wav()
+
+    async def step(self, name: str, method: str, path: str, **kwargs: Any) -> Dict[str, Any]:
+        """요청 1개 (지연 기록, 실패하면 기록 후 예외)"""
+        started = time.perf_counter()
+        try:
+            async with self.http.request(method, f"{self.args.base_url}{path}", **kwargs) as resp:
+                body = await resp.read()
+                if resp.status >= 400:
+                    raise RuntimeError(f"{name} → HTTP {resp.status}: {body[:200]!r}")
+                result = json.loads(body) if body else {}
+        except Exception:
+            self.stats.fail(name)
+            raise
+        self.stats.record(name, (time.perf_counter() - started) * 1000)
+        return result
+
+    async def run(self, index: int) -> None:
+        email = f"load-{uuid.uuid4().hex[:12]}@example.com"
+        password = "load-test-password"
+        user = await self.step("signup", "POST", "/api/users/signup", json={
+            "email": email, "name": f"부하테스트{index}", "password": password,
+            "role": "ROLE_BE", "level": "LEVEL_MID"
+        })
+        token = (await self.step("login", "POST", "/api/users/login", json={
+            "email": email, "password": password
+        }))["access_token"]
+
+        form = aiohttp.FormData()
+        form.add_field("file", self.pdf, filename="portfolio.pdf", content_type="application/pdf")
+        portfolio = await self.step(
+            "portfolio", "POST", "/api/portfolios/upload",
+            data=form, headers={"Authorization": f"Bearer {token}"}
+        )
+
+        form = aiohttp.FormData()
+        form.add_field("user_id", user["id"])
+        form.add_field("portfolio_id", portfolio["id"])
+        started = await self.step("session_start", "POST", "/api/voice/session/start", data=form)
+        session_id = started["session_id"]
+        question_id = started["question"]["id"]
+        turn_type = "main"
+
+        for _ in range(self.args.turns):
+            form = aiohttp.FormData()
+            form.add_field("session_id", session_id)
+            form.add_field("question_id", question_id)
+            form.add_field("turn_type", turn_type)
+            form.add_field("stream_tts", "true" if self.args.stream_tts else "false")
+            form.add_field("audio_file", self.wav, filename="answer.wav", content_type="audio/wav")
+            answer = await self.step(f"turn_{turn_type}", "POST", "/api/voice/answer/complete", data=form)
+            if answer.get("metrics", {}).get("deadline", {}).get("partial"):
+                self.stats.partial += 1
+            next_question = answer["next_question"]
+            if next_question["type"] == "end":
+                break
+            question_id = next_question["id"]
+            turn_type = next_question["question_type"]
+
+        if self.args.video:
+            form = aiohttp.FormData()
+            form.add_field("user_id", user["id"])
+            form.add_field("session_id", session_id)
+            form.add_field("question_id", question_id)
+            with open(self.args.video, "rb") as f:
+                form.add_field("file", f.read(), filename=os.path.basename(self.args.video))
+            video = await self.step("video_upload", "POST", "/api/video/upload", data=form)
+            result = await self.step("video_analyze", "POST", f"/api/video/analyze/{video['video_id']}")
+            if result.get("partial"):
+                self.stats.partial += 1
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Replay interview session flows against the backend")
+    parser.add_argument("--base-url", default="http://localhost:8000", help="Backend URL")
+    parser.add_argument("--flows", type=int, default=20, help="Total user flows")
+    parser.add_argument("--concurrency", type=int, default=5, help="Concurrent flows")
+    parser.add_argument("--turns", type=int, default=4, help="Voice answer turns per session")
+    parser.add_argument("--stream-tts", action="store_true", help="Request audio_stream_url for follow-ups")
+    parser.add_argument("--video", help="Video file for the video analysis step (skipped if omitted)")
+    parser.add_argument("--mock-url", help="Mock model server URL (prints its /mock/stats at the end)")
+    return parser.parse_args()
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    stats = StepStats()
+    semaphore = asyncio.Semaphore(args.concurrency)
+    completed = 0
+
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=600)) as session:
+        runner = FlowRunner(session, args, stats)
+
+        async def worker(index: int) -> None:
+            nonlocal completed
+            async with semaphore:
+                try:
+                    await runner.run(index)
+                    completed += 1
+                except Exception as e:
+                    print(f"⚠️ flow {index} failed: {e}")
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(i) for i in range(args.flows)))
+        elapsed = time.perf_counter() - started
+
+        print(
+            f"\n[flows] {completed} ok / {args.flows - completed} failed in {elapsed:.2f}s "
+            f"({completed / elapsed:.2f} flows/s) | concurrency {args.concurrency} | "
+            f"partial (deadline) responses {stats.partial}\n"
+        )
+        stats.report(elapsed)
+
+        for name, url in (("backend latency", f"{args.base_url}/health/latency"),
+                          ("mock stats", f"{args.mock_url}/mock/stats" if args.mock_url else None)):
+            if url is None:
+                continue
+            try:
+                async with session.get(url) as resp:
+                    if resp.status == 200:
+                        print(f"\n[{name}]")
+                        print(json.dumps(await resp.json(), indent=2, ensure_ascii=False))
+            except aiohttp.ClientError as e:
+                print(f"⚠️ {name} unavailable: {e}")
+
+
+def main():
+    asyncio.run(main_async(parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""TTS 서버 부하 테스트 - 동시 세션 수에 따른 처리량 / 지연 + 큐 지표
+
+먼저 TTS 서버를 띄운 뒤 실행:
+    TTS_WORKERS=2 TTS_MAX_BATCH=8 TTS_MAX_WAIT_MS=10 python scripts/tts_server.py
+    python scripts/load_test_tts.py --base-url http://localhost:8004 --requests 200 --concurrency 16
+
+--unique(기본)면 요청마다 다른 문장을 보내 서버 캐시를 우회 (실제 합성 부하 측정)
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import uuid
+
+import aiohttp
+
+SENTENCES = [
+    "자기소개 부탁드립니다.",
+    "가장 기억에 남는 프로젝트는 무엇인가요?",
+    "그 프로젝트에서 맡은 역할을 설명해 주세요.",
+    "협업 중 갈등이 있었다면 어떻게 해결하셨나요?",
+]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load test the MeloTTS server")
+    parser.add_argument("--base-url", default="http://localhost:8004", help="TTS server URL")
+    parser.add_argument("--requests", type=int, default=100, help="Total requests")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent sessions")
+    parser.add_argument("--endpoint", choices=["tts", "tts/stream"], default="tts")
+    parser.add_argument("--no-unique", dest="unique", action="store_false",
+                        help="Repeat the same sentences (measures cache hits)")
+    return parser.parse_args()
+
+
+async def _one(session: aiohttp.ClientSession, args: argparse.Namespace, index: int) -> float:
+    text = SENTENCES[index % len(SENTENCES)]
+    if args.unique:
+        text = f"{text} 요청 {uuid.uuid4().hex[:6]}번."
+
+    started = time.perf_counter()
+    async with session.post(f"{args.base_url}/{args.endpoint}", json={"text": text}) as resp:
+        resp.raise_for_status()
+        await resp.read()
+    return (time.perf_counter() - started) * 1000
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies = []
+    errors = 0
+
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=300)) as session:
+        async def worker(index: int) -> None:
+            nonlocal errors
+            async with semaphore:
+                try:
+                    latencies.append(await _one(session, args, index))
+                except Exception as e:
+                    errors += 1
+                    print(f"⚠️ request {index} failed: {e}")
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(i) for i in range(args.requests)))
+        elapsed = time.perf_counter() - started
+
+        async with session.get(f"{args.base_url}/queue/stats") as resp:
+            queue_stats = await resp.json() if resp.status == 200 else None
+
+    if latencies:
+        latencies.sort()
+        p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)]
+        print(
+            f"[{args.endpoint}] {len(latencies)} ok / {errors} failed in {elapsed:.2f}s "
+            f"({len(latencies) / elapsed:.2f} req/s) | concurrency {args.concurrency} | "
+            f"p50 {statistics.median(latencies):.0f}ms | p95 {p95:.0f}ms | max {latencies[-1]:.0f}ms"
+        )
+    if queue_stats:
+        print("[queue stats]")
+        print(json.dumps(queue_stats, indent=2, ensure_ascii=False))
+
+
+def main():
+    asyncio.run(main_async(parse_args()))
+
+
+if __name__ == "__main__":
+    main()
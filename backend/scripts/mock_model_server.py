@@ -0,0 +1,460 @@
+#!/usr/bin/env python
+"""모델 서버 대역 (mock) - Gemini REST, /stt, /generate, /tts
+
+실제 모델 / API 쿼터 없이 지연 분포에 따라 기다린 뒤 정해진 응답을 돌려줌.
+클라이언트 / 커넥션 풀 벤치마크 (scripts/bench_http_pool.py)와
+전체 흐름 부하 테스트 (scripts/load_test_flows.py)용
+
+- Gemini: POST /v1beta/models/{model}:generateContent, :streamGenerateContent
+  (GEMINI_API_ENDPOINT로 LLM 게이트웨이 / GeminiClient가 이 서버를 호출)
+  generationConfig.responseSchema가 있으면 스키마에 맞는 JSON을 만들어 응답
+- STT: POST /stt (WhisperA6000Client 계약: multipart file + language → text, segments)
+- LLM: POST /generate (A6000 LLM 계약, stream=true면 NDJSON)
+- TTS: POST /tts, /tts/stream, /tts/audio (MeloTTS 클라이언트 계약)
+- GET /mock/stats: 엔드포인트 그룹별 요청 수 / 주입한 오류 / 평균 지연
+
+엔드포인트 그룹(gemini, stt, generate, tts)마다 지연 분포와 오류율을 따로 지정:
+    --latency gemini=800:lognormal:0.6   평균 800ms, 로그정규 (꼬리 두께 0.6)
+    --latency stt=400:uniform:0.3        400ms ± 30%
+    --error-rate all=0.01                1% 요청에 500
+    --rate-limit-rate 0.05               Gemini 요청 5%에 429 (키 쿨다운 동작 확인)
+    --canned canned.json                 {"프롬프트에 포함된 문자열": "응답 텍스트"} (Gemini / generate)
+
+실행:
+    python scripts/mock_model_server.py --port 8090 --latency-ms 50
+    GEMINI_API_ENDPOINT=http://localhost:8090 GEMINI_API_KEY=mock \\
+    A6000_STT_URL=http://localhost:8090 A6000_LLM_URL=http://localhost:8090 \\
+    A6000_TTS_URL=http://localhost:8090 USE_A6000_MODELS=true uvicorn main:app
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import os
+import random
+import struct
+import uuid
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI, File, Form, Request, UploadFile
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel
+
+app = FastAPI()
+
+# 요청당 인위적 지연 (밀리초, 그룹별 --latency가 없을 때 고정 지연)
+LATENCY_MS = float(os.getenv("MOCK_LATENCY_MS", "50"))
+
+GROUPS = ("gemini", "stt", "generate", "tts")
+
+
+class LatencyProfile:
+    """
+    지연 분포 (평균 mean_ms, 분포 모양 dist, 퍼짐 spread)
+
+    - fixed: 항상 mean_ms
+    - uniform: mean_ms × (1 ± spread)
+    - normal: 표준편차 mean_ms × spread (0 미만은 0)
+    - lognormal: 평균이 mean_ms가 되는 로그정규 (spread = σ, 클수록 꼬리가 김)
+    - exponential: 평균 mean_ms인 지수 분포
+    """
+
+    DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal", "exponential")
+
+    def __init__(self, mean_ms: float, dist: str = "fixed", spread: float = 0.0):
+        if dist not in self.DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {dist}")
+        self.mean_ms = mean_ms
+        self.dist = dist
+        self.spread = spread
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyProfile":
+        """"800", "800:lognormal", "800:lognormal:0.6" 형식"""
+        parts = spec.split(":")
+        mean_ms = float(parts[0])
+        dist = parts[1] if len(parts) > 1 else "fixed"
+        default_spread = {"uniform": 0.3, "normal": 0.3, "lognormal": 0.5}.get(dist, 0.0)
+        spread = float(parts[2]) if len(parts) > 2 else default_spread
+        return cls(mean_ms, dist, spread)
+
+    def sample_ms(self) -> float:
+        if self.mean_ms <= 0:
+            return 0.0
+        if self.dist == "uniform":
+            return random.uniform(self.mean_ms * (1 - self.spread), self.mean_ms * (1 + self.spread))
+        if self.dist == "normal":
+            return max(0.0, random.gauss(self.mean_ms, self.mean_ms * self.spread))
+        if self.dist == "lognormal":
+            return self.mean_ms * random.lognormvariate(-self.spread ** 2 / 2, self.spread)
+        if self.dist == "exponential":
+            return random.expovariate(1.0 / self.mean_ms)
+        return self.mean_ms
+
+    def describe(self) -> str:
+        return f"{self.mean_ms:g}ms {self.dist}" + (f" ({self.spread:g})" if self.spread else "")
+
+
+class MockConfig:
+    """그룹별 지연 분포 / 오류율, Gemini 429 비율, 프롬프트별 고정 응답"""
+
+    def __init__(self):
+        self.latency: Dict[str, LatencyProfile] = {}
+        self.error_rate: Dict[str, float] = {}
+        self.rate_limit_rate = 0.0
+        self.canned: Dict[str, str] = {}
+        self.stats: Dict[str, Dict[str, float]] = {
+            group: {"requests": 0, "errors": 0, "rate_limited": 0, "latency_ms_total": 0.0}
+            for group in GROUPS
+        }
+
+    def profile(self, group: str) -> LatencyProfile:
+        return self.latency.get(group) or LatencyProfile(LATENCY_MS)
+
+    def sample_ms(self, group: str) -> float:
+        latency_ms = self.profile(group).sample_ms()
+        stats = self.stats[group]
+        stats["requests"] += 1
+        stats["latency_ms_total"] += latency_ms
+        return latency_ms
+
+    def injected_error(self, group: str) -> Optional[JSONResponse]:
+        """주입할 오류 응답 (없으면 None)"""
+        if group == "gemini" and random.random() < self.rate_limit_rate:
+            self.stats[group]["rate_limited"] += 1
+            return JSONResponse(status_code=429, content={"error": {
+                "code": 429, "message": "Resource has been exhausted (mock)", "status": "RESOURCE_EXHAUSTED"
+            }})
+        if random.random() < self.error_rate.get(group, 0.0):
+            self.stats[group]["errors"] += 1
+            return JSONResponse(status_code=500, content={"error": {
+                "code": 500, "message": "Internal error (mock)", "status": "INTERNAL"
+            }})
+        return None
+
+    def canned_text(self, prompt: str) -> Optional[str]:
+        for needle, text in self.canned.items():
+            if needle in prompt:
+                return text
+        return None
+
+
+config = MockConfig()
+
+
+async def _delay(group: str) -> float:
+    """그룹의 지연 분포에서 뽑은 시간만큼 대기 (뽑은 값 반환)"""
+    latency_ms = config.sample_ms(group)
+    if latency_ms > 0:
+        await asyncio.sleep(latency_ms / 1000.0)
+    return latency_ms
+
+
+class GenerateRequest(BaseModel):
+    prompt: str
+    max_tokens: int = 200
+    temperature: float = 0.7
+    stream: bool = False
+
+
+class TTSRequest(BaseModel):
+    text: str
+    speaker: str = "KR"
+    speed: float = 1.0
+
+
+class TTSAudioRequest(TTSRequest):
+    format: Optional[str] = None
+    bitrate_kbps: Optional[int] = None
+
+
+@app.get("/health")
+async def health():
+    return {"status": "healthy", "mock": True}
+
+
+@app.get("/mock/stats")
+async def mock_stats():
+    result = {}
+    for group, stats in config.stats.items():
+        requests = int(stats["requests"])
+        result[group] = {
+            "profile": config.profile(group).describe(),
+            "requests": requests,
+            "errors": int(stats["errors"]),
+            "rate_limited": int(stats["rate_limited"]),
+            "avg_latency_ms": round(stats["latency_ms_total"] / requests, 1) if requests else 0.0
+        }
+    return result
+
+
+# ==================== Gemini (REST) ====================
+
+MOCK_FOLLOWUP = "그 프로젝트에서 가장 어려웠던 기술적 문제는 무엇이었나요? 그 문제를 어떻게 해결하셨나요?"
+MOCK_FEEDBACK = (
+    "1. 시선 처리가 안정적이어서 면접관에게 신뢰감을 주는 모습이 좋았습니다.\n\n"
+    "2. 말하는 속도가 다소 빨라 핵심 내용이 잘 전달되지 않을 수 있으니 조금 천천히 말해 보세요.\n\n"
+    "3. 답변 중 '음', '어' 같은 필러가 자주 나오므로 잠시 멈추고 생각을 정리하는 연습을 추천합니다."
+)
+MOCK_GENERIC = "목 서버 응답입니다. 실제 모델을 호출하지 않았습니다."
+
+
+def _prompt_text(body: Dict[str, Any]) -> str:
+    return "\n".join(
+        part.get("text", "")
+        for content in body.get("contents") or []
+        for part in content.get("parts") or []
+        if isinstance(part, dict)
+    )
+
+
+# google.generativeai REST 전송은 Schema.Type을 정수로 보냄 ({"type": 5, "items": {"type": 6, ...}})
+SCHEMA_TYPES = {1: "string", 2: "number", 3: "integer", 4: "boolean", 5: "array", 6: "object"}
+
+
+def _schema_type(schema: Dict[str, Any]) -> str:
+    """responseSchema의 type (정수 enum / "ARRAY" / "array" 모두) → 소문자 이름"""
+    raw = schema.get("type", schema.get("type_", "string"))
+    if isinstance(raw, int) or (isinstance(raw, str) and raw.isdigit()):
+        return SCHEMA_TYPES.get(int(raw), "string")
+    return str(raw).lower()
+
+
+def _schema_value(schema: Dict[str, Any], name: str = "value") -> Any:
+    """Gemini responseSchema(OpenAPI 부분 집합)에 맞는 그럴듯한 값"""
+    schema_type = _schema_type(schema)
+    if schema.get("enum"):
+        return schema["enum"][0]
+    if schema_type == "object":
+        return {key: _schema_value(child, key) for key, child in (schema.get("properties") or {}).items()}
+    if schema_type == "array":
+        return [_schema_value(schema.get("items") or {}, name) for _ in range(3)]
+    if schema_type == "integer":
+        return random.randint(60, 90)
+    if schema_type == "number":
+        return round(random.uniform(60, 90), 1)
+    if schema_type == "boolean":
+        return True
+    return f"mock {name}"
+
+
+def _gemini_text(body: Dict[str, Any]) -> str:
+    prompt = _prompt_text(body)
+    canned = config.canned_text(prompt)
+    if canned is not None:
+        return canned
+    generation_config = body.get("generationConfig") or body.get("generation_config") or {}
+    schema = generation_config.get("responseSchema") or generation_config.get("response_schema")
+    if schema:
+        return json.dumps(_schema_value(schema), ensure_ascii=False)
+    if "json" in str(generation_config.get("responseMimeType", "")).lower():
+        return "{}"
+    if "꼬리" in prompt:
+        return MOCK_FOLLOWUP
+    if "피드백" in prompt:
+        return MOCK_FEEDBACK
+    return MOCK_GENERIC
+
+
+def _gemini_response(text: str, prompt_tokens: int) -> Dict[str, Any]:
+    return {
+        "candidates": [{
+            "content": {"parts": [{"text": text}], "role": "model"},
+            "finishReason": "STOP",
+            "index": 0
+        }],
+        "usageMetadata": {
+            "promptTokenCount": prompt_tokens,
+            "candidatesTokenCount": len(text) // 2,
+            "totalTokenCount": prompt_tokens + len(text) // 2
+        }
+    }
+
+
+@app.post("/{version}/models/{model_action}")
+async def gemini(version: str, model_action: str, request: Request):
+    _, _, action = model_action.partition(":")
+    if action not in ("generateContent", "streamGenerateContent"):
+        return JSONResponse(status_code=404, content={"error": {"code": 404, "status": "NOT_FOUND"}})
+
+    body = await request.json()
+    error = config.injected_error("gemini")
+    latency_ms = await _delay("gemini") if error is None else 0.0
+    if error is not None:
+        return error
+
+    text = _gemini_text(body)
+    prompt_tokens = len(_prompt_text(body)) // 2
+    if action == "generateContent":
+        return _gemini_response(text, prompt_tokens)
+
+    # 스트리밍: 문장 단위 청크 (지연은 첫 청크 전에 절반, 나머지를 청크 사이에 분배)
+    chunks = [sentence + " " for sentence in text.split(". ")] if ". " in text else [text]
+    sse = request.query_params.get("alt") == "sse"
+
+    async def stream():
+        if not sse:
+            yield "["
+        for i, chunk in enumerate(chunks):
+            await asyncio.sleep(latency_ms / 1000.0 / 2 / len(chunks))
+            payload = json.dumps(_gemini_response(chunk, prompt_tokens), ensure_ascii=False)
+            if sse:
+                yield f"data: {payload}\r\n\r\n"
+            else:
+                yield ("," if i else "") + payload
+        if not sse:
+            yield "]"
+
+    return StreamingResponse(stream(), media_type="text/event-stream" if sse else "application/json")
+
+
+# ==================== STT ====================
+
+MOCK_TRANSCRIPT = "네 저는 백엔드 개발자로 일해왔습니다"
+
+
+@app.post("/stt")
+async def stt(file: UploadFile = File(...), language: str = Form("ko")):
+    await file.read()
+    error = config.injected_error("stt")
+    if error is not None:
+        return error
+    await _delay("stt")
+    return {
+        "text": MOCK_TRANSCRIPT,
+        "segments": [{"start": 0.0, "end": 2.5, "text": MOCK_TRANSCRIPT}]
+    }
+
+
+# ==================== LLM (A6000 /generate) ====================
+
+@app.post("/generate")
+async def generate(request: GenerateRequest):
+    error = config.injected_error("generate")
+    if error is not None:
+        return error
+    text = config.canned_text(request.prompt) or MOCK_FOLLOWUP
+    latency_ms = config.sample_ms("generate")
+    if not request.stream:
+        await asyncio.sleep(latency_ms / 1000.0)
+        return {"text": text}
+
+    async def deltas():
+        # 단어 단위로 나눠 전체 지연을 고르게 분배
+        words = text.split(" ")
+        for i, word in enumerate(words):
+            await asyncio.sleep(latency_ms / 1000.0 / len(words))
+            delta = word if i == 0 else " " + word
+            yield json.dumps({"delta": delta}, ensure_ascii=False) + "\n"
+        yield json.dumps({"done": True}) + "\n"
+
+    return StreamingResponse(deltas(), media_type="application/x-ndjson")
+
+
+# ==================== TTS ====================
+
+def _silent_wav(duration_sec: float = 0.5, sample_rate: int = 16000) -> bytes:
+    """무음 16-bit 모노 WAV"""
+    frames = int(duration_sec * sample_rate)
+    buffer = io.BytesIO()
+    buffer.write(b"RIFF" + struct.pack("<I", 36 + frames * 2) + b"WAVE")
+    buffer.write(b"fmt " + struct.pack("<IHHIIHH", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16))
+    buffer.write(b"data" + struct.pack("<I", frames * 2) + b"\x00\x00" * frames)
+    return buffer.getvalue()
+
+
+@app.post("/tts")
+async def tts(request: TTSRequest):
+    error = config.injected_error("tts")
+    if error is not None:
+        return error
+    await _delay("tts")
+    return {"audio_url": f"/audio/{uuid.uuid4().hex}.wav"}
+
+
+@app.post("/tts/stream")
+async def tts_stream(request: TTSRequest):
+    error = config.injected_error("tts")
+    if error is not None:
+        return error
+    sentences: List[str] = [s.strip() for s in request.text.replace("?", "?\n").split("\n") if s.strip()]
+
+    async def events():
+        for index, sentence in enumerate(sentences or [request.text]):
+            await _delay("tts")
+            event = {"index": index, "text": sentence, "audio_url": f"/audio/{uuid.uuid4().hex}.wav"}
+            yield json.dumps(event, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
+@app.post("/tts/audio")
+async def tts_audio(request: TTSAudioRequest):
+    error = config.injected_error("tts")
+    if error is not None:
+        return error
+    await _delay("tts")
+    # 요청한 코덱과 관계없이 무음 WAV (헤더로 실제 코덱을 알려줌)
+    return Response(
+        content=_silent_wav(),
+        media_type="audio/wav",
+        headers={"X-Audio-Codec": "wav"}
+    )
+
+
+def _parse_group_values(specs: List[str], parse_value) -> Dict[str, Any]:
+    """["gemini=800:lognormal", "all=50"] → {그룹: 값} (all은 모든 그룹)"""
+    values: Dict[str, Any] = {}
+    for spec in specs:
+        group, _, value = spec.partition("=")
+        if group != "all" and group not in GROUPS:
+            raise SystemExit(f"Unknown endpoint group: {group} (choose from all, {', '.join(GROUPS)})")
+        for target in (GROUPS if group == "all" else (group,)):
+            values[target] = parse_value(value)
+    return values
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Mock model server (Gemini / STT / LLM / TTS)")
+    parser.add_argument("--host", default="0.0.0.0", help="Host to bind")
+    parser.add_argument("--port", type=int, default=8090, help="Port to bind")
+    parser.add_argument("--latency-ms", type=float, default=LATENCY_MS,
+                        help="Fixed per-request latency for groups without --latency")
+    parser.add_argument("--latency", action="append", default=[], metavar="GROUP=MS[:DIST[:SPREAD]]",
+                        help=f"Latency distribution per group ({', '.join(LatencyProfile.DISTRIBUTIONS)})")
+    parser.add_argument("--error-rate", action="append", default=[], metavar="GROUP=RATE",
+                        help="Fraction of requests answered with HTTP 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0,
+                        help="Fraction of Gemini requests answered with HTTP 429")
+    parser.add_argument("--canned", help="JSON file mapping prompt substrings to response texts")
+    parser.add_argument("--seed", type=int, help="Random seed (reproducible latency / errors)")
+    return parser.parse_args()
+
+
+def main():
+    global LATENCY_MS
+    args = parse_args()
+    LATENCY_MS = args.latency_ms
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    config.latency = _parse_group_values(args.latency, LatencyProfile.parse)
+    config.error_rate = _parse_group_values(args.error_rate, float)
+    config.rate_limit_rate = args.rate_limit_rate
+    if args.canned:
+        with open(args.canned, "r", encoding="utf-8") as f:
+            config.canned = json.load(f)
+
+    import uvicorn
+    print(f"🚀 Starting mock model server on http://{args.host}:{args.port}")
+    for group in GROUPS:
+        error_rate = config.error_rate.get(group, 0.0)
+        print(f"   {group:<8} latency {config.profile(group).describe()}"
+              + (f", error rate {error_rate:g}" if error_rate else "")
+              + (f", 429 rate {config.rate_limit_rate:g}" if group == "gemini" and config.rate_limit_rate else ""))
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,6 @@ import argparse
 import io
 import os
 import sys
-import uuid
 from pathlib import Path
 from typing import Optional
 
@@ -36,6 +35,7 @@ if not MELO_REPO_PATH.exists():
     )
 
 sys.path.insert(0, str(MELO_REPO_PATH))
+sys.path.insert(0, str(BACKEND_ROOT))
 
 try:
     from melo.api import TTS
@@ -45,6 +45,8 @@ except ImportError as exc:
         "pip install -r backend/third_party/MeloTTS/requirements.txt"
     ) from exc
 
+from utils.tts_cache import TTSCache, tts_cache_key
+
 
 # 전역 변수
 app = FastAPI(title="MeloTTS Server")
@@ -52,6 +54,10 @@ models: dict[str, TTS] = {}
 OUTPUT_DIR = BACKEND_ROOT / "tmp" / "tts_outputs"
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+# 같은 (텍스트, 화자, 속도, 모델 버전)은 한 번만 합성 → /audio/cache/<key>.wav
+TTS_MODEL_VERSION = os.getenv("TTS_MODEL_VERSION", "melotts")
+tts_cache = TTSCache(cache_dir=str(OUTPUT_DIR / "cache"))
+
 
 class TTSRequest(BaseModel):
     text: str
@@ -115,24 +121,25 @@ async def synthesize_speech(request: TTSRequest):
                 detail=f"Speaker '{request.speaker}' not found. Available: {list(speaker_ids.keys())}"
             )
 
-        # 음성 생성 (동기 함수를 별도 스레드에서 실행)
-        output_filename = f"{uuid.uuid4().hex}.wav"
-        output_path = OUTPUT_DIR / output_filename
-
-        # run_in_executor로 블록킹 작업을 비동기로 실행
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            lambda: model.tts_to_file(
-                request.text,
-                speaker_ids[request.speaker],
-                str(output_path),
-                speed=request.speed
+        # 음성 생성 (동기 함수를 별도 스레드에서 실행, 같은 요청은 캐시 재사용)
+        async def produce(output_path: str) -> None:
+            # run_in_executor로 블록킹 작업을 비동기로 실행
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(
+                None,
+                lambda: model.tts_to_file(
+                    request.text,
+                    speaker_ids[request.speaker],
+                    output_path,
+                    speed=request.speed
+                )
             )
-        )
+
+        key = tts_cache_key(request.text, request.speaker, request.speed, TTS_MODEL_VERSION)
+        cached_path = await tts_cache.get_or_create(key, produce)
 
         # URL 반환 (정적 파일 제공)
-        audio_url = f"/audio/{output_filename}"
+        audio_url = f"/audio/cache/{cached_path.name}"
 
         return TTSResponse(audio_url=audio_url)
 
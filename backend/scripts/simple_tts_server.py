@@ -7,14 +7,15 @@ from pathlib import Path
 BACKEND_ROOT = Path(__file__).resolve().parents[1]
 MELO_REPO_PATH = BACKEND_ROOT / "third_party" / "MeloTTS"
 sys.path.insert(0, str(MELO_REPO_PATH))
+sys.path.insert(0, str(BACKEND_ROOT))
 
 import asyncio
-import uuid
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from melo.api import TTS
+from utils.tts_cache import TTSCache, tts_cache_key
 
 app = FastAPI()
 
@@ -31,6 +32,7 @@ app.add_middleware(
 OUTPUT_DIR = BACKEND_ROOT / "tmp" / "tts_outputs"
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 model = None
+tts_cache = TTSCache(cache_dir=str(OUTPUT_DIR / "cache"))
 
 
 class TTSRequest(BaseModel):
@@ -63,24 +65,25 @@ async def health():
 
 @app.post("/tts")
 async def tts(request: TTSRequest):
-    # 파일명 생성
-    output_filename = f"{uuid.uuid4().hex}.wav"
-    output_path = OUTPUT_DIR / output_filename
-
-    # TTS 생성 (별도 스레드에서 실행)
-    loop = asyncio.get_event_loop()
     speaker_id = model.hps.data.spk2id[request.speaker]
 
-    await loop.run_in_executor(
-        None,
-        model.tts_to_file,
-        request.text,
-        speaker_id,
-        str(output_path),
-        request.speed
-    )
-
-    return {"audio_url": f"/audio/{output_filename}"}
+    async def produce(output_path: str) -> None:
+        # TTS 생성 (별도 스레드에서 실행)
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(
+            None,
+            model.tts_to_file,
+            request.text,
+            speaker_id,
+            output_path,
+            request.speed
+        )
+
+    # 같은 요청은 캐시 재사용
+    key = tts_cache_key(request.text, request.speaker, request.speed, "melotts-kr")
+    cached_path = await tts_cache.get_or_create(key, produce)
+
+    return {"audio_url": f"/audio/cache/{cached_path.name}"}
 
 
 # 정적 파일 제공
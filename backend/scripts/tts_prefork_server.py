@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+"""MeloTTS 멀티 프로세스 서버 - 모델을 먼저 로드한 뒤 fork
+
+tts_server.py(app)를 그대로 쓰되:
+    1. 마스터가 모델 가중치를 로드하고 gc.freeze() (copy-on-write 페이지 공유 유지)
+    2. 리스닝 소켓을 만든 뒤 N개 워커 fork (소켓 공유, 커널이 연결 분배)
+    3. 워커마다 CPU affinity / torch 스레드 수 설정 → warm-up 추론 → /ready 200
+    4. 워커가 죽으면 같은 번호로 다시 fork (번호별 지수 백오프)
+       빨리 죽는 일이 TTS_MAX_FAST_FAILURES번 연속되면 그 번호는 포기,
+       모든 워커를 포기하면 마스터도 종료 (exit 1, 재시작은 프로세스 관리자에 맡김)
+
+실행:
+    TTS_PROCESSES=4 TTS_THREADS_PER_PROCESS=2 python scripts/tts_prefork_server.py --port 8004
+    curl http://localhost:8004/ready
+
+warm-up 추론은 fork 이후 워커에서만 실행 (fork 전에 OpenMP 스레드 풀을 만들면
+자식 프로세스에서 멈출 수 있음)
+
+환경 변수:
+    TTS_PROCESSES: 워커 프로세스 수 (기본: CPU 수 // TTS_THREADS_PER_PROCESS)
+    TTS_THREADS_PER_PROCESS: 워커별 torch 스레드 수 (기본: 2)
+    TTS_CPU_AFFINITY: true면 워커마다 겹치지 않는 CPU 집합에 고정 (Linux, 기본: true)
+    TTS_RESTART_BACKOFF_SEC: 워커 재시작 첫 대기 시간, 연속 실패마다 2배 (기본: 1)
+    TTS_RESTART_BACKOFF_MAX_SEC: 재시작 대기 시간 상한 (기본: 30)
+    TTS_FAST_FAILURE_SEC: 이보다 빨리 죽으면 연속 실패로 셈 (기본: 60, warm-up 포함)
+    TTS_MAX_FAST_FAILURES: 번호별 연속 실패 허용 횟수 (기본: 5)
+"""
+
+import argparse
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+# 프로세스마다 모델 1개 (프로세스 안의 배치 워커는 1개로 고정)
+if os.getenv("TTS_WORKERS", "1") != "1":
+    print("⚠️ TTS_WORKERS is ignored in prefork mode (1 model per process)")
+os.environ["TTS_WORKERS"] = "1"
+
+import tts_server  # noqa: E402
+
+THREADS_PER_PROCESS = int(os.getenv("TTS_THREADS_PER_PROCESS", "2"))
+CPU_AFFINITY = os.getenv("TTS_CPU_AFFINITY", "true").lower() == "true"
+RESTART_BACKOFF_SEC = float(os.getenv("TTS_RESTART_BACKOFF_SEC", "1"))
+RESTART_BACKOFF_MAX_SEC = float(os.getenv("TTS_RESTART_BACKOFF_MAX_SEC", "30"))
+FAST_FAILURE_SEC = float(os.getenv("TTS_FAST_FAILURE_SEC", "60"))
+MAX_FAST_FAILURES = int(os.getenv("TTS_MAX_FAST_FAILURES", "5"))
+
+
+def parse_args() -> argparse.Namespace:
+    default_processes = int(os.getenv(
+        "TTS_PROCESSES", str(max(1, (os.cpu_count() or 1) // THREADS_PER_PROCESS))
+    ))
+    parser = argparse.ArgumentParser(description="Prefork MeloTTS server")
+    parser.add_argument("--host", default="0.0.0.0", help="Host to bind")
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8004")), help="Port to bind")
+    parser.add_argument("--processes", type=int, default=default_processes, help="Worker processes")
+    parser.add_argument("--threads", type=int, default=THREADS_PER_PROCESS, help="Torch threads per worker")
+    return parser.parse_args()
+
+
+def _worker_cpus(index: int, threads: int) -> Optional[List[int]]:
+    """워커 번호 → 고정할 CPU 목록 (CPU가 모자라면 순환)"""
+    if not CPU_AFFINITY or not hasattr(os, "sched_getaffinity"):
+        return None
+    available = sorted(os.sched_getaffinity(0))
+    start = (index * threads) % len(available)
+    return [available[(start + i) % len(available)] for i in range(min(threads, len(available)))]
+
+
+def _run_worker(index: int, sock: socket.socket, threads: int) -> None:
+    """자식 프로세스: 스레드 / affinity 설정 → warm-up → uvicorn"""
+    cpus = _worker_cpus(index, threads)
+    if cpus:
+        os.sched_setaffinity(0, cpus)
+
+    import torch
+    torch.set_num_threads(threads)
+
+    elapsed = tts_server.warm_up(0)
+    print(f"✅ worker {index} (pid {os.getpid()}) ready: warm-up {elapsed:.2f}s, "
+          f"threads {threads}, cpus {cpus or 'any'}")
+
+    import uvicorn
+    server = uvicorn.Server(uvicorn.Config(tts_server.app, log_level="warning"))
+    server.run(sockets=[sock])
+
+
+def _spawn(index: int, sock: socket.socket, threads: int) -> int:
+    pid = os.fork()
+    if pid == 0:
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        code = 0
+        try:
+            _run_worker(index, sock, threads)
+        except Exception as e:
+            print(f"❌ worker {index} failed: {e}")
+            code = 1
+        finally:
+            os._exit(code)
+    return pid
+
+
+def restart_delay(failures: int) -> float:
+    """연속 실패 횟수 → 재시작 전 대기 시간 (1, 2, 4, ... 상한까지)"""
+    if failures <= 0:
+        return 0.0
+    return min(RESTART_BACKOFF_SEC * (2 ** (failures - 1)), RESTART_BACKOFF_MAX_SEC)
+
+
+def main():
+    args = parse_args()
+
+    # 1. fork 전에 가중치 로드 (추론은 하지 않음)
+    started = time.perf_counter()
+    tts_server.get_model(0)
+    gc.collect()
+    gc.freeze()  # 이후 GC가 공유 객체를 건드려 페이지를 복사하지 않도록
+    print(f"🔊 Model preloaded in {time.perf_counter() - started:.1f}s (pid {os.getpid()})")
+
+    # 2. 공유 리스닝 소켓
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((args.host, args.port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+
+    # 3. 워커 fork
+    workers: Dict[int, int] = {}              # pid → 워커 번호
+    spawned_at: Dict[int, float] = {}         # 워커 번호 → 마지막 fork 시각
+    failures: Dict[int, int] = {}             # 워커 번호 → 연속 빠른 실패 횟수
+    pending: Dict[int, float] = {}            # 워커 번호 → 재시작 예정 시각
+    given_up: List[int] = []
+
+    def spawn(index: int) -> None:
+        workers[_spawn(index, sock, args.threads)] = index
+        spawned_at[index] = time.monotonic()
+
+    for index in range(args.processes):
+        spawn(index)
+    print(f"🚀 {args.processes} TTS worker(s) on http://{args.host}:{args.port} "
+          f"({args.threads} thread(s) each, affinity {'on' if CPU_AFFINITY else 'off'})")
+
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        pending.clear()
+        for pid in workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    # 4. 감시: 죽은 워커는 백오프 후 같은 번호로 재시작
+    #    (재시작 대기 중에도 다른 워커 종료를 놓치지 않도록 예정 시각까지만 폴링)
+    while workers or pending:
+        now = time.monotonic()
+        for index, due in list(pending.items()):
+            if due <= now and not stopping:
+                del pending[index]
+                spawn(index)
+
+        try:
+            if pending:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+                if pid == 0:
+                    time.sleep(max(0.0, min(0.5, min(pending.values(), default=0.0) - time.monotonic())))
+                    continue
+            else:
+                pid, status = os.wait()
+        except ChildProcessError:
+            if pending:
+                time.sleep(max(0.0, min(pending.values(), default=0.0) - time.monotonic()))
+                continue
+            break
+        except InterruptedError:
+            continue
+
+        index = workers.pop(pid, None)
+        if index is None or stopping:
+            continue
+
+        uptime = time.monotonic() - spawned_at[index]
+        failures[index] = failures.get(index, 0) + 1 if uptime < FAST_FAILURE_SEC else 1
+        if uptime < FAST_FAILURE_SEC and failures[index] >= MAX_FAST_FAILURES:
+            given_up.append(index)
+            print(f"❌ worker {index} (pid {pid}) failed {failures[index]} times in a row "
+                  f"(last uptime {uptime:.1f}s), not restarting")
+            continue
+        delay = restart_delay(failures[index])
+        print(f"⚠️ worker {index} (pid {pid}) exited with status {status} after {uptime:.1f}s, "
+              f"restarting in {delay:.1f}s")
+        pending[index] = time.monotonic() + delay
+
+    sock.close()
+    if not stopping and len(given_up) == args.processes:
+        print("❌ All TTS workers failed, stopping the master")
+        sys.exit(1)
+    print("👋 TTS server stopped")
+
+
+if __name__ == "__main__":
+    main()
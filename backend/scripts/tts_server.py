@@ -8,14 +8,26 @@ from pathlib import Path
 BACKEND_ROOT = Path(__file__).resolve().parents[1]
 MELO_REPO_PATH = BACKEND_ROOT / "third_party" / "MeloTTS"
 sys.path.insert(0, str(MELO_REPO_PATH))
+sys.path.insert(0, str(BACKEND_ROOT))
 
 import asyncio
-import uuid
-from fastapi import FastAPI, HTTPException
+import json
+import tempfile
+import threading
+import time
+from typing import Optional
+
+from fastapi import FastAPI, Header, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
+from utils.audio_utils import AUDIO_CODECS, clamp_bitrate, encode_audio, negotiate_audio_codec
+from utils.micro_batcher import MicroBatcher
+from utils.sentences import split_sentences
+from utils.tts_cache import TTSCache, tts_cache_key
+
 app = FastAPI()
 
 app.add_middleware(
@@ -30,25 +42,111 @@ app.add_middleware(
 OUTPUT_DIR = Path(os.getenv("OUTPUT_DIR", str(BACKEND_ROOT / "tmp" / "tts_outputs")))
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-# 모델은 나중에 로드
-_model = None
+# 같은 (텍스트, 화자, 속도, 모델 버전)은 한 번만 합성 → /audio/cache/<key>.wav
+TTS_MODEL_VERSION = os.getenv("TTS_MODEL_VERSION", "melotts-kr")
+tts_cache = TTSCache(cache_dir=str(OUTPUT_DIR / "cache"))
+
+# /tts/audio 결과(wav + 압축본)를 캐시 디렉토리에 남길지 (false면 요청마다 임시 파일만 사용)
+TTS_PERSIST_AUDIO = os.getenv("TTS_PERSIST_AUDIO", "true").lower() == "true"
+
+# 모델은 나중에 로드 (워커별 인스턴스)
+# 요청 핸들러(화자 조회)와 배치 워커 스레드가 동시에 처음 로드해도 한 번만 로드
+_models = {}
+_models_lock = threading.Lock()
+# 이 프로세스에서 실제 추론이 한 번 이상 끝났는지 (/ready)
+_warmed_up = False
+
+
+def get_model(worker_id: int = 0):
+    """Lazy loading - 첫 요청 때 모델 로드 (블로킹, 이벤트 루프에서는 resolve_speaker 사용)"""
+    model = _models.get(worker_id)
+    if model is not None:
+        return model
+    with _models_lock:
+        if worker_id not in _models:
+            print(f"🔊 Loading TTS model (worker {worker_id})...")
+            try:
+                from melo.api import TTS
+                _models[worker_id] = TTS(language="KR", device="cpu")
+                print(f"✅ Model loaded! (worker {worker_id})")
+            except Exception as e:
+                print(f"❌ Model loading failed: {e}")
+                import traceback
+                traceback.print_exc()
+                raise
+        return _models[worker_id]
+
 
+async def resolve_speaker(speaker: str) -> int:
+    """
+    화자 이름 → speaker ID (워커 0의 모델 기준)
 
-def get_model():
-    """Lazy loading - 첫 요청 때 모델 로드"""
-    global _model
-    if _model is None:
-        print("🔊 Loading TTS model...")
+    모델이 아직 없으면 이벤트 루프 밖에서 로드 (로드 중에도 다른 요청 / 헬스 체크 처리)
+
+    Raises:
+        HTTPException(400): 없는 화자
+    """
+    model = _models.get(0) or await asyncio.to_thread(get_model, 0)
+    speaker_ids = model.hps.data.spk2id
+    if speaker not in speaker_ids:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Speaker '{speaker}' not found. Available: {list(speaker_ids.keys())}"
+        )
+    return speaker_ids[speaker]
+
+
+def synthesize_batch(worker_id: int, jobs: list) -> list:
+    """
+    워커 스레드에서 배치 합성
+
+    jobs: (text, speaker_id, output_path, speed) 리스트
+    요청별로 실패를 분리해 한 요청의 오류가 배치 전체를 실패시키지 않음
+    """
+    global _warmed_up
+    model = get_model(worker_id)
+    results = []
+    for text, speaker_id, output_path, speed in jobs:
         try:
-            from melo.api import TTS
-            _model = TTS(language="KR", device="cpu")
-            print("✅ Model loaded!")
+            model.tts_to_file(text, speaker_id, output_path, speed)
+            results.append(output_path)
+            _warmed_up = True
         except Exception as e:
-            print(f"❌ Model loading failed: {e}")
-            import traceback
-            traceback.print_exc()
-            raise
-    return _model
+            results.append(e)
+    return results
+
+
+def warm_up(worker_id: int = 0, text: str = "안녕하세요.") -> float:
+    """
+    짧은 문장으로 추론 1회 (지연 초기화 / 스레드 풀 생성 비용을 첫 사용자 대신 부담)
+
+    Returns:
+        warm-up 소요 시간 (초)
+    """
+    global _warmed_up
+    started = time.perf_counter()
+    model = get_model(worker_id)
+    output_path = OUTPUT_DIR / f"warmup_{os.getpid()}.wav"
+    try:
+        model.tts_to_file(text, model.hps.data.spk2id["KR"], str(output_path), 1.0)
+    finally:
+        output_path.unlink(missing_ok=True)
+    _warmed_up = True
+    return time.perf_counter() - started
+
+
+# 요청 큐 → 마이크로 배치 → 고정 워커 (모델 경합 / 기본 스레드 풀 경합 방지)
+# 환경 변수:
+#     TTS_WORKERS: 모델 워커 수 (워커마다 모델 1개 로드, 기본: 1)
+#     TTS_MAX_BATCH: 배치 최대 크기 (기본: 8)
+#     TTS_MAX_WAIT_MS: 배치를 모으는 최대 대기 시간 (기본: 10)
+tts_batcher = MicroBatcher(
+    "tts",
+    synthesize_batch,
+    workers=int(os.getenv("TTS_WORKERS", "1")),
+    max_batch_size=int(os.getenv("TTS_MAX_BATCH", "8")),
+    max_wait_ms=float(os.getenv("TTS_MAX_WAIT_MS", "10"))
+)
 
 
 class TTSRequest(BaseModel):
@@ -57,6 +155,11 @@ class TTSRequest(BaseModel):
     speed: float = 1.0
 
 
+class TTSAudioRequest(TTSRequest):
+    format: Optional[str] = None        # opus | webm | mp3 | wav (없으면 Accept 헤더)
+    bitrate_kbps: Optional[int] = None
+
+
 @app.get("/")
 async def root():
     return {"status": "ok", "message": "MeloTTS Server"}
@@ -67,37 +170,28 @@ async def health():
     return {"status": "healthy"}
 
 
+@app.get("/ready")
+async def ready():
+    """warm-up 추론이 끝난 뒤에만 200 (로드 밸런서 / 오케스트레이터 readiness probe용)"""
+    if not _warmed_up:
+        return JSONResponse(status_code=503, content={"status": "warming_up", "pid": os.getpid()})
+    return {"status": "ready", "pid": os.getpid(), "models": len(_models)}
+
+
 @app.post("/tts")
 async def tts(request: TTSRequest):
     try:
-        model = get_model()
-
-        # 파일명 생성
-        output_filename = f"{uuid.uuid4().hex}.wav"
-        output_path = OUTPUT_DIR / output_filename
-
         # speaker ID 가져오기
-        speaker_ids = model.hps.data.spk2id
-        if request.speaker not in speaker_ids:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Speaker '{request.speaker}' not found. Available: {list(speaker_ids.keys())}"
-            )
+        speaker_id = await resolve_speaker(request.speaker)
 
-        speaker_id = speaker_ids[request.speaker]
-
-        # TTS 생성 (별도 스레드)
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            model.tts_to_file,
-            request.text,
-            speaker_id,
-            str(output_path),
-            request.speed
-        )
+        async def produce(output_path: str) -> None:
+            # TTS 생성 (배치 큐 → 모델 워커)
+            await tts_batcher.submit((request.text, speaker_id, output_path, request.speed))
+
+        key = tts_cache_key(request.text, request.speaker, request.speed, TTS_MODEL_VERSION)
+        cached_path = await tts_cache.get_or_create(key, produce)
 
-        return {"audio_url": f"/audio/{output_filename}"}
+        return {"audio_url": f"/audio/cache/{cached_path.name}"}
 
     except HTTPException:
         raise
@@ -105,6 +199,122 @@ async def tts(request: TTSRequest):
         raise HTTPException(status_code=500, detail=f"TTS failed: {str(e)}")
 
 
+@app.post("/tts/stream")
+async def tts_stream(request: TTSRequest):
+    """
+    문장/절 단위 스트리밍 합성 (NDJSON, chunked)
+
+    조각 하나가 끝날 때마다 한 줄씩 전송하므로 클라이언트는 첫 조각부터 재생 가능
+        {"index": 0, "text": "...", "audio_url": "/audio/cache/...", "elapsed_ms": 812.3}
+        ...
+        {"done": true, "chunks": 3, "ttfb_ms": 812.3, "total_ms": 2310.5}
+    """
+    speaker_id = await resolve_speaker(request.speaker)
+    chunks = split_sentences(request.text)
+
+    async def events():
+        started = time.perf_counter()
+        ttfb_ms = None
+        try:
+            for index, chunk in enumerate(chunks):
+                async def produce(output_path: str, chunk: str = chunk) -> None:
+                    await tts_batcher.submit((chunk, speaker_id, output_path, request.speed))
+
+                key = tts_cache_key(chunk, request.speaker, request.speed, TTS_MODEL_VERSION)
+                cached_path = await tts_cache.get_or_create(key, produce)
+
+                elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+                if ttfb_ms is None:
+                    ttfb_ms = elapsed_ms
+                yield json.dumps({
+                    "index": index,
+                    "text": chunk,
+                    "audio_url": f"/audio/cache/{cached_path.name}",
+                    "elapsed_ms": elapsed_ms
+                }, ensure_ascii=False) + "\n"
+
+            total_ms = round((time.perf_counter() - started) * 1000, 1)
+            print(f"🔊 stream TTS: {len(chunks)} chunks, TTFB {ttfb_ms}ms, total {total_ms}ms")
+            yield json.dumps({
+                "done": True,
+                "chunks": len(chunks),
+                "ttfb_ms": ttfb_ms,
+                "total_ms": total_ms
+            }) + "\n"
+        except Exception as e:
+            yield json.dumps({"error": str(e)}, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
+@app.post("/tts/audio")
+async def tts_audio(request: TTSAudioRequest, accept: Optional[str] = Header(None)):
+    """
+    압축 오디오를 응답 본문으로 직접 반환 (정적 파일 URL / 두 번째 요청 불필요)
+
+    코덱: body의 format > Accept 헤더 (audio/ogg, audio/webm, audio/mpeg, audio/wav) > TTS_AUDIO_CODEC
+    응답 헤더: Content-Type, X-Audio-Codec, X-Audio-Bitrate-Kbps, X-Cache
+    """
+    try:
+        codec = negotiate_audio_codec(request.format, accept)
+    except ValueError as e:
+        raise HTTPException(status_code=406, detail=str(e))
+    spec = AUDIO_CODECS[codec]
+    bitrate = clamp_bitrate(codec, request.bitrate_kbps)
+
+    speaker_id = await resolve_speaker(request.speaker)
+
+    async def synthesize_wav(output_path: str) -> None:
+        await tts_batcher.submit((request.text, speaker_id, output_path, request.speed))
+
+    try:
+        if TTS_PERSIST_AUDIO:
+            # 파일 캐시 계층: wav 1개 + (코덱, 비트레이트)별 압축본
+            key = tts_cache_key(request.text, request.speaker, request.speed, TTS_MODEL_VERSION)
+            encoded_key = tts_cache_key(
+                request.text, request.speaker, request.speed, TTS_MODEL_VERSION,
+                namespace=f"{codec}@{bitrate}"
+            )
+            cached = tts_cache.get(encoded_key, spec["suffix"])
+            if cached is None:
+                wav_path = await tts_cache.get_or_create(key, synthesize_wav)
+
+                async def encode(output_path: str) -> None:
+                    await asyncio.to_thread(encode_audio, str(wav_path), output_path, codec, bitrate)
+
+                cached = await tts_cache.get_or_create(encoded_key, encode, suffix=spec["suffix"])
+                cache_status = "miss"
+            else:
+                cache_status = "hit"
+            audio = await asyncio.to_thread(cached.read_bytes)
+        else:
+            with tempfile.TemporaryDirectory(prefix="tts_audio_") as tmp_dir:
+                wav_path = os.path.join(tmp_dir, "speech.wav")
+                encoded_path = os.path.join(tmp_dir, f"speech{spec['suffix']}")
+                await synthesize_wav(wav_path)
+                await asyncio.to_thread(encode_audio, wav_path, encoded_path, codec, bitrate)
+                audio = await asyncio.to_thread(Path(encoded_path).read_bytes)
+            cache_status = "bypass"
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"TTS failed: {str(e)}")
+
+    headers = {"X-Audio-Codec": codec, "X-Cache": cache_status, "Vary": "Accept"}
+    if bitrate:
+        headers["X-Audio-Bitrate-Kbps"] = str(bitrate)
+    return Response(content=audio, media_type=spec["mime"], headers=headers)
+
+
+@app.get("/cache/stats")
+async def cache_stats():
+    return tts_cache.stats()
+
+
+@app.get("/queue/stats")
+async def queue_stats():
+    """요청 큐 / 배치 지표 (큐 길이, 배치 크기, 대기 / 처리 지연 히스토그램)"""
+    return tts_batcher.stats()
+
+
 # 정적 파일
 app.mount("/audio", StaticFiles(directory=str(OUTPUT_DIR)), name="audio")
 
@@ -114,5 +324,7 @@ if __name__ == "__main__":
     port = int(os.getenv("PORT", "8004"))
     print(f"🚀 Starting TTS server on http://0.0.0.0:{port}")
     print("⚠️  Model will load on first request (lazy loading)")
+    print("💡 Preloaded multi-process mode: python scripts/tts_prefork_server.py")
+    print(f"📦 Batching: {tts_batcher.workers} worker(s), batch ≤ {tts_batcher.max_batch_size}, wait ≤ {tts_batcher.max_wait_ms}ms")
     print(f"📁 Output directory: {OUTPUT_DIR}")
     uvicorn.run(app, host="0.0.0.0", port=port, log_level="info")
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""TTS 캐시 워밍업: 고정 메인 질문 음성을 미리 합성
+
+백엔드와 같은 환경 변수(USE_A6000_MODELS, MELO_TTS_BASE_URL, TTS_CACHE_DIR)로
+get_tts_client()를 통해 합성하므로 백엔드 캐시와 TTS 서버 캐시가 함께 채워짐
+
+Usage:
+    python scripts/warm_tts_cache.py --speaker KR --speed 1.0
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+load_dotenv(BACKEND_ROOT / ".env")
+
+from clients import get_tts_client
+from clients.http_pool import close_http_pool
+from services.question_generator import pre_synthesize_main_questions
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pre-synthesize predefined main questions")
+    parser.add_argument("--speaker", default="KR", help="Speaker id (default: KR)")
+    parser.add_argument("--speed", type=float, default=1.0, help="Speed (default: 1.0)")
+    return parser.parse_args()
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    tts_client = get_tts_client()
+    try:
+        audio_urls = await pre_synthesize_main_questions(tts_client, speaker=args.speaker, speed=args.speed)
+        for question_id, audio_url in audio_urls.items():
+            print(f"✅ {question_id}: {audio_url}")
+    finally:
+        await tts_client.close()
+        await close_http_pool()
+
+
+def main():
+    asyncio.run(main_async(parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -8,18 +8,17 @@ import os
 import json
 from typing import Dict, Any, List
 from sqlalchemy.orm import Session
-import google.generativeai as genai
 from dotenv import load_dotenv
 
+from clients.llm_gateway import get_llm_gateway
 from models import Portfolio, User, CapabilityEvaluation
+from utils.single_flight import single_flight
+from utils.structured_output import JSONRepairError, valid_items, json_generation_config, parse_json_response
+from utils.prompt_budget import compact_analysis, compact_json, estimate_tokens, fit_to_budget, log_prompt_size
+from schemas import CapabilityScoreItem, CapabilityScoresResult
 
 load_dotenv()
 
-# Gemini API 설정
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-if GEMINI_API_KEY:
-    genai.configure(api_key=GEMINI_API_KEY)
-
 
 # 직무별 역량 카테고리 정의 (6개 고정)
 ROLE_CAPABILITIES = {
@@ -53,10 +52,16 @@ ROLE_CAPABILITIES = {
 class CapabilityEvaluator:
     """역량 평가 생성 클래스"""
 
-    def __init__(self, model_name: str = None):
+    def __init__(self, model_name: str = None, use_cache: bool = True):
+        """
+        Args:
+            model_name: 사용할 Gemini 모델 이름
+            use_cache: False면 LLM 응답 캐시를 우회 (항상 새로 평가)
+        """
         if model_name is None:
             model_name = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
-        self.model = genai.GenerativeModel(model_name)
+        self.model_name = model_name
+        self.use_cache = use_cache
 
     def evaluate_portfolio_capabilities(
         self,
@@ -67,6 +72,8 @@ class CapabilityEvaluator:
         """
         포트폴리오를 분석하여 6개 역량 평가 생성
 
+        같은 포트폴리오에 대한 동시 요청은 한 번만 평가하고 결과를 공유
+
         Args:
             portfolio_id: 포트폴리오 ID
             user_id: 사용자 ID
@@ -75,6 +82,18 @@ class CapabilityEvaluator:
         Returns:
             생성된 역량 평가 데이터
         """
+        return single_flight.do(
+            "evaluate_portfolio_capabilities",
+            [self.model_name, portfolio_id, user_id],
+            lambda: self._evaluate_portfolio_capabilities(portfolio_id, user_id, db)
+        )
+
+    def _evaluate_portfolio_capabilities(
+        self,
+        portfolio_id: str,
+        user_id: str,
+        db: Session
+    ) -> Dict[str, Any]:
         # 1. Portfolio, User 조회
         portfolio = db.query(Portfolio).filter(Portfolio.id == portfolio_id).first()
         if not portfolio:
@@ -155,6 +174,16 @@ class CapabilityEvaluator:
         cv_analysis = summary_data.get("cv_analysis", {})
         github_analysis = summary_data.get("github_analysis", {})
 
+        # 분석 결과를 토큰 예산 안으로 압축 (원본 저장소 목록 / README 등은 제외)
+        analysis_json = fit_to_budget(lambda level: compact_json({
+            "cv": compact_analysis(cv_analysis, level),
+            "github": compact_analysis(github_analysis, level)
+        }))
+        raw_analysis_tokens = estimate_tokens(
+            json.dumps(cv_analysis, ensure_ascii=False, indent=2)
+            + json.dumps(github_analysis, ensure_ascii=False, indent=2)
+        )
+
         # 역량 카테고리 리스트
         capability_names = [f"{cap['name_ko']} ({cap['name_en']})" for cap in capabilities]
 
@@ -165,15 +194,12 @@ class CapabilityEvaluator:
 아래 {role_name}의 포트폴리오 분석 결과를 바탕으로, 다음 6가지 역량에 대해 각각 점수를 매기고 피드백을 작성해주세요.
 
 # 포트폴리오 분석 결과
-
-## CV 분석
-{json.dumps(cv_analysis, ensure_ascii=False, indent=2)}
-
-## GitHub 분석
-{json.dumps(github_analysis, ensure_ascii=False, indent=2)}
+(cv: CV 분석, github: GitHub 분석 / score: 전체 점수, has: 보유 스킬, missing: 부족한 필수 스킬,
+strengths·weaknesses: {{스킬: 근거}}, summary: 요약)
+{analysis_json}
 
 # 평가 대상 역량 (6개)
-{json.dumps(capability_names, ensure_ascii=False, indent=2)}
+{compact_json(capability_names)}
 
 # 요구사항
 각 역량에 대해 다음을 작성해주세요:
@@ -209,27 +235,35 @@ class CapabilityEvaluator:
 - feedback은 긍정적 평가 1문장 + 개선 방향 2-3문장 형식을 반드시 지켜주세요.
 """
 
-        # Gemini API 호출
-        response = self.model.generate_content(prompt)
-        result_text = response.text
+        log_prompt_size(
+            "capability_scores",
+            prompt,
+            baseline_tokens=estimate_tokens(prompt) - estimate_tokens(analysis_json) + raw_analysis_tokens
+        )
 
-        # JSON 파싱
-        if "```json" in result_text:
-            result_text = result_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in result_text:
-            result_text = result_text.split("```")[1].split("```")[0].strip()
+        # Gemini API 호출 (LLM 게이트웨이: 키 라우팅 / 속도 제한 / 429 쿨다운 / 응답 캐시)
+        # 스키마를 지정한 JSON 모드 + 깨진 응답은 로컬 복구
+        gateway = get_llm_gateway()
+        generation_config = json_generation_config(CapabilityScoresResult)
+        response = gateway.generate_content(
+            prompt, model_name=self.model_name, cache=self.use_cache, generation_config=generation_config
+        )
 
         try:
-            result_data = json.loads(result_text)
-            evaluations = result_data.get("evaluations", [])
+            result_data = parse_json_response(response.text, "capability_scores")
+            evaluations = valid_items(result_data.get("evaluations", []), CapabilityScoreItem)
 
             if len(evaluations) != 6:
                 raise ValueError(f"Gemini가 {len(evaluations)}개 역량을 반환했습니다. 6개여야 합니다.")
 
             return evaluations
 
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Gemini 응답을 JSON으로 파싱할 수 없습니다: {str(e)}\n\n응답:\n{result_text}")
+        except (AttributeError, ValueError) as e:
+            # 같은 응답을 캐시에서 다시 받지 않도록 삭제
+            gateway.forget(prompt, model_name=self.model_name, generation_config=generation_config)
+            if isinstance(e, JSONRepairError):
+                raise ValueError(f"Gemini 응답을 JSON으로 파싱할 수 없습니다: {str(e)}\n\n응답:\n{e.text}")
+            raise
 
     def _save_to_db(
         self,
@@ -6,7 +6,7 @@ CV 분석 서비스
 
 import os
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from io import BytesIO
 from sqlalchemy.orm import Session
 from PIL import Image
@@ -14,6 +14,8 @@ from PIL import Image
 from models import User, Portfolio
 from rag.utils import get_competency_matrix
 from .llm_analyzer import LLMAnalyzer
+from .portfolio_digest import build_portfolio_digest, format_portfolio_digest, load_portfolio_digest
+from .portfolio_summary import merge_portfolio_summary
 
 
 class CVAnalyzer:
@@ -178,6 +180,36 @@ class CVAnalyzer:
                 "summary": "..."
             }
         """
+        prepared = self.prepare_analysis(portfolio_id, user_id, db, role, level)
+
+        # 7. DB 업데이트
+        print(f"[INFO] Saving analysis to database...")
+        portfolio = db.query(Portfolio).filter(Portfolio.id == portfolio_id).first()
+        self.save_analysis_to_db(
+            portfolio=portfolio,
+            extracted_text=prepared["extracted_text"],
+            analysis=prepared["analysis"],
+            db=db,
+            digest=prepared["digest"]
+        )
+
+        # 8. 결과 반환
+        return self.analysis_response(portfolio_id, user_id, prepared)
+
+    def prepare_analysis(
+        self,
+        portfolio_id: str,
+        user_id: str,
+        db: Session,
+        role: str = None,
+        level: str = None
+    ) -> Dict[str, Any]:
+        """
+        CV 분석 (DB 저장 없음, db는 조회에만 사용)
+
+        Returns:
+            {"role", "level", "extracted_text", "analysis", "digest"}
+        """
         # 1. DB에서 Portfolio, User 조회
         portfolio = db.query(Portfolio).filter(Portfolio.id == portfolio_id).first()
         if not portfolio:
@@ -193,22 +225,28 @@ class CVAnalyzer:
         if not level:
             level = user.level
 
-        # 3. 파일 경로 확인
-        file_url = portfolio.file_url
-        # /static/uploads/FE.pdf -> backend/static/uploads/FE.pdf
-        file_path = os.path.join(os.path.dirname(__file__), "..", file_url.lstrip("/"))
+        # 3~4. 텍스트 추출 (이미 추출해 둔 텍스트가 충분하면 파일을 다시 파싱하지 않음)
+        extracted_text = portfolio.parsed_text
+        if not extracted_text or len(extracted_text.strip()) <= 100:
+            file_url = portfolio.file_url
+            # /static/uploads/FE.pdf -> backend/static/uploads/FE.pdf
+            file_path = os.path.join(os.path.dirname(__file__), "..", file_url.lstrip("/"))
 
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"CV 파일을 찾을 수 없습니다: {file_path}")
+            if not os.path.exists(file_path):
+                raise FileNotFoundError(f"CV 파일을 찾을 수 없습니다: {file_path}")
 
-        # 4. 텍스트 추출
-        print(f"[INFO] Extracting text from {file_path}...")
-        extracted_text = self.extract_text_from_file(file_path)
+            print(f"[INFO] Extracting text from {file_path}...")
+            extracted_text = self.extract_text_from_file(file_path)
 
-        if not extracted_text:
-            raise ValueError("텍스트 추출에 실패했습니다.")
+            if not extracted_text:
+                raise ValueError("텍스트 추출에 실패했습니다.")
 
-        print(f"[INFO] Extracted {len(extracted_text)} characters")
+            print(f"[INFO] Extracted {len(extracted_text)} characters")
+
+        # 포트폴리오 다이제스트 (저장된 것이 현재 텍스트와 같으면 재사용)
+        digest = load_portfolio_digest(portfolio) if portfolio.parsed_text == extracted_text else None
+        if digest is None:
+            digest = build_portfolio_digest(extracted_text, self.llm_analyzer)
 
         # 5. RAG 역량 매트릭스 조회
         print(f"[INFO] Fetching competency matrix for {level}, {role}...")
@@ -220,38 +258,38 @@ class CVAnalyzer:
         # 6. LLM으로 분석
         print(f"[INFO] Analyzing CV with LLM...")
         analysis_result = self.llm_analyzer.analyze_cv_with_competency(
-            cv_text=extracted_text,
+            cv_text=format_portfolio_digest(digest),
             role=role,
             competency_matrix=competency_matrix
         )
 
-        # 7. DB 업데이트
-        print(f"[INFO] Saving analysis to database...")
-        self.save_analysis_to_db(
-            portfolio=portfolio,
-            extracted_text=extracted_text,
-            analysis=analysis_result,
-            db=db
-        )
+        return {
+            "role": role,
+            "level": level,
+            "extracted_text": extracted_text,
+            "analysis": analysis_result,
+            "digest": digest
+        }
 
-        # 8. 결과 반환
-        result = {
+    def analysis_response(self, portfolio_id: str, user_id: str, prepared: Dict[str, Any]) -> Dict[str, Any]:
+        """prepare_analysis() 결과 → API 응답 형식"""
+        extracted_text = prepared["extracted_text"]
+        return {
             "portfolio_id": portfolio_id,
             "user_id": user_id,
-            "role": role,
-            "level": level,
+            "role": prepared["role"],
+            "level": prepared["level"],
             "extracted_text": extracted_text[:500] + "..." if len(extracted_text) > 500 else extracted_text,
-            **analysis_result
+            **prepared["analysis"]
         }
 
-        return result
-
     def save_analysis_to_db(
         self,
         portfolio: Portfolio,
         extracted_text: str,
         analysis: Dict[str, Any],
-        db: Session
+        db: Session,
+        digest: Optional[Dict[str, Any]] = None
     ):
         """
         분석 결과를 DB에 저장 (기존 summary와 병합)
@@ -261,27 +299,38 @@ class CVAnalyzer:
             extracted_text: 추출된 텍스트
             analysis: 분석 결과
             db: 데이터베이스 세션
+            digest: extracted_text로 만든 포트폴리오 다이제스트 (함께 저장)
         """
-        # 기존 summary 확인
-        existing_summary = {}
-        if portfolio.summary:
-            try:
-                existing_summary = json.loads(portfolio.summary)
-            except json.JSONDecodeError:
-                existing_summary = {}
-
-        # CV 분석 결과 추가
-        existing_summary["cv_analysis"] = analysis
-
-        # Portfolio 업데이트
-        portfolio.parsed_text = extracted_text
-        portfolio.summary = json.dumps(existing_summary, ensure_ascii=False)
-
+        self.apply_analysis(portfolio, extracted_text, analysis, db, digest)
         db.commit()
         db.refresh(portfolio)
 
         print(f"[SUCCESS] CV analysis saved to portfolio {portfolio.id}")
 
+    def apply_analysis(
+        self,
+        portfolio: Portfolio,
+        extracted_text: str,
+        analysis: Dict[str, Any],
+        db: Session,
+        digest: Optional[Dict[str, Any]] = None
+    ):
+        """분석 결과를 Portfolio에 반영 (summary의 cv_analysis 섹션 병합, 커밋하지 않음)"""
+        merge_portfolio_summary(portfolio, {"cv_analysis": analysis}, db)
+        self.apply_extracted_text(portfolio, extracted_text, digest)
+
+    def apply_extracted_text(
+        self,
+        portfolio: Portfolio,
+        extracted_text: str,
+        digest: Optional[Dict[str, Any]] = None
+    ):
+        """추출 텍스트 / 다이제스트를 Portfolio에 반영 (커밋하지 않음)"""
+        portfolio.parsed_text = extracted_text
+        if digest is not None:
+            portfolio.digest_json = json.dumps(digest, ensure_ascii=False)
+            portfolio.digest_hash = digest["content_hash"]
+
 
 # 싱글톤 인스턴스
 cv_analyzer = CVAnalyzer()
@@ -5,7 +5,6 @@ GitHub API를 사용하여 사용자의 저장소를 분석하고 RAG + Gemini
 """
 
 import os
-import json
 import requests
 from typing import Dict, Any, List
 from dotenv import load_dotenv
@@ -14,6 +13,7 @@ from sqlalchemy.orm import Session
 from models import User, Portfolio
 from rag.utils import get_competency_matrix
 from .llm_analyzer import LLMAnalyzer
+from .portfolio_summary import merge_portfolio_summary
 
 load_dotenv()
 
@@ -228,6 +228,35 @@ class GitHubAnalyzer:
         Returns:
             분석 결과
         """
+        prepared = self.prepare_github_analysis(user_id, portfolio_id, db, role, level, max_repos)
+
+        # 6. DB 저장
+        print(f"[INFO] Saving GitHub analysis to database...")
+        portfolio = db.query(Portfolio).filter(Portfolio.id == portfolio_id).first()
+        self.save_github_analysis_to_db(
+            portfolio=portfolio,
+            analysis=prepared["analysis"],
+            db=db
+        )
+
+        # 7. 결과 반환
+        return self.analysis_response(portfolio_id, user_id, prepared)
+
+    def prepare_github_analysis(
+        self,
+        user_id: str,
+        portfolio_id: str,
+        db: Session,
+        role: str = None,
+        level: str = None,
+        max_repos: int = 10
+    ) -> Dict[str, Any]:
+        """
+        GitHub 프로필 분석 (DB 저장 없음, db는 조회에만 사용)
+
+        Returns:
+            {"role", "level", "analysis"}
+        """
         # 1. DB에서 User, Portfolio 조회
         user = db.query(User).filter(User.id == user_id).first()
         if not user:
@@ -265,25 +294,18 @@ class GitHubAnalyzer:
         if "error" in analysis_result:
             raise Exception(analysis_result["error"])
 
-        # 6. DB 저장
-        print(f"[INFO] Saving GitHub analysis to database...")
-        self.save_github_analysis_to_db(
-            portfolio=portfolio,
-            analysis=analysis_result,
-            db=db
-        )
+        return {"role": role, "level": level, "analysis": analysis_result}
 
-        # 7. 결과 반환
-        result = {
+    def analysis_response(self, portfolio_id: str, user_id: str, prepared: Dict[str, Any]) -> Dict[str, Any]:
+        """prepare_github_analysis() 결과 → API 응답 형식"""
+        return {
             "portfolio_id": portfolio_id,
             "user_id": user_id,
-            "role": role,
-            "level": level,
-            **analysis_result
+            "role": prepared["role"],
+            "level": prepared["level"],
+            **prepared["analysis"]
         }
 
-        return result
-
     def save_github_analysis_to_db(
         self,
         portfolio: Portfolio,
@@ -298,19 +320,8 @@ class GitHubAnalyzer:
             analysis: GitHub 분석 결과
             db: 데이터베이스 세션
         """
-        # 기존 summary 확인
-        existing_summary = {}
-        if portfolio.summary:
-            try:
-                existing_summary = json.loads(portfolio.summary)
-            except json.JSONDecodeError:
-                existing_summary = {}
-
-        # GitHub 분석 결과 추가
-        existing_summary["github_analysis"] = analysis
-
-        # Portfolio 업데이트
-        portfolio.summary = json.dumps(existing_summary, ensure_ascii=False)
+        # 최신 summary에 github_analysis 섹션 병합 (CV 분석 결과를 덮어쓰지 않도록)
+        merge_portfolio_summary(portfolio, {"github_analysis": analysis}, db)
 
         db.commit()
         db.refresh(portfolio)
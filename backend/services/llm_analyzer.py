@@ -6,24 +6,33 @@ Google Gemini API를 사용한 CV 및 GitHub 데이터 분석
 
 import os
 import json
-from typing import Dict, Any, List
-import google.generativeai as genai
+from typing import Dict, Any, List, Optional, Type
 from dotenv import load_dotenv
+from pydantic import BaseModel
+
+from clients.llm_gateway import get_gemini_api_keys, get_llm_gateway
+from utils.single_flight import single_flight
+from utils.structured_output import JSONRepairError, json_generation_config, parse_json_response
+from utils.prompt_budget import compact_github_data, compact_json, dedupe, estimate_tokens, fit_to_budget, log_prompt_size
+from schemas import CompetencyAnalysisResult, InitialQuestionItem, JobPostingParseResult, PortfolioDigestResult
 
 load_dotenv()
 
-# Gemini API 설정
-# GEMINI_API_KEY는 이제 동적으로 로드하여 사용합니다.
+# 호출별 마감 시간 (초과하면 기본 질문으로 대체, 헤지 요청은 LLM 게이트웨이가 처리)
+INITIAL_QUESTIONS_DEADLINE_SEC = float(os.getenv("INITIAL_QUESTIONS_DEADLINE_SEC", "25"))
+FOLLOWUP_DEADLINE_SEC = float(os.getenv("FOLLOWUP_DEADLINE_SEC", "10"))
 
 
 class LLMAnalyzer:
     """LLM 기반 역량 분석 클래스 (Gemini API 사용)"""
 
-    def __init__(self, model_name: str = None):
+    def __init__(self, model_name: str = None, use_cache: bool = True):
         """
         Args:
             model_name: 사용할 Gemini 모델 이름 (기본값: 환경변수 또는 gemini-1.5-flash)
+            use_cache: False면 LLM 응답 캐시를 우회 (항상 새로 생성)
         """
+        self.use_cache = use_cache
         if model_name is None:
             # 모델명 업데이트: 2.0-flash-exp -> 1.5-flash (안정성 및 쿼터 확보)
             model_name = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
@@ -31,45 +40,53 @@ class LLMAnalyzer:
 
     def get_api_keys(self) -> List[str]:
         """환경변수에서 사용 가능한 모든 Gemini API 키를 가져옵니다."""
-        keys = []
-        # GEMINI_API_KEY1 ~ 3 확인
-        for i in range(1, 4):
-            key = os.getenv(f"GEMINI_API_KEY{i}")
-            if key:
-                keys.append(key)
-        
-        # 레거시 키 확인
-        legacy_key = os.getenv("GEMINI_API_KEY")
-        if legacy_key and legacy_key not in keys:
-            keys.append(legacy_key)
-            
-        return keys
+        return get_gemini_api_keys()
 
-    def _generate_content(self, prompt: str) -> Any:
+    def _generate_content(
+        self,
+        prompt: str,
+        generation_config: Optional[Dict[str, Any]] = None,
+        deadline_sec: Optional[float] = None,
+        operation: Optional[str] = None
+    ) -> Any:
         """
-        여러 API 키를 순차적으로 시도하여 컨텐츠를 생성합니다.
+        LLM 게이트웨이로 컨텐츠를 생성합니다.
+
+        키 선택(가장 한가한 키), 키별 속도 제한, 429 쿨다운, 다른 키로 재시도는 게이트웨이가 처리
+        같은 (모델, 프롬프트, 설정)은 LLM 응답 캐시에서 재사용 (use_cache=False면 우회)
+        deadline_sec가 있으면 p95가 지나도 응답이 없을 때 헤지 요청, 마감 초과 시 LLMDeadlineExceeded
         """
-        api_keys = self.get_api_keys()
-        if not api_keys:
-            raise Exception("No Gemini API keys found in environment variables.")
-
-        last_error = None
-        for i, api_key in enumerate(api_keys):
-            try:
-                # API 키 설정
-                genai.configure(api_key=api_key)
-                model = genai.GenerativeModel(self.model_name)
-                
-                # 생성 요청
-                return model.generate_content(prompt)
-                
-            except Exception as e:
-                last_error = e
-                print(f"⚠️ Gemini API Key #{i+1} failed: {str(e)[:200]}...")
-                continue
-        
-        # 모든 키 실패 시 마지막 에러 발생
-        raise last_error or Exception("All Gemini API keys failed.")
+        kwargs = {"generation_config": generation_config} if generation_config else {}
+        return get_llm_gateway().generate_content(
+            prompt,
+            model_name=self.model_name,
+            cache=self.use_cache,
+            deadline_sec=deadline_sec,
+            operation=operation,
+            **kwargs
+        )
+
+    def _generate_json(
+        self,
+        prompt: str,
+        prompt_type: str,
+        schema: Type[BaseModel],
+        as_list: bool = False,
+        deadline_sec: Optional[float] = None
+    ) -> Any:
+        """
+        스키마를 지정한 JSON 모드로 생성하고 파싱합니다.
+
+        깨진 응답(잘림, 끝의 쉼표 등)은 모델을 다시 호출하지 않고 로컬에서 복구
+        복구도 실패하면 캐시된 응답을 지우고 JSONRepairError (다음 재분석은 새로 생성)
+        """
+        generation_config = json_generation_config(schema, as_list)
+        response = self._generate_content(prompt, generation_config, deadline_sec, prompt_type)
+        try:
+            return parse_json_response(response.text, prompt_type, schema if as_list else None)
+        except JSONRepairError:
+            get_llm_gateway().forget(prompt, model_name=self.model_name, generation_config=generation_config)
+            raise
 
     def analyze_cv_with_competency(
         self,
@@ -81,7 +98,7 @@ class LLMAnalyzer:
         CV 텍스트를 분석하여 역량 평가
 
         Args:
-            cv_text: PDF에서 추출된 CV 텍스트
+            cv_text: CV 내용 (포트폴리오 다이제스트 텍스트, services/portfolio_digest.py)
             role: 직무 ('ROLE_FE' or 'ROLE_BE')
             competency_matrix: RAG에서 가져온 역량 매트릭스
 
@@ -89,20 +106,12 @@ class LLMAnalyzer:
             역량 평가 결과 JSON
         """
         prompt = self._build_cv_analysis_prompt(cv_text, role, competency_matrix)
-
-        response = self._generate_content(prompt)
-        result_text = response.text
-
-        # JSON 파싱 (마크다운 코드블록 제거)
-        if "```json" in result_text:
-            result_text = result_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in result_text:
-            result_text = result_text.split("```")[1].split("```")[0].strip()
+        log_prompt_size("cv_analysis", prompt)
 
         try:
-            return json.loads(result_text)
-        except json.JSONDecodeError:
-            # JSON 파싱 실패 시 기본 구조 반환
+            return self._generate_json(prompt, "cv_analysis", CompetencyAnalysisResult)
+        except JSONRepairError as e:
+            # 복구 후에도 JSON 파싱 실패 시 기본 구조 반환
             return {
                 "role": role,
                 "possessed_skills": [],
@@ -110,7 +119,7 @@ class LLMAnalyzer:
                 "strengths": [],
                 "weaknesses": [],
                 "overall_score": 0,
-                "analysis": result_text
+                "analysis": e.text
             }
 
     def analyze_github_with_competency(
@@ -131,19 +140,15 @@ class LLMAnalyzer:
             역량 평가 결과 JSON
         """
         prompt = self._build_github_analysis_prompt(github_data, role, competency_matrix)
-
-        response = self._generate_content(prompt)
-        result_text = response.text
-
-        # JSON 파싱
-        if "```json" in result_text:
-            result_text = result_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in result_text:
-            result_text = result_text.split("```")[1].split("```")[0].strip()
+        log_prompt_size(
+            "github_analysis",
+            prompt,
+            baseline_tokens=estimate_tokens(self._build_github_analysis_prompt(github_data, role, competency_matrix, compact=False))
+        )
 
         try:
-            return json.loads(result_text)
-        except json.JSONDecodeError:
+            return self._generate_json(prompt, "github_analysis", CompetencyAnalysisResult)
+        except JSONRepairError as e:
             return {
                 "role": role,
                 "possessed_skills": [],
@@ -151,7 +156,7 @@ class LLMAnalyzer:
                 "strengths": [],
                 "weaknesses": [],
                 "overall_score": 0,
-                "analysis": result_text
+                "analysis": e.text
             }
 
     def parse_job_posting(self, raw_text: str, company_name: str, position: str, source_url: str = "") -> Dict[str, Any]:
@@ -217,16 +222,7 @@ class LLMAnalyzer:
 }}
 """
         try:
-            response = self._generate_content(prompt)
-            result_text = response.text.strip()
-            
-            # JSON 파싱 (마크다운 코드블록 제거)
-            if "```json" in result_text:
-                result_text = result_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in result_text:
-                result_text = result_text.split("```")[1].split("```")[0].strip()
-                
-            return json.loads(result_text)
+            return self._generate_json(prompt, "job_posting", JobPostingParseResult)
         except Exception as e:
             print(f"Job posting parsing error: {e}")
             # 실패 시 기본 구조 반환 (프론트엔드 호환성 유지)
@@ -245,6 +241,36 @@ class LLMAnalyzer:
                 "error": str(e)
             }
 
+    def build_portfolio_digest(self, portfolio_text: str) -> Dict[str, Any]:
+        """
+        포트폴리오 원문을 구조화 다이제스트(보유 역량, 기술 스택, 프로젝트, 요약)로 정리합니다.
+
+        Args:
+            portfolio_text: 포트폴리오 파싱 텍스트 (전체)
+
+        Returns:
+            다이제스트 JSON (skills, tech_stacks, projects, summary)
+
+        Raises:
+            JSONRepairError: 응답을 JSON으로 파싱할 수 없음
+        """
+        prompt = f"""
+당신은 개발자 포트폴리오를 정리하는 전문가입니다.
+아래 포트폴리오를 면접 질문 생성에 쓸 수 있도록 핵심만 구조화해주세요.
+
+# 포트폴리오
+{portfolio_text}
+
+# 요구사항
+1. skills: 포트폴리오에서 드러나는 역량 (기술 + 협업/문제 해결 등), 최대 15개
+2. tech_stacks: 사용한 언어 / 프레임워크 / 인프라 / 도구 이름 (영어 원문 그대로, 중복 없이)
+3. projects: 주요 프로젝트 최대 5개 (name: 프로젝트명, stack: 사용 기술, summary: 역할과 성과 1-2문장)
+4. summary: 지원자 전체 요약 2-3문장
+5. 포트폴리오에 없는 내용은 만들지 마세요.
+"""
+        log_prompt_size("portfolio_digest", prompt)
+        return self._generate_json(prompt, "portfolio_digest", PortfolioDigestResult)
+
     def generate_initial_questions(
         self,
         portfolio_text: str,
@@ -252,6 +278,8 @@ class LLMAnalyzer:
     ) -> List[Dict[str, str]]:
         """
         초기 면접 질문 3개를 생성합니다.
+
+        같은 입력의 동시 요청(더블 클릭 / 재시도)은 한 번만 생성하고 결과를 공유합니다.
         
         Args:
             portfolio_text: 포트폴리오 내용 (요약 또는 전체)
@@ -260,6 +288,17 @@ class LLMAnalyzer:
         Returns:
             질문 리스트 (type, text)
         """
+        return single_flight.do(
+            "generate_initial_questions",
+            [self.model_name, portfolio_text, job_posting_text],
+            lambda: self._generate_initial_questions(portfolio_text, job_posting_text)
+        )
+
+    def _generate_initial_questions(
+        self,
+        portfolio_text: str,
+        job_posting_text: str
+    ) -> List[Dict[str, str]]:
         prompt = f"""
 당신은 전문 기술 면접관입니다.
 지원자의 포트폴리오와 채용 공고를 바탕으로 면접 질문 3개를 생성해주세요.
@@ -301,20 +340,13 @@ class LLMAnalyzer:
 ]
 """
         try:
-            response = self._generate_content(prompt)
-            result_text = response.text.strip()
-            
-            # JSON 파싱
-            if "```json" in result_text:
-                result_text = result_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in result_text:
-                result_text = result_text.split("```")[1].split("```")[0].strip()
-                
-            questions = json.loads(result_text)
-            return questions
-            
+            return self._generate_json(
+                prompt, "initial_questions", InitialQuestionItem, as_list=True,
+                deadline_sec=INITIAL_QUESTIONS_DEADLINE_SEC
+            )
         except Exception as e:
             print(f"Initial question generation failed: {e}")
+            get_llm_gateway().record_fallback("initial_questions")
             # 실패 시 기본 질문 반환
             return [
                 {"type": "weakness", "text": "직무 공고에서 요구하는 기술 중 본인이 가장 부족하다고 생각하는 것은 무엇이며, 이를 보완하기 위해 어떤 노력을 하고 있나요?"},
@@ -360,7 +392,9 @@ class LLMAnalyzer:
 꼬리 질문: "React 대시보드의 성능 최적화를 위해 구체적으로 어떤 기법들을 적용하셨나요?"
 """
         try:
-            response = self._generate_content(prompt)
+            response = self._generate_content(
+                prompt, deadline_sec=FOLLOWUP_DEADLINE_SEC, operation="followup_question"
+            )
             followup = response.text.strip()
 
             # 마크다운 코드블록 제거
@@ -371,6 +405,7 @@ class LLMAnalyzer:
 
         except Exception as e:
             print(f"Followup question generation failed: {e}")
+            get_llm_gateway().record_fallback("followup_question")
             # 실패 시 기본 질문 반환
             return "방금 말씀하신 부분에 대해 좀 더 구체적으로 설명해주시겠어요?"
 
@@ -405,10 +440,10 @@ class LLMAnalyzer:
 {cv_text}
 
 # 평가 기준 - 필수 역량
-{json.dumps(must_have_list, ensure_ascii=False, indent=2)}
+{compact_json(dedupe(must_have_list))}
 
 # 평가 기준 - 우대 역량
-{json.dumps(nice_to_have_list, ensure_ascii=False, indent=2)}
+{compact_json(dedupe(nice_to_have_list))}
 
 # 요구사항
 1. CV에서 보유하고 있는 기술 스택과 역량을 파악하세요.
@@ -444,9 +479,14 @@ class LLMAnalyzer:
         self,
         github_data: Dict[str, Any],
         role: str,
-        competency_matrix: Dict[str, Any]
+        competency_matrix: Dict[str, Any],
+        compact: bool = True
     ) -> str:
-        """GitHub 분석을 위한 프롬프트 생성"""
+        """
+        GitHub 분석을 위한 프롬프트 생성
+
+        compact=True면 저장소 데이터를 토큰 예산 안으로 압축 (False는 압축 전 크기 비교용)
+        """
 
         must_have_skills = competency_matrix.get("must_have", {}).get("technical_skills", [])
         nice_to_have_skills = competency_matrix.get("nice_to_have", {}).get("technical_skills", [])
@@ -462,18 +502,28 @@ class LLMAnalyzer:
         }
         role_name = role_map.get(role, "Developer")
 
+        if compact:
+            # desc: 설명, langs: 언어별 코드 비율(%), readme: README 앞부분
+            github_json = fit_to_budget(lambda level: compact_json(compact_github_data(github_data, level)))
+            must_have_json = compact_json(dedupe(must_have_list))
+            nice_to_have_json = compact_json(dedupe(nice_to_have_list))
+        else:
+            github_json = json.dumps(github_data, ensure_ascii=False, indent=2)
+            must_have_json = json.dumps(must_have_list, ensure_ascii=False, indent=2)
+            nice_to_have_json = json.dumps(nice_to_have_list, ensure_ascii=False, indent=2)
+
         prompt = f"""
 당신은 개발자 역량을 평가하는 전문가입니다.
 아래 GitHub 프로필 정보를 분석하여 {role_name} 직무에 대한 역량을 평가해주세요.
 
-# GitHub 프로필 정보
-{json.dumps(github_data, ensure_ascii=False, indent=2)}
+# GitHub 프로필 정보 (repos: 저장소 목록, desc: 설명, langs: 언어별 코드 비율(%), readme: README 앞부분)
+{github_json}
 
 # 평가 기준 - 필수 역량
-{json.dumps(must_have_list, ensure_ascii=False, indent=2)}
+{must_have_json}
 
 # 평가 기준 - 우대 역량
-{json.dumps(nice_to_have_list, ensure_ascii=False, indent=2)}
+{nice_to_have_json}
 
 # 요구사항
 1. 저장소의 언어 사용 비율, README, 프로젝트 설명을 분석하세요.
@@ -2,13 +2,40 @@
 포트폴리오 통합 분석 서비스
 
 CV + GitHub 분석을 통합하여 수행
+- 두 분석은 서로 독립 (CV: PDF 파싱 + Gemini, GitHub: GitHub API 여러 번 + Gemini)이므로
+  각자의 DB 세션으로 동시에 실행
+- 결과는 호출자의 세션에서 Portfolio.summary에 한 번에 병합해 한 트랜잭션으로 커밋
+  (두 분석기가 각자 summary를 읽고 덮어쓰던 경쟁 조건 제거)
+
+환경 변수:
+    PORTFOLIO_ANALYSIS_WORKERS: CV / GitHub 분석 스레드 수 (기본: 4)
 """
 
-from typing import Dict, Any
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
 from sqlalchemy.orm import Session
 
+from database import SessionLocal
+from models import Portfolio
 from .cv_analyzer import cv_analyzer
 from .github_analyzer import github_analyzer
+from .portfolio_summary import merge_portfolio_summary
+
+# CV / GitHub 분석용 스레드 풀 (분석 1건당 최대 2개 작업)
+_analysis_pool = ThreadPoolExecutor(
+    max_workers=int(os.getenv("PORTFOLIO_ANALYSIS_WORKERS", "4")),
+    thread_name_prefix="portfolio-analysis"
+)
+
+
+def _run_with_own_session(fn: Callable[..., Dict[str, Any]], **kwargs: Any) -> Dict[str, Any]:
+    """스레드 전용 DB 세션으로 실행 (세션은 스레드 간에 공유하지 않음)"""
+    db = SessionLocal()
+    try:
+        return fn(db=db, **kwargs)
+    finally:
+        db.close()
 
 
 def analyze_full_portfolio(
@@ -27,7 +54,7 @@ def analyze_full_portfolio(
     Args:
         user_id: 사용자 ID
         portfolio_id: 포트폴리오 ID
-        db: 데이터베이스 세션
+        db: 데이터베이스 세션 (결과 병합 / 저장용)
         role: 직무 (선택, 기본값: User.role)
         level: 경력 레벨 (선택, 기본값: User.level)
         max_repos: GitHub 분석 시 최대 저장소 개수
@@ -50,47 +77,69 @@ def analyze_full_portfolio(
         "status": "success"
     }
 
-    # 1. CV 분석
+    # 1. CV / GitHub 분석 동시 실행 (DB 저장 없음)
+    print("\n" + "="*60)
+    print(f"STEP 1: 분석 시작 (CV: {analyze_cv}, GitHub: {analyze_github})")
+    print("="*60)
+    cv_future: Optional[Future] = None
+    github_future: Optional[Future] = None
     if analyze_cv:
+        cv_future = _analysis_pool.submit(
+            _run_with_own_session, cv_analyzer.prepare_analysis,
+            portfolio_id=portfolio_id, user_id=user_id, role=role, level=level
+        )
+    if analyze_github:
+        github_future = _analysis_pool.submit(
+            _run_with_own_session, github_analyzer.prepare_github_analysis,
+            user_id=user_id, portfolio_id=portfolio_id, role=role, level=level, max_repos=max_repos
+        )
+
+    cv_prepared = None
+    github_prepared = None
+    if cv_future is not None:
         try:
-            print("\n" + "="*60)
-            print("STEP 1: CV 분석 시작")
-            print("="*60)
-            cv_result = cv_analyzer.analyze_cv(
-                portfolio_id=portfolio_id,
-                user_id=user_id,
-                db=db,
-                role=role,
-                level=level
-            )
-            result["cv_analysis"] = cv_result
+            cv_prepared = cv_future.result()
+            result["cv_analysis"] = cv_analyzer.analysis_response(portfolio_id, user_id, cv_prepared)
             print("\n[SUCCESS] CV 분석 완료")
         except Exception as e:
             print(f"\n[ERROR] CV 분석 실패: {str(e)}")
             result["cv_analysis"] = {"error": str(e)}
             result["status"] = "partial"
-
-    # 2. GitHub 분석
-    if analyze_github:
+    if github_future is not None:
         try:
-            print("\n" + "="*60)
-            print("STEP 2: GitHub 분석 시작")
-            print("="*60)
-            github_result = github_analyzer.analyze_github_and_save(
-                user_id=user_id,
-                portfolio_id=portfolio_id,
-                db=db,
-                role=role,
-                level=level,
-                max_repos=max_repos
-            )
-            result["github_analysis"] = github_result
+            github_prepared = github_future.result()
+            result["github_analysis"] = github_analyzer.analysis_response(portfolio_id, user_id, github_prepared)
             print("\n[SUCCESS] GitHub 분석 완료")
         except Exception as e:
             print(f"\n[ERROR] GitHub 분석 실패: {str(e)}")
             result["github_analysis"] = {"error": str(e)}
             result["status"] = "partial"
 
+    # 2. 성공한 분석 결과를 한 트랜잭션으로 저장
+    if cv_prepared is not None or github_prepared is not None:
+        print("\n" + "="*60)
+        print("STEP 2: 분석 결과 저장")
+        print("="*60)
+        try:
+            portfolio = db.query(Portfolio).filter(Portfolio.id == portfolio_id).first()
+            if not portfolio:
+                raise ValueError(f"Portfolio not found: {portfolio_id}")
+            sections = {}
+            if cv_prepared is not None:
+                sections["cv_analysis"] = cv_prepared["analysis"]
+            if github_prepared is not None:
+                sections["github_analysis"] = github_prepared["analysis"]
+            merge_portfolio_summary(portfolio, sections, db)
+            if cv_prepared is not None:
+                cv_analyzer.apply_extracted_text(portfolio, cv_prepared["extracted_text"], cv_prepared["digest"])
+            db.commit()
+            print(f"[SUCCESS] 분석 결과 저장 완료: {', '.join(sections)}")
+        except Exception as e:
+            db.rollback()
+            print(f"\n[ERROR] 분석 결과 저장 실패: {str(e)}")
+            result["status"] = "save_failed"
+            result["save_error"] = str(e)
+
     # 3. 최종 상태 확인
     if not analyze_cv and not analyze_github:
         result["status"] = "no_analysis"
@@ -0,0 +1,178 @@
+"""
+포트폴리오 다이제스트
+
+업로드 시 포트폴리오 원문을 한 번만 구조화(보유 역량, 기술 스택, 프로젝트, 요약)해서
+Portfolio.digest_json에 원문 해시(digest_hash)와 함께 저장하고,
+초기 질문 / 꼬리 질문 / CV 분석 프롬프트가 원문이나 글자 수로 자른 원문 대신 이 다이제스트를 사용
+- 원문이 바뀌면(CV 재추출 등) 해시가 달라지므로 다음 사용 시 다시 생성
+- LLM을 쓸 수 없거나 응답을 파싱하지 못하면 규칙 기반(키워드 / 줄 단위) 다이제스트로 대체
+
+환경 변수:
+    PORTFOLIO_DIGEST_MAX_INPUT_CHARS: 다이제스트 생성에 넣는 원문 최대 글자 수 (기본: 20000)
+"""
+
+import hashlib
+import json
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from models import Portfolio
+from utils.prompt_budget import compact_analysis, compact_json, dedupe
+
+DIGEST_VERSION = 1
+MAX_INPUT_CHARS = int(os.getenv("PORTFOLIO_DIGEST_MAX_INPUT_CHARS", "20000"))
+
+# 규칙 기반 다이제스트용 기술 키워드 (LLM을 쓸 수 없을 때만 사용)
+TECH_KEYWORDS = (
+    "Python", "Java", "Kotlin", "JavaScript", "TypeScript", "Go", "Rust", "C++", "C#", "Swift", "Dart",
+    "React", "Vue", "Angular", "Next.js", "Nuxt.js", "Svelte", "Redux", "Recoil", "Zustand", "Tailwind",
+    "HTML", "CSS", "Sass", "Webpack", "Vite", "Node.js", "Express", "NestJS", "Django", "Flask", "FastAPI",
+    "Spring", "Spring Boot", "JPA", "GraphQL", "gRPC", "REST", "MySQL", "PostgreSQL", "SQLite", "MongoDB",
+    "Redis", "Elasticsearch", "Kafka", "RabbitMQ", "Docker", "Kubernetes", "AWS", "GCP", "Azure",
+    "Terraform", "Jenkins", "GitHub Actions", "Git", "Linux", "Nginx", "PyTorch", "TensorFlow", "Keras",
+    "scikit-learn", "Pandas", "NumPy", "OpenCV", "Hugging Face", "LangChain", "Jest", "Cypress", "Flutter",
+)
+_PROJECT_LINE = re.compile(r"(프로젝트|project)", re.IGNORECASE)
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+def rule_based_digest(text: str) -> Dict[str, Any]:
+    """키워드 매칭 / 줄 단위 규칙으로 만든 다이제스트 (LLM 대체용)"""
+    found = []
+    for keyword in TECH_KEYWORDS:
+        pattern = r"(?<![\w.+#])" + re.escape(keyword) + r"(?![\w+#])"
+        if re.search(pattern, text, re.IGNORECASE):
+            found.append(keyword)
+
+    lines = [" ".join(line.split()) for line in text.splitlines()]
+    projects = [
+        {"name": line[:80], "stack": [], "summary": ""}
+        for line in dedupe(line for line in lines if _PROJECT_LINE.search(line) and len(line) <= 120)[:5]
+    ]
+    summary = " ".join(line for line in lines if line)[:300]
+    return {"skills": [], "tech_stacks": found, "projects": projects, "summary": summary}
+
+
+def build_portfolio_digest(text: str, llm_analyzer: Any = None) -> Dict[str, Any]:
+    """
+    포트폴리오 원문 → 다이제스트 (LLM, 실패하면 규칙 기반)
+
+    블로킹 호출 (async 코드에서는 llm_executor.run으로 실행)
+
+    Returns:
+        {"version", "content_hash", "source": "llm" | "rule",
+         "skills", "tech_stacks", "projects": [{name, stack, summary}], "summary"}
+    """
+    digest = None
+    source = "llm"
+    if text and text.strip():
+        try:
+            if llm_analyzer is None:
+                from services.llm_analyzer import LLMAnalyzer
+                llm_analyzer = LLMAnalyzer()
+            digest = llm_analyzer.build_portfolio_digest(text[:MAX_INPUT_CHARS])
+            if not isinstance(digest, dict):
+                digest = None
+        except Exception as e:
+            print(f"⚠️ 포트폴리오 다이제스트 LLM 생성 실패, 규칙 기반으로 대체: {e}")
+    if digest is None:
+        digest = rule_based_digest(text or "")
+        source = "rule"
+
+    return {
+        "version": DIGEST_VERSION,
+        "content_hash": content_hash(text),
+        "source": source,
+        "skills": dedupe(digest.get("skills") or [], 15),
+        "tech_stacks": dedupe(digest.get("tech_stacks") or []),
+        "projects": [
+            {
+                "name": str(project.get("name", "")).strip(),
+                "stack": dedupe(project.get("stack") or []),
+                "summary": str(project.get("summary", "")).strip()
+            }
+            for project in (digest.get("projects") or [])[:5]
+            if isinstance(project, dict) and project.get("name")
+        ],
+        "summary": str(digest.get("summary") or "").strip()
+    }
+
+
+def store_portfolio_digest(portfolio: Portfolio, digest: Dict[str, Any], db: Session) -> None:
+    portfolio.digest_json = json.dumps(digest, ensure_ascii=False)
+    portfolio.digest_hash = digest["content_hash"]
+    db.commit()
+
+
+def load_portfolio_digest(portfolio: Portfolio) -> Optional[Dict[str, Any]]:
+    """저장된 다이제스트 (없거나 원문이 바뀌었거나 버전이 다르면 None)"""
+    if not portfolio.digest_json or portfolio.digest_hash != content_hash(portfolio.parsed_text):
+        return None
+    try:
+        digest = json.loads(portfolio.digest_json)
+    except json.JSONDecodeError:
+        return None
+    return digest if digest.get("version") == DIGEST_VERSION else None
+
+
+def ensure_portfolio_digest(portfolio: Portfolio, db: Session) -> Optional[Dict[str, Any]]:
+    """
+    저장된 다이제스트를 반환하고, 없거나 오래됐으면 새로 만들어 저장
+
+    업로드 시 만들어 두므로 보통은 DB 조회만으로 끝남
+    (다이제스트 도입 전 업로드된 포트폴리오 / CV 재추출로 원문이 바뀐 경우만 생성)
+    """
+    digest = load_portfolio_digest(portfolio)
+    if digest is not None or not portfolio.parsed_text:
+        return digest
+    digest = build_portfolio_digest(portfolio.parsed_text)
+    store_portfolio_digest(portfolio, digest, db)
+    return digest
+
+
+def format_portfolio_digest(digest: Dict[str, Any]) -> str:
+    """프롬프트에 넣을 다이제스트 텍스트"""
+    lines = []
+    if digest.get("summary"):
+        lines.append(f"요약: {digest['summary']}")
+    if digest.get("tech_stacks"):
+        lines.append(f"기술 스택: {', '.join(digest['tech_stacks'])}")
+    if digest.get("skills"):
+        lines.append(f"역량: {', '.join(digest['skills'])}")
+    projects: List[Dict[str, Any]] = digest.get("projects") or []
+    if projects:
+        lines.append("프로젝트:")
+        for project in projects:
+            stack = f" [{', '.join(project['stack'])}]" if project.get("stack") else ""
+            summary = f" - {project['summary']}" if project.get("summary") else ""
+            lines.append(f"- {project['name']}{stack}{summary}")
+    return "\n".join(lines)
+
+
+def portfolio_prompt_text(portfolio: Optional[Portfolio], db: Session, default: str = "포트폴리오 없음") -> str:
+    """
+    프롬프트용 포트폴리오 텍스트 (다이제스트 우선)
+
+    다이제스트를 만들 원문이 없으면 CV / GitHub 분석 요약(summary)을 압축해서 사용
+    """
+    if portfolio is None:
+        return default
+    digest = ensure_portfolio_digest(portfolio, db)
+    if digest is not None:
+        return format_portfolio_digest(digest) or "내용 없음"
+    if portfolio.summary:
+        try:
+            summary = json.loads(portfolio.summary)
+        except json.JSONDecodeError:
+            return portfolio.summary
+        return compact_json({
+            "cv": compact_analysis(summary.get("cv_analysis")),
+            "github": compact_analysis(summary.get("github_analysis"))
+        })
+    return "내용 없음"
@@ -0,0 +1,45 @@
+"""
+Portfolio.summary 병합
+
+summary는 CV / GitHub 분석 결과를 섹션(cv_analysis, github_analysis)별로 담는 JSON
+- 섹션을 병합하기 직전에 DB에서 summary를 다시 읽어(지원하는 DB는 행 잠금),
+  다른 세션이 그 사이 저장한 섹션을 오래된 값으로 덮어쓰지 않음
+- 커밋은 호출자가 (여러 섹션 / 다른 컬럼 변경과 한 트랜잭션으로)
+"""
+
+import json
+from typing import Any, Dict
+
+from sqlalchemy.orm import Session
+
+from models import Portfolio
+
+
+def load_summary(portfolio: Portfolio) -> Dict[str, Any]:
+    """summary JSON (없거나 깨졌으면 빈 dict)"""
+    if not portfolio.summary:
+        return {}
+    try:
+        summary = json.loads(portfolio.summary)
+    except json.JSONDecodeError:
+        return {}
+    return summary if isinstance(summary, dict) else {}
+
+
+def merge_portfolio_summary(portfolio: Portfolio, sections: Dict[str, Any], db: Session) -> Dict[str, Any]:
+    """
+    summary에 섹션 병합 (커밋하지 않음)
+
+    Args:
+        portfolio: Portfolio 객체 (db 세션에 속한)
+        sections: {"cv_analysis": {...}, "github_analysis": {...}} 중 갱신할 섹션
+        db: 데이터베이스 세션
+
+    Returns:
+        병합된 summary
+    """
+    db.refresh(portfolio, attribute_names=["summary"], with_for_update=True)
+    summary = load_summary(portfolio)
+    summary.update(sections)
+    portfolio.summary = json.dumps(summary, ensure_ascii=False)
+    return summary
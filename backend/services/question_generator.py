@@ -4,7 +4,10 @@
 메인 질문 관리 및 꼬리질문 프롬프트 생성
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from clients.base import TTSClient
 
 
 class QuestionGenerator:
@@ -92,3 +95,35 @@ class QuestionGenerator:
             다음 질문 존재 여부
         """
         return current_index < len(self.main_questions) - 1
+
+
+async def pre_synthesize_main_questions(
+    tts_client: "TTSClient",
+    questions: List[Dict[str, Any]] = None,
+    speaker: str = "KR",
+    speed: float = 1.0
+) -> Dict[str, str]:
+    """
+    메인 질문 음성을 미리 합성해 TTS 캐시 워밍업
+
+    Args:
+        tts_client: TTS 클라이언트 (CachedTTSClient면 캐시에 저장됨)
+        questions: 질문 리스트 (없으면 DEFAULT_MAIN_QUESTIONS)
+        speaker: 화자 ID
+        speed: 속도 배율
+
+    Returns:
+        {질문 ID: audio_url} (실패한 질문은 제외)
+    """
+    questions = questions or QuestionGenerator.DEFAULT_MAIN_QUESTIONS
+    audio_urls = {}
+    for question in questions:
+        try:
+            audio_urls[question["id"]] = await tts_client.synthesize(
+                text=question["text"],
+                speaker=speaker,
+                speed=speed
+            )
+        except Exception as e:
+            print(f"⚠️ 질문 음성 사전 합성 실패 ({question['id']}): {e}")
+    return audio_urls
@@ -0,0 +1,212 @@
+"""
+실시간 음성 턴 처리 (WebSocket 음성 세션용)
+
+- EnergyVAD: 프레임 에너지 기반 발화/침묵 판정 + 턴 종료(end-of-turn) 감지
+- IncrementalTranscriber: 답변을 받는 동안 슬라이딩 윈도우로 부분 전사
+
+입력 오디오는 16kHz mono PCM16(little-endian) 바이트
+"""
+
+import os
+import tempfile
+import uuid
+import wave
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from clients.base import STTClient
+from services.transcript_store import compact_segments
+
+SAMPLE_RATE = 16000
+BYTES_PER_SAMPLE = 2
+
+
+class EnergyVAD:
+    """
+    RMS 에너지 기반 VAD
+
+    발화 임계값 = max(잡음 바닥 × ratio, min_rms)
+    잡음 바닥은 침묵 프레임의 지수 이동 평균으로 추적
+
+    환경 변수:
+        VOICE_EOT_SILENCE_MS: 발화 후 이 시간 이상 침묵하면 턴 종료 (기본: 800)
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = SAMPLE_RATE,
+        frame_ms: int = 30,
+        end_silence_ms: Optional[int] = None,
+        min_speech_ms: int = 300,
+        min_rms: float = 400.0,
+        ratio: float = 3.0
+    ):
+        self.frame_samples = sample_rate * frame_ms // 1000
+        self.frame_ms = frame_ms
+        self.end_silence_ms = end_silence_ms or int(os.getenv("VOICE_EOT_SILENCE_MS", "800"))
+        self.min_speech_ms = min_speech_ms
+        self.min_rms = min_rms
+        self.ratio = ratio
+
+        self.noise_floor: Optional[float] = None
+        self.speech_ms = 0
+        self.silence_ms = 0
+        self._pending = np.zeros(0, dtype=np.int16)
+
+    def update(self, samples: np.ndarray) -> bool:
+        """
+        새 샘플 반영
+
+        Returns:
+            턴 종료 여부 (충분히 말한 뒤 end_silence_ms 이상 침묵)
+        """
+        buf = np.concatenate([self._pending, samples])
+        n_frames = len(buf) // self.frame_samples
+        self._pending = buf[n_frames * self.frame_samples:]
+
+        if n_frames:
+            frames = buf[:n_frames * self.frame_samples].reshape(n_frames, self.frame_samples)
+            rms = np.sqrt(np.mean(frames.astype(np.float64) ** 2, axis=1))
+            for value in rms:
+                threshold = max((self.noise_floor or 0.0) * self.ratio, self.min_rms)
+                if value >= threshold:
+                    self.speech_ms += self.frame_ms
+                    self.silence_ms = 0
+                else:
+                    self.silence_ms += self.frame_ms
+                    self.noise_floor = value if self.noise_floor is None else 0.95 * self.noise_floor + 0.05 * value
+
+        return self.speech_ms >= self.min_speech_ms and self.silence_ms >= self.end_silence_ms
+
+
+def write_wav(path: str, pcm: bytes, sample_rate: int = SAMPLE_RATE) -> str:
+    """PCM16 mono 바이트 → wav 파일"""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(BYTES_PER_SAMPLE)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm)
+    return path
+
+
+class IncrementalTranscriber:
+    """
+    슬라이딩 윈도우 부분 전사
+
+    확정되지 않은 구간(committed 이후)만 반복 전사하고, 윈도우가
+    max_window_sec를 넘으면 마지막 segment 앞까지를 확정해 윈도우를 앞으로 당김
+    → 답변 길이와 무관하게 한 번의 전사 비용이 일정
+
+    환경 변수:
+        VOICE_STT_STEP_SEC: 새 오디오가 이만큼 쌓일 때마다 부분 전사 (기본: 2.0)
+        VOICE_STT_WINDOW_SEC: 윈도우 최대 길이 (기본: 12.0)
+    """
+
+    def __init__(
+        self,
+        stt: STTClient,
+        sample_rate: int = SAMPLE_RATE,
+        step_sec: Optional[float] = None,
+        max_window_sec: Optional[float] = None,
+        language: str = "ko"
+    ):
+        self.stt = stt
+        self.sample_rate = sample_rate
+        self.step_sec = step_sec or float(os.getenv("VOICE_STT_STEP_SEC", "2.0"))
+        self.max_window_sec = max_window_sec or float(os.getenv("VOICE_STT_WINDOW_SEC", "12.0"))
+        self.language = language
+
+        self.pcm = bytearray()
+        self.committed_bytes = 0
+        self.committed_text: List[str] = []
+        self.committed_segments: List[Dict[str, Any]] = []
+        self.partial_text = ""
+        self._last_step_bytes = 0
+        self._remainder = b""
+        self.stt_calls = 0
+
+    @property
+    def duration_sec(self) -> float:
+        return len(self.pcm) / (self.sample_rate * BYTES_PER_SAMPLE)
+
+    def append(self, chunk: bytes) -> np.ndarray:
+        """
+        오디오 추가 (VAD 입력용 샘플 반환)
+
+        클라이언트가 샘플 중간에서 청크를 나누면 남는 홀수 바이트를 다음 청크 앞에 붙임
+        """
+        chunk = self._remainder + chunk
+        cut = len(chunk) - len(chunk) % BYTES_PER_SAMPLE
+        chunk, self._remainder = chunk[:cut], chunk[cut:]
+        self.pcm.extend(chunk)
+        return np.frombuffer(chunk, dtype=np.int16)
+
+    def should_step(self) -> bool:
+        step_bytes = int(self.step_sec * self.sample_rate) * BYTES_PER_SAMPLE
+        return len(self.pcm) - self._last_step_bytes >= step_bytes
+
+    @property
+    def text(self) -> str:
+        return " ".join([*self.committed_text, self.partial_text]).strip()
+
+    async def _transcribe_window(self) -> Dict[str, Any]:
+        window = bytes(self.pcm[self.committed_bytes:])
+        tmp_path = os.path.join(tempfile.gettempdir(), f"voice_window_{uuid.uuid4().hex}.wav")
+        write_wav(tmp_path, window, self.sample_rate)
+        try:
+            self.stt_calls += 1
+            return await self.stt.transcribe_with_segments(tmp_path, language=self.language)
+        finally:
+            os.remove(tmp_path)
+
+    async def step(self) -> str:
+        """
+        확정되지 않은 윈도우 부분 전사
+
+        Returns:
+            현재까지의 전체 텍스트 (확정 + 부분)
+        """
+        self._last_step_bytes = len(self.pcm)
+        result = await self._transcribe_window()
+        segments = compact_segments(result.get("segments", []))
+        window_sec = (len(self.pcm) - self.committed_bytes) / (self.sample_rate * BYTES_PER_SAMPLE)
+
+        if window_sec > self.max_window_sec and len(segments) > 1:
+            # 마지막 segment 앞까지 확정 (마지막 segment는 아직 말하는 중일 수 있음)
+            self._commit(segments[:-1])
+            cut_sec = segments[-1]["start"]
+            self.committed_bytes += int(cut_sec * self.sample_rate) * BYTES_PER_SAMPLE
+            self.partial_text = segments[-1]["text"]
+        else:
+            self.partial_text = result.get("text", "").strip()
+        return self.text
+
+    async def finalize(self) -> Dict[str, Any]:
+        """
+        남은 윈도우 최종 전사
+
+        Returns:
+            {"text": 전체 텍스트, "segments": 턴 전체 기준 시간의 segments}
+        """
+        if len(self.pcm) > self.committed_bytes:
+            result = await self._transcribe_window()
+            self._commit(compact_segments(result.get("segments", [])))
+            if not result.get("segments"):
+                self.committed_text.append(result.get("text", "").strip())
+        self.partial_text = ""
+        return {"text": self.text, "segments": self.committed_segments}
+
+    def _commit(self, segments: List[Dict[str, Any]]) -> None:
+        offset = self.committed_bytes / (self.sample_rate * BYTES_PER_SAMPLE)
+        for seg in segments:
+            shifted = {**seg, "start": seg["start"] + offset, "end": seg["end"] + offset}
+            if "words" in seg:
+                shifted["words"] = [
+                    {**w, "start": w["start"] + offset, "end": w["end"] + offset}
+                    for w in seg["words"]
+                ]
+            self.committed_segments.append(shifted)
+            self.committed_text.append(seg["text"])
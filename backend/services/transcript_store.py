@@ -0,0 +1,127 @@
+"""
+전사(Transcript) 재사용 서비스
+
+음성 면접(VoiceInterviewOrchestrator)과 영상 분석(/api/video/analyze)이
+같은 미디어에 대해 Whisper를 두 번 돌리지 않도록
+InterviewTranscript를 미디어 해시 + STT 모델 티어로 조회/저장
+"""
+
+import json
+from typing import Dict, Any, List, Optional
+from sqlalchemy.orm import Session
+
+from models import InterviewTranscript, InterviewVideo, InterviewQuestion
+
+
+def stt_model_tier(model_size: str) -> str:
+    """
+    로컬 openai-whisper 모델 크기 → STT 모델 티어 문자열
+
+    WhisperLocalClient.model_tier와 같은 형식을 사용해야 두 파이프라인이 매칭됨
+    """
+    return f"openai-whisper-{model_size}"
+
+
+def compact_segments(segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Whisper segments에서 저장에 필요한 필드만 추림 (tokens, logprob 등 제거)
+
+    Args:
+        segments: Whisper transcribe 결과의 segments
+
+    Returns:
+        [{"start": 0.0, "end": 2.1, "text": "...", "words": [...]}]
+    """
+    compact = []
+    for seg in segments or []:
+        item = {
+            "start": float(seg.get("start", 0.0)),
+            "end": float(seg.get("end", 0.0)),
+            "text": str(seg.get("text", "")).strip()
+        }
+        words = seg.get("words")
+        if words:
+            item["words"] = [
+                {
+                    "start": float(w.get("start", 0.0)),
+                    "end": float(w.get("end", 0.0)),
+                    "word": str(w.get("word", "")).strip()
+                }
+                for w in words
+            ]
+        compact.append(item)
+    return compact
+
+
+def load_segments(transcript: InterviewTranscript) -> List[Dict[str, Any]]:
+    """저장된 segments_json 파싱 (없거나 깨졌으면 빈 리스트)"""
+    if not transcript or not transcript.segments_json:
+        return []
+    try:
+        return json.loads(transcript.segments_json)
+    except json.JSONDecodeError:
+        return []
+
+
+def find_reusable_transcript(
+    db: Session,
+    media_hash: str,
+    stt_model: str,
+    require_segments: bool = False
+) -> Optional[InterviewTranscript]:
+    """
+    같은 미디어 + 같은 STT 모델 티어로 이미 만들어진 전사 조회
+
+    Args:
+        db: 데이터베이스 세션
+        media_hash: 원본 미디어 SHA-256
+        stt_model: STT 모델 티어 (예: 'openai-whisper-base')
+        require_segments: True면 segments가 저장된 전사만 인정
+
+    Returns:
+        재사용 가능한 InterviewTranscript (없으면 None)
+    """
+    if not media_hash or not stt_model:
+        return None
+
+    query = db.query(InterviewTranscript).filter(
+        InterviewTranscript.media_hash == media_hash,
+        InterviewTranscript.stt_model == stt_model,
+        InterviewTranscript.text != ""
+    )
+    if require_segments:
+        query = query.filter(InterviewTranscript.segments_json.isnot(None))
+
+    return query.order_by(InterviewTranscript.created_at.desc()).first()
+
+
+def get_session_history(db: Session, session_id: str) -> List[Dict[str, Any]]:
+    """
+    세션의 질문-답변 기록 (음성 면접 / 영상 분석 전사 모두 포함)
+
+    Args:
+        db: 데이터베이스 세션
+        session_id: 세션 ID
+
+    Returns:
+        [{"question_id", "question", "question_type", "video_id", "answer", "stt_model"}]
+    """
+    rows = db.query(InterviewQuestion, InterviewVideo, InterviewTranscript).join(
+        InterviewVideo, InterviewVideo.question_id == InterviewQuestion.id
+    ).join(
+        InterviewTranscript, InterviewTranscript.video_id == InterviewVideo.id
+    ).filter(
+        InterviewQuestion.session_id == session_id
+    ).order_by(InterviewVideo.created_at).all()
+
+    return [
+        {
+            "question_id": question.id,
+            "question": question.text,
+            "question_type": question.type,
+            "video_id": video.id,
+            "answer": transcript.text,
+            "stt_model": transcript.stt_model
+        }
+        for question, video, transcript in rows
+    ]
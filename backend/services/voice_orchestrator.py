@@ -5,35 +5,81 @@ STT → LLM → TTS 전체 흐름 관리
 """
 
 import os
+import json
+import time
 import uuid
+import asyncio
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from fastapi import UploadFile
 from sqlalchemy.orm import Session
 
 from clients.base import STTClient, LLMClient, TTSClient
 from models import (
+    generate_uuid,
     InterviewSession,
     InterviewQuestion,
     InterviewVideo,
     InterviewTranscript,
     Portfolio
 )
-from utils.audio_utils import save_upload_file, convert_to_wav, get_audio_duration
+from utils.audio_utils import (
+    save_upload_file,
+    convert_to_wav,
+    get_audio_duration,
+    compute_media_hash
+)
 from services.question_generator import QuestionGenerator
+from services.transcript_store import (
+    compact_segments,
+    find_reusable_transcript,
+    load_segments
+)
+from utils.latency import latency_metrics
+from utils.bounded_executor import llm_executor
+from services.portfolio_digest import (
+    build_portfolio_digest,
+    format_portfolio_digest,
+    load_portfolio_digest,
+    store_portfolio_digest
+)
+from utils.sentences import SentenceBuffer
+from utils.deadline import Deadline, DeadlineExceeded, VOICE_TURN_DEADLINE_SEC
+
+# 턴 마감 시간 안에서 뒤 단계용으로 남겨 두는 시간 (LLM은 TTS 몫을, TTS는 DB 커밋 몫을 남김)
+TTS_RESERVE_SEC = float(os.getenv("VOICE_TTS_RESERVE_SEC", "3"))
+COMMIT_RESERVE_SEC = float(os.getenv("VOICE_COMMIT_RESERVE_SEC", "1"))
+
+# LLM이 마감 시간 안에 꼬리질문을 한 문장도 만들지 못했을 때 쓰는 질문
+FALLBACK_FOLLOWUP_QUESTION = "방금 말씀하신 부분에 대해 좀 더 구체적으로 설명해주시겠어요?"
 
 
 class VoiceInterviewOrchestrator:
     """
     음성 면접 전체 파이프라인 관리
 
-    흐름:
-    1. 오디오 파일 저장 및 변환 (webm → wav)
-    2. STT: 음성 → 텍스트
-    3. DB 저장: InterviewVideo, InterviewTranscript
-    4. LLM: 포트폴리오 + 답변 기반 꼬리질문 생성
-    5. TTS: 꼬리질문 → 음성
-    6. 응답 반환
+    흐름 (서로 의존하지 않는 단계는 동시 실행):
+    1. 오디오 파일 저장 → 변환 (webm → wav) ∥ 미디어 해시
+    2. STT: 음성 → 텍스트 (같은 미디어의 기존 전사가 있으면 재사용)
+       ∥ 꼬리질문 답변 턴이면 다음 메인 질문 + TTS 미리 준비
+    3. LLM: 포트폴리오 + 답변 기반 꼬리질문 생성 (스트리밍, 완성된 문장부터 4 시작)
+    4. TTS: 꼬리질문 → 음성
+    5. DB 저장: InterviewVideo, InterviewTranscript, 다음 질문 (한 번에 커밋)
+    6. 응답 반환 (metrics.stage_ms에 단계별 소요 시간)
+
+    process_answer는 턴 전체 마감 시간(Deadline)을 만들어 단계마다 남은 예산만 줌
+    - 변환 / STT가 예산을 넘으면 DeadlineExceeded (답변 없이는 진행 불가)
+    - LLM이 넘으면 그때까지 완성된 문장(없으면 기본 꼬리질문), TTS가 넘으면 음성 없이
+      audio_stream_url로 응답 (부분 결과, metrics.deadline.partial)
+
+    next_question.audio_url은 질문 전체 음성일 때만 채움
+    - 여러 문장인 꼬리질문은 audio_url을 비우고 audio_chunks(문장별 음성, 순서대로 재생)
+      + audio_stream_url로 응답 (첫 문장 음성만 audio_url에 넣지 않음)
+
+    환경 변수:
+        LLM_STREAMING: "false"면 LLM 전체 응답 후 TTS (기본: true, 지연 비교용)
+        VOICE_TURN_DEADLINE_SEC: 턴 전체 예산 (기본: 30)
     """
 
     def __init__(
@@ -48,13 +94,15 @@ class VoiceInterviewOrchestrator:
         self.tts = tts_client
         self.db = db
         self.question_gen = QuestionGenerator()
+        self.stream_llm = os.getenv("LLM_STREAMING", "true").lower() == "true"
 
     async def process_answer(
         self,
         session_id: str,
         question_id: str,
         audio_file: UploadFile,
-        turn_type: str  # "main" or "followup"
+        turn_type: str,  # "main" or "followup"
+        stream_tts: bool = False
     ) -> Dict[str, Any]:
         """
         답변 처리 전체 파이프라인
@@ -64,6 +112,8 @@ class VoiceInterviewOrchestrator:
             question_id: 현재 질문 ID
             audio_file: 녹음된 음성 파일
             turn_type: "main" (메인 질문 답변) or "followup" (꼬리질문 답변)
+            stream_tts: True면 꼬리질문 음성을 기다리지 않고 audio_stream_url로
+                문장 단위 스트리밍 (첫 음성까지의 시간 단축)
 
         Returns:
             {
@@ -71,55 +121,234 @@ class VoiceInterviewOrchestrator:
                 "metrics": {...},
                 "next_question": {...}
             }
+
+        Raises:
+            DeadlineExceeded: 변환 / STT가 턴 예산 안에 끝나지 않음
         """
+        turn_started = time.perf_counter()
+        stage_ms: Dict[str, float] = {}
+        deadline = Deadline(VOICE_TURN_DEADLINE_SEC, name="voice_turn")
+
+        async def timed(name: str, awaitable):
+            started = time.perf_counter()
+            try:
+                return await awaitable
+            finally:
+                stage_ms[name] = round((time.perf_counter() - started) * 1000, 1)
+
         # 1. 세션 정보 가져오기
         session = self.db.query(InterviewSession).filter_by(id=session_id).first()
         if not session:
             raise ValueError(f"Session not found: {session_id}")
 
-        # 2. 오디오 파일 저장 및 변환
-        upload_dir = Path("uploads/audio")
-        upload_dir.mkdir(parents=True, exist_ok=True)
+        # 꼬리질문 답변 턴: 다음 메인 질문은 답변과 무관하므로 STT와 동시에 준비 (TTS 포함)
+        next_main_task = None
+        if turn_type != "main":
+            next_main_task = asyncio.create_task(
+                timed("next_question", self._get_next_main_question(session, deadline))
+            )
+
+        try:
+            # 2. 오디오 파일 저장
+            upload_dir = Path("uploads/audio")
+            upload_dir.mkdir(parents=True, exist_ok=True)
+
+            original_path = str(upload_dir / f"{uuid.uuid4()}_{audio_file.filename}")
+            await timed("save", save_upload_file(audio_file, original_path))
+
+            # webm → wav 변환 / 미디어 해시는 서로 독립 → 동시 실행 (블로킹 작업은 스레드)
+            async def convert() -> Tuple[str, float]:
+                # ffmpeg / ffprobe는 남은 예산을 타임아웃으로 받아 넘으면 프로세스 종료
+                try:
+                    wav = await asyncio.to_thread(
+                        convert_to_wav, original_path,
+                        timeout_sec=deadline.budget("convert", reserve=TTS_RESERVE_SEC)
+                    )
+                    return wav, await asyncio.to_thread(
+                        get_audio_duration, wav,
+                        timeout_sec=deadline.budget("convert", reserve=TTS_RESERVE_SEC)
+                    )
+                except DeadlineExceeded:
+                    raise
+                except TimeoutError as e:
+                    deadline.timeout("convert")
+                    raise DeadlineExceeded("convert", str(e))
+
+            (wav_path, duration), media_hash = await asyncio.gather(
+                timed("convert", convert()),
+                timed("hash", asyncio.to_thread(compute_media_hash, original_path))
+            )
 
-        original_path = str(upload_dir / f"{uuid.uuid4()}_{audio_file.filename}")
-        await save_upload_file(audio_file, original_path)
+            # 3. STT: 음성 → 텍스트 (같은 미디어 + 같은 모델 티어 전사가 있으면 재사용)
+            stt_model = self.stt.model_tier
+            existing = find_reusable_transcript(self.db, media_hash, stt_model)
+            if existing:
+                transcript_text = existing.text
+                segments = load_segments(existing)
+            else:
+                stt_result = await timed(
+                    "stt",
+                    deadline.run(
+                        "stt",
+                        self.stt.transcribe_with_segments(wav_path, language="ko"),
+                        reserve=TTS_RESERVE_SEC
+                    )
+                )
+                transcript_text = stt_result["text"]
+                segments = compact_segments(stt_result["segments"])
+
+            # 4. 다음 질문 (메인 답변 → LLM 꼬리질문 + TTS / 꼬리 답변 → 미리 준비한 메인 질문)
+            if next_main_task is not None:
+                next_question = await next_main_task
+            else:
+                next_question = await timed(
+                    "next_question",
+                    self._generate_followup_question(
+                        session, question_id, transcript_text, stream_tts, deadline=deadline
+                    )
+                )
+        except BaseException:
+            if next_main_task is not None and not next_main_task.done():
+                next_main_task.cancel()
+            raise
+
+        # 5. DB 저장 + 6. 응답 구성
+        return self._commit_turn(
+            session=session,
+            question_id=question_id,
+            next_question=next_question,
+            media_path=original_path,
+            wav_path=wav_path,
+            duration=duration,
+            transcript_text=transcript_text,
+            segments=segments,
+            media_hash=media_hash,
+            stt_model=stt_model,
+            stage_ms=stage_ms,
+            turn_started=turn_started,
+            transcript_reused=existing is not None,
+            deadline=deadline
+        )
 
-        # webm → wav 변환
-        wav_path = convert_to_wav(original_path)
-        duration = get_audio_duration(wav_path)
+    async def finish_streamed_answer(
+        self,
+        session_id: str,
+        question_id: str,
+        turn_type: str,
+        wav_path: str,
+        transcript_text: str,
+        segments: List[Dict[str, Any]],
+        duration: float,
+        stage_ms: Optional[Dict[str, float]] = None,
+        prepared_next: Optional["asyncio.Task"] = None,
+        on_audio_chunk: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
+    ) -> Dict[str, Any]:
+        """
+        WebSocket 음성 세션의 턴 마무리 (STT는 답변 중 이미 끝난 상태)
 
-        # 3. STT: 음성 → 텍스트
-        transcript_text = await self.stt.transcribe(wav_path, language="ko")
+        Args:
+            session_id: 세션 ID
+            question_id: 현재 질문 ID
+            turn_type: "main" or "followup"
+            wav_path: 턴 전체 오디오 (wav)
+            transcript_text: 최종 전사 텍스트
+            segments: 최종 전사 segments
+            duration: 답변 길이 (초)
+            stage_ms: 이미 측정한 단계별 시간 (예: stt_final)
+            prepared_next: prepare_next_main_question()으로 미리 시작한 작업
+            on_audio_chunk: 꼬리질문 문장 음성이 준비될 때마다 순서대로 호출
+
+        Returns:
+            process_answer()와 같은 형식
+        """
+        turn_started = time.perf_counter()
+        stage_ms = dict(stage_ms or {})
+
+        session = self.db.query(InterviewSession).filter_by(id=session_id).first()
+        if not session:
+            raise ValueError(f"Session not found: {session_id}")
+
+        next_started = time.perf_counter()
+        if turn_type == "main":
+            next_question = await self._generate_followup_question(
+                session, question_id, transcript_text, on_audio_chunk=on_audio_chunk
+            )
+        else:
+            next_question = await (prepared_next or self._get_next_main_question(session))
+        stage_ms["next_question"] = round((time.perf_counter() - next_started) * 1000, 1)
+
+        media_hash = await asyncio.to_thread(compute_media_hash, wav_path)
+        return self._commit_turn(
+            session=session,
+            question_id=question_id,
+            next_question=next_question,
+            media_path=wav_path,
+            wav_path=wav_path,
+            duration=duration,
+            transcript_text=transcript_text,
+            segments=segments,
+            media_hash=media_hash,
+            stt_model=self.stt.model_tier,
+            stage_ms=stage_ms,
+            turn_started=turn_started,
+            transcript_reused=False
+        )
+
+    def prepare_next_main_question(self, session_id: str) -> "asyncio.Task":
+        """
+        다음 메인 질문(+ TTS) 준비를 백그라운드로 시작
+
+        꼬리질문 답변 턴에서는 다음 질문이 답변과 무관하므로 답변을 듣는 동안 준비
+        """
+        session = self.db.query(InterviewSession).filter_by(id=session_id).first()
+        if not session:
+            raise ValueError(f"Session not found: {session_id}")
+        return asyncio.create_task(self._get_next_main_question(session))
 
-        # 4. DB 저장: InterviewVideo
+    def _commit_turn(
+        self,
+        session: InterviewSession,
+        question_id: str,
+        next_question: Dict[str, Any],
+        media_path: str,
+        wav_path: str,
+        duration: float,
+        transcript_text: str,
+        segments: List[Dict[str, Any]],
+        media_hash: str,
+        stt_model: str,
+        stage_ms: Dict[str, float],
+        turn_started: float,
+        transcript_reused: bool,
+        deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
+        """영상 / 전사 / 다음 질문 (+ 세션 종료)을 한 번에 커밋하고 응답 구성"""
+
+        # DB 저장: ID는 미리 생성해 flush 불필요
+        db_started = time.perf_counter()
         video = InterviewVideo(
+            id=generate_uuid(),
             user_id=session.user_id,
-            session_id=session_id,
+            session_id=session.id,
             question_id=question_id,
-            video_url=original_path,  # 원본 파일
+            video_url=media_path,     # 원본 파일
             audio_url=wav_path,       # 변환된 WAV
             duration_sec=duration
         )
-        self.db.add(video)
-        self.db.flush()  # ID 생성
-
-        # 5. DB 저장: InterviewTranscript
         transcript = InterviewTranscript(
             video_id=video.id,
             text=transcript_text,
-            language="ko"
+            language="ko",
+            media_hash=media_hash,
+            stt_model=stt_model,
+            segments_json=json.dumps(segments, ensure_ascii=False) if segments else None
         )
-        self.db.add(transcript)
+        self.db.add_all([video, transcript])
 
-        # 6. 다음 질문 생성
-        next_question = await self._generate_next_question(
-            session, question_id, transcript_text, turn_type
-        )
-
-        # 7. 다음 질문 DB 저장
         if next_question["type"] != "end":
             question = InterviewQuestion(
-                session_id=session_id,
+                id=generate_uuid(),
+                session_id=session.id,
                 text=next_question["text"],
                 type=next_question["question_type"],
                 source="llm" if next_question["question_type"] == "followup" else "predefined",
@@ -129,64 +358,73 @@ class VoiceInterviewOrchestrator:
             self.db.add(question)
             next_question["id"] = question.id
 
+            if not next_question["audio_url"]:
+                next_question["audio_stream_url"] = f"/api/voice/questions/{question.id}/audio/stream"
+        else:
+            # 세션 종료 처리도 같은 트랜잭션에서
+            session.status = "completed"
+            session.completed_at = datetime.utcnow().isoformat()
+
         self.db.commit()
+        stage_ms["db_commit"] = round((time.perf_counter() - db_started) * 1000, 1)
+
+        # 턴 전체 지연 (LLM 스트리밍 on/off 비교용)
+        stage_ms["total"] = round((time.perf_counter() - turn_started) * 1000, 1)
+        latency_metrics.record(
+            f"turn_total_{'stream' if self.stream_llm else 'batch'}",
+            stage_ms["total"]
+        )
 
-        # 8. 응답 구성
         return {
             "answer_text": transcript_text,
             "metrics": {
                 "duration_sec": duration,
                 "word_count": len(transcript_text.split()),
-                "avg_wpm": (len(transcript_text.split()) / duration * 60) if duration > 0 else 0
+                "avg_wpm": (len(transcript_text.split()) / duration * 60) if duration > 0 else 0,
+                "transcript_reused": transcript_reused,
+                "stage_ms": stage_ms,
+                **({"deadline": deadline.to_dict()} if deadline is not None else {})
             },
             "next_question": next_question
         }
 
-    async def _generate_next_question(
-        self,
-        session: InterviewSession,
-        current_question_id: str,
-        user_answer: str,
-        turn_type: str
-    ) -> Dict[str, Any]:
+    async def _portfolio_digest_text(self, portfolio: Portfolio) -> str:
         """
-        다음 질문 생성 (꼬리질문 or 다음 메인 질문)
+        꼬리질문 프롬프트용 포트폴리오 다이제스트 텍스트
 
-        Args:
-            session: 면접 세션
-            current_question_id: 현재 질문 ID
-            user_answer: 사용자 답변 텍스트
-            turn_type: "main" or "followup"
-
-        Returns:
-            다음 질문 딕셔너리
+        다이제스트가 없거나 원문이 바뀐 경우(다이제스트 도입 전 업로드 등)에만
+        스레드에서 한 번 생성해 저장, 이후 턴은 DB의 다이제스트를 그대로 사용
         """
-        # 메인 질문에 대한 답변 → 꼬리질문 생성
-        if turn_type == "main":
-            return await self._generate_followup_question(
-                session, current_question_id, user_answer
-            )
-        # 꼬리질문에 대한 답변 → 다음 메인 질문
-        else:
-            return await self._get_next_main_question(session)
+        digest = load_portfolio_digest(portfolio)
+        if digest is None and portfolio.parsed_text:
+            try:
+                digest = await llm_executor.run(build_portfolio_digest, portfolio.parsed_text)
+                store_portfolio_digest(portfolio, digest, self.db)
+            except Exception as e:
+                print(f"⚠️ 포트폴리오 다이제스트 생성 실패: {e}")
+                return ""
+        return format_portfolio_digest(digest) if digest else ""
 
     async def _generate_followup_question(
         self,
         session: InterviewSession,
         current_question_id: str,
-        user_answer: str
+        user_answer: str,
+        stream_tts: bool = False,
+        on_audio_chunk: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
+        deadline: Optional[Deadline] = None
     ) -> Dict[str, Any]:
         """
         LLM으로 꼬리질문 생성
 
         포트폴리오 정보 + 현재 질문 + 사용자 답변 → 꼬리질문
         """
-        # 포트폴리오 정보 가져오기
+        # 포트폴리오 정보 가져오기 (업로드 시 만든 다이제스트, 턴마다 원문을 다시 정리하지 않음)
         portfolio_text = ""
         if session.portfolio_id:
             portfolio = self.db.query(Portfolio).filter_by(id=session.portfolio_id).first()
-            if portfolio and portfolio.parsed_text:
-                portfolio_text = portfolio.parsed_text
+            if portfolio:
+                portfolio_text = await self._portfolio_digest_text(portfolio)
 
         # 현재 질문 텍스트
         current_question = self.db.query(InterviewQuestion).filter_by(
@@ -210,34 +448,135 @@ class VoiceInterviewOrchestrator:
                 user_answer=user_answer
             )
 
-        # LLM으로 꼬리질문 생성
-        followup_text = await self.llm.generate(prompt, max_tokens=150)
-
-        # TTS로 음성 생성
-        audio_url = await self.tts.synthesize(
-            text=followup_text,
-            speaker="KR",
-            speed=1.0
+        # LLM으로 꼬리질문 생성 + TTS로 음성 생성
+        # (스트리밍 TTS면 클라이언트가 audio_stream_url로 받으므로 합성 생략)
+        followup_text, audio_chunks = await self._generate_followup_with_tts(
+            prompt, synthesize=not stream_tts, on_audio_chunk=on_audio_chunk, deadline=deadline
         )
 
-        return {
+        # audio_url은 항상 질문 전체 음성 (한 문장일 때만 채움)
+        # 여러 문장이면 비워 두고 문장별 음성(audio_chunks)을 순서대로 재생
+        # (비어 있으면 커밋 시 audio_stream_url도 붙음)
+        result = {
             "id": f"followup_{uuid.uuid4()}",
             "text": followup_text,
-            "audio_url": audio_url,
+            "audio_url": audio_chunks[0]["audio_url"] if len(audio_chunks) == 1 else "",
             "type": "question",
             "question_type": "followup",
             "order": current_question.order if current_question else 0,
             "parent_question_id": current_question_id
         }
+        if len(audio_chunks) > 1:
+            result["audio_chunks"] = audio_chunks
+        return result
+
+    async def _generate_followup_with_tts(
+        self,
+        prompt: str,
+        synthesize: bool = True,
+        on_audio_chunk: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
+        deadline: Optional[Deadline] = None
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        LLM 생성과 TTS를 겹쳐서 실행
+
+        스트리밍 모드에서는 문장이 완성되는 즉시 해당 문장의 TTS를 시작하고
+        나머지 문장은 계속 생성 (on_audio_chunk가 있으면 문장 음성을 순서대로 전달)
+
+        deadline이 있으면 LLM은 TTS 몫을 남긴 예산까지만 기다리고 (넘으면 완성된 문장까지,
+        하나도 없으면 기본 꼬리질문), TTS가 예산을 넘으면 음성 없이 반환
+
+        Returns:
+            (꼬리질문 전체 텍스트, [{"text": 문장, "audio_url": ...}])
+        """
+        started = time.perf_counter()
+        sentences: List[str] = []
+        tasks: List[asyncio.Task] = []
+
+        def start_tts(sentence: str) -> None:
+            if not sentences:
+                latency_metrics.record("llm_first_sentence", (time.perf_counter() - started) * 1000)
+            sentences.append(sentence)
+            if synthesize:
+                previous = tasks[-1] if tasks else None
+                tasks.append(asyncio.create_task(
+                    self._synthesize_chunk(len(tasks), sentence, previous, on_audio_chunk)
+                ))
+
+        async def generate() -> str:
+            if self.stream_llm:
+                buffer = SentenceBuffer()
+                parts = []
+                async for delta in self.llm.generate_stream(prompt, max_tokens=150):
+                    parts.append(delta)
+                    for sentence in buffer.feed(delta):
+                        start_tts(sentence)
+                for sentence in buffer.flush():
+                    start_tts(sentence)
+                return "".join(parts).strip()
+            text = (await self.llm.generate(prompt, max_tokens=150)).strip()
+            if text:
+                start_tts(text)
+            return text
+
+        try:
+            if deadline is None:
+                text = await generate()
+            else:
+                try:
+                    text = await deadline.run("llm", generate(), reserve=TTS_RESERVE_SEC)
+                except DeadlineExceeded:
+                    # 완성된 문장까지만 사용 (TTS도 이미 시작됨)
+                    text = " ".join(sentences)
+                    if not text:
+                        start_tts(FALLBACK_FOLLOWUP_QUESTION)
+                        text = FALLBACK_FOLLOWUP_QUESTION
+            latency_metrics.record("llm_total", (time.perf_counter() - started) * 1000)
+
+            if deadline is None:
+                audio_urls = await asyncio.gather(*tasks)
+            else:
+                try:
+                    audio_urls = await deadline.run("tts", asyncio.gather(*tasks), reserve=COMMIT_RESERVE_SEC)
+                except DeadlineExceeded:
+                    # 음성 없이 반환 → 클라이언트는 audio_stream_url로 받음
+                    return text, []
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        latency_metrics.record("followup_ready", (time.perf_counter() - started) * 1000)
+        return text, [
+            {"text": sentence, "audio_url": audio_url}
+            for sentence, audio_url in zip(sentences, audio_urls)
+        ]
+
+    async def _synthesize_chunk(
+        self,
+        index: int,
+        sentence: str,
+        previous: Optional["asyncio.Task"],
+        on_audio_chunk: Optional[Callable[[Dict[str, Any]], Awaitable[None]]]
+    ) -> str:
+        """문장 1개 합성 (합성은 병렬, 전달은 앞 문장이 전달된 뒤 순서대로)"""
+        audio_url = await self.tts.synthesize(text=sentence, speaker="KR", speed=1.0)
+        if previous is not None:
+            await previous
+        if on_audio_chunk is not None:
+            await on_audio_chunk({"index": index, "text": sentence, "audio_url": audio_url})
+        return audio_url
 
     async def _get_next_main_question(
         self,
-        session: InterviewSession
+        session: InterviewSession,
+        deadline: Optional[Deadline] = None
     ) -> Dict[str, Any]:
         """
         다음 메인 질문 가져오기
 
         세션의 현재 진행 상황을 보고 다음 메인 질문 반환
+        (deadline 안에 TTS가 끝나지 않으면 음성 없이 반환, audio_stream_url로 재생)
         """
         # 세션에 몇 개의 메인 질문이 있었는지 확인
         main_questions_count = self.db.query(InterviewQuestion).filter(
@@ -260,11 +599,18 @@ class VoiceInterviewOrchestrator:
             }
 
         # TTS로 음성 생성
-        audio_url = await self.tts.synthesize(
+        synthesize = self.tts.synthesize(
             text=next_question_data["text"],
             speaker="KR",
             speed=1.0
         )
+        if deadline is None:
+            audio_url = await synthesize
+        else:
+            try:
+                audio_url = await deadline.run("tts", synthesize, reserve=COMMIT_RESERVE_SEC)
+            except DeadlineExceeded:
+                audio_url = ""
 
         return {
             "id": next_question_data["id"],
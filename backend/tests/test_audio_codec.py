@@ -0,0 +1,54 @@
+"""
+TTS 응답 코덱 협상 테스트
+
+명시적 format 우선, Accept 헤더 q값 / 와일드카드 처리, 코덱별 비트레이트 보정 확인
+"""
+
+import sys
+import os
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.audio_utils import clamp_bitrate, negotiate_audio_codec
+
+
+def test_explicit_format_wins():
+    assert negotiate_audio_codec("MP3", accept="audio/ogg") == "mp3"
+    try:
+        negotiate_audio_codec("flac")
+        assert False, "지원하지 않는 format은 ValueError"
+    except ValueError:
+        pass
+    print("✅ 명시적 format 테스트 통과")
+
+
+def test_accept_header():
+    assert negotiate_audio_codec(accept=None, default="opus") == "opus"
+    assert negotiate_audio_codec(accept="audio/mpeg;q=0.5, audio/webm;q=0.9") == "webm"
+    assert negotiate_audio_codec(accept="audio/ogg;q=0, audio/x-wav") == "wav"
+    assert negotiate_audio_codec(accept="text/html, */*;q=0.1", default="mp3") == "mp3"
+    assert negotiate_audio_codec(accept="audio/mp3;q=abc, audio/wav;q=0.2") == "wav"
+    try:
+        negotiate_audio_codec(accept="video/mp4, audio/ogg;q=0")
+        assert False, "지원 형식이 없으면 ValueError"
+    except ValueError:
+        pass
+    print("✅ Accept 헤더 협상 테스트 통과")
+
+
+def test_clamp_bitrate():
+    assert clamp_bitrate("opus") == 24
+    assert clamp_bitrate("opus", 2) == 6
+    assert clamp_bitrate("webm", 500) == 128
+    assert clamp_bitrate("mp3", 64) == 64
+    assert clamp_bitrate("mp3", 8) == 32
+    assert clamp_bitrate("wav", 64) is None
+    print("✅ 비트레이트 보정 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_explicit_format_wins()
+    test_accept_header()
+    test_clamp_bitrate()
+    print("\n✅ 모든 코덱 협상 테스트 통과!")
@@ -0,0 +1,135 @@
+"""
+요청 마감 시간(Deadline) 테스트
+
+단계별 예산(상한 / 예약분), 예산이 없을 때 건너뛰기, async / 블로킹 단계 취소,
+부분 결과 기록(skipped / timed_out)을 확인
+"""
+
+import sys
+import os
+import time
+import asyncio
+import threading
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.deadline import BLOCKING_WORKERS, Deadline, DeadlineExceeded, blocking_pool_stats
+
+
+def test_stage_budget():
+    deadline = Deadline(10.0, name="test")
+    assert 9.0 < deadline.budget("stt") <= 10.0
+    assert deadline.budget("llm", cap=2.0) == 2.0
+    assert 6.0 < deadline.budget("llm", reserve=3.0) <= 7.0
+    assert not deadline.partial
+
+    try:
+        deadline.budget("tts", reserve=20.0)
+        assert False, "예산이 없으면 DeadlineExceeded"
+    except DeadlineExceeded as e:
+        assert e.stage == "tts"
+        assert isinstance(e, TimeoutError)
+    assert deadline.skipped == ["tts"]
+    assert deadline.partial
+    print("✅ 단계별 예산 테스트 통과")
+
+
+def test_async_stage_cancelled():
+    deadline = Deadline(0.2, name="test")
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def main():
+        assert await deadline.run("fast", asyncio.sleep(0, result="ok")) == "ok"
+        started = time.perf_counter()
+        try:
+            await deadline.run("llm", slow())
+            assert False, "예산을 넘으면 DeadlineExceeded"
+        except DeadlineExceeded as e:
+            assert e.stage == "llm"
+        assert time.perf_counter() - started < 1.0
+        # 예산이 다 떨어진 뒤의 단계는 실행하지 않음
+        try:
+            await deadline.run("tts", slow())
+            assert False
+        except DeadlineExceeded:
+            pass
+
+    asyncio.run(main())
+    assert cancelled == [True]
+    assert deadline.timed_out == ["llm"]
+    assert deadline.skipped == ["tts"]
+    summary = deadline.to_dict()
+    assert summary["partial"] and summary["remaining_ms"] == 0
+    print("✅ async 단계 취소 테스트 통과")
+
+
+def test_blocking_stage_abandoned():
+    deadline = Deadline(0.2, name="test")
+    assert deadline.call("stt", lambda x: x * 2, 21) == 42
+
+    started = time.perf_counter()
+    try:
+        deadline.call("stt", time.sleep, 2)
+        assert False, "예산을 넘으면 DeadlineExceeded"
+    except DeadlineExceeded:
+        pass
+    # 블로킹 호출이 끝날 때까지 기다리지 않음
+    assert time.perf_counter() - started < 1.0
+    assert deadline.timed_out == ["stt"]
+    assert "stt" in deadline.to_dict()["queue_ms"]
+    print("✅ 블로킹 단계 타임아웃 테스트 통과")
+
+
+def _wait_pool_idle(timeout=5.0):
+    started = time.perf_counter()
+    while blocking_pool_stats()["running"] and time.perf_counter() - started < timeout:
+        time.sleep(0.05)
+
+
+def test_saturated_pool_skips_stage():
+    """버려진 호출이 풀을 다 차지하면 다음 단계는 실행하지 않고 건너뜀 (요청이 멈추지 않음)"""
+    _wait_pool_idle()
+    for _ in range(BLOCKING_WORKERS):
+        try:
+            Deadline(0.05, name="slow").call("stt", time.sleep, 1.0)
+            assert False
+        except DeadlineExceeded:
+            pass
+    stats = blocking_pool_stats()
+    assert stats["abandoned"] == BLOCKING_WORKERS and stats["running"] == BLOCKING_WORKERS
+
+    deadline = Deadline(5.0, name="test")
+    ran = []
+    started = time.perf_counter()
+    try:
+        deadline.call("stt", lambda: ran.append(True))
+        assert False, "풀이 버려진 작업으로 가득 차면 DeadlineExceeded"
+    except DeadlineExceeded as e:
+        assert e.stage == "stt"
+    assert time.perf_counter() - started < 0.5
+    assert ran == []
+    assert deadline.skipped == ["stt"] and deadline.partial
+    assert blocking_pool_stats()["saturated_skips"] >= 1
+
+    # 버려진 작업이 끝나면 다시 풀에서 실행
+    _wait_pool_idle()
+    stats = blocking_pool_stats()
+    assert stats["abandoned"] == 0 and stats["queued"] == 0
+    assert Deadline(5.0, name="test").call("stt", lambda: threading.current_thread().name).startswith("deadline")
+    print("✅ 풀 포화 시 단계 건너뛰기 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_stage_budget()
+    test_async_stage_cancelled()
+    test_blocking_stage_abandoned()
+    test_saturated_pool_skips_stage()
+    print("\n✅ 모든 Deadline 테스트 통과!")
@@ -0,0 +1,51 @@
+"""
+필러 탐지 엔진 테스트
+"""
+
+import sys
+import os
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pipeline.fillers import FillerMatcher, detect_fillers, get_filler_matcher
+
+
+def test_korean_filler_token_boundary():
+    """'어'는 단독 토큰만 필러로 인정 ('어떻게'는 제외)"""
+    matcher = get_filler_matcher()
+    assert matcher.count("어떻게 해결했는지 말씀드리면") == 0
+    assert matcher.count("어 그러니까 음... 어어 그렇습니다") == 3
+
+
+def test_multi_word_filler():
+    """여러 단어 필러와 단일 필러를 한 번의 스캔으로 탐지"""
+    matcher = FillerMatcher(["you know", "know", "um"])
+    labels = sorted(label for _, _, label in matcher.find("um you know".split()))
+    assert labels == ["know", "um", "you know"]
+
+
+def test_filler_timeline_uses_word_timestamps():
+    """단어 타임스탬프 기준으로 초 단위 필러 타임라인 생성"""
+    segments = [
+        {"start": 0.0, "end": 2.0, "text": "음 안녕하세요"},
+        {
+            "start": 3.0, "end": 5.0, "text": "어 반갑습니다",
+            "words": [
+                {"word": " 어,", "start": 3.4, "end": 3.6},
+                {"word": " 반갑습니다", "start": 3.8, "end": 4.9}
+            ]
+        }
+    ]
+    result = detect_fillers(segments, duration_sec=5.0)
+
+    assert result["count"] == 2
+    assert result["timeline"] == [1, 0, 0, 1, 0]
+    assert [e["t"] for e in result["events"]] == [0.0, 3.4]
+
+
+if __name__ == "__main__":
+    test_korean_filler_token_boundary()
+    test_multi_word_filler()
+    test_filler_timeline_uses_word_timestamps()
+    print("✅ 필러 탐지 테스트 통과")
@@ -0,0 +1,121 @@
+"""
+HTTP 커넥션 풀 재시도 정책 테스트
+
+멱등이 아닌 POST는 타임아웃 / 504를 재시도하지 않고 (GPU 작업 중복 방지),
+서버가 처리하지 않은 게 확실한 429/502/503과 연결 실패만 재시도하는지 확인
+"""
+
+import sys
+import os
+import asyncio
+import socket
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aiohttp import web
+
+from clients.http_pool import HTTPPool
+
+
+async def _serve(handler):
+    """handler를 /work (GET / POST)로 띄우고 (runner, base_url) 반환"""
+    app = web.Application()
+    app.router.add_route("*", "/work", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def _pool() -> HTTPPool:
+    return HTTPPool(retries=2, backoff_sec=0.01)
+
+
+def test_post_timeout_not_retried():
+    """POST 타임아웃은 한 번만 호출 / GET이나 idempotent=True는 재시도"""
+    async def run():
+        calls = []
+
+        async def slow(request):
+            calls.append(request.method)
+            await asyncio.sleep(0.5)
+            return web.json_response({"ok": True})
+
+        runner, base_url = await _serve(slow)
+        pool = _pool()
+        try:
+            for method, idempotent, expected in (("POST", None, 1), ("GET", None, 3), ("POST", True, 3)):
+                calls.clear()
+                try:
+                    await pool.request_json(method, f"{base_url}/work", timeout_sec=0.1, idempotent=idempotent)
+                    assert False, "타임아웃이어야 함"
+                except asyncio.TimeoutError:
+                    pass
+                assert len(calls) == expected, (method, idempotent, calls)
+        finally:
+            await pool.close()
+            await runner.cleanup()
+
+    asyncio.run(run())
+    print("✅ POST 타임아웃 재시도 안 함 테스트 통과")
+
+
+def test_post_retries_only_unprocessed_statuses():
+    """POST: 503은 재시도 후 성공, 504는 재시도하지 않음"""
+    async def run():
+        responses = {"503": [503, 200], "504": [504, 200]}
+        calls = []
+
+        async def flaky(request):
+            key = request.query["status"]
+            calls.append(key)
+            return web.json_response({"ok": True}, status=responses[key].pop(0))
+
+        runner, base_url = await _serve(flaky)
+        pool = _pool()
+        try:
+            assert await pool.request_json("POST", f"{base_url}/work?status=503", json={}) == {"ok": True}
+            try:
+                await pool.request_json("POST", f"{base_url}/work?status=504", json={})
+                assert False, "504는 그대로 실패"
+            except Exception as e:
+                assert getattr(e, "status", None) == 504
+            assert calls == ["503", "503", "504"]
+        finally:
+            await pool.close()
+            await runner.cleanup()
+
+    asyncio.run(run())
+    print("✅ POST 상태 코드 재시도 테스트 통과")
+
+
+def test_post_connect_failure_retried():
+    """연결 자체가 안 되면 POST도 재시도 (서버에 닿지 않았음)"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    async def run():
+        pool = _pool()
+        try:
+            await pool.request_json("POST", f"http://127.0.0.1:{port}/work", json={})
+            assert False, "연결 실패여야 함"
+        except Exception:
+            pass
+        finally:
+            stats = pool.stats()["hosts"][f"127.0.0.1:{port}"]
+            await pool.close()
+        assert stats["retries"] == 2 and stats["failures"] == 1
+
+    asyncio.run(run())
+    print("✅ POST 연결 실패 재시도 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_post_timeout_not_retried()
+    test_post_retries_only_unprocessed_statuses()
+    test_post_connect_failure_retried()
+    print("\n✅ 모든 HTTP 풀 테스트 통과!")
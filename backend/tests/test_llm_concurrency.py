@@ -0,0 +1,169 @@
+"""
+LLM 호출 비동기 실행 테스트
+
+동기 SDK(generate_content)를 감싼 LLM 호출이 이벤트 루프를 막지 않아
+여러 음성 면접 턴이 직렬화되지 않는지 확인
+"""
+
+import sys
+import os
+import time
+import asyncio
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clients import gemini_client
+from clients.gemini_client import GeminiClient
+from clients.llm_gateway import LLMGateway
+from utils.llm_cache import LLMResponseCache
+from utils.bounded_executor import BoundedExecutor
+
+LLM_DELAY_SEC = 0.3
+
+
+class BlockingResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class BlockingModel:
+    """google.generativeai GenerativeModel 대역 (동기 호출, 지연 후 응답)"""
+
+    def __init__(self, delay=LLM_DELAY_SEC):
+        self.delay = delay
+
+    def generate_content(self, prompt, **kwargs):
+        time.sleep(self.delay)
+        return BlockingResponse(f"꼬리질문: {prompt}")
+
+
+def _gemini_client(executor: BoundedExecutor, delay=LLM_DELAY_SEC) -> GeminiClient:
+    """실제 GeminiClient.generate → LLM 게이트웨이 경로 (키의 모델 객체만 대역으로)"""
+    gateway = LLMGateway(api_keys=["test-key"], rpm=6000, cache=LLMResponseCache(enabled=False))
+    gateway.slots[0]._models["test-model"] = BlockingModel(delay)
+    client = GeminiClient.__new__(GeminiClient)
+    client.gateway = gateway
+    client.model_name = "test-model"
+    client.timeout_sec = executor.timeout_sec
+    return client
+
+
+def _with_executor(executor: BoundedExecutor, fn):
+    """gemini_client가 쓰는 llm_executor를 잠시 교체 (끝나면 복원)"""
+    original = gemini_client.llm_executor
+    gemini_client.llm_executor = executor
+    try:
+        return fn()
+    finally:
+        gemini_client.llm_executor = original
+
+
+async def _voice_turn(llm: GeminiClient, index: int) -> str:
+    """STT 이후 LLM 단계만 남긴 음성 턴"""
+    await asyncio.sleep(0.01)
+    return await llm.generate(f"답변 {index}")
+
+
+def test_concurrent_turns_are_not_serialized():
+    """동시 턴 4개가 순차 실행(4 × 지연)보다 훨씬 빨리 끝나야 함"""
+    executor = BoundedExecutor("test-llm", max_concurrency=4, timeout_sec=5)
+    llm = _gemini_client(executor)
+
+    async def run():
+        started = time.perf_counter()
+        results = await asyncio.gather(*(_voice_turn(llm, i) for i in range(4)))
+        return results, time.perf_counter() - started
+
+    results, elapsed = _with_executor(executor, lambda: asyncio.run(run()))
+
+    assert results == [f"꼬리질문: 답변 {i}" for i in range(4)]
+    assert elapsed < LLM_DELAY_SEC * 2, f"turns serialized: {elapsed:.2f}s"
+
+
+def test_event_loop_stays_responsive():
+    """LLM 호출 중에도 이벤트 루프가 다른 작업(틱)을 계속 처리"""
+    executor = BoundedExecutor("test-llm", max_concurrency=2, timeout_sec=5)
+    llm = _gemini_client(executor)
+
+    async def run():
+        ticks = 0
+        done = asyncio.Event()
+
+        async def ticker():
+            nonlocal ticks
+            while not done.is_set():
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        await llm.generate("답변")
+        done.set()
+        await task
+        return ticks
+
+    ticks = _with_executor(executor, lambda: asyncio.run(run()))
+    assert ticks >= 10, f"event loop blocked (ticks={ticks})"
+
+
+def test_concurrency_limit_and_timeout():
+    """동시 실행 수 제한 + 호출별 타임아웃"""
+    executor = BoundedExecutor("test-llm", max_concurrency=1, timeout_sec=5)
+    llm = _gemini_client(executor)
+
+    async def run_limited():
+        started = time.perf_counter()
+        await asyncio.gather(llm.generate("a"), llm.generate("b"))
+        return time.perf_counter() - started
+
+    assert _with_executor(executor, lambda: asyncio.run(run_limited())) >= LLM_DELAY_SEC * 2 * 0.9
+
+    slow = _gemini_client(executor)
+    slow.timeout_sec = 0.05
+
+    async def run_timeout():
+        try:
+            await slow.generate("c")
+        except asyncio.TimeoutError:
+            return True
+        return False
+
+    assert _with_executor(executor, lambda: asyncio.run(run_timeout()))
+    assert executor.timeouts == 1
+    time.sleep(LLM_DELAY_SEC)
+
+
+def test_timed_out_call_holds_slot_until_thread_finishes():
+    """타임아웃된 호출의 스레드가 끝날 때까지 슬롯을 반납하지 않음 (in_flight도 유지)"""
+    executor = BoundedExecutor("test-llm", max_concurrency=1, timeout_sec=5)
+    hung = _gemini_client(executor, delay=0.5)
+    hung.timeout_sec = 0.05
+    llm = _gemini_client(executor, delay=0.01)
+
+    async def run():
+        try:
+            await hung.generate("멈춘 호출")
+            assert False, "타임아웃이어야 함"
+        except asyncio.TimeoutError:
+            pass
+        # 호출자는 돌아왔지만 스레드는 아직 실행 중
+        assert executor.stats()["in_flight"] == 1
+
+        # 다음 호출은 슬롯을 기다렸다가 스레드가 풀리면 바로 실행 (실행기 대기열에서 시간 초과 X)
+        started = time.perf_counter()
+        result = await llm.generate("다음 호출")
+        return result, time.perf_counter() - started
+
+    result, elapsed = _with_executor(executor, lambda: asyncio.run(run()))
+    assert result == "꼬리질문: 다음 호출"
+    assert 0.3 < elapsed < 1.0, elapsed
+    assert executor.stats()["in_flight"] == 0
+    assert executor.timeouts == 1
+
+
+if __name__ == "__main__":
+    test_concurrent_turns_are_not_serialized()
+    test_event_loop_stays_responsive()
+    test_concurrency_limit_and_timeout()
+    test_timed_out_call_holds_slot_until_thread_finishes()
+    print("✅ LLM 동시성 테스트 통과")
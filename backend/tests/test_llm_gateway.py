@@ -0,0 +1,194 @@
+"""
+LLM 게이트웨이 테스트
+
+키별 라우팅(가장 한가한 키), 429 쿨다운 후 다른 키로 재시도, 토큰 버킷 제한,
+응답 캐시 히트 / 우회, 헤지 요청 / 마감 초과, 스트리밍 키 점유 / 쿨다운 확인
+(실제 Gemini 호출 없이 키별 모델 객체를 대역으로 교체)
+"""
+
+import sys
+import os
+import time
+import asyncio
+import tempfile
+import threading
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clients.llm_gateway import CachedResponse, LLMDeadlineExceeded, LLMGateway, NoAvailableKeyError
+from utils.llm_cache import LLMResponseCache
+
+MODEL = "test-model"
+
+
+class RateLimited(Exception):
+    code = 429
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeModel:
+    """GenerativeModel 대역 (호출 기록, 지연, 실패 주입)"""
+
+    def __init__(self, name, delay=0.0, error=None):
+        self.name = name
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    def generate_content(self, contents, **kwargs):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return FakeResponse(f"{self.name}: {contents}")
+
+
+def _gateway(models, cache=None, **kwargs):
+    cache = cache or LLMResponseCache(enabled=False)
+    gateway = LLMGateway(api_keys=[f"k{i}" for i in range(len(models))], cache=cache, **kwargs)
+    for slot, model in zip(gateway.slots, models):
+        slot._models[MODEL] = model
+    return gateway
+
+
+def test_least_loaded_routing():
+    """동시 요청이 한 키에 몰리지 않고 키마다 나뉨"""
+    models = [FakeModel("a", delay=0.1), FakeModel("b", delay=0.1), FakeModel("c", delay=0.1)]
+    gateway = _gateway(models, rpm=600)
+
+    threads = [
+        threading.Thread(target=gateway.generate_content, args=("q",), kwargs={"model_name": MODEL})
+        for _ in range(3)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert [m.calls for m in models] == [1, 1, 1]
+
+
+def test_rate_limit_cooldown_and_failover():
+    """429 난 키는 쿨다운되고 요청은 다른 키로 성공"""
+    models = [FakeModel("a", error=RateLimited("429 quota exceeded")), FakeModel("b")]
+    gateway = _gateway(models, rpm=600, cooldown_sec=30)
+
+    assert gateway.generate_content("q", model_name=MODEL).text.startswith("b")
+    stats = gateway.stats()["keys"]
+    assert stats["key1"]["rate_limited"] == 1
+    assert stats["key1"]["cooldown_remaining_sec"] > 0
+
+    # 쿨다운 중인 키 #1은 더 이상 호출되지 않음
+    gateway.generate_content("q", model_name=MODEL)
+    assert models[0].calls == 1 and models[1].calls == 2
+
+
+def test_token_bucket_limit():
+    """버킷이 비고 max_wait 안에 충전되지 않으면 즉시 실패"""
+    gateway = _gateway([FakeModel("a")], rpm=6, max_wait_sec=0)  # 버스트 1개
+    gateway.generate_content("q", model_name=MODEL)
+    try:
+        gateway.generate_content("q", model_name=MODEL)
+    except NoAvailableKeyError:
+        return
+    raise AssertionError("expected NoAvailableKeyError")
+
+
+def test_response_cache_hit_and_bypass():
+    """같은 (모델, 프롬프트)는 캐시에서 반환, cache=False면 항상 호출"""
+    model = FakeModel("a")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = LLMResponseCache(path=os.path.join(tmp_dir, "llm_cache.sqlite3"), enabled=True)
+        gateway = _gateway([model], cache=cache, rpm=600)
+
+        first = gateway.generate_content("q", model_name=MODEL, cache=True)
+        second = gateway.generate_content("q", model_name=MODEL, cache=True)
+        assert isinstance(second, CachedResponse) and second.text == first.text
+        assert model.calls == 1
+
+        gateway.generate_content("q", model_name=MODEL, cache=False)
+        assert model.calls == 2
+        assert cache.stats()["hits"] == 1
+
+
+
+def test_hedged_request_and_deadline():
+    """느린 키의 응답이 p95(여기서는 기본 대기 시간)를 넘기면 다른 키로 헤지, 마감 초과는 예외"""
+    models = [FakeModel("slow", delay=1.0), FakeModel("fast", delay=0.05)]
+    gateway = _gateway(models, rpm=600)
+    gateway.hedge_default_delay_sec = 0.1
+
+    started = time.monotonic()
+    response = gateway.generate_content("q", model_name=MODEL, deadline_sec=2.0, operation="test")
+    assert response.text.startswith("fast")
+    assert time.monotonic() - started < 0.5
+
+    gateway = _gateway([FakeModel("a", delay=0.5), FakeModel("b", delay=0.5)], rpm=600)
+    gateway.hedge_default_delay_sec = 0.05
+    try:
+        gateway.generate_content("q", model_name=MODEL, deadline_sec=0.2, operation="test")
+        assert False, "LLMDeadlineExceeded가 나야 함"
+    except LLMDeadlineExceeded:
+        gateway.record_fallback("test")
+
+    policy = gateway.stats()["policy"]["test"]
+    assert policy["hedged"] == 1 and policy["deadline_exceeded"] == 1 and policy["fallback_rate"] == 1.0
+
+
+class FakeStreamModel:
+    """generate_content_async(stream=True) 대역 (청크 텍스트를 순서대로, 실패 주입)"""
+
+    def __init__(self, chunks, error=None):
+        self.chunks = chunks
+        self.error = error
+
+    async def generate_content_async(self, contents, **kwargs):
+        if self.error is not None:
+            raise self.error
+
+        async def stream():
+            for text in self.chunks:
+                yield FakeResponse(text)
+        return stream()
+
+
+def test_stream_model_routing_and_cooldown():
+    """스트리밍도 게이트웨이 키를 점유 (끝나면 반납), 429가 난 키는 쿨다운 후 다른 키 사용"""
+    gateway = _gateway([FakeModel("a"), FakeModel("b")], rpm=600)
+    gateway.slots[0]._async_models[MODEL] = FakeStreamModel(["a1"], error=RateLimited("429 quota"))
+    gateway.slots[1]._async_models[MODEL] = FakeStreamModel(["b1", "b2"])
+
+    async def stream_once():
+        async with gateway.stream_model(MODEL) as model:
+            assert sum(slot.in_flight for slot in gateway.slots) == 1
+            response = await model.generate_content_async("q", stream=True)
+            return [chunk.text async for chunk in response]
+
+    async def run():
+        try:
+            await stream_once()
+            assert False, "key1 스트리밍은 429"
+        except RateLimited:
+            pass
+        return await stream_once()
+
+    assert asyncio.run(run()) == ["b1", "b2"]
+    stats = gateway.stats()["keys"]
+    assert stats["key1"]["rate_limited"] == 1 and stats["key1"]["cooldown_remaining_sec"] > 0
+    assert stats["key2"]["requests"] == 1
+    assert all(slot.in_flight == 0 for slot in gateway.slots)
+
+
+if __name__ == "__main__":
+    test_least_loaded_routing()
+    test_rate_limit_cooldown_and_failover()
+    test_token_bucket_limit()
+    test_response_cache_hit_and_bypass()
+    test_hedged_request_and_deadline()
+    test_stream_model_routing_and_cooldown()
+    print("✅ LLM 게이트웨이 테스트 통과")
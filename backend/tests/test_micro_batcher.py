@@ -0,0 +1,65 @@
+"""
+마이크로 배치 큐 테스트
+
+동시 요청이 배치로 묶이고, 요청별 실패가 분리되며, 지표가 기록되는지 확인
+"""
+
+import sys
+import os
+import time
+import asyncio
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.micro_batcher import MicroBatcher
+
+WORK_SEC = 0.05
+
+
+def _handler(worker_id, items):
+    """배치당 고정 비용 (모델 호출 대역)"""
+    time.sleep(WORK_SEC)
+    return [ValueError(item) if item == "bad" else f"{item}@{worker_id}" for item in items]
+
+
+def test_concurrent_requests_are_batched():
+    """동시 요청 8개가 한 워커에서 소수의 배치로 처리"""
+    batcher = MicroBatcher("test-tts", _handler, workers=1, max_batch_size=8, max_wait_ms=20)
+
+    async def run():
+        results = await asyncio.gather(*(batcher.submit(f"req{i}") for i in range(8)))
+        await batcher.stop()
+        return results
+
+    results = asyncio.run(run())
+    stats = batcher.stats()
+
+    assert results == [f"req{i}@0" for i in range(8)]
+    assert stats["processed"] == 8
+    assert stats["histograms"]["batch_size"]["count"] <= 2
+    assert stats["histograms"]["latency_ms"]["count"] == 8
+
+
+def test_failure_is_per_request():
+    """배치 안 한 요청의 실패가 다른 요청에 영향 없음"""
+    batcher = MicroBatcher("test-tts", _handler, workers=2, max_batch_size=4, max_wait_ms=10)
+
+    async def run():
+        results = await asyncio.gather(
+            batcher.submit("ok1"), batcher.submit("bad"), batcher.submit("ok2"),
+            return_exceptions=True
+        )
+        await batcher.stop()
+        return results
+
+    ok1, bad, ok2 = asyncio.run(run())
+    assert ok1.startswith("ok1@") and ok2.startswith("ok2@")
+    assert isinstance(bad, ValueError)
+    assert batcher.failed == 1
+
+
+if __name__ == "__main__":
+    test_concurrent_requests_are_batched()
+    test_failure_is_per_request()
+    print("✅ 마이크로 배치 테스트 통과")
@@ -0,0 +1,89 @@
+"""
+목 모델 서버 테스트
+
+SDK REST 전송이 보내는 responseSchema(정수 Schema.Type)에 맞는 JSON을 만드는지,
+LLM 게이트웨이 → 목 서버 → 구조화 출력 파싱까지 실제 경로로 왕복되는지 확인
+"""
+
+import sys
+import os
+import socket
+import threading
+import time
+
+# backend 디렉토리 / scripts 디렉토리를 Python 경로에 추가
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.join(BACKEND_DIR, "scripts"))
+
+import uvicorn
+
+import mock_model_server
+from clients.llm_gateway import LLMGateway
+from schemas import InitialQuestionItem
+from utils.structured_output import json_generation_config, parse_json_response, structured_output_metrics
+
+
+def test_schema_value_accepts_integer_types():
+    """{"type": 5, "items": {"type": 6, ...}} (SDK REST 직렬화) / "ARRAY" / "array" 모두 같은 모양"""
+    for array_type, object_type, string_type in ((5, 6, 1), ("ARRAY", "OBJECT", "STRING"), ("array", "object", "string")):
+        value = mock_model_server._schema_value({
+            "type": array_type,
+            "items": {"type": object_type, "properties": {
+                "text": {"type": string_type, "enum": []},
+                "score": {"type": 3 if array_type == 5 else "integer"}
+            }}
+        })
+        assert isinstance(value, list) and len(value) == 3
+        assert isinstance(value[0]["text"], str) and isinstance(value[0]["score"], int)
+    print("✅ 정수 Schema.Type 테스트 통과")
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_gateway_round_trip_through_mock():
+    """json_generation_config → SDK REST 요청 → 목 서버 → parse_json_response"""
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(mock_model_server.app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    original_latency = mock_model_server.config.latency
+    mock_model_server.config.latency = {group: mock_model_server.LatencyProfile(0) for group in mock_model_server.GROUPS}
+    original_endpoint = os.environ.get("GEMINI_API_ENDPOINT")
+    os.environ["GEMINI_API_ENDPOINT"] = f"http://127.0.0.1:{port}"
+    thread.start()
+    try:
+        for _ in range(100):
+            if server.started:
+                break
+            time.sleep(0.05)
+
+        gateway = LLMGateway(api_keys=["mock-key"])
+        response = gateway.generate_content(
+            "초기 면접 질문을 JSON 배열로 만들어 주세요",
+            model_name="gemini-test",
+            generation_config=json_generation_config(InitialQuestionItem, as_list=True)
+        )
+        items = parse_json_response(response.text, "mock_round_trip", InitialQuestionItem)
+    finally:
+        server.should_exit = True
+        thread.join(timeout=5)
+        mock_model_server.config.latency = original_latency
+        if original_endpoint is None:
+            os.environ.pop("GEMINI_API_ENDPOINT", None)
+        else:
+            os.environ["GEMINI_API_ENDPOINT"] = original_endpoint
+
+    assert len(items) == 3
+    assert all(isinstance(item["type"], str) and isinstance(item["text"], str) for item in items)
+    assert structured_output_metrics.stats()["mock_round_trip"]["ok"] == 1
+    print("✅ 게이트웨이 ↔ 목 서버 왕복 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_schema_value_accepts_integer_types()
+    test_gateway_round_trip_through_mock()
+    print("\n✅ 모든 목 모델 서버 테스트 통과!")
@@ -0,0 +1,146 @@
+"""
+포트폴리오 통합 분석 테스트
+
+CV / GitHub 분석이 각자의 DB 세션으로 동시에 실행되는지,
+두 결과가 기존 summary 섹션을 지우지 않고 한 번에 병합되는지,
+한쪽이 실패해도 다른 쪽 결과는 저장되는지 확인 (실제 Gemini / GitHub 호출 없음)
+"""
+
+import sys
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from database import Base
+from models import User, Portfolio
+from services import portfolio_analyzer
+from services.cv_analyzer import cv_analyzer
+from services.github_analyzer import github_analyzer
+
+DELAY_SEC = 0.3
+
+
+def setup_db():
+    """스레드 간에 공유되는 인메모리 SQLite + 사용자 / 포트폴리오 1개"""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    TestSession = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = TestSession()
+    user = User(email="load@example.com", password_hash="x", name="테스트", github_username="octocat")
+    db.add(user)
+    db.flush()
+    portfolio = Portfolio(
+        user_id=user.id, file_url="/uploads/cv.pdf", filename="cv.pdf",
+        summary=json.dumps({"capabilities": {"kept": True}})
+    )
+    db.add(portfolio)
+    db.commit()
+    return TestSession, db, user.id, portfolio.id
+
+
+@contextmanager
+def patch_analyzers(TestSession, sessions, github_error=None):
+    """prepare 단계를 느린 가짜로, 세션 팩토리를 테스트 DB로 잠시 교체 (끝나면 복원)"""
+
+    def fake_cv(portfolio_id, user_id, db, role=None, level=None):
+        sessions.append(("cv", id(db), threading.get_ident()))
+        time.sleep(DELAY_SEC)
+        return {
+            "role": "ROLE_BE", "level": "LEVEL_MID", "extracted_text": "새로 추출한 텍스트",
+            "analysis": {"overall_score": 80, "summary": "cv"}, "digest": None
+        }
+
+    def fake_github(user_id, portfolio_id, db, role=None, level=None, max_repos=10):
+        sessions.append(("github", id(db), threading.get_ident()))
+        time.sleep(DELAY_SEC)
+        if github_error:
+            raise RuntimeError(github_error)
+        return {"role": "ROLE_BE", "level": "LEVEL_MID", "analysis": {"overall_score": 70, "summary": "github"}}
+
+    original_session = portfolio_analyzer.SessionLocal
+    portfolio_analyzer.SessionLocal = TestSession
+    cv_analyzer.prepare_analysis = fake_cv
+    github_analyzer.prepare_github_analysis = fake_github
+    try:
+        yield
+    finally:
+        # 인스턴스 속성을 지우면 클래스의 원래 메서드가 다시 보임
+        del cv_analyzer.prepare_analysis
+        del github_analyzer.prepare_github_analysis
+        portfolio_analyzer.SessionLocal = original_session
+
+
+def test_parallel_analysis_merges_summary():
+    TestSession, db, user_id, portfolio_id = setup_db()
+    sessions = []
+
+    started = time.perf_counter()
+    with patch_analyzers(TestSession, sessions):
+        result = portfolio_analyzer.analyze_full_portfolio(user_id, portfolio_id, db)
+    elapsed = time.perf_counter() - started
+
+    assert result["status"] == "success"
+    assert result["cv_analysis"]["overall_score"] == 80
+    assert result["github_analysis"]["overall_score"] == 70
+    # 동시 실행: 두 분석 시간의 합보다 짧음, 세션은 분석마다 따로
+    assert elapsed < DELAY_SEC * 1.8, elapsed
+    assert len({session for _, session, _ in sessions}) == 2
+    assert id(db) not in {session for _, session, _ in sessions}
+
+    check = TestSession()
+    portfolio = check.query(Portfolio).filter_by(id=portfolio_id).first()
+    summary = json.loads(portfolio.summary)
+    assert summary["cv_analysis"]["summary"] == "cv"
+    assert summary["github_analysis"]["summary"] == "github"
+    assert summary["capabilities"] == {"kept": True}
+    assert portfolio.parsed_text == "새로 추출한 텍스트"
+    check.close()
+    db.close()
+    print("✅ 동시 분석 + summary 병합 테스트 통과")
+
+
+def test_partial_failure_keeps_other_result():
+    TestSession, db, user_id, portfolio_id = setup_db()
+
+    with patch_analyzers(TestSession, [], github_error="GitHub API rate limit"):
+        result = portfolio_analyzer.analyze_full_portfolio(user_id, portfolio_id, db)
+
+    assert result["status"] == "partial"
+    assert result["github_analysis"] == {"error": "GitHub API rate limit"}
+    summary = json.loads(db.query(Portfolio).filter_by(id=portfolio_id).first().summary)
+    assert summary["cv_analysis"]["summary"] == "cv"
+    assert "github_analysis" not in summary
+    db.close()
+    print("✅ 부분 실패 테스트 통과")
+
+
+def test_patches_are_restored():
+    original_session = portfolio_analyzer.SessionLocal
+    TestSession, db, _, _ = setup_db()
+    with patch_analyzers(TestSession, []):
+        pass
+    db.close()
+
+    assert portfolio_analyzer.SessionLocal is original_session
+    assert "prepare_analysis" not in vars(cv_analyzer)
+    assert "prepare_github_analysis" not in vars(github_analyzer)
+    print("✅ 패치 복원 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_parallel_analysis_merges_summary()
+    test_partial_failure_keeps_other_result()
+    test_patches_are_restored()
+    print("\n✅ 모든 포트폴리오 통합 분석 테스트 통과!")
@@ -0,0 +1,86 @@
+"""
+포트폴리오 다이제스트 테스트
+
+LLM 다이제스트 정규화(중복 제거 / 항목 수 제한), LLM 실패 시 규칙 기반 대체,
+원문이 바뀌면 저장된 다이제스트를 쓰지 않는지 확인 (실제 Gemini 호출 없음)
+"""
+
+import sys
+import os
+import json
+from types import SimpleNamespace
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.portfolio_digest import (
+    build_portfolio_digest,
+    content_hash,
+    format_portfolio_digest,
+    load_portfolio_digest
+)
+
+PORTFOLIO_TEXT = """홍길동 백엔드 개발자
+쇼핑몰 주문 시스템 프로젝트 (Spring Boot, MySQL, Redis)
+사내 배포 자동화 프로젝트 - Docker, GitHub Actions
+"""
+
+
+class FakeAnalyzer:
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.calls = 0
+
+    def build_portfolio_digest(self, text):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return self.result
+
+
+def test_llm_digest():
+    analyzer = FakeAnalyzer(result={
+        "skills": ["API 설계", "api 설계", "성능 튜닝"],
+        "tech_stacks": ["Spring Boot", "MySQL", "mysql", "Redis"],
+        "projects": [{"name": "주문 시스템", "stack": ["Spring Boot"], "summary": "주문 API 개발"}] * 7,
+        "summary": "백엔드 개발자"
+    })
+    digest = build_portfolio_digest(PORTFOLIO_TEXT, analyzer)
+
+    assert digest["source"] == "llm" and analyzer.calls == 1
+    assert digest["skills"] == ["API 설계", "성능 튜닝"]
+    assert digest["tech_stacks"] == ["Spring Boot", "MySQL", "Redis"]
+    assert len(digest["projects"]) == 5
+    assert digest["content_hash"] == content_hash(PORTFOLIO_TEXT)
+
+    text = format_portfolio_digest(digest)
+    assert "기술 스택: Spring Boot, MySQL, Redis" in text
+    assert "- 주문 시스템 [Spring Boot] - 주문 API 개발" in text
+
+
+def test_rule_based_fallback():
+    digest = build_portfolio_digest(PORTFOLIO_TEXT, FakeAnalyzer(error=RuntimeError("no keys")))
+    assert digest["source"] == "rule"
+    assert {"Spring Boot", "MySQL", "Redis", "Docker", "GitHub Actions"} <= set(digest["tech_stacks"])
+    assert len(digest["projects"]) == 2
+
+
+def test_stale_digest_ignored():
+    digest = build_portfolio_digest(PORTFOLIO_TEXT, FakeAnalyzer(error=RuntimeError("no keys")))
+    portfolio = SimpleNamespace(
+        parsed_text=PORTFOLIO_TEXT,
+        digest_json=json.dumps(digest, ensure_ascii=False),
+        digest_hash=digest["content_hash"]
+    )
+    assert load_portfolio_digest(portfolio) == digest
+
+    portfolio.parsed_text = PORTFOLIO_TEXT + "추가 경력"
+    assert load_portfolio_digest(portfolio) is None
+
+
+if __name__ == "__main__":
+    test_llm_digest()
+    test_rule_based_fallback()
+    test_stale_digest_ignored()
+    print("✅ 포트폴리오 다이제스트 테스트 통과")
@@ -0,0 +1,83 @@
+"""
+프롬프트 압축 테스트
+
+분석 결과 압축(저가치 필드 제거 / 스킬 중복 제거 / 키 맵), 토큰 예산 단계 축소,
+프롬프트 크기 통계 확인
+"""
+
+import sys
+import os
+import json
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.prompt_budget import (
+    compact_analysis,
+    compact_github_data,
+    compact_json,
+    estimate_tokens,
+    fit_to_budget,
+    log_prompt_size,
+    prompt_size_metrics
+)
+
+ANALYSIS = {
+    "role": "ROLE_BE",
+    "level": "LEVEL_MID",
+    "github_username": "user123",
+    "possessed_skills": ["Python", "python ", "Django", "AWS"],
+    "missing_skills": ["Kubernetes"],
+    "strengths": [
+        {"skill": "Django", "reason": "여러 프로젝트에서 REST API를 설계하고 운영한 경험이 있습니다. " * 5},
+        {"skill": "django", "reason": "중복"}
+    ],
+    "weaknesses": [{"skill": "테스트", "reason": "테스트 코드가 부족합니다."}],
+    "overall_score": 78,
+    "summary": "백엔드 경험이 풍부합니다.",
+    "analyzed_repos": [{"name": f"repo{i}", "description": "x" * 200, "languages": {"Python": 1}} for i in range(10)]
+}
+
+
+def test_compact_analysis():
+    compact = compact_analysis(ANALYSIS)
+    assert compact["has"] == ["Python", "Django", "AWS"]
+    assert list(compact["strengths"]) == ["Django"]
+    assert len(compact["strengths"]["Django"]) <= 201
+    assert "analyzed_repos" not in compact and "github_username" not in compact
+
+    # 마지막 단계는 이유를 생략하고 스킬 리스트만
+    assert compact_analysis(ANALYSIS, level=3)["strengths"] == ["Django"]
+
+    raw = json.dumps(ANALYSIS, ensure_ascii=False, indent=2)
+    assert estimate_tokens(compact_json(compact)) < estimate_tokens(raw) / 3
+
+
+def test_fit_to_budget():
+    github_data = {
+        "username": "user123",
+        "repositories": [
+            {"name": f"repo{i}", "description": "설명", "languages": {"Python": 900, "Shell": 100},
+             "stars": 3, "forks": 1, "readme": "README 내용 " * 200}
+            for i in range(10)
+        ]
+    }
+    render = lambda level: compact_json(compact_github_data(github_data, level))
+    assert compact_github_data(github_data)["repos"][0]["langs"] == {"Python": 90, "Shell": 10}
+
+    text = fit_to_budget(render, budget_tokens=600)
+    assert estimate_tokens(text) <= 600
+    assert estimate_tokens(text) < estimate_tokens(render(0))
+
+
+def test_log_prompt_size():
+    log_prompt_size("test_endpoint", "a" * 400, baseline_tokens=400)
+    stats = prompt_size_metrics.stats()["test_endpoint"]
+    assert stats["avg_tokens"] == 100 and stats["saved_ratio"] == 0.75
+
+
+if __name__ == "__main__":
+    test_compact_analysis()
+    test_fit_to_budget()
+    test_log_prompt_size()
+    print("✅ 프롬프트 압축 테스트 통과")
@@ -0,0 +1,124 @@
+"""
+single-flight 테스트
+
+동시에 들어온 같은 작업은 한 번만 실행되는지 (프로세스 안 / 락 디렉토리를 공유하는 다른 인스턴스),
+예외가 대기자에게도 전달되는지 확인
+"""
+
+import sys
+import os
+import time
+import tempfile
+import threading
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.single_flight import SingleFlight, fingerprint_key
+
+
+def run_concurrently(n, target):
+    results = [None] * n
+    errors = [None] * n
+
+    def worker(i):
+        try:
+            results[i] = target()
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results, errors
+
+
+def test_coalesces_in_process():
+    with tempfile.TemporaryDirectory() as tmp:
+        flight = SingleFlight(lock_dir=tmp)
+        calls = []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.2)
+            return {"questions": ["q1", "q2"]}
+
+        results, errors = run_concurrently(5, lambda: flight.do("op", ["a", "b"], slow))
+
+        assert len(calls) == 1
+        assert all(r == {"questions": ["q1", "q2"]} for r in results)
+        assert errors == [None] * 5
+        stats = flight.stats()["operations"]["op"]
+        assert stats["runs"] == 1 and stats["coalesced_local"] == 4
+
+        # 다른 입력은 합치지 않음
+        flight.do("op", ["a", "c"], slow)
+        assert len(calls) == 2
+
+
+def test_coalesces_across_instances():
+    """락 디렉토리를 공유하는 두 인스턴스 = 두 워커 프로세스"""
+    with tempfile.TemporaryDirectory() as tmp:
+        first = SingleFlight(lock_dir=tmp, result_ttl_sec=10)
+        second = SingleFlight(lock_dir=tmp, result_ttl_sec=10)
+        calls = []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.3)
+            return [1, 2, 3]
+
+        holder = {}
+        t = threading.Thread(target=lambda: holder.setdefault("r", first.do("op", "video-1", slow)))
+        t.start()
+        time.sleep(0.05)
+        result = second.do("op", "video-1", slow)
+        t.join()
+
+        assert len(calls) == 1
+        assert result == holder["r"] == [1, 2, 3]
+        assert second.stats()["operations"]["op"]["coalesced_remote"] == 1
+
+
+def test_error_propagates_to_waiters():
+    with tempfile.TemporaryDirectory() as tmp:
+        flight = SingleFlight(lock_dir=tmp)
+
+        def failing():
+            time.sleep(0.1)
+            raise ValueError("boom")
+
+        _, errors = run_concurrently(3, lambda: flight.do("op", 1, failing))
+        assert all(isinstance(e, ValueError) for e in errors)
+        assert flight.stats()["operations"]["op"]["failures"] == 1
+
+
+def test_sweep_removes_stale_files():
+    """TTL이 지난 결과 파일 / 오래 안 쓴 락 파일은 정리, 최근 파일은 유지"""
+    with tempfile.TemporaryDirectory() as tmp:
+        flight = SingleFlight(lock_dir=tmp, result_ttl_sec=10, lock_timeout_sec=60)
+        flight.do("op", "old", lambda: 1)
+        flight.do("op", "new", lambda: 2)
+        assert len(os.listdir(tmp)) == 4
+
+        old = fingerprint_key("op", "old")
+        past = time.time() - 120
+        for suffix in (".json", ".lock"):
+            os.utime(os.path.join(tmp, old + suffix), (past, past))
+
+        assert flight.sweep() == 2
+        new = fingerprint_key("op", "new")
+        assert sorted(os.listdir(tmp)) == sorted([new + ".json", new + ".lock"])
+
+        # 정리된 키도 다시 실행하면 새 파일로 정상 동작
+        assert flight.do("op", "old", lambda: 3) == 3
+
+
+if __name__ == "__main__":
+    test_coalesces_in_process()
+    test_coalesces_across_instances()
+    test_error_propagates_to_waiters()
+    test_sweep_removes_stale_files()
+    print("✅ single-flight 테스트 통과")
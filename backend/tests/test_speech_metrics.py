@@ -0,0 +1,122 @@
+"""
+음성 타임라인 / 발화 구간 조인 테스트
+"""
+
+import sys
+import os
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pipeline.metrics import metrics_by_speech_span
+from pipeline.speech_metrics import (
+    attach_speech_columns, build_speech_timeline, label_speech_spans, merge_speech_intervals
+)
+
+SEGMENTS = [
+    {"start": 0.0, "end": 2.0, "text": "one two three four"},
+    {"start": 5.0, "end": 6.0, "text": "five six"}
+]
+
+
+def test_rolling_wpm_pause_and_filler_density():
+    """프레임 시각마다 윈도우 WPM / 현재 휴지 길이 / 필러 밀도"""
+    speech = build_speech_timeline(
+        SEGMENTS,
+        frame_times=[0.0, 1.0, 3.0, 5.5, 8.0],
+        filler_events=[{"t": 0.9, "filler": "um"}],
+        window_sec=2.0,
+        duration_sec=8.0
+    )
+
+    # 단어 시각: 0, 0.5, 1, 1.5 / 5, 5.5 (segment 안에 균등 분배), 2초 윈도우 → 개수 × 30
+    assert speech["wpm"].tolist() == [90.0, 120.0, 0.0, 60.0, 0.0]
+    # 말하는 중 0, 두 segment 사이 휴지 3초, 마지막 segment 뒤 클립 끝까지 2초
+    assert speech["pause_sec"].tolist() == [0.0, 0.0, 3.0, 0.0, 2.0]
+    assert speech["filler_density"].tolist() == [30.0, 30.0, 0.0, 0.0, 0.0]
+
+
+def test_no_speech_is_one_long_pause():
+    speech = build_speech_timeline([], frame_times=[0.0, 1.0], duration_sec=4.0)
+    assert speech["wpm"].tolist() == [0.0, 0.0]
+    assert speech["pause_sec"].tolist() == [4.0, 4.0]
+
+
+def test_attach_speech_columns():
+    """vision 프레임마다 음성 컬럼을 나란히 추가 (소수점 2자리)"""
+    timeline = [{"t": 0.0, "gaze": "center"}, {"t": 1.0, "gaze": "left"}]
+    speech = build_speech_timeline(
+        [{"start": 0.0, "end": 3.0, "text": "a b c"}],
+        frame_times=[0.0, 1.0],
+        window_sec=3.0
+    )
+    attach_speech_columns(timeline, speech)
+
+    assert timeline[0] == {"t": 0.0, "gaze": "center", "wpm": 40.0, "pause_sec": 0.0, "filler_density": 0.0}
+    assert timeline[1]["wpm"] == 60.0
+    assert isinstance(timeline[1]["wpm"], float)
+
+
+def test_merge_overlapping_and_adjacent_intervals():
+    segments = [
+        {"start": 4.0, "end": 5.0, "text": "d"},
+        {"start": 0.0, "end": 2.0, "text": "a"},
+        {"start": 1.0, "end": 3.0, "text": "b"},          # 겹침
+        {"start": 3.2, "end": 3.5, "text": "c"},          # 0.2초 간격 → 이어진 발화
+    ]
+    assert merge_speech_intervals(segments) == [(0.0, 3.5), (4.0, 5.0)]
+
+    # 단어 타임스탬프가 있으면 segment 경계 대신 사용 (segment 안의 침묵도 휴지로)
+    with_words = [{
+        "start": 0.0, "end": 4.0, "text": "a b",
+        "words": [{"word": "a", "start": 0.0, "end": 1.0}, {"word": "b", "start": 3.0, "end": 4.0}]
+    }]
+    assert merge_speech_intervals(with_words) == [(0.0, 1.0), (3.0, 4.0)]
+    assert merge_speech_intervals([]) == []
+
+
+def test_label_frames_outside_and_inside_spans():
+    segments = [{"start": 1.0, "end": 2.0, "text": "a"}, {"start": 1.5, "end": 3.0, "text": "b"},
+                {"start": 5.0, "end": 6.0, "text": "c"}]
+    frame_times = [0.0, 0.99, 1.0, 2.5, 3.0, 4.0, 5.5, 6.0, 9.0]
+    assert label_speech_spans(frame_times, segments) == [
+        "pre_answer", "pre_answer", "speaking", "speaking",
+        "pause", "pause", "speaking", "pause", "pause"
+    ]
+    # 발화가 없으면 전부 답변 전
+    assert label_speech_spans([0.0, 1.0], []) == ["pre_answer", "pre_answer"]
+
+
+def test_metrics_by_speech_span():
+    """구간별 프레임 비율 / 시선 / 웃음 (웃음 임계값은 클립 전체 기준)"""
+    gazes = ["LEFT", "CENTER", "CENTER", "CENTER", "LEFT", "CENTER"]
+    smiles = [0.0, 0.0, 1.0, 1.0, 0.0, 1.0]
+    timeline = [
+        {"t": float(i), "valid": True, "gaze": gaze, "smile": smile}
+        for i, (gaze, smile) in enumerate(zip(gazes, smiles))
+    ]
+    segments = [{"start": 2.0, "end": 3.5, "text": "a"}, {"start": 5.0, "end": 6.0, "text": "b"}]
+    labels = label_speech_spans([f["t"] for f in timeline], segments)
+    assert labels == ["pre_answer", "pre_answer", "speaking", "speaking", "pause", "speaking"]
+
+    result = metrics_by_speech_span(timeline, labels)
+
+    assert set(result) == {"pre_answer", "speaking", "pause"}
+    assert result["speaking"]["frame_count"] == 3
+    assert result["speaking"]["frame_ratio"] == 0.5
+    assert result["speaking"]["start_t"] == 2.0
+    assert result["speaking"]["center_gaze_ratio"] == 1.0
+    assert result["speaking"]["smile_ratio"] == 1.0
+    assert result["pre_answer"]["center_gaze_ratio"] == 0.5
+    assert result["pre_answer"]["smile_ratio"] == 0.0
+    assert result["pause"]["nod_count"] == 0
+
+
+if __name__ == "__main__":
+    test_rolling_wpm_pause_and_filler_density()
+    test_no_speech_is_one_long_pause()
+    test_attach_speech_columns()
+    test_merge_overlapping_and_adjacent_intervals()
+    test_label_frames_outside_and_inside_spans()
+    test_metrics_by_speech_span()
+    print("✅ 음성 타임라인 / 발화 구간 테스트 통과")
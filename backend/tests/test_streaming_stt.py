@@ -0,0 +1,112 @@
+"""
+실시간 음성 턴 처리 테스트
+
+EnergyVAD의 턴 종료 판정, IncrementalTranscriber의 청크 경계 처리 /
+슬라이딩 윈도우 확정 / segment 시간 보정을 확인 (실제 STT 호출 없음)
+"""
+
+import sys
+import os
+import asyncio
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from services.streaming_stt import SAMPLE_RATE, EnergyVAD, IncrementalTranscriber
+
+
+def _tone(ms, amplitude=3000):
+    n = SAMPLE_RATE * ms // 1000
+    return (amplitude * np.sin(2 * np.pi * 220 * np.arange(n) / SAMPLE_RATE)).astype(np.int16)
+
+
+def _silence(ms):
+    return np.zeros(SAMPLE_RATE * ms // 1000, dtype=np.int16)
+
+
+def test_vad_end_of_turn():
+    vad = EnergyVAD(end_silence_ms=300)
+    assert not vad.update(_silence(1000)), "말하기 전 침묵은 턴 종료가 아님"
+    assert not vad.update(_tone(600))
+    assert not vad.update(_silence(150))
+    assert vad.update(_silence(200))
+    print("✅ VAD 턴 종료 테스트 통과")
+
+
+def test_vad_ignores_short_blip_and_partial_frames():
+    vad = EnergyVAD(end_silence_ms=300)
+    # 최소 발화 길이(300ms)보다 짧은 소리 뒤 침묵은 턴 종료가 아님
+    assert not vad.update(_tone(90))
+    assert not vad.update(_silence(1000))
+
+    # 프레임(30ms)보다 작게 나뉘어 들어와도 같은 판정
+    vad = EnergyVAD(end_silence_ms=300)
+    audio = np.concatenate([_tone(600), _silence(400)])
+    results = [vad.update(audio[i:i + 100]) for i in range(0, len(audio), 100)]
+    assert results[-1] and not any(results[:len(results) // 2])
+    print("✅ VAD 짧은 소리 / 부분 프레임 테스트 통과")
+
+
+class FakeSTT:
+    """STTClient 대역 (미리 정한 결과를 차례로 반환)"""
+
+    def __init__(self, results):
+        self.results = list(results)
+
+    async def transcribe_with_segments(self, audio_path, language="ko"):
+        return self.results.pop(0)
+
+
+def test_append_carries_odd_byte():
+    transcriber = IncrementalTranscriber(FakeSTT([]))
+    pcm = _tone(100).tobytes()
+
+    received = []
+    for start in range(0, len(pcm), 333):
+        received.append(transcriber.append(pcm[start:start + 333]))
+
+    assert bytes(transcriber.pcm) == pcm
+    assert np.array_equal(np.concatenate(received), _tone(100))
+    print("✅ 홀수 바이트 청크 경계 테스트 통과")
+
+
+def test_sliding_window_commit_offsets():
+    stt = FakeSTT([
+        {"text": "첫 문장 둘째", "segments": [
+            {"start": 0.0, "end": 1.5, "text": "첫 문장"},
+            {"start": 2.0, "end": 3.0, "text": "둘째"}
+        ]},
+        {"text": "둘째 문장 끝", "segments": [
+            {"start": 0.0, "end": 1.2, "text": "둘째 문장 끝",
+             "words": [{"start": 0.5, "end": 1.0, "word": "끝"}]}
+        ]}
+    ])
+    transcriber = IncrementalTranscriber(stt, step_sec=1.0, max_window_sec=2.0)
+    transcriber.append(_tone(3000).tobytes())
+    assert transcriber.should_step()
+
+    async def run():
+        partial = await transcriber.step()
+        assert not transcriber.should_step()
+        return partial, await transcriber.finalize()
+
+    partial, final = asyncio.run(run())
+
+    # 윈도우(3초)가 상한(2초)을 넘어 마지막 segment 앞까지 확정
+    assert partial == "첫 문장 둘째"
+    assert transcriber.committed_bytes == 2 * SAMPLE_RATE * 2
+    assert final["text"] == "첫 문장 둘째 문장 끝"
+    # 두 번째 윈도우의 segment / word 시간은 확정 지점(2초) 기준으로 보정
+    assert [(s["start"], s["end"]) for s in final["segments"]] == [(0.0, 1.5), (2.0, 3.2)]
+    assert final["segments"][1]["words"][0]["start"] == 2.5
+    print("✅ 슬라이딩 윈도우 확정 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_vad_end_of_turn()
+    test_vad_ignores_short_blip_and_partial_frames()
+    test_append_carries_odd_byte()
+    test_sliding_window_commit_offsets()
+    print("\n✅ 모든 실시간 음성 턴 처리 테스트 통과!")
@@ -0,0 +1,74 @@
+"""
+구조화 출력 파서 테스트
+
+코드블록 / 끝의 쉼표 / 잘린 응답을 모델 재호출 없이 복구하는지,
+pydantic 모델 → Gemini response_schema 변환과 통계 확인
+"""
+
+import sys
+import os
+from typing import List, Optional
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydantic import BaseModel
+
+from utils.structured_output import (
+    JSONRepairError,
+    parse_json_response,
+    repair_json,
+    response_schema_for,
+    structured_output_metrics
+)
+
+
+class Item(BaseModel):
+    skill: str
+    reason: str
+
+
+class Result(BaseModel):
+    role: str
+    strengths: List[Item]
+    note: Optional[str] = None
+
+
+def test_repair():
+    assert parse_json_response('```json\n{"a": [1, 2,], "b": "x",}\n```', "t1") == {"a": [1, 2], "b": "x"}
+    assert parse_json_response('결과입니다: {"a": 1} 이상입니다.', "t1") == {"a": 1}
+    # 잘린 객체: 열린 문자열 / 괄호를 닫음
+    assert parse_json_response('{"role": "ROLE_BE", "summary": "잘린 요', "t1") == {
+        "role": "ROLE_BE", "summary": "잘린 요"
+    }
+    # 잘린 배열: 반쯤 생성된 마지막 원소는 버림
+    questions = parse_json_response(
+        '[{"skill": "a", "reason": "r"}, {"skill": "b", "rea', "t1", Item
+    )
+    assert questions == [{"skill": "a", "reason": "r"}]
+
+    try:
+        repair_json("JSON이 아닙니다")
+        assert False, "JSONRepairError가 나야 함"
+    except JSONRepairError:
+        pass
+
+    stats = structured_output_metrics.stats()["t1"]
+    assert stats["repaired"] == 4 and stats["failed"] == 0
+
+
+def test_response_schema():
+    schema = response_schema_for(Result)
+    assert schema["type"] == "object"
+    assert schema["required"] == ["role", "strengths"]
+    assert schema["properties"]["strengths"]["items"]["properties"]["skill"] == {"type": "string"}
+    assert schema["properties"]["note"] == {"type": "string", "nullable": True}
+    assert "$defs" not in str(schema) and "title" not in schema
+
+    assert response_schema_for(Item, as_list=True)["type"] == "array"
+
+
+if __name__ == "__main__":
+    test_repair()
+    test_response_schema()
+    print("✅ 구조화 출력 테스트 통과")
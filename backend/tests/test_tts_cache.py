@@ -0,0 +1,128 @@
+"""
+TTS 오디오 캐시 테스트
+
+같은 키 동시 요청의 single-flight, 개수 상한 초과 시 LRU 삭제,
+TTS 서버가 지운 audio_url 항목의 재합성을 확인 (실제 TTS 서버 호출 없음)
+"""
+
+import sys
+import os
+import time
+import asyncio
+import tempfile
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import aiohttp
+
+from clients import cached_tts_client
+from clients.cached_tts_client import CachedTTSClient
+from utils.tts_cache import TTSCache, tts_cache_key
+
+
+def _key(text):
+    return tts_cache_key(text, "KR", 1.0, "test-model")
+
+
+def test_single_flight():
+    cache = TTSCache(cache_dir=tempfile.mkdtemp())
+    calls = []
+
+    async def produce(tmp_path):
+        calls.append(tmp_path)
+        await asyncio.sleep(0.1)
+        with open(tmp_path, "wb") as f:
+            f.write(b"RIFF")
+
+    async def run():
+        return await asyncio.gather(*(cache.get_or_create(_key("안녕하세요"), produce) for _ in range(5)))
+
+    paths = asyncio.run(run())
+    assert len(calls) == 1
+    assert len(set(paths)) == 1 and paths[0].read_bytes() == b"RIFF"
+    assert cache.misses == 1 and cache.coalesced == 4
+
+    asyncio.run(cache.get_or_create(_key("안녕하세요"), produce))
+    assert len(calls) == 1 and cache.hits == 1
+    print("✅ single-flight 테스트 통과")
+
+
+def test_lru_eviction():
+    cache = TTSCache(cache_dir=tempfile.mkdtemp(), max_entries=2)
+
+    async def produce(tmp_path):
+        with open(tmp_path, "wb") as f:
+            f.write(b"RIFF")
+
+    async def run():
+        first = await cache.get_or_create(_key("첫 번째"), produce)
+        os.utime(first, (time.time() - 60, time.time() - 60))
+        second = await cache.get_or_create(_key("두 번째"), produce)
+        os.utime(second, (time.time() - 30, time.time() - 30))
+        # 첫 번째를 다시 사용 → 가장 오래 안 쓴 항목은 두 번째
+        await cache.get_or_create(_key("첫 번째"), produce)
+        await cache.get_or_create(_key("세 번째"), produce)
+
+    asyncio.run(run())
+    assert cache.get(_key("첫 번째")) is not None
+    assert cache.get(_key("두 번째")) is None
+    assert cache.get(_key("세 번째")) is not None
+    assert cache.evictions == 1
+    print("✅ LRU 삭제 테스트 통과")
+
+
+class FakeTTS:
+    """MeloTTS 클라이언트 대역 (합성할 때마다 새 audio_url)"""
+
+    base_url = "http://tts.test"
+    model_version = "test-model"
+
+    def __init__(self):
+        self.calls = 0
+
+    async def synthesize(self, text, speaker="KR", speed=1.0, output_path=None):
+        self.calls += 1
+        return f"/audio/cache/{self.calls}.wav"
+
+
+class FakePool:
+    """HEAD 요청만 처리하는 HTTP 풀 대역 (available에 없는 URL은 404)"""
+
+    def __init__(self, available):
+        self.available = available
+        self.heads = []
+
+    async def request_bytes(self, method, url, **kwargs):
+        self.heads.append(url)
+        if url not in self.available:
+            raise aiohttp.ClientResponseError(None, (), status=404)
+        return b"", {}
+
+
+def test_evicted_audio_url_is_resynthesized():
+    inner = FakeTTS()
+    client = CachedTTSClient(inner, cache=TTSCache(cache_dir=tempfile.mkdtemp()), url_ttl_sec=0)
+    pool = FakePool({"http://tts.test/audio/cache/1.wav"})
+    original = cached_tts_client.get_http_pool
+    cached_tts_client.get_http_pool = lambda: pool
+    try:
+        assert asyncio.run(client.synthesize("질문")) == "/audio/cache/1.wav"
+        # TTL이 지났지만 서버에 파일이 남아 있음 → 캐시 사용
+        assert asyncio.run(client.synthesize("질문")) == "/audio/cache/1.wav"
+        assert inner.calls == 1 and pool.heads == ["http://tts.test/audio/cache/1.wav"]
+
+        # 서버가 LRU로 파일을 지움 → 다시 합성
+        pool.available.clear()
+        assert asyncio.run(client.synthesize("질문")) == "/audio/cache/2.wav"
+        assert inner.calls == 2 and client.resynthesized == 1
+    finally:
+        cached_tts_client.get_http_pool = original
+    print("✅ 서버에서 지워진 audio_url 재합성 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_single_flight()
+    test_lru_eviction()
+    test_evicted_audio_url_is_resynthesized()
+    print("\n✅ 모든 TTS 캐시 테스트 통과!")
@@ -1,21 +1,162 @@
 """
 오디오 처리 유틸리티
 
-ffmpeg를 사용한 오디오 변환 (webm → wav)
+ffmpeg를 사용한 오디오 변환 (webm → wav, wav → Opus / MP3)
 """
 
 import os
 import uuid
+import hashlib
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
+
+
+# 압축 오디오 코덱 (TTS 응답용)
+# bitrate: (기본, 최소, 최대) kbps, 음성 전용이라 낮게 잡음
+AUDIO_CODECS: Dict[str, Dict[str, Any]] = {
+    "opus": {
+        "mime": "audio/ogg; codecs=opus",
+        "suffix": ".ogg",
+        "ffmpeg": ["-c:a", "libopus", "-application", "voip", "-f", "ogg"],
+        "bitrate": (24, 6, 128)
+    },
+    "webm": {
+        "mime": "audio/webm; codecs=opus",
+        "suffix": ".webm",
+        "ffmpeg": ["-c:a", "libopus", "-application", "voip", "-f", "webm"],
+        "bitrate": (24, 6, 128)
+    },
+    "mp3": {
+        "mime": "audio/mpeg",
+        "suffix": ".mp3",
+        "ffmpeg": ["-c:a", "libmp3lame", "-f", "mp3"],
+        "bitrate": (48, 32, 192)
+    },
+    "wav": {
+        "mime": "audio/wav",
+        "suffix": ".wav",
+        "ffmpeg": ["-c:a", "pcm_s16le", "-f", "wav"],
+        "bitrate": None
+    }
+}
+
+# Accept 헤더 MIME → 코덱
+_MIME_CODECS = {
+    "audio/ogg": "opus",
+    "audio/opus": "opus",
+    "audio/webm": "webm",
+    "audio/mpeg": "mp3",
+    "audio/mp3": "mp3",
+    "audio/wav": "wav",
+    "audio/wave": "wav",
+    "audio/x-wav": "wav"
+}
+
+
+def negotiate_audio_codec(
+    requested: Optional[str] = None,
+    accept: Optional[str] = None,
+    default: Optional[str] = None
+) -> str:
+    """
+    응답 코덱 결정
+
+    명시적 format이 우선이고, 없으면 Accept 헤더에서 q값이 가장 높은 지원 형식 선택
+
+    Args:
+        requested: "opus" | "webm" | "mp3" | "wav"
+        accept: HTTP Accept 헤더
+        default: 와일드카드 / 헤더 없음일 때 코덱 (None이면 TTS_AUDIO_CODEC, 기본 opus)
+
+    Raises:
+        ValueError: 지원하지 않는 format이거나 Accept에 지원 형식이 없음
+    """
+    default = default or os.getenv("TTS_AUDIO_CODEC", "opus")
+    if requested:
+        codec = requested.lower()
+        if codec not in AUDIO_CODECS:
+            raise ValueError(f"Unsupported audio format '{requested}'. Available: {list(AUDIO_CODECS)}")
+        return codec
+    if not accept:
+        return default
+
+    best: Optional[Tuple[float, str]] = None
+    for part in accept.split(","):
+        fields = [f.strip() for f in part.split(";")]
+        mime = fields[0].lower()
+        q = 1.0
+        for field in fields[1:]:
+            if field.startswith("q="):
+                try:
+                    q = float(field[2:])
+                except ValueError:
+                    q = 0.0
+        codec = default if mime in ("audio/*", "*/*") else _MIME_CODECS.get(mime)
+        if codec is None or q <= 0:
+            continue
+        if best is None or q > best[0]:
+            best = (q, codec)
+
+    if best is None:
+        raise ValueError(f"None of the accepted types are supported: {accept}")
+    return best[1]
+
+
+def clamp_bitrate(codec: str, bitrate_kbps: Optional[int] = None) -> Optional[int]:
+    """코덱별 허용 범위로 비트레이트 보정 (무손실 wav는 None)"""
+    limits = AUDIO_CODECS[codec]["bitrate"]
+    if limits is None:
+        return None
+    default, low, high = limits
+    return min(max(bitrate_kbps or default, low), high)
+
+
+def encode_audio(
+    input_path: str,
+    output_path: str,
+    codec: str = "opus",
+    bitrate_kbps: Optional[int] = None,
+    timeout_sec: float = 30.0
+) -> str:
+    """
+    오디오를 압축 코덱으로 인코딩 (ffmpeg 사용, 모노)
+
+    Args:
+        input_path: 입력 파일 경로 (보통 TTS wav)
+        output_path: 출력 파일 경로
+        codec: AUDIO_CODECS 키
+        bitrate_kbps: 목표 비트레이트 (범위 밖이면 보정)
+        timeout_sec: ffmpeg 타임아웃
+
+    Returns:
+        출력 파일 경로
+
+    Raises:
+        RuntimeError: ffmpeg 인코딩 실패 / 타임아웃
+    """
+    spec = AUDIO_CODECS[codec]
+    command = ["ffmpeg", "-v", "error", "-i", input_path, "-ac", "1", *spec["ffmpeg"]]
+    bitrate = clamp_bitrate(codec, bitrate_kbps)
+    if bitrate:
+        command += ["-b:a", f"{bitrate}k"]
+    command += ["-y", output_path]
+
+    try:
+        subprocess.run(command, capture_output=True, text=True, check=True, timeout=timeout_sec)
+        return output_path
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"ffmpeg encoding failed: {e.stderr}")
+    except subprocess.TimeoutExpired:
+        raise RuntimeError(f"ffmpeg encoding timed out after {timeout_sec}s")
 
 
 def convert_to_wav(
     input_path: str,
     output_path: Optional[str] = None,
     sample_rate: int = 16000,
-    channels: int = 1
+    channels: int = 1,
+    timeout_sec: Optional[float] = None
 ) -> str:
     """
     오디오 파일을 WAV 형식으로 변환 (ffmpeg 사용)
@@ -25,6 +166,7 @@ def convert_to_wav(
         output_path: 출력 파일 경로 (None이면 자동 생성)
         sample_rate: 샘플링 레이트 (기본: 16kHz, Whisper 권장)
         channels: 채널 수 (1=모노, 2=스테레오)
+        timeout_sec: ffmpeg 타임아웃 (넘으면 프로세스 종료, None이면 제한 없음)
 
     Returns:
         변환된 WAV 파일 경로
@@ -32,6 +174,7 @@ def convert_to_wav(
     Raises:
         FileNotFoundError: 입력 파일이 없을 때
         RuntimeError: ffmpeg 변환 실패
+        TimeoutError: timeout_sec 안에 변환이 끝나지 않음
     """
     if not os.path.exists(input_path):
         raise FileNotFoundError(f"Input file not found: {input_path}")
@@ -57,27 +200,32 @@ def convert_to_wav(
             command,
             capture_output=True,
             text=True,
-            check=True
+            check=True,
+            timeout=timeout_sec
         )
         return output_path
     except subprocess.CalledProcessError as e:
         raise RuntimeError(
             f"ffmpeg conversion failed: {e.stderr}"
         )
+    except subprocess.TimeoutExpired:
+        raise TimeoutError(f"ffmpeg conversion timed out after {timeout_sec:.1f}s")
 
 
-def get_audio_duration(audio_path: str) -> float:
+def get_audio_duration(audio_path: str, timeout_sec: Optional[float] = None) -> float:
     """
     오디오 파일의 길이를 초 단위로 반환 (ffprobe 사용)
 
     Args:
         audio_path: 오디오 파일 경로
+        timeout_sec: ffprobe 타임아웃 (None이면 제한 없음)
 
     Returns:
         오디오 길이 (초)
 
     Raises:
         RuntimeError: ffprobe 실패
+        TimeoutError: timeout_sec 안에 끝나지 않음
     """
     command = [
         "ffprobe",
@@ -92,11 +240,34 @@ def get_audio_duration(audio_path: str) -> float:
             command,
             capture_output=True,
             text=True,
-            check=True
+            check=True,
+            timeout=timeout_sec
         )
         return float(result.stdout.strip())
     except (subprocess.CalledProcessError, ValueError) as e:
         raise RuntimeError(f"ffprobe failed: {e}")
+    except subprocess.TimeoutExpired:
+        raise TimeoutError(f"ffprobe timed out after {timeout_sec:.1f}s")
+
+
+def compute_media_hash(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """
+    미디어 파일의 SHA-256 해시 계산 (청크 단위 스트리밍)
+
+    동일한 미디어에 대한 STT 결과를 재사용하기 위한 키로 사용
+
+    Args:
+        file_path: 미디어 파일 경로
+        chunk_size: 읽기 단위 (기본: 1MB)
+
+    Returns:
+        16진수 해시 문자열
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
 
 
 async def save_upload_file(upload_file, destination: str) -> str:
@@ -0,0 +1,123 @@
+"""
+블로킹 호출용 제한 실행기
+
+동기 SDK 호출(google.generativeai의 generate_content 등)을 이벤트 루프 밖의
+전용 스레드 풀에서 실행하고, 동시 실행 수와 호출별 타임아웃을 제한
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+
+class BoundedExecutor:
+    """
+    전용 스레드 풀 + 동시 실행 제한 + 타임아웃
+
+    세마포어는 이벤트 루프마다 따로 만들어 스크립트(asyncio.run 반복)에서도 안전
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        timeout_sec: Optional[float] = None
+    ):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.timeout_sec = timeout_sec
+        self._pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix=name)
+        self._semaphores: Dict[int, asyncio.Semaphore] = {}
+        self.in_flight = 0
+        self.timeouts = 0
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop_id = id(asyncio.get_running_loop())
+        semaphore = self._semaphores.get(loop_id)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop_id] = semaphore
+        return semaphore
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """동시 실행 슬롯 1개 점유 (네이티브 async 호출에도 같은 제한 적용)"""
+        async with self._semaphore():
+            self.in_flight += 1
+            try:
+                yield
+            finally:
+                self.in_flight -= 1
+
+    async def run(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        timeout_sec: Optional[float] = None,
+        **kwargs: Any
+    ) -> Any:
+        """
+        블로킹 함수를 스레드 풀에서 실행
+
+        Raises:
+            asyncio.TimeoutError: timeout_sec(없으면 기본값) 초과
+                (스레드 작업은 끝까지 실행되지만 호출자는 즉시 반환,
+                 작업이 끝날 때까지 슬롯은 계속 점유)
+        """
+        timeout_sec = timeout_sec or self.timeout_sec
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphore()
+        started = loop.time()
+
+        # 대기열에서 기다린 시간까지 포함한 호출 단위 타임아웃
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=timeout_sec)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise
+
+        # 슬롯은 호출자가 아니라 스레드 작업이 끝날 때 반납
+        # (타임아웃 후에도 멈춘 호출이 스레드를 잡고 있는 동안은 새 호출을 받지 않음)
+        self.in_flight += 1
+        future = self._pool.submit(functools.partial(fn, *args, **kwargs))
+        future.add_done_callback(lambda _: self._release_threadsafe(loop, semaphore))
+
+        remaining = None if timeout_sec is None else max(0.0, timeout_sec - (loop.time() - started))
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=remaining)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise
+
+    def _release(self, semaphore: asyncio.Semaphore) -> None:
+        self.in_flight -= 1
+        semaphore.release()
+
+    def _release_threadsafe(self, loop: asyncio.AbstractEventLoop, semaphore: asyncio.Semaphore) -> None:
+        """스레드 작업 완료 콜백 (풀 스레드에서 호출) → 이벤트 루프에서 슬롯 반납"""
+        try:
+            loop.call_soon_threadsafe(self._release, semaphore)
+        except RuntimeError:
+            # 루프가 이미 닫힘 (asyncio.run 종료): 그 루프의 세마포어는 더 쓰이지 않음
+            self.in_flight -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "timeouts": self.timeouts
+        }
+
+
+# LLM 호출 전용 실행기
+# 환경 변수:
+#     LLM_MAX_CONCURRENCY: 동시 LLM 호출 수 (기본: 8)
+#     LLM_TIMEOUT_SEC: 호출별 타임아웃 (기본: 30)
+llm_executor = BoundedExecutor(
+    "llm",
+    max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", "8")),
+    timeout_sec=float(os.getenv("LLM_TIMEOUT_SEC", "30"))
+)
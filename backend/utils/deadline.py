@@ -0,0 +1,219 @@
+"""
+요청 단위 마감 시간 (deadline) 전파
+
+요청 진입 시 전체 시간 예산으로 Deadline을 만들고 단계(ffmpeg, STT, LLM, TTS)에 넘기면
+각 단계는 남은 예산(단계별 상한, 뒤 단계용 예약분 제외)만큼만 실행
+- 서브프로세스: subprocess.run(timeout=...)으로 넘기면 시간 초과 시 프로세스를 종료
+- async 단계: wait_for로 취소
+- 블로킹 스레드 단계(Whisper 등): 결과를 기다리지 않고 버림 (스레드는 끝까지 실행됨)
+  버려진 호출이 전용 풀을 다 차지하면 기다리지 않고 단계를 건너뜀 (요청이 무한정 멈추지 않도록)
+  (풀 상태는 blocking_pool_stats() / GET /health/blocking-pool로 확인)
+예산이 떨어진 단계는 건너뛰었다고 기록하고, 호출 측은 그때까지의 결과(부분 결과)를 반환
+
+환경 변수:
+    VIDEO_ANALYSIS_DEADLINE_SEC: 영상 분석 요청 전체 예산 (기본: 300)
+    VOICE_TURN_DEADLINE_SEC: 음성 면접 답변 턴 전체 예산 (기본: 30)
+    DEADLINE_BLOCKING_WORKERS: 블로킹 단계 전용 스레드 수 (기본: 4)
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+VIDEO_ANALYSIS_DEADLINE_SEC = float(os.getenv("VIDEO_ANALYSIS_DEADLINE_SEC", "300"))
+VOICE_TURN_DEADLINE_SEC = float(os.getenv("VOICE_TURN_DEADLINE_SEC", "30"))
+
+# 블로킹 단계(Whisper 등)를 마감 시간 안에서 기다리기 위한 전용 스레드 풀
+BLOCKING_WORKERS = int(os.getenv("DEADLINE_BLOCKING_WORKERS", "4"))
+_blocking_pool = ThreadPoolExecutor(max_workers=BLOCKING_WORKERS, thread_name_prefix="deadline")
+
+# 풀 상태 (queued: 시작 전, running: 실행 중, abandoned: 실행 중이지만 호출자가 버린 작업)
+_pool_lock = threading.Lock()
+_pool_state = {"queued": 0, "running": 0, "abandoned": 0, "saturated_skips": 0, "not_started": 0}
+
+
+def blocking_pool_stats() -> Dict[str, int]:
+    """블로킹 단계 전용 풀 상태 (saturated_skips: 버려진 작업이 풀을 다 차지해 건너뛴 단계 수)"""
+    with _pool_lock:
+        return {"workers": BLOCKING_WORKERS, **_pool_state}
+
+
+class DeadlineExceeded(TimeoutError):
+    """단계에 남은 예산이 없거나 단계가 예산 안에 끝나지 않음 (stage: 단계 이름)"""
+
+    def __init__(self, stage: str, message: Optional[str] = None):
+        super().__init__(message or f"{stage}: deadline exceeded")
+        self.stage = stage
+
+
+class Deadline:
+    """
+    요청 하나의 전체 시간 예산
+
+    Args:
+        budget_sec: 전체 예산 (초)
+        name: 로그 / 통계용 요청 이름 (예: "analyze_interview")
+    """
+
+    def __init__(self, budget_sec: float, name: str = "request"):
+        self.budget_sec = budget_sec
+        self.name = name
+        self.started = time.monotonic()
+        self.expires_at = self.started + budget_sec
+        self.skipped: List[str] = []
+        self.timed_out: List[str] = []
+        self.queue_ms: Dict[str, float] = {}
+
+    def remaining(self) -> float:
+        """남은 시간 (초, 0 이상)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def budget(self, stage: str, cap: Optional[float] = None, reserve: float = 0.0) -> float:
+        """
+        단계에 줄 시간 = min(남은 시간 - 뒤 단계용 예약분, 단계 상한)
+
+        Raises:
+            DeadlineExceeded: 줄 시간이 없음 (단계를 건너뛴 것으로 기록)
+        """
+        available = self.remaining() - reserve
+        if cap is not None:
+            available = min(available, cap)
+        if available <= 0:
+            self.skip(stage)
+            raise DeadlineExceeded(stage, f"{stage}: no budget left ({self.name})")
+        return available
+
+    def skip(self, stage: str) -> None:
+        """예산 부족으로 실행하지 않은 단계 기록"""
+        if stage not in self.skipped:
+            self.skipped.append(stage)
+            print(f"⏱️ {self.name}: {stage} skipped (deadline)")
+
+    def timeout(self, stage: str) -> None:
+        """실행했지만 예산 안에 끝나지 않아 취소한 단계 기록"""
+        if stage not in self.timed_out:
+            self.timed_out.append(stage)
+            print(f"⏱️ {self.name}: {stage} cancelled after budget ran out")
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.skipped or self.timed_out)
+
+    async def run(
+        self,
+        stage: str,
+        awaitable: Awaitable[T],
+        cap: Optional[float] = None,
+        reserve: float = 0.0
+    ) -> T:
+        """
+        async 단계를 남은 예산 안에서 실행 (넘으면 취소)
+
+        Raises:
+            DeadlineExceeded: 예산이 없거나 예산 안에 끝나지 않음
+        """
+        try:
+            timeout = self.budget(stage, cap, reserve)
+        except DeadlineExceeded:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            raise
+        try:
+            return await asyncio.wait_for(awaitable, timeout=timeout)
+        except asyncio.TimeoutError:
+            self.timeout(stage)
+            raise DeadlineExceeded(stage, f"{stage}: not finished within {timeout:.1f}s")
+
+    def call(
+        self,
+        stage: str,
+        fn: Callable[..., T],
+        *args: Any,
+        cap: Optional[float] = None,
+        reserve: float = 0.0,
+        **kwargs: Any
+    ) -> T:
+        """
+        블로킹 단계를 스레드에서 실행하고 남은 예산만큼만 기다림 (sync 코드용)
+
+        취소할 수 없는 호출(Whisper 등)이므로 시간이 넘으면 결과를 버리고 DeadlineExceeded
+        - 모든 스레드를 버려진 호출이 차지하고 있으면 제출하지 않고 바로 건너뜀
+          (언제 풀릴지 모르는 스레드를 기다리거나 요청 스레드에서 무제한 실행하지 않음)
+        - 다른 요청의 작업 때문에 대기열에서 시작도 못 한 작업은 타임아웃이 아니라 건너뛴 단계로 기록
+          (대기 시간은 queue_ms에 따로 기록)
+
+        Raises:
+            DeadlineExceeded: 예산이 없거나 예산 안에 끝나지 않음
+        """
+        timeout = self.budget(stage, cap, reserve)
+
+        with _pool_lock:
+            saturated = _pool_state["abandoned"] >= BLOCKING_WORKERS
+            if saturated:
+                _pool_state["saturated_skips"] += 1
+            else:
+                _pool_state["queued"] += 1
+
+        if saturated:
+            print(f"⚠️ {self.name}: blocking pool saturated by abandoned jobs ({blocking_pool_stats()})")
+            self.skip(stage)
+            raise DeadlineExceeded(stage, f"{stage}: blocking pool saturated by abandoned jobs")
+
+        submitted = time.monotonic()
+        job: Dict[str, Any] = {}
+
+        def run() -> T:
+            with _pool_lock:
+                _pool_state["queued"] -= 1
+                _pool_state["running"] += 1
+                job["started"] = time.monotonic()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with _pool_lock:
+                    _pool_state["running"] -= 1
+                    if job.get("abandoned"):
+                        _pool_state["abandoned"] -= 1
+
+        future: Future = _blocking_pool.submit(run)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            with _pool_lock:
+                not_started = future.cancel()
+                if not_started:
+                    _pool_state["queued"] -= 1
+                    _pool_state["not_started"] += 1
+                else:
+                    job["abandoned"] = True
+                    _pool_state["abandoned"] += 1
+            if not_started:
+                self.queue_ms[stage] = round((time.monotonic() - submitted) * 1000, 1)
+                self.skip(stage)
+                raise DeadlineExceeded(stage, f"{stage}: not started within {timeout:.1f}s (blocking pool busy)")
+            self.timeout(stage)
+            raise DeadlineExceeded(stage, f"{stage}: not finished within {timeout:.1f}s")
+        finally:
+            if "started" in job and stage not in self.queue_ms:
+                self.queue_ms[stage] = round((job["started"] - submitted) * 1000, 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """응답에 넣는 마감 시간 요약"""
+        return {
+            "budget_ms": round(self.budget_sec * 1000),
+            "elapsed_ms": round((time.monotonic() - self.started) * 1000, 1),
+            "remaining_ms": round(self.remaining() * 1000, 1),
+            "partial": self.partial,
+            "skipped_stages": list(self.skipped),
+            "timed_out_stages": list(self.timed_out),
+            "queue_ms": dict(self.queue_ms)
+        }
@@ -0,0 +1,95 @@
+"""
+지연 시간 메트릭
+
+단계별(예: tts_ttfb, llm_first_token, turn_total) 최근 샘플을 보관하고
+p50 / p95 / 평균을 계산 (프로세스 메모리, /health/latency에서 조회)
+"""
+
+import bisect
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, Optional, Sequence
+
+
+class LatencyRecorder:
+    """이름별 최근 N개 지연 샘플 (밀리초)"""
+
+    def __init__(self, window: int = 500):
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self._counts: Dict[str, int] = {}
+
+    def record(self, name: str, elapsed_ms: float) -> None:
+        samples = self._samples.setdefault(name, deque(maxlen=self.window))
+        samples.append(float(elapsed_ms))
+        self._counts[name] = self._counts.get(name, 0) + 1
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """with 블록 실행 시간을 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - started) * 1000)
+
+    def count(self, name: str) -> int:
+        """보관 중인 최근 샘플 수"""
+        samples = self._samples.get(name)
+        return len(samples) if samples else 0
+
+    def percentile(self, name: str, q: float) -> Optional[float]:
+        """최근 샘플의 q 분위수 (샘플이 없으면 None)"""
+        samples = self._samples.get(name)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+        return ordered[index]
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        result = {}
+        for name, samples in self._samples.items():
+            if not samples:
+                continue
+            result[name] = {
+                "count": self._counts[name],
+                "avg_ms": round(sum(samples) / len(samples), 1),
+                "p50_ms": round(self.percentile(name, 0.5), 1),
+                "p95_ms": round(self.percentile(name, 0.95), 1),
+                "max_ms": round(max(samples), 1)
+            }
+        return result
+
+
+# 프로세스 전역 레코더
+latency_metrics = LatencyRecorder()
+
+
+class Histogram:
+    """
+    고정 버킷 히스토그램 (누적 아님, 버킷별 개수)
+
+    큐 길이 / 배치 크기처럼 분포 모양이 중요한 값용
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = sorted(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        labels = [f"<={b:g}" for b in self.buckets] + [f">{self.buckets[-1]:g}"]
+        return {
+            "count": self.count,
+            "avg": round(self.total / self.count, 2) if self.count else None,
+            "buckets": dict(zip(labels, self.counts))
+        }
@@ -0,0 +1,190 @@
+"""
+LLM 응답 캐시
+
+hash(model, prompt, generation config)를 키로 응답 텍스트를 SQLite에 저장
+- 항목별 TTL, 만료 / 개수 상한 초과 시 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+- WAL 모드라 여러 워커 프로세스가 같은 파일을 공유 가능
+- 히트 / 미스 / 저장 / 삭제 통계
+
+환경 변수:
+    LLM_CACHE_ENABLED: false면 캐시 전체 우회 (기본: true)
+    LLM_CACHE_PATH: SQLite 파일 경로 (기본: backend/tmp/llm_cache.sqlite3)
+    LLM_CACHE_TTL_SEC: 기본 TTL (기본: 604800 = 7일)
+    LLM_CACHE_MAX_ENTRIES: 최대 항목 수 (기본: 20000)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+
+
+def llm_cache_key(model_name: str, prompt: str, config: Optional[Dict[str, Any]] = None) -> str:
+    """캐시 키 (SHA-256, config는 키 순서와 무관)"""
+    raw = json.dumps(
+        {"model": model_name, "prompt": prompt, "config": config or {}},
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite 기반 TTL + LRU 캐시 (스레드 안전)"""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl_sec: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        enabled: Optional[bool] = None
+    ):
+        self.path = Path(path or os.getenv("LLM_CACHE_PATH", str(BACKEND_ROOT / "tmp" / "llm_cache.sqlite3")))
+        self.ttl_sec = ttl_sec or float(os.getenv("LLM_CACHE_TTL_SEC", str(7 * 24 * 3600)))
+        self.max_entries = max_entries or int(os.getenv("LLM_CACHE_MAX_ENTRIES", "20000"))
+        self.enabled = enabled if enabled is not None else (
+            os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+        )
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.expired = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_access ON llm_cache (last_access)")
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 응답 텍스트 (없거나 만료면 None), 히트 시 LRU 갱신"""
+        if not self.enabled:
+            return None
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT response, expires_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            response, expires_at = row
+            if expires_at <= now:
+                conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                conn.commit()
+                self.expired += 1
+                self.misses += 1
+                return None
+            conn.execute(
+                "UPDATE llm_cache SET last_access = ?, hits = hits + 1 WHERE key = ?", (now, key)
+            )
+            conn.commit()
+            self.hits += 1
+            return response
+
+    def put(self, key: str, model_name: str, response: str, ttl_sec: Optional[float] = None) -> None:
+        if not self.enabled or not response:
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_cache (key, model, response, created_at, expires_at, last_access, hits)
+                VALUES (?, ?, ?, ?, ?, ?, 0)
+                """,
+                (key, model_name, response, now, now + (ttl_sec or self.ttl_sec), now)
+            )
+            conn.commit()
+            self.stores += 1
+            self._evict(conn, now)
+
+    def delete(self, key: str) -> None:
+        """항목 삭제 (파싱할 수 없는 응답 등을 다음 호출에서 재사용하지 않도록)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """만료 항목 삭제 후 상한 초과분은 LRU로 삭제 (락 보유 상태에서 호출)"""
+        cursor = conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+        self.expired += cursor.rowcount
+        count = conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            cursor = conn.execute(
+                "DELETE FROM llm_cache WHERE key IN "
+                "(SELECT key FROM llm_cache ORDER BY last_access ASC LIMIT ?)",
+                (overflow,)
+            )
+            self.evictions += cursor.rowcount
+        conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM llm_cache")
+            conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        entries = 0
+        if self.enabled:
+            with self._lock:
+                entries = self._connect().execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "path": str(self.path),
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "ttl_sec": self.ttl_sec,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "expired": self.expired
+        }
+
+
+# 프로세스 전역 캐시
+_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> LLMResponseCache:
+    global _cache
+    if _cache is None:
+        _cache = LLMResponseCache()
+    return _cache
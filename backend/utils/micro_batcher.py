@@ -0,0 +1,154 @@
+"""
+요청 마이크로 배치 큐
+
+동시에 들어온 요청을 디스패처가 작은 배치로 묶어 (최대 크기 / 최대 대기 시간)
+고정된 수의 워커에 넘김. 워커마다 전용 스레드 1개에서 실행되므로
+워커별 모델 인스턴스를 스레드 안전하게 쓸 수 있음 (scripts/tts_server.py)
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.latency import Histogram
+
+# handler(worker_id, items) -> items와 같은 순서의 결과 (예외 객체면 해당 요청만 실패)
+BatchHandler = Callable[[int, List[Any]], List[Any]]
+
+MS_BUCKETS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+COUNT_BUCKETS = (0, 1, 2, 4, 8, 16, 32, 64)
+
+
+class MicroBatcher:
+    """
+    요청 큐 + 배치 디스패처 + 고정 워커
+
+    지표 (stats()):
+        queue_depth: 배치를 꺼낼 때의 대기 요청 수 분포
+        batch_size: 배치 크기 분포
+        queue_wait_ms: 요청이 큐에서 기다린 시간
+        latency_ms: 제출부터 결과까지 시간
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: BatchHandler,
+        workers: int = 1,
+        max_batch_size: int = 8,
+        max_wait_ms: float = 10.0
+    ):
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max_wait_ms
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._batches: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._pools = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{name}-{i}")
+            for i in range(self.workers)
+        ]
+
+        self.busy_workers = 0
+        self.processed = 0
+        self.failed = 0
+        self.hist = {
+            "queue_depth": Histogram(COUNT_BUCKETS),
+            "batch_size": Histogram(COUNT_BUCKETS),
+            "queue_wait_ms": Histogram(MS_BUCKETS),
+            "latency_ms": Histogram(MS_BUCKETS)
+        }
+
+    def start(self) -> None:
+        """디스패처 / 워커 태스크 시작 (실행 중인 이벤트 루프 필요, 중복 호출 무시)"""
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue()
+        # 배치 대기열은 워커 수만큼만 → 워커가 밀리면 요청이 큐에 남아 다음 배치가 커짐
+        self._batches = asyncio.Queue(maxsize=self.workers)
+        self._tasks = [asyncio.create_task(self._dispatch())]
+        self._tasks += [asyncio.create_task(self._work(i)) for i in range(self.workers)]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        for pool in self._pools:
+            pool.shutdown(wait=False)
+
+    async def submit(self, item: Any) -> Any:
+        """요청 1개 제출 후 결과 대기 (처음 호출 시 자동 시작)"""
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, future, time.perf_counter()))
+        return await future
+
+    async def _dispatch(self) -> None:
+        while True:
+            first = await self._queue.get()
+            self.hist["queue_depth"].observe(self._queue.qsize() + 1)
+            batch = [first]
+
+            # 첫 요청 이후 max_wait_ms 동안만 추가로 모음
+            deadline = time.perf_counter() + self.max_wait_ms / 1000.0
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # 취소된 요청(클라이언트 끊김)은 버림
+            batch = [entry for entry in batch if not entry[1].done()]
+            if batch:
+                self.hist["batch_size"].observe(len(batch))
+                await self._batches.put(batch)
+
+    async def _work(self, worker_id: int) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[Tuple[Any, asyncio.Future, float]] = await self._batches.get()
+            started = time.perf_counter()
+            for _, _, enqueued in batch:
+                self.hist["queue_wait_ms"].observe((started - enqueued) * 1000)
+
+            self.busy_workers += 1
+            try:
+                results = await loop.run_in_executor(
+                    self._pools[worker_id], self.handler, worker_id, [item for item, _, _ in batch]
+                )
+            except Exception as e:
+                results = [e] * len(batch)
+            finally:
+                self.busy_workers -= 1
+
+            finished = time.perf_counter()
+            for (_, future, enqueued), result in zip(batch, results):
+                self.hist["latency_ms"].observe((finished - enqueued) * 1000)
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    self.failed += 1
+                    future.set_exception(result)
+                else:
+                    self.processed += 1
+                    future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "busy_workers": self.busy_workers,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "processed": self.processed,
+            "failed": self.failed,
+            "histograms": {name: hist.snapshot() for name, hist in self.hist.items()}
+        }
@@ -0,0 +1,199 @@
+"""
+토큰 예산 기반 프롬프트 압축
+
+분석 결과(JSON)를 프롬프트에 넣기 전에 줄임
+- 근사 토크나이저로 로컬에서 토큰 수 추정 (API 호출 없음)
+- 가치가 낮은 필드(원본 저장소 목록, 추출 텍스트, 메타데이터) 제거, 스킬 중복 제거
+- 강점 / 약점은 {스킬: 이유} 형태의 키 맵으로, JSON은 공백 없이 직렬화
+- 예산을 넘으면 단계적으로 더 줄임 (이유 길이 → 항목 수 → 이유 생략)
+- 엔드포인트별 프롬프트 크기 / 절감량 기록 (/health/prompt-sizes)
+
+환경 변수:
+    PROMPT_TOKEN_BUDGET: 프롬프트에 넣는 분석 데이터의 토큰 예산 (기본: 2000)
+"""
+
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+DEFAULT_TOKEN_BUDGET = int(os.getenv("PROMPT_TOKEN_BUDGET", "2000"))
+
+# 압축 단계: (항목 수 상한, 이유 최대 글자 수, README 최대 글자 수) — 뒤로 갈수록 작게
+COMPACTION_LEVELS = [
+    (None, 200, 600),
+    (10, 120, 300),
+    (6, 60, 120),
+    (5, 0, 0),
+]
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    근사 토큰 수 (Gemini 토크나이저 기준 대략치)
+
+    영문 / 숫자 / 기호는 약 4글자당 1토큰, 한글 등 비 ASCII 문자는 글자당 1토큰으로 계산
+    """
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def compact_json(value: Any) -> str:
+    """공백 없는 JSON (한글 그대로)"""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def dedupe(values: Iterable[Any], limit: Optional[int] = None) -> List[Any]:
+    """대소문자 / 앞뒤 공백을 무시하고 중복 제거 (처음 나온 순서 유지)"""
+    seen = set()
+    result = []
+    for value in values:
+        if value is None:
+            continue
+        key = str(value).strip().lower()
+        if not key or key in seen:
+            continue
+        seen.add(key)
+        result.append(str(value).strip())
+        if limit is not None and len(result) >= limit:
+            break
+    return result
+
+
+def _clip(text: Any, max_chars: int) -> str:
+    text = " ".join(str(text or "").split())
+    return text if len(text) <= max_chars else text[:max_chars].rstrip() + "…"
+
+
+def _keyed_items(items: Sequence[Any], max_items: Optional[int], reason_chars: int) -> Any:
+    """[{"skill", "reason"}] → {스킬: 이유} (이유를 생략하는 단계면 스킬 리스트)"""
+    skills = dedupe(
+        (item.get("skill") if isinstance(item, dict) else item for item in items or []), max_items
+    )
+    if reason_chars <= 0:
+        return skills
+    reasons = {}
+    for item in items or []:
+        if isinstance(item, dict) and item.get("skill"):
+            reasons.setdefault(str(item["skill"]).strip().lower(), item.get("reason", ""))
+    return {skill: _clip(reasons.get(skill.lower(), ""), reason_chars) for skill in skills}
+
+
+def compact_analysis(analysis: Optional[Dict[str, Any]], level: int = 0) -> Dict[str, Any]:
+    """
+    CV / GitHub 역량 분석 결과 → 프롬프트용 압축 형태
+
+    점수 / 보유·부족 스킬 / 강점·약점 / 요약만 남기고 나머지(analyzed_repos, extracted_text,
+    github_username 등)는 버림
+    """
+    if not analysis:
+        return {}
+    max_items, reason_chars, _ = COMPACTION_LEVELS[min(level, len(COMPACTION_LEVELS) - 1)]
+    compact = {
+        "score": analysis.get("overall_score"),
+        "has": dedupe(analysis.get("possessed_skills") or [], max_items),
+        "missing": dedupe(analysis.get("missing_skills") or [], max_items),
+        "strengths": _keyed_items(analysis.get("strengths"), max_items, reason_chars),
+        "weaknesses": _keyed_items(analysis.get("weaknesses"), max_items, reason_chars),
+        "summary": _clip(analysis.get("summary") or analysis.get("analysis"), max(reason_chars * 2, 120)),
+    }
+    return {key: value for key, value in compact.items() if value not in (None, "", [], {})}
+
+
+def compact_github_data(github_data: Dict[str, Any], level: int = 0) -> Dict[str, Any]:
+    """
+    GitHub API 수집 데이터 → 프롬프트용 압축 형태
+
+    저장소별 이름 / 설명 / 주요 언어(바이트 비율 순) / 스타 / README 일부만 남김
+    """
+    max_items, _, readme_chars = COMPACTION_LEVELS[min(level, len(COMPACTION_LEVELS) - 1)]
+    repos = []
+    for repo in (github_data.get("repositories") or [])[:max_items]:
+        languages = repo.get("languages") or {}
+        total = sum(languages.values()) or 1
+        top_languages = sorted(languages.items(), key=lambda item: item[1], reverse=True)[:5]
+        compact = {
+            "name": repo.get("name"),
+            "desc": _clip(repo.get("description"), 150) or None,
+            "langs": {name: round(size * 100 / total) for name, size in top_languages} or None,
+            "stars": repo.get("stars") or None,
+            "readme": _clip(repo.get("readme"), readme_chars) if readme_chars else None,
+        }
+        repos.append({key: value for key, value in compact.items() if value is not None and value != ""})
+    return {
+        "username": github_data.get("username"),
+        "repos": repos,
+    }
+
+
+def fit_to_budget(render: Callable[[int], str], budget_tokens: Optional[int] = None) -> str:
+    """
+    render(level)을 압축 단계별로 호출해 예산 안에 들어오는 첫 결과를 반환
+    (마지막 단계도 넘으면 마지막 단계 결과)
+    """
+    budget_tokens = budget_tokens or DEFAULT_TOKEN_BUDGET
+    text = ""
+    for level in range(len(COMPACTION_LEVELS)):
+        text = render(level)
+        if estimate_tokens(text) <= budget_tokens:
+            break
+    return text
+
+
+class PromptSizeStats:
+    """엔드포인트별 프롬프트 토큰 수 / 압축 전 대비 절감량"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def record(self, endpoint: str, tokens: int, baseline_tokens: Optional[int] = None) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(
+                endpoint, {"count": 0, "tokens_total": 0, "baseline_total": 0, "max_tokens": 0}
+            )
+            stats["count"] += 1
+            stats["tokens_total"] += tokens
+            stats["baseline_total"] += baseline_tokens if baseline_tokens is not None else tokens
+            stats["max_tokens"] = max(stats["max_tokens"], tokens)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            snapshot = {name: dict(values) for name, values in self._stats.items()}
+        result = {}
+        for name, values in snapshot.items():
+            saved = values["baseline_total"] - values["tokens_total"]
+            result[name] = {
+                "count": values["count"],
+                "avg_tokens": round(values["tokens_total"] / values["count"]),
+                "max_tokens": values["max_tokens"],
+                "avg_saved_tokens": round(saved / values["count"]),
+                "saved_ratio": round(saved / values["baseline_total"], 3) if values["baseline_total"] else 0.0,
+            }
+        return result
+
+
+# 프로세스 전역 통계
+prompt_size_metrics = PromptSizeStats()
+
+
+def log_prompt_size(endpoint: str, prompt: str, baseline_tokens: Optional[int] = None) -> int:
+    """
+    프롬프트 크기 기록 + 로그
+
+    Args:
+        endpoint: 프롬프트 종류 (예: "capability_scores")
+        prompt: 실제로 보낼 프롬프트
+        baseline_tokens: 압축 전 프롬프트의 추정 토큰 수 (절감량 계산용)
+
+    Returns:
+        추정 토큰 수
+    """
+    tokens = estimate_tokens(prompt)
+    prompt_size_metrics.record(endpoint, tokens, baseline_tokens)
+    if baseline_tokens:
+        saved = max(0, baseline_tokens - tokens)
+        print(f"📏 {endpoint} 프롬프트 ~{tokens} 토큰 (압축 전 ~{baseline_tokens}, -{saved * 100 // baseline_tokens}%)")
+    else:
+        print(f"📏 {endpoint} 프롬프트 ~{tokens} 토큰")
+    return tokens
@@ -0,0 +1,78 @@
+"""
+문장 / 절 단위 분할
+
+스트리밍 TTS에서 텍스트를 짧은 단위로 나눠 먼저 끝난 조각부터 합성하기 위함
+SentenceBuffer는 LLM 스트리밍 델타에서 완성된 문장을 순서대로 꺼냄
+"""
+
+import re
+from typing import List
+
+# 문장 끝: 마침표/물음표/느낌표/말줄임표 (+ 닫는 따옴표) 뒤 공백
+SENTENCE_END_RE = re.compile(r"(?<=[.?!。…])[\"'”’)]*\s+")
+# 델타 끝에서 바로 문장 완성으로 볼 수 있는 부호
+UNAMBIGUOUS_END_RE = re.compile(r"[?!。][\"'”’)]*$")
+# 긴 문장을 나눌 절 경계: 쉼표 / 세미콜론 / 콜론 뒤 공백
+CLAUSE_END_RE = re.compile(r"(?<=[,;:，])\s+")
+
+
+def split_sentences(text: str, max_chars: int = 60) -> List[str]:
+    """
+    텍스트를 문장 단위로 분할, max_chars보다 긴 문장은 절 단위로 한 번 더 분할
+
+    Args:
+        text: 원문
+        max_chars: 조각 최대 길이 (절 경계가 없으면 초과할 수 있음)
+
+    Returns:
+        공백이 정리된 조각 리스트 (빈 조각 제외)
+    """
+    chunks: List[str] = []
+    for sentence in SENTENCE_END_RE.split(text.strip()):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        if len(sentence) <= max_chars:
+            chunks.append(sentence)
+            continue
+
+        # 절 단위로 나눈 뒤 max_chars 안에서 다시 묶음
+        current = ""
+        for clause in CLAUSE_END_RE.split(sentence):
+            if current and len(current) + 1 + len(clause) > max_chars:
+                chunks.append(current)
+                current = clause
+            else:
+                current = f"{current} {clause}".strip()
+        if current:
+            chunks.append(current)
+    return chunks
+
+
+class SentenceBuffer:
+    """
+    스트리밍 텍스트 델타를 모아 완성된 문장만 반환
+
+    문장 끝 부호 뒤에 공백이 와야 완성으로 판단하므로
+    "3.5" 같은 숫자 중간에서 끊기지 않음 (마지막 문장은 flush()로 반환)
+    """
+
+    def __init__(self):
+        self._buffer = ""
+
+    def feed(self, delta: str) -> List[str]:
+        """델타 추가 후 새로 완성된 문장 리스트 반환"""
+        self._buffer += delta
+        parts = SENTENCE_END_RE.split(self._buffer)
+        self._buffer = parts.pop()
+        # 물음표/느낌표로 끝나면 숫자와 헷갈릴 일이 없으므로 바로 완성 처리
+        if UNAMBIGUOUS_END_RE.search(self._buffer):
+            parts.append(self._buffer)
+            self._buffer = ""
+        return [part.strip() for part in parts if part.strip()]
+
+    def flush(self) -> List[str]:
+        """남은 텍스트 (마지막 문장) 반환"""
+        rest = self._buffer.strip()
+        self._buffer = ""
+        return [rest] if rest else []
@@ -0,0 +1,265 @@
+"""
+중복 요청 합치기 (single-flight)
+
+같은 작업 + 같은 입력(fingerprint)의 호출이 동시에 들어오면 한 번만 실행하고
+나머지는 진행 중인 결과를 기다림 (더블 클릭 / 프론트 재시도로 쿼터를 낭비하지 않도록)
+
+- 프로세스 안: 스레드 이벤트로 대기 (sync 엔드포인트는 스레드 풀에서 실행됨)
+- 프로세스 간 (uvicorn 워커 여러 개): 키별 파일 락(fcntl)으로 직렬화하고,
+  먼저 끝난 워커가 남긴 결과 파일(JSON)을 result_ttl_sec 동안 재사용
+  (fcntl이 없는 환경에서는 프로세스 안에서만 합침)
+- 키마다 .lock / .json 파일이 생기므로 결과를 쓸 때 주기적으로(최소 1분 간격) 정리:
+  TTL이 지난 결과 파일, lock_timeout_sec 동안 쓰이지 않은 락 파일 삭제
+
+환경 변수:
+    SINGLE_FLIGHT_DIR: 락 / 결과 파일 디렉토리 (기본: backend/tmp/single_flight)
+    SINGLE_FLIGHT_RESULT_TTL_SEC: 다른 워커의 결과를 재사용할 시간 (기본: 10)
+    SINGLE_FLIGHT_LOCK_TIMEOUT_SEC: 락 대기 최대 시간, 넘으면 직접 실행 (기본: 600)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+
+T = TypeVar("T")
+
+
+def fingerprint_key(operation: str, fingerprint: Any) -> str:
+    """작업 이름 + 입력 → 키 (SHA-256)"""
+    raw = json.dumps([operation, fingerprint], ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class _Call:
+    """진행 중인 호출 1개 (프로세스 안 대기자 공유)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """작업별 single-flight 실행기 + 통계"""
+
+    def __init__(
+        self,
+        lock_dir: Optional[str] = None,
+        result_ttl_sec: Optional[float] = None,
+        lock_timeout_sec: Optional[float] = None
+    ):
+        self.lock_dir = Path(lock_dir or os.getenv(
+            "SINGLE_FLIGHT_DIR", str(BACKEND_ROOT / "tmp" / "single_flight")
+        ))
+        self.result_ttl_sec = result_ttl_sec if result_ttl_sec is not None else float(
+            os.getenv("SINGLE_FLIGHT_RESULT_TTL_SEC", "10")
+        )
+        self.lock_timeout_sec = lock_timeout_sec or float(os.getenv("SINGLE_FLIGHT_LOCK_TIMEOUT_SEC", "600"))
+
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self.sweep_interval_sec = max(self.result_ttl_sec, 60.0)
+        self._last_sweep = 0.0
+        self.swept = 0
+
+    def _count(self, operation: str, field: str) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(
+                operation, {"runs": 0, "coalesced_local": 0, "coalesced_remote": 0, "failures": 0}
+            )
+            stats[field] += 1
+
+    def do(self, operation: str, fingerprint: Any, fn: Callable[[], T]) -> T:
+        """
+        fn()을 single-flight로 실행
+
+        Args:
+            operation: 작업 이름 (예: "analyze_interview")
+            fingerprint: 입력 식별값 (JSON 직렬화 가능한 값, 같으면 같은 작업)
+            fn: 실제 작업 (인자 없는 함수)
+
+        Returns:
+            fn() 결과 (대기자는 먼저 실행한 호출의 결과를 그대로 받음)
+
+        Raises:
+            fn()에서 난 예외 (프로세스 안 대기자에게도 같은 예외 전달)
+        """
+        key = fingerprint_key(operation, fingerprint)
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                call.waiters += 1
+
+        if not leader:
+            self._count(operation, "coalesced_local")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._run_exclusive(operation, key, fn)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            self._count(operation, "failures")
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def _run_exclusive(self, operation: str, key: str, fn: Callable[[], T]) -> T:
+        """다른 워커 프로세스와 직렬화해서 실행 (최근 결과가 있으면 재사용)"""
+        started = time.time()
+        with self._file_lock(key) as locked:
+            if locked:
+                shared = self._read_result(key, not_before=started - self.result_ttl_sec)
+                if shared is not None:
+                    self._count(operation, "coalesced_remote")
+                    return shared["result"]
+
+            self._count(operation, "runs")
+            result = fn()
+            if locked:
+                self._write_result(key, result)
+            return result
+
+    @contextmanager
+    def _file_lock(self, key: str) -> Iterator[bool]:
+        """키별 파일 락 (획득하면 True, fcntl이 없거나 타임아웃이면 False)"""
+        if fcntl is None:
+            yield False
+            return
+
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_dir / f"{key}.lock", "a+") as handle:
+            deadline = time.monotonic() + self.lock_timeout_sec
+            locked = False
+            while True:
+                try:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    locked = True
+                    # 마지막 사용 시각 (오래 안 쓴 락 파일 정리 기준)
+                    os.utime(handle.fileno())
+                    break
+                except BlockingIOError:
+                    if time.monotonic() >= deadline:
+                        print(f"⚠️ single-flight lock timeout ({key[:12]}), running without lock")
+                        break
+                    time.sleep(0.05)
+            try:
+                yield locked
+            finally:
+                if locked:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _result_path(self, key: str) -> Path:
+        return self.lock_dir / f"{key}.json"
+
+    def _read_result(self, key: str, not_before: float) -> Optional[Dict[str, Any]]:
+        path = self._result_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                shared = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if shared.get("finished_at", 0) < not_before:
+            return None
+        return shared
+
+    def _write_result(self, key: str, result: Any) -> None:
+        """결과를 다른 워커용으로 남김 (JSON 직렬화가 안 되는 결과는 공유하지 않음)"""
+        try:
+            payload = json.dumps({"finished_at": time.time(), "result": result}, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return
+        path = self._result_path(key)
+        tmp_path = path.with_name(f".{key}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ single-flight result write failed: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+        if time.time() - self._last_sweep >= self.sweep_interval_sec:
+            self.sweep()
+
+    def sweep(self) -> int:
+        """
+        오래된 파일 정리 (삭제한 파일 수 반환)
+
+        - 결과 파일: result_ttl_sec이 지나면 재사용되지 않으므로 삭제
+        - 락 파일: lock_timeout_sec 동안 아무도 잡지 않았고 지금도 잡혀 있지 않을 때만 삭제
+          (그보다 오래 기다리는 대기자는 없으므로 다른 락 파일로 갈라지지 않음)
+        """
+        now = time.time()
+        self._last_sweep = now
+        removed = 0
+        try:
+            paths = list(self.lock_dir.iterdir())
+        except OSError:
+            return 0
+
+        for path in paths:
+            try:
+                age = now - path.stat().st_mtime
+                if path.suffix == ".json" and age > self.result_ttl_sec:
+                    path.unlink()
+                    removed += 1
+                elif path.suffix == ".lock" and age > self.lock_timeout_sec and fcntl is not None:
+                    with open(path, "a+") as handle:
+                        try:
+                            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                        except BlockingIOError:
+                            continue
+                        path.unlink()
+                        removed += 1
+            except OSError:
+                continue
+
+        with self._lock:
+            self.swept += removed
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            operations = {name: dict(values) for name, values in self._stats.items()}
+            in_flight = len(self._calls)
+        for values in operations.values():
+            total = values["runs"] + values["coalesced_local"] + values["coalesced_remote"]
+            coalesced = values["coalesced_local"] + values["coalesced_remote"]
+            values["coalesced_ratio"] = round(coalesced / total, 3) if total else 0.0
+        return {
+            "cross_process": fcntl is not None,
+            "result_ttl_sec": self.result_ttl_sec,
+            "in_flight": in_flight,
+            "swept_files": self.swept,
+            "operations": operations
+        }
+
+
+# 프로세스 전역 인스턴스
+single_flight = SingleFlight()
@@ -0,0 +1,268 @@
+"""
+LLM 구조화 출력 (JSON) 생성 / 파싱
+
+- pydantic 모델(schemas.py) → Gemini response_schema 변환
+  (response_mime_type=application/json과 함께 넘기면 모델이 스키마에 맞는 JSON만 생성)
+- 관대한 로컬 복구 파서: 코드블록 / 앞뒤 설명 문장 / 끝의 쉼표 / 잘린 출력을
+  모델을 다시 호출하지 않고 고쳐서 파싱
+- 프롬프트 종류별 파싱 성공 / 복구 / 실패 통계
+
+환경 변수:
+    LLM_JSON_SCHEMA_ENABLED: false면 response_schema 없이 JSON MIME 타입만 요청 (기본: true)
+"""
+
+import json
+import os
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+# Gemini Schema가 받는 키 (OpenAPI 3.0 부분 집합)
+_SCHEMA_KEYS = {"type", "format", "description", "nullable", "enum", "items", "properties", "required"}
+
+
+class JSONRepairError(ValueError):
+    """복구 파서로도 JSON을 얻지 못함 (text: 모델 원본 응답)"""
+
+    def __init__(self, message: str, text: str):
+        super().__init__(message)
+        self.text = text
+
+
+def _to_gemini_schema(node: Dict[str, Any], defs: Dict[str, Any]) -> Dict[str, Any]:
+    """pydantic JSON Schema 노드 → Gemini Schema ($ref 펼치기, Optional → nullable)"""
+    if "$ref" in node:
+        node = defs[node["$ref"].split("/")[-1]]
+
+    variants = node.get("anyOf")
+    if variants:
+        non_null = [v for v in variants if v.get("type") != "null"]
+        schema = _to_gemini_schema(non_null[0], defs) if non_null else {"type": "string"}
+        if len(non_null) < len(variants):
+            schema["nullable"] = True
+        return schema
+
+    schema = {key: value for key, value in node.items() if key in _SCHEMA_KEYS}
+    if "properties" in schema:
+        schema["properties"] = {
+            name: _to_gemini_schema(child, defs) for name, child in schema["properties"].items()
+        }
+    if "items" in schema:
+        schema["items"] = _to_gemini_schema(schema["items"], defs)
+    if schema.get("type") == "object" and not schema.get("properties"):
+        # 자유 형식 객체는 Gemini Schema로 표현할 수 없으므로 문자열로 대체
+        schema = {"type": "string"}
+    return schema
+
+
+@lru_cache(maxsize=None)
+def response_schema_for(model: Type[BaseModel], as_list: bool = False) -> Dict[str, Any]:
+    """
+    pydantic 모델 → Gemini response_schema (dict)
+
+    dict로 넘겨야 LLM 응답 캐시 키(generation_config 포함)에 스키마 내용이 반영됨
+
+    Args:
+        model: 출력 스키마 모델
+        as_list: True면 모델의 배열 (예: 질문 리스트)
+    """
+    json_schema = model.model_json_schema()
+    schema = _to_gemini_schema(json_schema, json_schema.get("$defs", {}))
+    if as_list:
+        return {"type": "array", "items": schema}
+    return schema
+
+
+def json_generation_config(model: Type[BaseModel], as_list: bool = False) -> Dict[str, Any]:
+    """JSON 출력용 generation_config (LLM_JSON_SCHEMA_ENABLED=false면 MIME 타입만)"""
+    config: Dict[str, Any] = {"response_mime_type": "application/json"}
+    if os.getenv("LLM_JSON_SCHEMA_ENABLED", "true").lower() == "true":
+        config["response_schema"] = response_schema_for(model, as_list)
+    return config
+
+
+def strip_code_fence(text: str) -> str:
+    """마크다운 코드블록 제거 (닫는 ```가 잘려 나간 경우도 처리)"""
+    text = text.strip()
+    if "```" not in text:
+        return text
+    body = text.split("```", 1)[1]
+    if body.startswith("json"):
+        body = body[len("json"):]
+    return body.split("```", 1)[0].strip()
+
+
+def _close(stack: List[str]) -> str:
+    return "".join("}" if opener == "{" else "]" for opener in reversed(stack))
+
+
+def repair_json(text: str) -> str:
+    """
+    깨진 JSON 텍스트를 최대한 파싱 가능한 형태로 고침
+
+    - 코드블록 / 첫 {, [ 앞의 설명 문장 제거
+    - 닫는 괄호 앞의 쉼표 제거
+    - 잘린 출력: 열린 문자열 / 괄호를 닫고, 그래도 안 되면
+      마지막으로 완성된 항목(쉼표 위치)까지 잘라서 닫음
+
+    Returns:
+        복구된 JSON 텍스트
+
+    Raises:
+        JSONRepairError: JSON 시작(객체 / 배열)을 찾을 수 없거나 복구 실패
+    """
+    body = strip_code_fence(text)
+    starts = [i for i in (body.find("{"), body.find("[")) if i >= 0]
+    if not starts:
+        raise JSONRepairError("JSON 객체 / 배열을 찾을 수 없습니다.", text)
+    body = body[min(starts):]
+
+    out: List[str] = []
+    stack: List[str] = []
+    # 잘린 출력용 후보: (쉼표 직전까지의 길이, 그 시점의 열린 괄호)
+    cut_points: List[Tuple[int, List[str]]] = []
+    in_string = False
+    escaped = False
+
+    for ch in body:
+        if in_string:
+            out.append(ch)
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+
+        if ch == '"':
+            in_string = True
+        elif ch in "{[":
+            stack.append(ch)
+        elif ch in "}]":
+            # 닫는 괄호 앞의 쉼표 제거
+            while out and out[-1].isspace():
+                out.pop()
+            if out and out[-1] == ",":
+                out.pop()
+            if not stack:
+                break
+            stack.pop()
+            out.append(ch)
+            if not stack:
+                # 최상위 값이 끝나면 뒤에 붙은 설명 문장은 버림
+                break
+            continue
+        elif ch == ",":
+            cut_points.append((len(out), list(stack)))
+        out.append(ch)
+
+    if not stack and not in_string:
+        return "".join(out)
+
+    # 잘린 출력: 열린 문자열 / 괄호를 그 자리에서 닫은 값
+    closed = "".join(out)
+    if in_string:
+        closed += '"'
+    closed = closed.rstrip().rstrip(",")
+    if closed.endswith(":"):
+        closed += " null"
+    closed += _close(stack)
+
+    # 마지막으로 완성된 항목(쉼표 위치)까지 잘라서 닫은 값들
+    truncated = ("".join(out[:length]) + _close(open_stack) for length, open_stack in reversed(cut_points))
+
+    # 배열 안에서 잘렸으면 반쯤 생성된 마지막 원소(예: 잘린 질문)를 버리는 쪽을 우선
+    candidates = [*truncated, closed] if "[" in stack else [closed, *truncated]
+    for candidate in candidates:
+        if _loads(candidate) is not None:
+            return candidate
+
+    raise JSONRepairError("잘린 JSON을 복구할 수 없습니다.", text)
+
+
+def _loads(text: str) -> Any:
+    """파싱 성공 시 값, 실패 시 None (문자열 안의 줄바꿈 허용)"""
+    try:
+        return json.loads(text, strict=False)
+    except ValueError:
+        return None
+
+
+class StructuredOutputMetrics:
+    """프롬프트 종류별 JSON 파싱 결과 통계 (ok: 바로 파싱, repaired: 복구 후 파싱, failed: 실패)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Dict[str, Dict[str, int]] = {}
+
+    def record(self, prompt_type: str, outcome: str) -> None:
+        with self._lock:
+            counts = self._counts.setdefault(prompt_type, {"ok": 0, "repaired": 0, "failed": 0})
+            counts[outcome] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            result = {name: dict(counts) for name, counts in self._counts.items()}
+        for counts in result.values():
+            total = counts["ok"] + counts["repaired"] + counts["failed"]
+            counts["failure_rate"] = round(counts["failed"] / total, 3) if total else 0.0
+            counts["repair_rate"] = round(counts["repaired"] / total, 3) if total else 0.0
+        return result
+
+
+# 프로세스 전역 통계
+structured_output_metrics = StructuredOutputMetrics()
+
+
+def valid_items(value: List[Any], item_model: Type[BaseModel]) -> List[Any]:
+    """스키마에 맞지 않는 배열 원소(잘려서 필드가 빠진 원소 등) 제거"""
+    items = []
+    for item in value:
+        try:
+            item_model.model_validate(item)
+        except ValidationError:
+            continue
+        items.append(item)
+    return items
+
+
+def parse_json_response(text: str, prompt_type: str, item_model: Optional[Type[BaseModel]] = None) -> Any:
+    """
+    LLM 응답 텍스트 → JSON 값 (실패하면 로컬 복구 후 재시도, 결과를 통계에 기록)
+
+    Args:
+        text: 모델 응답 텍스트
+        prompt_type: 통계용 프롬프트 종류 (예: "cv_analysis")
+        item_model: 배열 응답일 때 원소 스키마 (맞지 않는 원소는 제거하고 복구로 기록)
+
+    Raises:
+        JSONRepairError: 복구 후에도 파싱 실패
+    """
+    repaired = False
+    value = _loads(strip_code_fence(text))
+    if value is None:
+        repaired = True
+        try:
+            value = _loads(repair_json(text))
+        except JSONRepairError:
+            value = None
+
+    if value is not None and item_model is not None and isinstance(value, list):
+        items = valid_items(value, item_model)
+        repaired = repaired or len(items) < len(value)
+        value = items or None
+
+    if value is None:
+        structured_output_metrics.record(prompt_type, "failed")
+        print(f"⚠️ {prompt_type} JSON 파싱 실패 (응답 {len(text)}자)")
+        raise JSONRepairError(f"{prompt_type} 응답을 JSON으로 파싱할 수 없습니다.", text)
+
+    if repaired:
+        structured_output_metrics.record(prompt_type, "repaired")
+        print(f"🔧 {prompt_type} JSON 응답 로컬 복구")
+    else:
+        structured_output_metrics.record(prompt_type, "ok")
+    return value
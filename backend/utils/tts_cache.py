@@ -0,0 +1,224 @@
+"""
+TTS 오디오 캐시
+
+hash(text, speaker, speed, model version)를 키로 디스크에 저장하는 콘텐츠 주소 캐시
+- TTS 서버(scripts/)는 합성된 wav 파일을, TTSClient(CachedTTSClient)는 audio_url을 저장
+- 크기 / 개수 상한 초과 시 가장 오래 사용하지 않은 항목부터 삭제 (LRU, 파일 mtime 기준)
+- 같은 키의 동시 요청은 한 번만 합성 (single-flight)
+
+환경 변수:
+    TTS_CACHE_DIR: 캐시 디렉토리 (기본: backend/tmp/tts_cache)
+    TTS_CACHE_MAX_MB: 최대 용량 MB (기본: 512)
+    TTS_CACHE_MAX_ENTRIES: 최대 항목 수 (기본: 5000)
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import uuid
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+
+
+def tts_cache_key(
+    text: str,
+    speaker: str,
+    speed: float,
+    model_version: str,
+    namespace: str = ""
+) -> str:
+    """
+    캐시 키 (SHA-256)
+
+    Args:
+        text: 합성 텍스트 (앞뒤 공백 무시)
+        speaker: 화자 ID
+        speed: 속도 배율
+        model_version: TTS 모델 버전 (모델이 바뀌면 캐시 무효화)
+        namespace: 추가 구분자 (예: TTS 서버 URL)
+    """
+    raw = "\x1f".join([namespace, model_version, speaker, f"{float(speed):.3f}", text.strip()])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class TTSCache:
+    """
+    디스크 기반 LRU 캐시 (항목 = 키 이름의 파일 1개)
+
+    히트 시 파일 mtime을 갱신해 LRU 순서로 사용하므로
+    여러 프로세스가 같은 디렉토리를 공유해도 별도 인덱스가 필요 없음
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        max_entries: Optional[int] = None
+    ):
+        self.cache_dir = Path(cache_dir or os.getenv("TTS_CACHE_DIR", str(BACKEND_ROOT / "tmp" / "tts_cache")))
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes or int(float(os.getenv("TTS_CACHE_MAX_MB", "512")) * 1024 * 1024)
+        self.max_entries = max_entries or int(os.getenv("TTS_CACHE_MAX_ENTRIES", "5000"))
+
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    def path_for(self, key: str, suffix: str = ".wav") -> Path:
+        return self.cache_dir / f"{key}{suffix}"
+
+    def get(self, key: str, suffix: str = ".wav") -> Optional[Path]:
+        """캐시된 파일 경로 (없으면 None), 히트 시 LRU 갱신"""
+        path = self.path_for(key, suffix)
+        if not path.exists():
+            return None
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return path
+
+    async def get_or_create(
+        self,
+        key: str,
+        producer: Callable[[str], Awaitable[None]],
+        suffix: str = ".wav"
+    ) -> Path:
+        """
+        캐시 조회 후 없으면 producer로 생성
+
+        Args:
+            key: tts_cache_key() 결과
+            producer: 주어진 임시 경로에 파일을 써야 하는 async 함수
+            suffix: 파일 확장자
+
+        Returns:
+            캐시 파일 경로
+        """
+        cached = self.get(key, suffix)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        flight_key = f"{key}{suffix}"
+        inflight = self._inflight.get(flight_key)
+        if inflight is not None:
+            # 같은 키를 합성 중인 요청이 있으면 그 결과를 기다림
+            self.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[flight_key] = future
+        try:
+            path = self.path_for(key, suffix)
+            tmp_path = self.cache_dir / f".{key}.{uuid.uuid4().hex}.tmp{suffix}"
+            try:
+                await producer(str(tmp_path))
+                os.replace(tmp_path, path)
+            finally:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+            future.set_result(path)
+            self._evict()
+            return path
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 기다리는 요청이 없으면 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(flight_key, None)
+
+    def get_json(self, key: str) -> Optional[Dict[str, Any]]:
+        """작은 메타데이터 항목 조회 (예: audio_url)"""
+        path = self.get(key, ".json")
+        if path is None:
+            return None
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def put_json(self, key: str, value: Dict[str, Any]) -> None:
+        """메타데이터 항목 덮어쓰기 (원자적 교체)"""
+        path = self.path_for(key, ".json")
+        tmp_path = self.cache_dir / f".{key}.{uuid.uuid4().hex}.tmp.json"
+        tmp_path.write_text(json.dumps(value, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def delete(self, key: str, suffix: str = ".wav") -> None:
+        """항목 삭제 (없으면 무시)"""
+        try:
+            self.path_for(key, suffix).unlink()
+        except FileNotFoundError:
+            pass
+
+    async def get_or_create_json(
+        self,
+        key: str,
+        producer: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """get_or_create의 JSON 버전 (producer가 dict를 반환)"""
+        async def write(tmp_path: str) -> None:
+            value = await producer()
+            Path(tmp_path).write_text(json.dumps(value, ensure_ascii=False), encoding="utf-8")
+
+        path = await self.get_or_create(key, write, suffix=".json")
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def _evict(self) -> None:
+        """용량 / 개수 상한 초과 시 오래된 항목부터 삭제"""
+        entries = []
+        total = 0
+        for path in self.cache_dir.iterdir():
+            if path.name.startswith(".") or not path.is_file():
+                continue
+            stat = path.stat()
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        if total <= self.max_bytes and len(entries) <= self.max_entries:
+            return
+
+        entries.sort()
+        count = len(entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes and count <= self.max_entries:
+                break
+            try:
+                path.unlink()
+                self.evictions += 1
+            except OSError:
+                continue
+            total -= size
+            count -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "dir": str(self.cache_dir),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "inflight": len(self._inflight)
+        }
+
+
+# 프로세스 전역 캐시
+_cache: Optional[TTSCache] = None
+
+
+def get_tts_cache() -> TTSCache:
+    global _cache
+    if _cache is None:
+        _cache = TTSCache()
+    return _cache